@@ -13,10 +13,12 @@ ASR API 라우터
 import logging
 import json
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.device import Device
 from app.schemas.asr import (
     ASRSessionStartRequest,
@@ -30,9 +32,12 @@ from app.schemas.asr import (
 from app.services.asr_service import asr_service
 from app.services.mqtt_service import mqtt_service
 from app.services.websocket_service import ws_manager
+from app.services.emergency_service import emergency_service
 from app.utils.logger import logger
+from app.utils.log_context import bind_path_context, log_context
+from app.utils.tracing import tracer
 
-router = APIRouter(prefix="/asr", tags=["ASR (음성인식)"])
+router = APIRouter(prefix="/asr", tags=["ASR (음성인식)"], dependencies=[Depends(bind_path_context)])
 
 
 # 세션 상태 저장 (메모리)
@@ -137,7 +142,7 @@ async def start_device_asr_session(
         }
 
         logger.info(f"📤 MQTT 명령 전송: {mqtt_topic}")
-        logger.debug(f"   Payload: {mqtt_payload}")
+        logger.debug("   Payload: %s", mqtt_payload)
 
         mqtt_service.publish(mqtt_topic, json.dumps(mqtt_payload))
 
@@ -308,7 +313,7 @@ async def get_device_asr_session_status(
     Example:
         GET /asr/devices/1/session/status
     """
-    logger.debug(f"음성인식 세션 상태 조회: device_id={device_id}")
+    logger.debug("음성인식 세션 상태 조회: device_id=%s", device_id)
 
     # 장비 확인
     device = db.query(Device).filter(Device.id == device_id).first()
@@ -432,23 +437,28 @@ async def asr_health_check():
 @router.post("/result")
 async def receive_asr_result(
     result: RecognitionResult,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     ASR 서버로부터 음성인식 결과 수신
 
     RK3588 ASR 서버에서 음성인식이 완료되면 이 엔드포인트로 결과를 전송합니다.
     결과를 받으면 해당 장비를 구독 중인 모든 클라이언트에게 브로드캐스트합니다.
+    응급 결과(is_emergency)는 구독과 관계없이 모든 운영자 연결에 즉시 전송되고
+    emergency_events 테이블에 저장된 뒤 응답합니다.
 
     Args:
         result: 음성인식 결과 데이터
-            - device_id: 장비 ID
+            - device_id: 장비 ID (DB PK 또는 장비 고유 ID)
             - session_id: 세션 ID
             - text: 인식된 텍스트
             - timestamp: 인식 시각
             - duration: 음성 길이
             - is_emergency: 응급 상황 여부
             - emergency_keywords: 감지된 응급 키워드
+            - segment_end: 음성 구간 종료 시각 (epoch 초, 선택)
+        request: traceparent 헤더가 있으면 ASR 서버의 발화 trace 를 이어서 기록
         db: 데이터베이스 세션
 
     Returns:
@@ -472,54 +482,79 @@ async def receive_asr_result(
             "emergency_keywords": []
         }
     """
+    with log_context(device_id=result.device_id, session_id=result.session_id), tracer.start_span(
+        "backend.receive_asr_result",
+        parent=request.headers.get("traceparent"),
+        device_id=str(result.device_id),
+        is_emergency=result.is_emergency,
+    ):
+        return await _handle_asr_result(result, db)
+
+
+async def _handle_asr_result(result: RecognitionResult, db: AsyncSession) -> Dict:
     logger.info(
         f"🎤 음성인식 결과 수신: device_id={result.device_id}, text='{result.text}'"
     )
 
     try:
-        # 1. 장비 확인
-        device = db.query(Device).filter(Device.id == result.device_id).first()
+        # 1. 장비 확인 (DB PK 또는 ASR 서버가 보내는 장비 고유 ID)
+        if isinstance(result.device_id, int) or str(result.device_id).isdigit():
+            device = await db.get(Device, int(result.device_id))
+        else:
+            device = await db.scalar(
+                select(Device).where(Device.device_id == result.device_id)
+            )
         if not device:
             logger.warning(f"⚠️ 장비를 찾을 수 없음: {result.device_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
             )
 
-        # 2. 응급 상황 감지
-        if result.is_emergency:
-            logger.warning(
-                f"🚨 응급 상황 감지: device_id={result.device_id}, keywords={result.emergency_keywords}"
-            )
-
-        # 3. WebSocket으로 구독 중인 클라이언트들에게 브로드캐스트
         message = {
             "type": "asr_result",
-            "device_id": result.device_id,
-            "device_name": result.device_name,
+            "device_id": device.id,
+            "device_name": result.device_name or device.device_name,
             "session_id": result.session_id,
             "text": result.text,
             "timestamp": result.timestamp,
             "duration": result.duration,
             "is_emergency": result.is_emergency,
             "emergency_keywords": result.emergency_keywords,
+            "segment_end": result.segment_end,
         }
 
-        # 장비를 구독 중인 모든 사용자에게 브로드캐스트
-        await ws_manager.broadcast_to_subscribers(result.device_id, message)
+        # 2. 응급 상황: 우선 경로 (운영자 전체 즉시 전송 + 동기 저장)
+        if result.is_emergency:
+            logger.warning(
+                f"🚨 응급 상황 감지: device_id={device.id}, keywords={result.emergency_keywords}"
+            )
+            delivery = await emergency_service.dispatch(db, device.id, message)
+            return {
+                "status": "success",
+                "message": "응급 이벤트가 저장되고 운영자에게 전달되었습니다",
+                "device_id": device.id,
+                "text": result.text,
+                "is_emergency": True,
+                "broadcasted_count": delivery["delivered_count"],
+                "event_id": delivery["event_id"],
+            }
+
+        # 3. WebSocket으로 구독 중인 클라이언트들에게 브로드캐스트
+        await ws_manager.broadcast_to_subscribers(device.id, message)
 
         logger.info(
-            f"✅ 음성인식 결과 브로드캐스트 완료: {result.device_id} -> {len(ws_manager.device_subscriptions.get(result.device_id, set()))} 사용자"
+            f"✅ 음성인식 결과 브로드캐스트 완료: {device.id} -> {len(ws_manager.device_subscriptions.get(device.id, set()))} 사용자"
         )
 
         # 4. 응답 반환
         return {
             "status": "success",
             "message": "음성인식 결과가 저장되었습니다",
-            "device_id": result.device_id,
+            "device_id": device.id,
             "text": result.text,
             "is_emergency": result.is_emergency,
             "broadcasted_count": len(
-                ws_manager.device_subscriptions.get(result.device_id, set())
+                ws_manager.device_subscriptions.get(device.id, set())
             ),
         }
 
@@ -532,3 +567,20 @@ async def receive_asr_result(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"음성인식 결과 처리에 실패했습니다: {str(e)}",
         )
+
+
+@router.get("/emergency/stats")
+async def get_emergency_stats():
+    """
+    응급 우선 경로 지연 시간 통계
+
+    Returns:
+        {
+            "ingest": 음성 구간 종료 → 백엔드 수신,
+            "end_to_end": 음성 구간 종료 → 운영자 소켓 전송 완료,
+            "fanout": 백엔드 수신 → 운영자 소켓 전송 완료,
+            "operator_connections": 응급 채널 연결 수
+        }
+        각 항목은 count / p50_ms / p99_ms / max_ms
+    """
+    return emergency_service.stats()
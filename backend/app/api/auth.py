@@ -2,12 +2,12 @@
 인증 API 엔드포인트
 보안 가이드라인 1 준수: 인증/세션/토큰 관리
 """
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import User, RefreshToken, AuditLog
+from app.models import User, AuditLog
 from app.schemas import (
     LoginRequest, 
     TokenResponse, 
@@ -16,18 +16,20 @@ from app.schemas import (
     UserResponse
 )
 from app.security import (
-    verify_password,
-    get_password_hash,
+    get_password_hash_async,
+    verify_and_update_password_async,
     validate_password_strength,
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_token,
     verify_token_type,
+    get_token_user_id,
 )
 from app.dependencies import get_current_user, get_client_ip
+from app.services.count_cache import get_count_cache
+from app.services.auth_cache import get_auth_cache
+from app.services.refresh_token_store import get_refresh_token_store
 from app.utils.logger import logger
-from app.config import settings
 
 
 router = APIRouter(prefix="/auth", tags=["인증"])
@@ -66,8 +68,9 @@ async def register(
             detail=error_msg
         )
     
-    # 비밀번호 해싱 (BCrypt)
-    password_hash = get_password_hash(user_data.password)
+    # 비밀번호 해싱 (BCrypt, 전용 스레드 풀) - 기다리는 동안 DB 연결은 풀에 반환
+    db.rollback()
+    password_hash = await get_password_hash_async(user_data.password)
     
     # 사용자 생성
     new_user = User(
@@ -80,6 +83,7 @@ async def register(
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
+    get_count_cache().invalidate("users")
     
     # 감사 로그 기록
     ip_address = get_client_ip(request) if request else None
@@ -115,8 +119,17 @@ async def login(
     # 사용자 조회
     user = db.query(User).filter(User.username == login_data.username).first()
     
+    # 비밀번호 검증 (BCrypt, 전용 스레드 풀) + rounds 변경 시 새 해시
+    verified, new_password_hash = False, None
+    if user:
+        password_hash = user.password_hash
+        db.rollback()  # bcrypt 를 기다리는 동안 DB 연결을 풀에 반환 (동시 로그인 시 연결 고갈 방지)
+        verified, new_password_hash = await verify_and_update_password_async(
+            login_data.password, password_hash
+        )
+    
     # 사용자 없거나 비밀번호 불일치 (보안: 동일한 에러 메시지)
-    if not user or not verify_password(login_data.password, user.password_hash):
+    if not user or not verified:
         logger.warning(f"로그인 실패: {login_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -132,28 +145,26 @@ async def login(
     
     # 토큰 생성
     token_data = {
-        "sub": user.id,
+        "sub": str(user.id),
         "username": user.username,
         "role": user.role.value
     }
     
     access_token = create_access_token(token_data)
-    refresh_token = create_refresh_token({"sub": user.id})
+    refresh_token = create_refresh_token({"sub": str(user.id)})
     
     # Refresh 토큰 해시 저장 (보안 가이드라인 1-2)
-    token_hash = hash_token(refresh_token)
-    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    get_refresh_token_store().add(db, user.id, refresh_token)
     
-    db_refresh_token = RefreshToken(
-        user_id=user.id,
-        token_hash=token_hash,
-        expires_at=expires_at
-    )
-    db.add(db_refresh_token)
+    # bcrypt rounds 가 바뀐 경우 새 해시로 교체
+    if new_password_hash:
+        user.password_hash = new_password_hash
+        logger.info(f"비밀번호 해시 갱신 (bcrypt rounds 변경): {user.username}")
     
     # 마지막 로그인 시간 업데이트
     user.last_login_at = datetime.utcnow()
     db.commit()
+    get_auth_cache().invalidate_user(user.id)
     
     # 감사 로그 기록
     ip_address = get_client_ip(request) if request else None
@@ -198,23 +209,17 @@ async def refresh_token(
             detail="유효하지 않은 토큰입니다"
         )
     
-    user_id = payload.get("sub")
+    user_id = get_token_user_id(payload)
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰입니다"
         )
     
-    # Refresh 토큰 해시 확인
-    token_hash = hash_token(refresh_data.refresh_token)
-    db_token = db.query(RefreshToken).filter(
-        RefreshToken.user_id == user_id,
-        RefreshToken.token_hash == token_hash,
-        RefreshToken.revoked == False,
-        RefreshToken.expires_at > datetime.utcnow()
-    ).first()
-    
-    if not db_token:
+    # Refresh 토큰 확인 + 기존 토큰 무효화 (보안 가이드라인 1-2)
+    # 조건부 UPDATE 1회: 같은 토큰으로 동시에 갱신해도 1건만 성공
+    store = get_refresh_token_store()
+    if not store.consume(db, user_id, refresh_data.refresh_token):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않거나 만료된 토큰입니다"
@@ -228,29 +233,18 @@ async def refresh_token(
             detail="유효하지 않은 사용자입니다"
         )
     
-    # 기존 토큰 무효화 (보안 가이드라인 1-2)
-    db_token.revoked = True
-    
     # 새 토큰 발급
     token_data = {
-        "sub": user.id,
+        "sub": str(user.id),
         "username": user.username,
         "role": user.role.value
     }
     
     new_access_token = create_access_token(token_data)
-    new_refresh_token = create_refresh_token({"sub": user.id})
+    new_refresh_token = create_refresh_token({"sub": str(user.id)})
     
     # 새 Refresh 토큰 저장
-    new_token_hash = hash_token(new_refresh_token)
-    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    
-    new_db_refresh_token = RefreshToken(
-        user_id=user.id,
-        token_hash=new_token_hash,
-        expires_at=expires_at
-    )
-    db.add(new_db_refresh_token)
+    store.add(db, user.id, new_refresh_token)
     db.commit()
     
     logger.info(f"토큰 갱신: {user.username} (ID: {user.id})")
@@ -275,16 +269,8 @@ async def logout(
     보안 고려사항:
     - Refresh 토큰 무효화
     """
-    # Refresh 토큰 해시 확인 및 무효화
-    token_hash = hash_token(refresh_data.refresh_token)
-    db_token = db.query(RefreshToken).filter(
-        RefreshToken.user_id == current_user.id,
-        RefreshToken.token_hash == token_hash
-    ).first()
-    
-    if db_token:
-        db_token.revoked = True
-        db.commit()
+    # Refresh 토큰 무효화 (감사 로그와 함께 커밋)
+    get_refresh_token_store().revoke(db, current_user.id, refresh_data.refresh_token)
     
     # 감사 로그 기록
     ip_address = get_client_ip(request) if request else None
@@ -303,6 +289,38 @@ async def logout(
     return {"message": "로그아웃되었습니다"}
 
 
+@router.post("/logout-all")
+async def logout_all(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    request: Request = None
+) -> dict:
+    """
+    모든 기기에서 로그아웃
+    
+    보안 고려사항:
+    - 사용자의 모든 유효한 Refresh 토큰 무효화
+    - 이미 발급된 Access 토큰은 만료 시까지 유효
+    """
+    revoked = get_refresh_token_store().revoke_all(db, current_user.id)
+    
+    # 감사 로그 기록
+    ip_address = get_client_ip(request) if request else None
+    audit_log = AuditLog(
+        user_id=current_user.id,
+        action="user_logout_all",
+        resource_type="user",
+        resource_id=str(current_user.id),
+        ip_address=ip_address
+    )
+    db.add(audit_log)
+    db.commit()
+    
+    logger.info(f"전체 로그아웃: {current_user.username} (ID: {current_user.id}, 세션 {revoked}개)")
+    
+    return {"message": "모든 기기에서 로그아웃되었습니다", "revoked_sessions": revoked}
+
+
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: User = Depends(get_current_user)
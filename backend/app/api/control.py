@@ -4,9 +4,9 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models import Device, User, AuditLog
 from app.schemas.control import (
     CameraControlRequest,
@@ -22,9 +22,10 @@ from app.dependencies import (
 )
 from app.services import get_mqtt_service
 from app.utils.logger import logger
+from app.utils.log_context import bind_path_context
 
 
-router = APIRouter(prefix="/control", tags=["장비 제어"])
+router = APIRouter(prefix="/control", tags=["장비 제어"], dependencies=[Depends(bind_path_context)])
 
 
 @router.post("/devices/{device_id}/camera", response_model=ControlResponse)
@@ -33,7 +34,7 @@ async def control_camera(
     control: CameraControlRequest,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(require_operator),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     request: Request = None,
 ) -> ControlResponse:
     """
@@ -49,7 +50,7 @@ async def control_camera(
     - frame_interval: 프레임 간격 (ms, mjpeg_stills 모드일 경우)
     """
     # 장비 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
     if not device:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
@@ -110,7 +111,7 @@ async def control_camera(
         #     ip_address=ip_address
         # )
         # db.add(audit_log)
-        # db.commit()
+        # await db.commit()
 
         # 로그에 sink 정보 포함
         log_msg = f"장비 {device.device_name}의 카메라 제어: {control.action}"
@@ -142,7 +143,7 @@ async def control_microphone(
     control: MicrophoneControlRequest,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(require_operator),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     request: Request = None,
 ) -> ControlResponse:
     """
@@ -156,7 +157,7 @@ async def control_microphone(
     - ws_url: 오디오 스트림을 전송할 WebSocket 주소
     """
     # 장비 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
     if not device:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
@@ -209,7 +210,7 @@ async def control_speaker(
     control: SpeakerControlRequest,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(require_operator),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     request: Request = None,
 ) -> ControlResponse:
     """
@@ -219,7 +220,7 @@ async def control_speaker(
     액션: play (audio_url 필요), stop
     """
     # 장비 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
     if not device:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
@@ -294,7 +295,7 @@ async def control_display(
     control: DisplayControlRequest,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(require_operator),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     request: Request = None,
 ) -> ControlResponse:
     """
@@ -304,7 +305,7 @@ async def control_display(
     액션: show_text (content 필요), show_emoji (emoji_id 필요), clear
     """
     # 장비 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
     if not device:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
@@ -362,7 +363,7 @@ async def control_system(
     control: SystemControlRequest,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(require_operator),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     request: Request = None,
 ) -> ControlResponse:
     """
@@ -372,7 +373,7 @@ async def control_system(
     액션: restart (장비 재시작)
     """
     # 장비 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
     if not device:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
@@ -5,11 +5,12 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import Optional
-from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, or_, select, func
+from typing import List, Optional
+from datetime import datetime, timedelta
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models import Device, DeviceStatus, User, AuditLog
 from app.schemas.device import (
     DeviceCreate,
@@ -19,6 +20,8 @@ from app.schemas.device import (
     DeviceStatusCreate,
     DeviceStatusResponse,
     DeviceStatusListResponse,
+    DeviceStatusRangeResponse,
+    DeviceLatestStatusListResponse,
 )
 from app.dependencies import (
     get_current_active_user,
@@ -26,65 +29,124 @@ from app.dependencies import (
     require_admin,
     get_client_ip,
 )
+from app.services.count_cache import get_count_cache
+from app.services.latest_status_service import get_latest_status_service
+from app.services.status_retention_service import (
+    get_status_retention_service,
+    to_naive_utc,
+)
 from app.utils.logger import logger
+from app.utils.log_context import bind_path_context
+from app.utils.pagination import encode_cursor, decode_cursor
 
 
-router = APIRouter(prefix="/devices", tags=["장비 관리"])
+router = APIRouter(prefix="/devices", tags=["장비 관리"], dependencies=[Depends(bind_path_context)])
 
 
 @router.get("/", response_model=DeviceListResponse)
 async def list_devices(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     is_online: Optional[bool] = None,
     device_type: Optional[str] = None,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DeviceListResponse:
     """
     장비 목록 조회
 
+    - page: OFFSET 페이지네이션 (기존 방식)
+    - cursor: 이전 응답의 next_cursor 로 다음 페이지 조회 (page 무시, 깊은 페이지도 일정한 비용)
+    - total: 필터 조합별 캐시된 개수 (요청마다 COUNT 하지 않음)
+
     권한: VIEWER 이상
     """
-    # 쿼리 빌드
-    query = db.query(Device)
+    # 필터 빌드
+    filters = []
 
     if is_online is not None:
-        query = query.filter(Device.is_online == is_online)
+        filters.append(Device.is_online == is_online)
 
     if device_type:
-        query = query.filter(Device.device_type == device_type)
+        filters.append(Device.device_type == device_type)
 
-    # 총 개수
-    total = query.count()
+    # 총 개수 (캐시)
+    total = await get_count_cache().get_async(
+        db,
+        ("devices", is_online, device_type),
+        lambda session: session.query(Device).filter(*filters).count(),
+    )
 
-    # 페이지네이션
-    devices = (
-        query.order_by(desc(Device.registered_at))
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    # 정렬: registered_at DESC, id DESC (커서 비교 키)
+    query = (
+        select(Device)
+        .where(*filters)
+        .order_by(desc(Device.registered_at), desc(Device.id))
     )
 
+    if cursor:
+        try:
+            registered_at, last_id = decode_cursor(cursor, 2)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        # (registered_at, id) < 커서: 앞의 <= 조건으로 인덱스 범위 스캔 (행 생성자 비교는 MySQL 범위 최적화 불가)
+        query = query.where(
+            Device.registered_at <= registered_at,
+            or_(Device.registered_at < registered_at, Device.id < last_id),
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    devices = (await db.execute(query.limit(page_size + 1))).scalars().all()
+    next_cursor = None
+    if len(devices) > page_size:
+        devices = devices[:page_size]
+        last = devices[-1]
+        next_cursor = encode_cursor([last.registered_at, last.id])
+
     return DeviceListResponse(
-        devices=devices, total=total, page=page, page_size=page_size
+        devices=devices,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
+@router.get("/status/latest", response_model=DeviceLatestStatusListResponse)
+async def list_latest_statuses(
+    device_ids: Optional[List[int]] = Query(None),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> DeviceLatestStatusListResponse:
+    """
+    여러 장비 최신 상태 일괄 조회 (device_ids 생략 시 전체)
+
+    장비별 상태 이력 조회 없이 최신 상태 프로젝션(메모리 미러)에서 반환
+
+    권한: VIEWER 이상
+    """
+    statuses = await db.run_sync(get_latest_status_service().get_many, device_ids)
+
+    return DeviceLatestStatusListResponse(statuses=statuses, total=len(statuses))
+
+
 @router.get("/{device_id}", response_model=DeviceResponse)
 async def get_device(
     device_id: int,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DeviceResponse:
     """
     장비 상세 조회
 
     권한: VIEWER 이상
     """
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
 
     if not device:
         raise HTTPException(
@@ -160,6 +222,7 @@ async def register_device(
     db.add(new_device)
     db.commit()
     db.refresh(new_device)
+    get_count_cache().invalidate("devices")
 
     # TODO: 로그인 수정 후 감사 로그 활성화
     # ip_address = get_client_ip(request) if request else None
@@ -310,6 +373,8 @@ async def delete_device(
 
     db.delete(device)
     db.commit()
+    get_latest_status_service().forget(device_id)
+    get_count_cache().invalidate("devices")
 
     logger.info(f"관리자 {current_user.username}가 장비 {device_name} 삭제")
 
@@ -326,7 +391,7 @@ async def create_device_status(
     status_data: DeviceStatusCreate,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DeviceStatusResponse:
     """
     장비 상태 기록
@@ -334,7 +399,7 @@ async def create_device_status(
     권한: VIEWER 이상 (장비에서 호출)
     """
     # 장비 존재 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
 
     if not device:
         raise HTTPException(
@@ -359,8 +424,11 @@ async def create_device_status(
     device.last_seen_at = datetime.utcnow()
     device.is_online = True
 
-    db.commit()
-    db.refresh(new_status)
+    # 최신 상태 프로젝션 갱신 (같은 트랜잭션)
+    latest_status_service = get_latest_status_service()
+    latest = await db.run_sync(latest_status_service.upsert, new_status)
+    await db.commit()
+    latest_status_service.remember(latest)
 
     return new_status
 
@@ -370,7 +438,7 @@ async def get_device_status_history(
     device_id: int,
     limit: int = Query(10, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DeviceStatusListResponse:
     """
     장비 상태 이력 조회
@@ -378,7 +446,7 @@ async def get_device_status_history(
     권한: VIEWER 이상
     """
     # 장비 존재 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
 
     if not device:
         raise HTTPException(
@@ -387,24 +455,73 @@ async def get_device_status_history(
 
     # 상태 이력 조회 (최신순)
     statuses = (
-        db.query(DeviceStatus)
-        .filter(DeviceStatus.device_id == device_id)
-        .order_by(desc(DeviceStatus.recorded_at))
-        .limit(limit)
-        .all()
-    )
+        await db.execute(
+            select(DeviceStatus)
+            .where(DeviceStatus.device_id == device_id)
+            .order_by(desc(DeviceStatus.recorded_at))
+            .limit(limit)
+        )
+    ).scalars().all()
 
-    total = db.query(DeviceStatus).filter(DeviceStatus.device_id == device_id).count()
+    total = await db.scalar(
+        select(func.count(DeviceStatus.id)).where(DeviceStatus.device_id == device_id)
+    )
 
     return DeviceStatusListResponse(statuses=statuses, total=total)
 
 
+@router.get("/{device_id}/status/range", response_model=DeviceStatusRangeResponse)
+async def get_device_status_range(
+    device_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    resolution: str = Query("auto", pattern="^(auto|raw|1m|1h)$"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> DeviceStatusRangeResponse:
+    """
+    장비 상태 구간 조회 (min / max / avg)
+
+    resolution=auto 이면 구간 길이에 따라 원시(6시간 이하) / 1분(3일 이하) / 1시간 롤업 선택.
+    기본 구간: 최근 1시간
+
+    권한: VIEWER 이상
+    """
+    device = await db.get(Device, device_id)
+
+    if not device:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
+        )
+
+    end = to_naive_utc(end) if end else datetime.utcnow()
+    start = to_naive_utc(start) if start else end - timedelta(hours=1)
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start는 end보다 이전이어야 합니다",
+        )
+
+    retention_service = get_status_retention_service()
+    resolution, points = await db.run_sync(
+        retention_service.query_range, device_id, start, end, resolution
+    )
+
+    return DeviceStatusRangeResponse(
+        device_id=device_id,
+        resolution=resolution,
+        start=start,
+        end=end,
+        points=points,
+    )
+
+
 @router.get("/{device_id}/status/latest", response_model=DeviceStatusResponse)
 async def get_device_latest_status(
     device_id: int,
     # TODO: 로그인 수정 후 활성화
     # current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DeviceStatusResponse:
     """
     장비 최신 상태 조회
@@ -412,20 +529,15 @@ async def get_device_latest_status(
     권한: VIEWER 이상
     """
     # 장비 존재 확인
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = await db.get(Device, device_id)
 
     if not device:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="장비를 찾을 수 없습니다"
         )
 
-    # 최신 상태 조회
-    latest_status = (
-        db.query(DeviceStatus)
-        .filter(DeviceStatus.device_id == device_id)
-        .order_by(desc(DeviceStatus.recorded_at))
-        .first()
-    )
+    # 최신 상태 조회 (프로젝션)
+    latest_status = await db.run_sync(get_latest_status_service().get, device_id)
 
     if not latest_status:
         raise HTTPException(
@@ -16,8 +16,8 @@ from app.schemas import (
     UserListResponse,
 )
 from app.security import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
     validate_password_strength,
 )
 from app.dependencies import (
@@ -25,7 +25,11 @@ from app.dependencies import (
     require_admin,
     get_client_ip,
 )
+from app.services.count_cache import get_count_cache
+from app.services.auth_cache import get_auth_cache
+from app.services.refresh_token_store import get_refresh_token_store
 from app.utils.logger import logger
+from app.utils.pagination import encode_cursor, decode_cursor
 
 
 router = APIRouter(prefix="/users", tags=["사용자 관리"])
@@ -35,6 +39,7 @@ router = APIRouter(prefix="/users", tags=["사용자 관리"])
 async def list_users(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     role: Optional[UserRole] = None,
     is_active: Optional[bool] = None,
     current_user: User = Depends(require_admin),
@@ -43,6 +48,10 @@ async def list_users(
     """
     사용자 목록 조회 (관리자 전용)
     
+    - page: OFFSET 페이지네이션 (기존 방식)
+    - cursor: 이전 응답의 next_cursor 로 다음 페이지 조회 (id 순, page 무시)
+    - total: 필터 조합별 캐시된 개수
+    
     권한: ADMIN
     """
     # 쿼리 빌드
@@ -54,17 +63,38 @@ async def list_users(
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
     
-    # 총 개수
-    total = query.count()
+    # 총 개수 (캐시)
+    total = get_count_cache().get(
+        db,
+        ("users", role, is_active),
+        lambda session: query.with_session(session).count()
+    )
     
-    # 페이지네이션
-    users = query.offset((page - 1) * page_size).limit(page_size).all()
+    # 페이지네이션 (id 순)
+    query = query.order_by(User.id)
+    
+    if cursor:
+        try:
+            (last_id,) = decode_cursor(cursor, 1)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        query = query.filter(User.id > last_id)
+    else:
+        query = query.offset((page - 1) * page_size)
+    
+    # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    users = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(users) > page_size:
+        users = users[:page_size]
+        next_cursor = encode_cursor([users[-1].id])
     
     return UserListResponse(
         users=users,
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
@@ -122,17 +152,22 @@ async def create_user(
             detail=error_msg
         )
     
+    # 비밀번호 해싱 (BCrypt, 전용 스레드 풀) - 기다리는 동안 DB 연결은 풀에 반환
+    db.rollback()
+    password_hash = await get_password_hash_async(user_data.password)
+    
     # 사용자 생성
     new_user = User(
         username=user_data.username,
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         role=user_data.role
     )
     
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
+    get_count_cache().invalidate("users")
     
     # 감사 로그 기록
     ip_address = get_client_ip(request) if request else None
@@ -194,6 +229,8 @@ async def update_user(
     
     db.commit()
     db.refresh(user)
+    get_count_cache().invalidate("users")
+    get_auth_cache().invalidate_user(user.id)
     
     # 감사 로그 기록
     ip_address = get_client_ip(request) if request else None
@@ -253,12 +290,53 @@ async def delete_user(
     
     db.delete(user)
     db.commit()
+    get_count_cache().invalidate("users")
+    get_auth_cache().invalidate_user(user_id)
     
     logger.info(f"관리자 {current_user.username}가 사용자 {username} 삭제")
     
     return None
 
 
+@router.delete("/{user_id}/sessions", response_model=dict)
+async def revoke_user_sessions(
+    user_id: int,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+    request: Request = None
+):
+    """
+    사용자 강제 로그아웃 - 모든 Refresh 토큰 무효화 (관리자 전용)
+    
+    권한: ADMIN
+    """
+    user = db.query(User).filter(User.id == user_id).first()
+    
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다"
+        )
+    
+    revoked = get_refresh_token_store().revoke_all(db, user.id)
+    
+    # 감사 로그 기록
+    ip_address = get_client_ip(request) if request else None
+    audit_log = AuditLog(
+        user_id=current_user.id,
+        action="revoke_user_sessions",
+        resource_type="user",
+        resource_id=str(user.id),
+        ip_address=ip_address
+    )
+    db.add(audit_log)
+    db.commit()
+    
+    logger.info(f"관리자 {current_user.username}가 사용자 {user.username} 세션 {revoked}개 무효화")
+    
+    return {"message": "사용자의 모든 세션이 무효화되었습니다", "revoked_sessions": revoked}
+
+
 @router.put("/me/password", response_model=dict)
 async def change_own_password(
     password_data: UserPasswordChange,
@@ -271,8 +349,10 @@ async def change_own_password(
     
     보안: 기존 비밀번호 검증 → 새 비밀번호 정책 검증 → 해시 저장
     """
-    # 기존 비밀번호 확인
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    # 기존 비밀번호 확인 (BCrypt, 전용 스레드 풀) - 기다리는 동안 DB 연결은 풀에 반환
+    password_hash = current_user.password_hash
+    db.rollback()
+    if not await verify_password_async(password_data.current_password, password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다"
@@ -293,9 +373,11 @@ async def change_own_password(
             detail=error_msg
         )
     
-    # 비밀번호 업데이트
-    current_user.password_hash = get_password_hash(password_data.new_password)
+    # 비밀번호 업데이트 + 기존 세션 (Refresh 토큰) 모두 무효화
+    current_user.password_hash = await get_password_hash_async(password_data.new_password)
+    revoked = get_refresh_token_store().revoke_all(db, current_user.id)
     db.commit()
+    get_auth_cache().invalidate_user(current_user.id)
     
     # 감사 로그 기록
     ip_address = get_client_ip(request) if request else None
@@ -309,7 +391,7 @@ async def change_own_password(
     db.add(audit_log)
     db.commit()
     
-    logger.info(f"사용자 {current_user.username}가 비밀번호 변경")
+    logger.info(f"사용자 {current_user.username}가 비밀번호 변경 (세션 {revoked}개 무효화)")
     
     return {"message": "비밀번호가 성공적으로 변경되었습니다"}
 
@@ -10,7 +10,7 @@ from app.dependencies.auth import get_current_user
 from app.models import User
 from app.services import get_ws_manager
 from app.utils.logger import logger
-from app.security import decode_token
+from app.security import decode_token, get_token_user_id
 
 
 router = APIRouter(tags=["WebSocket"])
@@ -41,13 +41,13 @@ async def websocket_endpoint(
             await websocket.close(code=1008, reason="유효하지 않은 토큰입니다")
             return
         
-        user_id = payload.get("sub")
+        user_id = get_token_user_id(payload)
         if not user_id:
             await websocket.close(code=1008, reason="유효하지 않은 토큰입니다")
             return
         
-        # 연결 수락
-        await ws_manager.connect(websocket, user_id)
+        # 연결 수락 (admin / operator 는 응급 알림 채널에도 등록)
+        await ws_manager.connect(websocket, user_id, role=payload.get("role"))
         
         # 연결 성공 메시지
         await websocket.send_json({
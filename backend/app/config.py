@@ -4,7 +4,7 @@
 """
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List, Literal
 
 
 class Settings(BaseSettings):
@@ -29,6 +29,18 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    AUTH_TOKEN_CACHE_SIZE: int = 10000          # 검증된 access 토큰 → claims LRU 최대 개수 (0: 비활성)
+    AUTH_PRINCIPAL_CACHE_SECONDS: float = 10.0  # 인증 사용자 캐시 유효 기간 (0: 비활성, 다중 워커 간 최대 지연)
+    PASSWORD_BCRYPT_ROUNDS: int = 12            # 변경 시 기존 해시는 다음 로그인에서 새 rounds 로 재해싱
+    PASSWORD_HASH_WORKERS: int = 2              # bcrypt 전용 스레드 수 (이벤트 루프 밖에서 실행)
+    PASSWORD_HASH_MAX_PENDING: int = 16         # 대기 + 실행 중 최대 작업 수 (초과 시 503 + Retry-After)
+
+    # Refresh 토큰 저장소
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600   # 만료 / 무효화된 토큰 정리 주기 (0: 비활성)
+    REFRESH_TOKEN_PURGE_CHUNK_SIZE: int = 1000         # 한 번에 삭제할 최대 행 수 (잠금 시간 제한)
+    REFRESH_TOKEN_REVOKED_RETENTION_HOURS: int = 24    # 무효화된 토큰 보관 기간 (재사용 확인용)
+    REFRESH_TOKEN_BLOOM_ENABLED: bool = False          # 무효화 토큰 메모리 블룸 필터
+    REFRESH_TOKEN_BLOOM_CAPACITY: int = 100000         # 블룸 필터 예상 항목 수 (오탐률 0.1% 기준 크기 계산)
 
     # Database
     DB_HOST: str = "localhost"
@@ -36,6 +48,18 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
     DB_NAME: str
+    DB_POOL_SIZE: int = 10                      # 요청 처리용 동기 풀
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 10.0               # 체크아웃 최대 대기 (초), 초과 시 오류
+    DB_POOL_RECYCLE: int = 3600                 # 연결 재생성 주기 (초)
+    # 연결 확인: always (체크아웃마다 왕복 1회) | idle (오래 놀던 연결만) | never
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "idle"
+    DB_POOL_PING_IDLE_SECONDS: int = 300        # idle 전략에서 확인할 최소 유휴 시간
+    DB_INGEST_POOL_SIZE: int = 5                # MQTT 수신 / 백그라운드 작업 전용 풀
+    DB_INGEST_MAX_OVERFLOW: int = 5
+    DB_ASYNC_DRIVER: str = "aiomysql"          # 비동기 엔진 드라이버 (get_async_db)
+    DB_ASYNC_POOL_SIZE: int = 20
+    DB_ASYNC_MAX_OVERFLOW: int = 10
 
     # MQTT
     MQTT_BROKER_HOST: str = "localhost"
@@ -47,6 +71,19 @@ class Settings(BaseSettings):
     # ASR (음성인식 서버)
     ASR_SERVER_URL: str = "http://10.10.11.17:8001"  # ASR WebSocket API 서버 URL
 
+    # Device status 보존 / 롤업
+    STATUS_ROLLUP_ENABLED: bool = True
+    STATUS_ROLLUP_INTERVAL_SECONDS: int = 60    # 롤업 + 정리 작업 주기
+    STATUS_RAW_RETENTION_HOURS: int = 48        # 원시 상태 보존 기간
+    STATUS_ROLLUP_1M_RETENTION_DAYS: int = 30   # 1분 롤업 보존 기간
+    STATUS_ROLLUP_1H_RETENTION_DAYS: int = 365  # 1시간 롤업 보존 기간
+    STATUS_PURGE_CHUNK_SIZE: int = 5000         # 한 번에 삭제할 최대 행 수 (잠금 시간 제한)
+    STATUS_PURGE_PAUSE_SECONDS: float = 0.05    # 삭제 청크 사이 대기
+    LATEST_STATUS_RESYNC_SECONDS: int = 30      # 최신 상태 메모리 미러 재동기화 주기 (다중 워커)
+
+    # 목록 API
+    LIST_COUNT_CACHE_SECONDS: int = 30          # 목록 총 개수 캐시 유효 기간 (만료 후 백그라운드 갱신)
+
     # File Upload
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
     UPLOAD_DIR: str = "./uploads"
@@ -56,6 +93,19 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FILE: str = "./logs/app.log"
+    # text: 사람이 읽는 형식 / json: 한 줄에 JSON 1개 (request_id, device_id, session_id, topic, latency_ms 필드)
+    LOG_FORMAT: Literal["text", "json"] = "text"
+    LOG_MAX_BYTES: int = 10485760  # 로그 파일 회전 크기 (10MB)
+    LOG_BACKUP_COUNT: int = 5  # 보관할 회전 파일 수
+    # 로거별 샘플링 비율 (로거=비율, 쉼표 구분) - INFO 이하만 적용, WARNING 이상은 항상 기록
+    LOG_SAMPLE_RATES: str = "app.mqtt.message=0.01"
+
+    # Tracing (발화 단위 지연 추적, ASR 서버 trace 와 traceparent 헤더로 연결)
+    TRACE_EXPORTER: Literal["off", "file", "otlp"] = "off"
+    TRACE_SERVICE_NAME: str = "backend"
+    TRACE_FILE: str = "./logs/traces.jsonl"
+    TRACE_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACE_SAMPLE_RATE: float = 1.0  # 백엔드에서 새로 시작하는 trace 샘플링 비율
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True
@@ -66,11 +116,26 @@ class Settings(BaseSettings):
         """MySQL 데이터베이스 연결 URL"""
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def async_database_url(self) -> str:
+        """MySQL 비동기 연결 URL (aiomysql)"""
+        return f"mysql+{self.DB_ASYNC_DRIVER}://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
     @property
     def cors_origins_list(self) -> List[str]:
         """CORS 허용 오리진 리스트"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def log_sample_rates(self) -> Dict[str, float]:
+        """로거별 샘플링 비율"""
+        rates = {}
+        for item in self.LOG_SAMPLE_RATES.split(","):
+            name, _, rate = item.partition("=")
+            if name.strip() and rate.strip():
+                rates[name.strip()] = float(rate)
+        return rates
+
     @property
     def allowed_audio_extensions_list(self) -> List[str]:
         """허용된 오디오 확장자 리스트"""
@@ -2,23 +2,76 @@
 데이터베이스 연결 및 세션 관리
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from app.config import settings
+from app.utils.db_pool import (
+    InstrumentedQueuePool,
+    InstrumentedAsyncAdaptedQueuePool,
+    instrument_engine,
+)
+
+# 공통 풀 옵션 (pre-ping 은 "always" 일 때만 체크아웃마다 왕복, "idle" 은 instrument_engine 에서 처리)
+_pool_options = dict(
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING == "always",
+    echo=settings.DEBUG,  # 디버그 모드에서만 SQL 로그 출력
+)
+
+
+def _instrument(engine, name: str) -> None:
+    instrument_engine(
+        engine,
+        name,
+        pre_ping=settings.DB_POOL_PRE_PING,
+        ping_idle_seconds=settings.DB_POOL_PING_IDLE_SECONDS,
+    )
+
 
-# SQLAlchemy 엔진 생성
+# SQLAlchemy 엔진 생성 (요청 처리)
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,  # 연결 검증
-    pool_recycle=3600,   # 1시간마다 연결 재생성
-    echo=settings.DEBUG  # 디버그 모드에서만 SQL 로그 출력
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    **_pool_options
 )
+_instrument(engine, "request")
 
 # 세션 팩토리
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 수신 / 백그라운드 작업 전용 엔진 (MQTT 핸들러 스레드가 요청 처리 풀을 점유하지 않도록 분리)
+ingest_engine = create_engine(
+    settings.database_url,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_INGEST_POOL_SIZE,
+    max_overflow=settings.DB_INGEST_MAX_OVERFLOW,
+    **_pool_options
+)
+_instrument(ingest_engine, "ingest")
+
+IngestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=ingest_engine)
+
+# 비동기 엔진 (aiomysql) - 쿼리 대기 중에도 이벤트 루프를 막지 않음
+async_engine = create_async_engine(
+    settings.async_database_url,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    **_pool_options
+)
+_instrument(async_engine.sync_engine, "async")
+
+# 비동기 세션 팩토리 (커밋 후 속성 재조회로 인한 암묵적 I/O 방지)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 # Base 클래스
 Base = declarative_base()
 
@@ -26,7 +79,7 @@ Base = declarative_base()
 def get_db() -> Generator[Session, None, None]:
     """
     데이터베이스 세션 의존성
-    
+
     Yields:
         Session: 데이터베이스 세션
     """
@@ -37,10 +90,22 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션 의존성
+
+    동기 서비스 코드는 `await db.run_sync(func, ...)` 로 재사용
+
+    Yields:
+        AsyncSession: 비동기 데이터베이스 세션
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db() -> None:
     """
     데이터베이스 초기화
     모든 테이블 생성
     """
     Base.metadata.create_all(bind=engine)
-
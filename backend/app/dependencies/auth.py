@@ -9,8 +9,9 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import User, UserRole
-from app.security import decode_token, verify_token_type
+from app.security import verify_token_type, get_token_user_id
 from app.schemas.auth import TokenPayload
+from app.services.auth_cache import get_auth_cache
 
 
 # Bearer 토큰 스키마
@@ -40,8 +41,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    auth_cache = get_auth_cache()
+    
+    # 서명 검증 (검증된 토큰은 exp 까지 캐시)
     token = credentials.credentials
-    payload = decode_token(token)
+    payload = auth_cache.get_claims(token)
     
     if payload is None:
         raise credentials_exception
@@ -50,12 +54,12 @@ async def get_current_user(
     if not verify_token_type(payload, "access"):
         raise credentials_exception
     
-    user_id: int = payload.get("sub")
+    user_id = get_token_user_id(payload)
     if user_id is None:
         raise credentials_exception
     
-    # 사용자 조회
-    user = db.query(User).filter(User.id == user_id).first()
+    # 사용자 조회 (짧은 TTL 캐시, 사용자 변경 시 무효화)
+    user = auth_cache.get_user(db, user_id)
     if user is None:
         raise credentials_exception
     
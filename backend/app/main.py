@@ -2,14 +2,19 @@
 FastAPI 메인 애플리케이션
 보안 가이드라인 준수
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import init_db
+from app.database import init_db, SessionLocal, async_engine
 from app.api import auth, users, devices, control, audio, websocket, asr
-from app.services import mqtt_service
+from app.services import mqtt_service, status_retention_service, latest_status_service, refresh_token_store
+from app.security import PasswordHashBusyError
+from app.utils.db_pool import get_pool_stats
+from app.utils.metrics import MetricsMiddleware, render_metrics
+from app.utils.log_context import RequestContextMiddleware
 from app.utils.logger import logger
 
 
@@ -27,6 +32,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"데이터베이스 초기화 실패: {e}")
     
+    # 장비 최신 상태 프로젝션 로드
+    try:
+        db = SessionLocal()
+        try:
+            count = latest_status_service.initialize(db)
+        finally:
+            db.close()
+        logger.info(f"장비 최신 상태 로드 완료: {count}개 장비")
+    except Exception as e:
+        logger.error(f"장비 최신 상태 로드 실패: {e}")
+    
     # MQTT 서비스 연결
     try:
         mqtt_service.connect()
@@ -44,9 +60,19 @@ async def lifespan(app: FastAPI):
         logger.error(f"MQTT 브로커 연결 실패: {e}")
         logger.warning("MQTT 없이 서버를 시작합니다. 장비 제어 기능이 제한됩니다.")
     
+    # 장비 상태 롤업 / 보존 기간 정리 작업
+    status_retention_service.start()
+    
+    # 만료 / 무효화된 Refresh 토큰 정리 (+ 재사용 확인용 블룸 필터 구성)
+    refresh_token_store.start()
+    
     yield
     
     # 종료
+    await status_retention_service.stop()
+    await refresh_token_store.stop()
+    await async_engine.dispose()
+    
     try:
         mqtt_service.disconnect()
         logger.info("MQTT 브로커 연결 해제")
@@ -73,6 +99,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 처리 시간 지표 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청별 request_id 로그 컨텍스트 + 구조화 접근 로그 (가장 바깥에서 실행되도록 마지막에 등록)
+app.add_middleware(RequestContextMiddleware)
+
+
+# bcrypt 풀 대기 한도 초과 (로그인 폭주 시 대기열 대신 빠른 거절)
+@app.exception_handler(PasswordHashBusyError)
+async def password_hash_busy_handler(request: Request, exc: PasswordHashBusyError):
+    """로그인 / 비밀번호 처리 요청이 몰려 bcrypt 대기 한도를 넘으면 503 + Retry-After"""
+    logger.warning(f"비밀번호 처리 대기 초과: {request.url.path} (retry_after={exc.retry_after}s)")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "로그인 요청이 많습니다. 잠시 후 다시 시도하세요"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -103,6 +148,24 @@ async def health_check():
     }
 
 
+@app.get("/health/db")
+async def db_pool_health():
+    """
+    DB 커넥션 풀 지표 (request / ingest / async)
+
+    풀별 size / in_use / idle / overflow, 누적 checkouts / overflow_events / timeouts /
+    invalidations / pings, 체크아웃 대기 시간 p50 / p99 / max
+    """
+    return get_pool_stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 지표 (HTTP / MQTT / WebSocket / DB / 응급 경로)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     
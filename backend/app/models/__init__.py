@@ -5,7 +5,10 @@ from app.models.user import User, UserRole
 from app.models.refresh_token import RefreshToken
 from app.models.device import Device
 from app.models.device_status import DeviceStatus, ComponentStatus
+from app.models.device_status_rollup import DeviceStatusRollup
+from app.models.device_latest_status import DeviceLatestStatus
 from app.models.audit_log import AuditLog
+from app.models.emergency_event import EmergencyEvent
 
 __all__ = [
     "User",
@@ -14,6 +17,9 @@ __all__ = [
     "Device",
     "DeviceStatus",
     "ComponentStatus",
+    "DeviceStatusRollup",
+    "DeviceLatestStatus",
     "AuditLog",
+    "EmergencyEvent",
 ]
 
@@ -1,7 +1,7 @@
 """
 장비 관련 모델
 """
-from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, Text
+from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -11,6 +11,12 @@ from app.database import Base
 class Device(Base):
     """장비 테이블"""
     __tablename__ = "devices"
+    __table_args__ = (
+        # 목록 정렬 (registered_at DESC, id DESC) + is_online / device_type 필터용 복합 인덱스
+        Index("idx_registered", "registered_at", "id"),
+        Index("idx_online_registered", "is_online", "registered_at", "id"),
+        Index("idx_type_registered", "device_type", "registered_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     device_id = Column(String(50), unique=True, nullable=False, index=True)  # MAC 주소 또는 고유 ID
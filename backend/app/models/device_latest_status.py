@@ -0,0 +1,30 @@
+"""
+장비 최신 상태 모델
+장비당 1행, 상태 수신 시 upsert (device_status 최신 행 조회 대체)
+"""
+from sqlalchemy import Column, Integer, Float, Enum, TIMESTAMP, ForeignKey
+
+from app.database import Base
+from app.models.device_status import ComponentStatus
+
+
+class DeviceLatestStatus(Base):
+    """장비 최신 상태 테이블"""
+    __tablename__ = "device_latest_status"
+    
+    device_id = Column(Integer, ForeignKey("devices.id", ondelete="CASCADE"), primary_key=True)
+    status_id = Column(Integer, nullable=False)  # 원본 device_status.id
+    
+    battery_level = Column(Integer, nullable=True)
+    memory_usage = Column(Integer, nullable=True)
+    storage_usage = Column(Integer, nullable=True)
+    temperature = Column(Float, nullable=True)
+    cpu_usage = Column(Integer, nullable=True)
+    
+    camera_status = Column(Enum(ComponentStatus), default=ComponentStatus.STOPPED, nullable=False)
+    mic_status = Column(Enum(ComponentStatus), default=ComponentStatus.STOPPED, nullable=False)
+    
+    recorded_at = Column(TIMESTAMP, nullable=False)
+    
+    def __repr__(self):
+        return f"<DeviceLatestStatus(device_id={self.device_id}, status_id={self.status_id})>"
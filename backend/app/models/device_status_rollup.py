@@ -0,0 +1,37 @@
+"""
+장비 상태 롤업 모델
+원시 device_status 를 1분 / 1시간 단위로 요약 (min / max / avg)
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, UniqueConstraint
+
+from app.database import Base
+
+
+class DeviceStatusRollup(Base):
+    """장비 상태 롤업 테이블"""
+    __tablename__ = "device_status_rollups"
+    __table_args__ = (
+        UniqueConstraint("device_id", "resolution", "bucket_start", name="uq_rollup_device_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    device_id = Column(Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False)
+    resolution = Column(String(8), nullable=False, index=True)   # "1m" / "1h"
+    bucket_start = Column(DateTime, nullable=False, index=True)  # 구간 시작 (UTC)
+    sample_count = Column(Integer, nullable=False, default=0)
+
+    battery_min = Column(Integer, nullable=True)
+    battery_max = Column(Integer, nullable=True)
+    battery_avg = Column(Float, nullable=True)
+    temperature_min = Column(Float, nullable=True)
+    temperature_max = Column(Float, nullable=True)
+    temperature_avg = Column(Float, nullable=True)
+    cpu_min = Column(Integer, nullable=True)
+    cpu_max = Column(Integer, nullable=True)
+    cpu_avg = Column(Float, nullable=True)
+    memory_min = Column(Integer, nullable=True)
+    memory_max = Column(Integer, nullable=True)
+    memory_avg = Column(Float, nullable=True)
+
+    def __repr__(self):
+        return f"<DeviceStatusRollup(device_id={self.device_id}, {self.resolution}, {self.bucket_start})>"
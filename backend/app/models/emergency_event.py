@@ -0,0 +1,30 @@
+"""
+응급 이벤트 모델
+응급 음성인식 결과는 브로드캐스트와 함께 즉시 저장
+"""
+from sqlalchemy import Column, Integer, String, Text, Float, TIMESTAMP, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class EmergencyEvent(Base):
+    """응급 이벤트 테이블"""
+    __tablename__ = "emergency_events"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    device_id = Column(Integer, ForeignKey("devices.id", ondelete="CASCADE"), nullable=False, index=True)
+    session_id = Column(String(100), nullable=True)
+    
+    text = Column(Text, nullable=False)
+    keywords = Column(Text, nullable=True)          # JSON 배열 문자열
+    segment_end = Column(Float, nullable=True)      # 음성 구간 종료 시각 (epoch 초, ASR 서버 기준)
+    
+    created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False, index=True)
+    
+    # Relationships
+    device = relationship("Device")
+    
+    def __repr__(self):
+        return f"<EmergencyEvent(id={self.id}, device_id={self.device_id}, text='{self.text[:20]}')>"
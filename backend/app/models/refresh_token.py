@@ -2,7 +2,7 @@
 리프레시 토큰 모델
 보안 가이드라인 1-2 준수: 토큰은 해시로 저장
 """
-from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -12,6 +12,10 @@ from app.database import Base
 class RefreshToken(Base):
     """리프레시 토큰 테이블"""
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # 사용자별 유효 세션 조회 / 일괄 무효화 (user_id, revoked=False, expires_at > now)
+        Index("idx_user_revoked_expires", "user_id", "revoked", "expires_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -19,6 +23,7 @@ class RefreshToken(Base):
     expires_at = Column(TIMESTAMP, nullable=False, index=True)
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
     revoked = Column(Boolean, default=False, nullable=False)
+    revoked_at = Column(TIMESTAMP, nullable=True, index=True)  # 무효화 시각 (보관 기간 정리 기준)
     
     # Relationships
     user = relationship("User", back_populates="refresh_tokens")
@@ -2,7 +2,7 @@
 사용자 모델
 보안 가이드라인 1-1 준수: 비밀번호는 BCrypt 해시로 저장
 """
-from sqlalchemy import Column, Integer, String, Boolean, Enum, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Boolean, Enum, TIMESTAMP, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -20,6 +20,11 @@ class UserRole(str, enum.Enum):
 class User(Base):
     """사용자 테이블"""
     __tablename__ = "users"
+    __table_args__ = (
+        # 목록 필터 (role / is_active) + id 순 커서 페이지네이션
+        Index("idx_role_id", "role", "id"),
+        Index("idx_active_id", "is_active", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
@@ -5,7 +5,7 @@ ASR (Automatic Speech Recognition) 스키마
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Union
 from datetime import datetime
 
 
@@ -153,14 +153,15 @@ class RecognitionResult(BaseModel):
     WebSocket으로 전달되는 실시간 인식 결과
     """
     type: str = Field(default="recognition_result", description="메시지 타입")
-    device_id: int = Field(..., description="장비 ID")
-    device_name: str = Field(..., description="장비 이름")
+    device_id: Union[int, str] = Field(..., description="장비 ID (DB PK 또는 장비 고유 ID)")
+    device_name: Optional[str] = Field(default=None, description="장비 이름 (없으면 DB 값 사용)")
     session_id: str = Field(..., description="세션 ID")
     text: str = Field(..., description="인식된 텍스트")
     timestamp: str = Field(..., description="인식 시각")
     duration: float = Field(..., description="음성 길이 (초)")
     is_emergency: bool = Field(default=False, description="응급 상황 여부")
     emergency_keywords: list[str] = Field(default_factory=list, description="감지된 응급 키워드")
+    segment_end: Optional[float] = Field(default=None, description="음성 구간 종료 시각 (epoch 초, 지연 측정용)")
     
     class Config:
         json_schema_extra = {
@@ -68,9 +68,10 @@ class DeviceResponse(DeviceBase):
 class DeviceListResponse(BaseModel):
     """장비 목록 응답 스키마"""
     devices: list[DeviceResponse]
-    total: int
+    total: int  # 캐시된 값 (최대 LIST_COUNT_CACHE_SECONDS 지연)
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 class DeviceStatusCreate(BaseModel):
@@ -98,3 +99,36 @@ class DeviceStatusListResponse(BaseModel):
     statuses: list[DeviceStatusResponse]
     total: int
 
+
+
+class DeviceLatestStatusListResponse(BaseModel):
+    """장비 최신 상태 일괄 조회 응답 스키마"""
+    statuses: list[DeviceStatusResponse]
+    total: int
+
+
+class DeviceStatusPoint(BaseModel):
+    """장비 상태 구간 조회 포인트 (원시 데이터는 min = max = avg)"""
+    timestamp: datetime
+    sample_count: int
+    battery_min: Optional[int] = None
+    battery_max: Optional[int] = None
+    battery_avg: Optional[float] = None
+    temperature_min: Optional[float] = None
+    temperature_max: Optional[float] = None
+    temperature_avg: Optional[float] = None
+    cpu_min: Optional[int] = None
+    cpu_max: Optional[int] = None
+    cpu_avg: Optional[float] = None
+    memory_min: Optional[int] = None
+    memory_max: Optional[int] = None
+    memory_avg: Optional[float] = None
+
+
+class DeviceStatusRangeResponse(BaseModel):
+    """장비 상태 구간 조회 응답 스키마"""
+    device_id: int
+    resolution: str  # raw / 1m / 1h
+    start: datetime
+    end: datetime
+    points: list[DeviceStatusPoint]
@@ -49,7 +49,8 @@ class UserResponse(UserBase):
 class UserListResponse(BaseModel):
     """사용자 목록 응답 스키마"""
     users: list[UserResponse]
-    total: int
+    total: int  # 캐시된 값 (최대 LIST_COUNT_CACHE_SECONDS 지연)
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
@@ -5,6 +5,11 @@ from app.security.password import (
     verify_password,
     get_password_hash,
     validate_password_strength,
+    verify_password_async,
+    get_password_hash_async,
+    verify_and_update_password_async,
+    get_password_hash_pool,
+    PasswordHashBusyError,
 )
 from app.security.jwt import (
     create_access_token,
@@ -12,16 +17,23 @@ from app.security.jwt import (
     decode_token,
     hash_token,
     verify_token_type,
+    get_token_user_id,
 )
 
 __all__ = [
     "verify_password",
     "get_password_hash",
     "validate_password_strength",
+    "verify_password_async",
+    "get_password_hash_async",
+    "verify_and_update_password_async",
+    "get_password_hash_pool",
+    "PasswordHashBusyError",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
     "hash_token",
     "verify_token_type",
+    "get_token_user_id",
 ]
 
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 import hashlib
+import secrets
 
 from app.config import settings
 
@@ -55,7 +56,9 @@ def create_refresh_token(data: dict) -> str:
     to_encode.update({
         "exp": expire,
         "iat": datetime.utcnow(),
-        "type": "refresh"
+        "type": "refresh",
+        # 같은 초에 발급해도 토큰 (해시) 이 겹치지 않도록 (교체된 토큰 재사용 방지)
+        "jti": secrets.token_hex(16)
     })
     
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -106,3 +109,21 @@ def verify_token_type(payload: Dict[str, Any], expected_type: str) -> bool:
     """
     return payload.get("type") == expected_type
 
+
+def get_token_user_id(payload: Dict[str, Any]) -> Optional[int]:
+    """
+    토큰 subject (sub) 에서 사용자 ID 추출
+
+    JWT 표준상 sub 는 문자열이어야 하므로 발급 시 str(user.id) 로 넣고 여기서 int 로 되돌립니다.
+    
+    Args:
+        payload: 디코딩된 토큰 페이로드
+    
+    Returns:
+        Optional[int]: 사용자 ID 또는 None (sub 없음 / 숫자 아님)
+    """
+    try:
+        return int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
@@ -1,11 +1,26 @@
 """
 비밀번호 보안 처리
 보안 가이드라인 1-1 준수: BCrypt 해싱
+
+bcrypt (rounds=12) 는 1건에 수백 ms 의 CPU 를 쓰므로 async 엔드포인트에서는
+*_async 함수로 전용 스레드 풀에서 실행합니다 (bcrypt 는 해싱 중 GIL 을 놓아 이벤트 루프가 계속 동작).
 """
+import math
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
 
-# BCrypt 컨텍스트 (rounds=12로 설정)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+from app.config import settings
+from app.utils.metrics import PASSWORD_HASH_SECONDS, PASSWORD_HASH_PENDING, PASSWORD_HASH_REJECTED
+
+# BCrypt 컨텍스트 (기본 rounds=12, 다른 rounds 의 기존 해시는 needs_update 대상)
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -35,6 +50,122 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 + 재해싱 필요 여부 확인
+    
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해시된 비밀번호
+    
+    Returns:
+        Tuple[bool, Optional[str]]: (일치 여부, 새 해시) - 저장된 해시의 rounds 가
+        PASSWORD_BCRYPT_ROUNDS 와 다르면 새 해시, 아니면 None
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+class PasswordHashBusyError(Exception):
+    """bcrypt 대기 작업이 한도를 넘음 (503 + Retry-After 로 응답)"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"비밀번호 처리 대기 초과 (retry_after={retry_after}s)")
+        self.retry_after = retry_after
+
+
+class PasswordHashPool:
+    """
+    bcrypt 전용 스레드 풀
+
+    - 이벤트 루프 밖에서 실행해 로그인이 몰려도 WebSocket / MQTT 처리가 멈추지 않음
+    - 대기 + 실행 중 작업이 max_pending 을 넘으면 바로 거절 (대기열이 끝없이 늘지 않도록)
+      Retry-After 는 현재 대기 작업 수와 최근 작업 시간으로 계산
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16):
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        self._pending = 0
+        # 최근 작업 시간 (지수 이동 평균, 초)
+        self._avg_seconds = 0.25
+        self._stats = {"completed": 0, "rejected": 0}
+
+    def _timed(self, op: str, fn, args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            PASSWORD_HASH_SECONDS.labels(op).observe(elapsed)
+            with self.lock:
+                self._avg_seconds = self._avg_seconds * 0.8 + elapsed * 0.2
+                self._stats["completed"] += 1
+
+    async def run(self, op: str, fn, *args):
+        """
+        bcrypt 작업 실행 (풀 스레드에서)
+
+        Raises:
+            PasswordHashBusyError: 대기 작업이 max_pending 이상
+        """
+        with self.lock:
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                retry_after = max(1, math.ceil(self._pending * self._avg_seconds / self.workers))
+                PASSWORD_HASH_REJECTED.inc()
+                raise PasswordHashBusyError(retry_after)
+            self._pending += 1
+        PASSWORD_HASH_PENDING.inc()
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._timed, op, fn, args)
+        finally:
+            with self.lock:
+                self._pending -= 1
+            PASSWORD_HASH_PENDING.dec()
+
+    def stats(self) -> dict:
+        """대기 작업 수 / 최근 작업 시간 / 누적 완료·거절 수"""
+        with self.lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "avg_ms": round(self._avg_seconds * 1000, 1),
+                **self._stats,
+            }
+
+
+# 전역 bcrypt 풀 인스턴스
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """bcrypt 풀 인스턴스 가져오기"""
+    return password_hash_pool
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password 를 bcrypt 풀에서 실행"""
+    return await password_hash_pool.run("verify", verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash 를 bcrypt 풀에서 실행"""
+    return await password_hash_pool.run("hash", get_password_hash, password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password 를 bcrypt 풀에서 실행"""
+    return await password_hash_pool.run("verify", verify_and_update_password, plain_password, hashed_password)
+
+
 def validate_password_strength(password: str) -> tuple[bool, str]:
     """
     비밀번호 강도 검증
@@ -6,6 +6,24 @@ from app.services.websocket_service import ws_manager, get_ws_manager, WebSocket
 from app.services.audio_service import audio_service, get_audio_service, AudioService
 from app.services.mqtt_handlers import handle_device_status, handle_device_response
 from app.services.asr_service import asr_service, ASRService
+from app.services.emergency_service import emergency_service, get_emergency_service, EmergencyService
+from app.services.status_retention_service import (
+    status_retention_service,
+    get_status_retention_service,
+    StatusRetentionService,
+)
+from app.services.count_cache import count_cache, get_count_cache, CountCache
+from app.services.auth_cache import auth_cache, get_auth_cache, AuthCache
+from app.services.latest_status_service import (
+    latest_status_service,
+    get_latest_status_service,
+    LatestStatusService,
+)
+from app.services.refresh_token_store import (
+    refresh_token_store,
+    get_refresh_token_store,
+    RefreshTokenStore,
+)
 
 __all__ = [
     "mqtt_service",
@@ -21,5 +39,23 @@ __all__ = [
     "handle_device_response",
     "asr_service",
     "ASRService",
+    "emergency_service",
+    "get_emergency_service",
+    "EmergencyService",
+    "status_retention_service",
+    "get_status_retention_service",
+    "StatusRetentionService",
+    "count_cache",
+    "get_count_cache",
+    "CountCache",
+    "auth_cache",
+    "get_auth_cache",
+    "AuthCache",
+    "latest_status_service",
+    "get_latest_status_service",
+    "LatestStatusService",
+    "refresh_token_store",
+    "get_refresh_token_store",
+    "RefreshTokenStore",
 ]
 
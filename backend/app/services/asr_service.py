@@ -128,7 +128,7 @@ class ASRService:
             result = await self._request("POST", "/asr/session/start", json=payload)
             
             logger.info(f"✅ ASR 세션 생성 완료: {result['session_id']}")
-            logger.debug(f"   WebSocket URL: {result['ws_url']}")
+            logger.debug("   WebSocket URL: %s", result['ws_url'])
             
             return result
         
@@ -163,12 +163,12 @@ class ASRService:
             >>> status = await asr_service.get_session_status("uuid-xxxx")
             >>> print(f"Active: {status['is_active']}")
         """
-        logger.debug(f"ASR 세션 상태 조회: {session_id}")
+        logger.debug("ASR 세션 상태 조회: %s", session_id)
         
         try:
             result = await self._request("GET", f"/asr/session/{session_id}/status")
             
-            logger.debug(f"세션 상태: active={result['is_active']}, processing={result['is_processing']}")
+            logger.debug("세션 상태: active=%s, processing=%s", result['is_active'], result['is_processing'])
             
             return result
         
@@ -244,7 +244,7 @@ class ASRService:
         try:
             result = await self._request("GET", "/asr/sessions")
             
-            logger.debug(f"활성 세션: {result['total']}개")
+            logger.debug("활성 세션: %s개", result['total'])
             
             return result
         
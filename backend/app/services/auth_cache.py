@@ -0,0 +1,169 @@
+"""
+인증 캐시
+get_current_user 가 요청마다 JWT 서명 검증 + User 조회를 반복하지 않도록
+
+- 토큰 캐시: 검증된 access 토큰 → claims (LRU, 키는 토큰 SHA-256 해시, 토큰 exp 까지만 유효)
+- 사용자 캐시: user_id → User 스냅샷 (짧은 TTL, 사용자 수정 / 삭제 / 역할 변경 / 비밀번호 변경 시 무효화)
+
+무효화는 프로세스 안에서만 전파되므로 다중 워커에서는 다른 워커의 변경이
+최대 AUTH_PRINCIPAL_CACHE_SECONDS 만큼 늦게 반영됩니다.
+"""
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.models import User
+from app.security import decode_token, hash_token
+from app.utils.metrics import AUTH_CACHE_REQUESTS
+
+_TOKEN_HIT = AUTH_CACHE_REQUESTS.labels("token", "hit")
+_TOKEN_MISS = AUTH_CACHE_REQUESTS.labels("token", "miss")
+_PRINCIPAL_HIT = AUTH_CACHE_REQUESTS.labels("principal", "hit")
+_PRINCIPAL_MISS = AUTH_CACHE_REQUESTS.labels("principal", "miss")
+
+
+def _snapshot(user: User) -> User:
+    """세션과 무관한 User 복사본 (컬럼 값만, 커밋 후 만료 / 세션 종료 영향 없음)"""
+    snapshot = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+class AuthCache:
+    """
+    access 토큰 claims LRU + 사용자 스냅샷 TTL 캐시
+
+    검증 실패한 토큰은 캐시하지 않습니다 (임의 토큰으로 캐시를 채우지 못하도록).
+    """
+
+    def __init__(self, token_cache_size: int = 10000, principal_ttl_seconds: float = 10.0):
+        self.token_cache_size = token_cache_size
+        self.principal_ttl_seconds = principal_ttl_seconds
+        self.lock = threading.Lock()
+        self._tokens: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._principals: Dict[int, Tuple[User, float]] = {}
+        # 무효화 세대 (조회 중 무효화된 사용자를 다시 캐시하지 않도록)
+        self._generation = 0
+        self._stats = {"token_hit": 0, "token_miss": 0, "principal_hit": 0, "principal_miss": 0}
+
+    def get_claims(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        access 토큰 검증 (캐시 적중 시 서명 검증 생략)
+
+        Args:
+            token: JWT 문자열
+
+        Returns:
+            Optional[Dict]: 검증된 claims (읽기 전용으로 사용) 또는 None
+        """
+        if self.token_cache_size <= 0:
+            return decode_token(token)
+
+        key = hash_token(token)
+        now = time.time()
+        with self.lock:
+            entry = self._tokens.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._tokens.move_to_end(key)
+                    self._stats["token_hit"] += 1
+                    _TOKEN_HIT.inc()
+                    return entry[0]
+                del self._tokens[key]
+            self._stats["token_miss"] += 1
+        _TOKEN_MISS.inc()
+
+        payload = decode_token(token)
+        if payload is None:
+            return None
+
+        expires_at = payload.get("exp")
+        if isinstance(expires_at, (int, float)) and expires_at > now:
+            with self.lock:
+                self._tokens[key] = (payload, float(expires_at))
+                self._tokens.move_to_end(key)
+                while len(self._tokens) > self.token_cache_size:
+                    self._tokens.popitem(last=False)
+        return payload
+
+    def get_user(self, db: Session, user_id: int) -> Optional[User]:
+        """
+        인증 사용자 조회 (캐시 적중 시 DB 조회 생략)
+
+        적중하면 스냅샷을 요청 세션에 merge(load=False) 로 붙여 반환하므로
+        엔드포인트에서 수정 후 commit 하면 평소처럼 UPDATE 됩니다.
+
+        Args:
+            db: 요청 DB 세션
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[User]: 요청 세션에 연결된 사용자 또는 None
+        """
+        if self.principal_ttl_seconds <= 0:
+            return db.query(User).filter(User.id == user_id).first()
+
+        now = time.time()
+        with self.lock:
+            entry = self._principals.get(user_id)
+            if entry is not None and now - entry[1] <= self.principal_ttl_seconds:
+                self._stats["principal_hit"] += 1
+                snapshot = entry[0]
+            else:
+                self._stats["principal_miss"] += 1
+                snapshot = None
+            generation = self._generation
+
+        if snapshot is not None:
+            _PRINCIPAL_HIT.inc()
+            return db.merge(snapshot, load=False)
+
+        _PRINCIPAL_MISS.inc()
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None:
+            snapshot = _snapshot(user)
+            with self.lock:
+                if generation == self._generation:
+                    self._principals[user_id] = (snapshot, now)
+        return user
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자 수정 / 삭제 / 역할·비밀번호 변경 후 호출 (다음 요청에서 다시 조회)"""
+        with self.lock:
+            self._generation += 1
+            self._principals.pop(user_id, None)
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self.lock:
+            self._generation += 1
+            self._tokens.clear()
+            self._principals.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 크기 / 적중률"""
+        with self.lock:
+            stats = dict(self._stats)
+            stats["tokens"] = len(self._tokens)
+            stats["principals"] = len(self._principals)
+        for cache in ("token", "principal"):
+            total = stats[f"{cache}_hit"] + stats[f"{cache}_miss"]
+            stats[f"{cache}_hit_rate"] = round(stats[f"{cache}_hit"] / total, 4) if total else 0.0
+        return stats
+
+
+# 전역 인증 캐시 인스턴스
+auth_cache = AuthCache(
+    token_cache_size=settings.AUTH_TOKEN_CACHE_SIZE,
+    principal_ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_SECONDS,
+)
+
+
+def get_auth_cache() -> AuthCache:
+    """인증 캐시 인스턴스 가져오기"""
+    return auth_cache
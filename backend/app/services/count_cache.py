@@ -0,0 +1,140 @@
+"""
+목록 총 개수 캐시
+목록 API 가 요청마다 COUNT(*) 를 실행하지 않도록 필터 조합별 개수를 캐시하고 백그라운드에서 갱신
+"""
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.utils.logger import logger
+
+
+class CountCache:
+    """
+    stale-while-revalidate 개수 캐시
+
+    - 유효 기간 안: 캐시 값 반환
+    - 만료: 이전 값을 바로 반환하고 백그라운드 스레드에서 다시 계산
+    - 캐시 없음 / invalidate() 직후: 요청 안에서 1번 계산
+    - 테이블별 세대 번호: 계산 도중 invalidate() 되면 그 결과는 버림 (무효화 전 값이 되살아나지 않도록)
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[int, float]] = {}
+        self._refreshing = set()
+        self._generations: Dict[str, int] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="count-cache")
+        self._tasks = set()
+
+    def _store(self, key: Hashable, count: int, generation: int) -> None:
+        """계산 시작 후 테이블이 무효화되지 않았을 때만 저장 (lock 보유 상태에서 호출)"""
+        if self._generations.get(key[0], 0) == generation:
+            self._entries[key] = (count, time.time())
+
+    def _refresh(self, key: Hashable, counter: Callable[[Session], int], bind, generation: int) -> None:
+        db = Session(bind=bind)
+        try:
+            count = counter(db)
+            with self.lock:
+                self._store(key, count, generation)
+        except Exception as e:
+            logger.warning(f"목록 개수 갱신 실패 {key}: {e}")
+        finally:
+            db.close()
+            with self.lock:
+                self._refreshing.discard(key)
+
+    async def _refresh_async(self, key: Hashable, counter: Callable[[Session], int], bind, generation: int) -> None:
+        try:
+            async with AsyncSession(bind=bind) as db:
+                count = await db.run_sync(counter)
+            with self.lock:
+                self._store(key, count, generation)
+        except Exception as e:
+            logger.warning(f"목록 개수 갱신 실패 {key}: {e}")
+        finally:
+            with self.lock:
+                self._refreshing.discard(key)
+
+    def _cached(self, key: Hashable):
+        """(캐시 값 또는 None, 백그라운드 갱신 필요 여부, 테이블 세대 번호) - lock 보유 상태에서 호출"""
+        generation = self._generations.get(key[0], 0)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False, generation
+        count, computed_at = entry
+        stale = time.time() - computed_at > self.ttl_seconds and key not in self._refreshing
+        if stale:
+            self._refreshing.add(key)
+        return count, stale, generation
+
+    def get(self, db: Session, key: Hashable, counter: Callable[[Session], int]) -> int:
+        """
+        캐시된 개수 조회
+
+        Args:
+            db: 요청 DB 세션 (캐시 없을 때 사용, 백그라운드 갱신은 같은 엔진의 새 세션)
+            key: 캐시 키 (테이블 + 필터 조합)
+            counter: 세션을 받아 개수를 계산하는 함수
+
+        Returns:
+            int: 총 개수 (만료된 경우 이전 값)
+        """
+        with self.lock:
+            count, stale, generation = self._cached(key)
+        if count is not None:
+            if stale:
+                self._executor.submit(self._refresh, key, counter, db.get_bind(), generation)
+            return count
+
+        count = counter(db)
+        with self.lock:
+            self._store(key, count, generation)
+        return count
+
+    async def get_async(self, db: AsyncSession, key: Hashable, counter: Callable[[Session], int]) -> int:
+        """
+        get() 의 비동기 세션 버전 (만료 시 이벤트 루프 태스크로 갱신)
+
+        Args:
+            db: 요청 비동기 세션
+            key: 캐시 키
+            counter: 동기 세션을 받아 개수를 계산하는 함수 (run_sync 로 실행)
+        """
+        with self.lock:
+            count, stale, generation = self._cached(key)
+        if count is not None:
+            if stale:
+                task = asyncio.create_task(self._refresh_async(key, counter, db.bind, generation))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return count
+
+        count = await db.run_sync(counter)
+        with self.lock:
+            self._store(key, count, generation)
+        return count
+
+    def invalidate(self, table: str) -> None:
+        """행 추가 / 삭제 후 해당 테이블 캐시 제거 (다음 조회에서 다시 계산, 진행 중인 계산 결과는 버림)"""
+        with self.lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            for key in [key for key in self._entries if key[0] == table]:
+                del self._entries[key]
+
+
+# 전역 개수 캐시 인스턴스
+count_cache = CountCache(ttl_seconds=settings.LIST_COUNT_CACHE_SECONDS)
+
+
+def get_count_cache() -> CountCache:
+    """개수 캐시 인스턴스 가져오기"""
+    return count_cache
@@ -0,0 +1,124 @@
+"""
+응급 상황 우선 전달 서비스
+응급 음성인식 결과는 일반 결과와 분리된 경로로 즉시 전달
+"""
+import json
+import time
+import asyncio
+from typing import Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.emergency_event import EmergencyEvent
+from app.services.websocket_service import ws_manager
+from app.utils.latency import LatencyTracker
+from app.utils.logger import logger
+from app.utils.metrics import EMERGENCY_DELIVERY_SECONDS
+
+
+class EmergencyService:
+    """
+    응급 결과 우선 경로
+
+    1. 운영자 전체 + 장비 구독자에게 즉시 WebSocket 전송 (구독 여부와 무관)
+    2. 동시에 DB 저장 (응답 전에 커밋 완료)
+    3. 음성 구간 종료 → 대시보드 전송 완료까지 지연 시간 측정
+    """
+
+    def __init__(self, history: int = 1000):
+        # segment_end (ASR 서버 시각) → 백엔드 수신
+        self.ingest_latency = LatencyTracker(history)
+        # segment_end → 운영자 소켓 전송 완료
+        self.delivery_latency = LatencyTracker(history)
+        # 백엔드 수신 → 운영자 소켓 전송 완료 (서버 간 시계 차이 영향 없음)
+        self.fanout_latency = LatencyTracker(history)
+
+    async def _persist(
+        self,
+        db: AsyncSession,
+        device_id: int,
+        session_id: Optional[str],
+        text: str,
+        keywords: List[str],
+        segment_end: Optional[float],
+    ) -> int:
+        event = EmergencyEvent(
+            device_id=device_id,
+            session_id=session_id,
+            text=text,
+            keywords=json.dumps(keywords, ensure_ascii=False),
+            segment_end=segment_end,
+        )
+        db.add(event)
+        await db.commit()
+        return event.id
+
+    async def dispatch(self, db: AsyncSession, device_id: int, message: dict) -> Dict:
+        """
+        응급 결과 전달 + 저장
+
+        Args:
+            db: 비동기 데이터베이스 세션
+            device_id: 장비 ID (DB PK)
+            message: 브로드캐스트할 asr_result 메시지
+
+        Returns:
+            Dict: event_id, delivered_count, 지연 시간 (ms)
+        """
+        received_at = time.time()
+        segment_end = message.get("segment_end")
+        message = dict(message, priority="emergency", received_at=received_at)
+
+        delivered, event_id = await asyncio.gather(
+            ws_manager.broadcast_emergency(device_id, message),
+            self._persist(
+                db,
+                device_id,
+                message.get("session_id"),
+                message.get("text", ""),
+                message.get("emergency_keywords") or [],
+                segment_end,
+            ),
+        )
+        delivered_at = time.time()
+
+        fanout_ms = (delivered_at - received_at) * 1000
+        self.fanout_latency.record(fanout_ms)
+        EMERGENCY_DELIVERY_SECONDS.labels("fanout").observe(fanout_ms / 1000)
+        result = {
+            "event_id": event_id,
+            "delivered_count": delivered,
+            "fanout_ms": round(fanout_ms, 2),
+        }
+
+        if segment_end:
+            self.ingest_latency.record((received_at - segment_end) * 1000)
+            end_to_end_ms = (delivered_at - segment_end) * 1000
+            self.delivery_latency.record(end_to_end_ms)
+            EMERGENCY_DELIVERY_SECONDS.labels("ingest").observe(received_at - segment_end)
+            EMERGENCY_DELIVERY_SECONDS.labels("end_to_end").observe(end_to_end_ms / 1000)
+            result["end_to_end_ms"] = round(end_to_end_ms, 2)
+
+        logger.warning(
+            f"🚨 응급 알림 전달: device_id={device_id}, event_id={event_id}, "
+            f"{delivered}개 연결, {fanout_ms:.1f}ms"
+        )
+        return result
+
+    def stats(self) -> Dict:
+        """응급 경로 지연 시간 p50 / p99"""
+        return {
+            "ingest": self.ingest_latency.summary(),
+            "end_to_end": self.delivery_latency.summary(),
+            "fanout": self.fanout_latency.summary(),
+            "operator_connections": len(ws_manager.operator_connections),
+        }
+
+
+# 전역 응급 서비스 인스턴스
+emergency_service = EmergencyService()
+
+
+def get_emergency_service() -> EmergencyService:
+    """응급 서비스 인스턴스 가져오기"""
+    return emergency_service
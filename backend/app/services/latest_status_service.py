@@ -0,0 +1,200 @@
+"""
+장비 최신 상태 프로젝션
+상태 수신 경로에서 device_latest_status (장비당 1행)를 upsert 하고 메모리에 미러링
+대시보드는 장비마다 ORDER BY recorded_at DESC LIMIT 1 을 실행하지 않고 한 번에 조회
+"""
+import time
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import DeviceStatus, DeviceLatestStatus, ComponentStatus
+from app.utils.logger import logger
+
+
+_FIELDS = [
+    "battery_level",
+    "memory_usage",
+    "storage_usage",
+    "temperature",
+    "cpu_usage",
+    "camera_status",
+    "mic_status",
+    "recorded_at",
+]
+
+
+def _snapshot(device_id: int, status_id: int, source) -> Dict:
+    """DeviceStatus / DeviceLatestStatus → 응답 형식 dict (DeviceStatusResponse 호환)"""
+    snapshot = {"id": status_id, "device_id": device_id}
+    for field in _FIELDS:
+        snapshot[field] = getattr(source, field)
+    for field in ("camera_status", "mic_status"):
+        if snapshot[field] is not None:
+            snapshot[field] = ComponentStatus(snapshot[field])
+    return snapshot
+
+
+class LatestStatusService:
+    """
+    장비 최신 상태 프로젝션 (DB 테이블 + 메모리 미러)
+
+    - upsert(): 상태 기록과 같은 트랜잭션에서 프로젝션 갱신
+    - remember(): 커밋 후 메모리 미러 갱신
+    - 다른 워커가 기록한 상태는 LATEST_STATUS_RESYNC_SECONDS 마다 테이블에서 다시 읽음
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._cache: Dict[int, Dict] = {}
+        self._synced_at: float = 0.0
+
+    def _upsert_statement(self, db: Session, values: Dict):
+        """
+        dialect 별 upsert 문 (기존 행보다 status_id 가 클 때만 갱신)
+
+        MQTT / HTTP 경로의 기록이 섞여 커밋되어도 더 오래된 상태가 최신 상태를 덮어쓰지 않도록 합니다.
+        """
+        table = DeviceLatestStatus.__table__
+        columns = [key for key in values if key not in ("device_id", "status_id")]
+        dialect = db.bind.dialect.name
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            stmt = mysql_insert(DeviceLatestStatus).values(**values)
+            newer = stmt.inserted.status_id > table.c.status_id
+            # MySQL 은 SET 을 왼쪽부터 적용하므로 비교 기준인 status_id 는 마지막에 갱신
+            return stmt.on_duplicate_key_update(
+                [(key, func.if_(newer, stmt.inserted[key], table.c[key])) for key in columns]
+                + [("status_id", func.if_(newer, stmt.inserted.status_id, table.c.status_id))]
+            )
+        if dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+            stmt = dialect_insert(DeviceLatestStatus).values(**values)
+            return stmt.on_conflict_do_update(
+                index_elements=["device_id"],
+                set_={key: stmt.excluded[key] for key in columns + ["status_id"]},
+                where=table.c.status_id < stmt.excluded.status_id,
+            )
+        return None
+
+    def upsert(self, db: Session, status: DeviceStatus) -> Dict:
+        """
+        새 상태 행으로 프로젝션 갱신 (커밋은 호출자가 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            status: 방금 add() 한 DeviceStatus
+
+        Returns:
+            Dict: 커밋 후 remember() 에 넘길 최신 상태
+        """
+        db.flush()  # status.id / recorded_at (server_default) 확정
+        snapshot = _snapshot(status.device_id, status.id, status)
+
+        values = {key: snapshot[key] for key in _FIELDS}
+        values["device_id"] = status.device_id
+        values["status_id"] = status.id
+
+        stmt = self._upsert_statement(db, values)
+        if stmt is not None:
+            db.execute(stmt)
+        else:
+            current = db.get(DeviceLatestStatus, status.device_id)
+            if current is None or current.status_id < status.id:
+                db.merge(DeviceLatestStatus(**values))
+        return snapshot
+
+    def remember(self, snapshot: Dict) -> None:
+        """커밋된 최신 상태를 메모리 미러에 반영 (더 오래된 상태로 덮어쓰지 않음)"""
+        with self.lock:
+            current = self._cache.get(snapshot["device_id"])
+            if current is None or current["id"] <= snapshot["id"]:
+                self._cache[snapshot["device_id"]] = snapshot
+
+    def forget(self, device_id: int) -> None:
+        """장비 삭제 시 미러에서 제거"""
+        with self.lock:
+            self._cache.pop(device_id, None)
+
+    def sync(self, db: Session) -> int:
+        """프로젝션 테이블 전체를 메모리로 다시 읽음"""
+        rows = db.query(DeviceLatestStatus).all()
+        loaded = {row.device_id: _snapshot(row.device_id, row.status_id, row) for row in rows}
+        with self.lock:
+            # 읽는 도중 이 워커에서 커밋된 더 최신 상태는 유지
+            for device_id, snapshot in self._cache.items():
+                if device_id in loaded and loaded[device_id]["id"] < snapshot["id"]:
+                    loaded[device_id] = snapshot
+            self._cache = loaded
+            self._synced_at = time.time()
+        return len(loaded)
+
+    def _ensure_synced(self, db: Session) -> None:
+        if time.time() - self._synced_at > settings.LATEST_STATUS_RESYNC_SECONDS:
+            self.sync(db)
+
+    def initialize(self, db: Session) -> int:
+        """
+        시작 시 프로젝션 준비
+
+        기존 설치에서 테이블이 비어 있으면 device_status 에서 장비별 최신 행으로 채운 뒤 메모리 로드
+        """
+        if db.query(DeviceLatestStatus.device_id).first() is None:
+            latest_ids = (
+                select(func.max(DeviceStatus.id).label("status_id"))
+                .group_by(DeviceStatus.device_id)
+                .subquery()
+            )
+            columns = ["device_id", "status_id"] + _FIELDS
+            source = select(
+                DeviceStatus.device_id,
+                DeviceStatus.id,
+                *[getattr(DeviceStatus, field) for field in _FIELDS],
+            ).join(latest_ids, DeviceStatus.id == latest_ids.c.status_id)
+            result = db.execute(insert(DeviceLatestStatus).from_select(columns, source))
+            db.commit()
+            if result.rowcount:
+                logger.info(f"장비 최신 상태 프로젝션 생성: {result.rowcount}개 장비")
+        return self.sync(db)
+
+    def get(self, db: Session, device_id: int) -> Optional[Dict]:
+        """장비 1대 최신 상태 (미러에 없으면 테이블 조회)"""
+        self._ensure_synced(db)
+        with self.lock:
+            snapshot = self._cache.get(device_id)
+        if snapshot is not None:
+            return snapshot
+
+        row = db.query(DeviceLatestStatus).filter(DeviceLatestStatus.device_id == device_id).first()
+        if row is None:
+            return None
+        snapshot = _snapshot(row.device_id, row.status_id, row)
+        self.remember(snapshot)
+        return snapshot
+
+    def get_many(self, db: Session, device_ids: Optional[List[int]] = None) -> List[Dict]:
+        """여러 장비 (None 이면 전체) 최신 상태, device_id 순"""
+        self._ensure_synced(db)
+        with self.lock:
+            if device_ids is None:
+                snapshots = list(self._cache.values())
+            else:
+                snapshots = [self._cache[i] for i in set(device_ids) if i in self._cache]
+        return sorted(snapshots, key=lambda snapshot: snapshot["device_id"])
+
+
+# 전역 최신 상태 서비스 인스턴스
+latest_status_service = LatestStatusService()
+
+
+def get_latest_status_service() -> LatestStatusService:
+    """최신 상태 서비스 인스턴스 가져오기"""
+    return latest_status_service
@@ -7,10 +7,11 @@ import json
 from datetime import datetime
 from sqlalchemy.orm import Session
 
-from app.database import SessionLocal
+from app.database import IngestSessionLocal
 from app.models import Device, DeviceStatus
 from app.utils.logger import logger
 from app.services.websocket_service import get_ws_manager
+from app.services.latest_status_service import get_latest_status_service
 
 
 def handle_device_status(topic: str, payload: str):
@@ -40,7 +41,7 @@ def handle_device_status(topic: str, payload: str):
             return
 
         # DB 세션 생성
-        db: Session = SessionLocal()
+        db: Session = IngestSessionLocal()
 
         try:
             # 장비 조회
@@ -67,12 +68,18 @@ def handle_device_status(topic: str, payload: str):
             )
 
             db.add(status)
+
+            # 최신 상태 프로젝션 갱신 (같은 트랜잭션)
+            latest_status_service = get_latest_status_service()
+            latest = latest_status_service.upsert(db, status)
             db.commit()
+            latest_status_service.remember(latest)
             db.refresh(status)
 
             # 상태 업데이트 로그는 DEBUG 레벨로 변경 (너무 자주 출력됨)
             logger.debug(
-                f"장비 {device_id} 상태 업데이트: 배터리 {data.get('battery_level')}%, 온도 {data.get('temperature')}°C"
+                "장비 %s 상태 업데이트: 배터리 %s%%, 온도 %s°C",
+                device_id, data.get('battery_level'), data.get('temperature')
             )
 
             # WebSocket으로 실시간 브로드캐스트
@@ -142,7 +149,7 @@ def _handle_device_offline(device_id: str):
     """
     장비 오프라인 처리 (LWT)
     """
-    db: Session = SessionLocal()
+    db: Session = IngestSessionLocal()
 
     try:
         device = db.query(Device).filter(Device.device_id == device_id).first()
@@ -4,7 +4,9 @@ MQTT 서비스
 참고: paho-mqtt 라이브러리 사용
 """
 import json
+import time
 import asyncio
+import logging
 from typing import Optional, Dict, Callable
 from datetime import datetime
 import paho.mqtt.client as mqtt
@@ -12,6 +14,11 @@ import uuid
 
 from app.config import settings
 from app.utils.logger import logger
+from app.utils.log_context import bind_log_context, reset_log_context
+from app.utils.metrics import MQTT_MESSAGES, MQTT_HANDLER_SECONDS
+
+# 메시지마다 남는 수신 로그 전용 로거 (LOG_SAMPLE_RATES 로 샘플링)
+message_logger = logging.getLogger("app.mqtt.message")
 
 
 class MQTTService:
@@ -21,6 +28,8 @@ class MQTTService:
         self.client: Optional[mqtt.Client] = None
         self.connected: bool = False
         self.message_handlers: Dict[str, Callable] = {}
+        # 패턴별 지표 (라벨 조회를 메시지마다 하지 않도록 등록 시 생성)
+        self.handler_metrics: Dict[str, tuple] = {}
         
     def connect(self) -> None:
         """MQTT 브로커에 연결"""
@@ -89,20 +98,40 @@ class MQTTService:
             logger.info("MQTT 정상 연결 해제")
     
     def _on_message(self, client, userdata, msg):
-        """메시지 수신 콜백"""
+        """메시지 수신 콜백 (토픽 / 장비 ID 를 로그 컨텍스트에 묶어 핸들러 로그에도 붙임)"""
+        topic = msg.topic
+        topic_parts = topic.split('/')
+        token = bind_log_context(
+            topic=topic,
+            device_id=topic_parts[1] if len(topic_parts) > 2 and topic_parts[0] == "devices" else None,
+        )
+        # 벽시계 시각: 포맷터가 레코드 생성 시각과 비교해 latency_ms 계산 (샘플링으로 버려지면 계산 안 함)
+        received_at = time.time()
         try:
-            topic = msg.topic
             payload = msg.payload.decode('utf-8')
             
-            logger.info(f"MQTT 메시지 수신: {topic}")
-            
-            # 핸들러 실행
+            # 핸들러 실행 (패턴별 메시지 수 / 처리 시간 기록)
+            matched = False
             for pattern, handler in self.message_handlers.items():
                 if self._match_topic(topic, pattern):
-                    handler(topic, payload)
+                    matched = True
+                    messages, handler_seconds = self.handler_metrics[pattern]
+                    messages.inc()
+                    start = time.perf_counter()
+                    try:
+                        handler(topic, payload)
+                    finally:
+                        handler_seconds.observe(time.perf_counter() - start)
+            if not matched:
+                MQTT_MESSAGES.labels("unmatched").inc()
         
         except Exception as e:
             logger.error(f"MQTT 메시지 처리 오류: {e}")
+        
+        finally:
+            if message_logger.isEnabledFor(logging.INFO):
+                message_logger.info("MQTT 메시지 수신: %s", topic, extra={"latency_from": received_at})
+            reset_log_context(token)
     
     def _match_topic(self, topic: str, pattern: str) -> bool:
         """토픽 매칭 (와일드카드 지원)"""
@@ -160,6 +189,10 @@ class MQTTService:
     
     def register_handler(self, topic_pattern: str, handler: Callable) -> None:
         """메시지 핸들러 등록"""
+        self.handler_metrics[topic_pattern] = (
+            MQTT_MESSAGES.labels(topic_pattern),
+            MQTT_HANDLER_SECONDS.labels(topic_pattern),
+        )
         self.message_handlers[topic_pattern] = handler
         logger.info(f"MQTT 핸들러 등록: {topic_pattern}")
     
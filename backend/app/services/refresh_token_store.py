@@ -0,0 +1,333 @@
+"""
+Refresh 토큰 저장소
+보안 가이드라인 1-2 준수: 토큰은 SHA-256 해시로만 저장
+
+- 발급 / 교체 (rotation) / 로그아웃 / 사용자 전체 세션 무효화
+- 교체는 조건부 UPDATE 1회로 확인과 무효화를 함께 처리 (SELECT 후 UPDATE 하지 않음,
+  같은 토큰으로 동시에 갱신해도 1건만 성공)
+- 만료 / 무효화된 행은 백그라운드에서 청크 단위로 삭제
+- 선택: 무효화된 토큰 해시의 메모리 블룸 필터 (REFRESH_TOKEN_BLOOM_ENABLED)
+  재사용된 (이미 교체 / 로그아웃된) 토큰은 잠금을 거는 UPDATE 대신 잠금 없는 조회로 확인 후 거절
+  블룸 필터는 "확실히 아님" 만 보장하므로 적중 시에는 항상 DB 로 확인합니다 (오탐으로 정상 토큰을 거절하지 않음).
+"""
+import math
+import time
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import IngestSessionLocal
+from app.models import RefreshToken
+from app.security import hash_token
+from app.utils.logger import logger
+from app.utils.metrics import REFRESH_TOKEN_CHECKS, REFRESH_TOKENS_PURGED
+
+# 삭제 청크 사이 대기 (다른 트랜잭션에 잠금 양보)
+_PURGE_PAUSE_SECONDS = 0.05
+
+
+class RevocationBloomFilter:
+    """
+    무효화된 토큰 해시 블룸 필터
+
+    토큰 해시 (SHA-256 hex) 가 이미 균일 분포이므로 앞 128비트를 두 값으로 나눠
+    이중 해싱 (h1 + i * h2) 으로 k 개 위치를 계산합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, token_hash: str) -> Iterable[int]:
+        h1 = int(token_hash[:16], 16)
+        h2 = int(token_hash[16:32], 16) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, token_hash: str) -> None:
+        for position in self._positions(token_hash):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, token_hash: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(token_hash))
+
+
+class RefreshTokenStore:
+    """
+    refresh_tokens 테이블 접근 + 정리 작업
+
+    쓰기 메서드는 커밋하지 않습니다 (호출한 엔드포인트가 감사 로그 등과 함께 커밋).
+    """
+
+    def __init__(self, bloom_enabled: bool = False, bloom_capacity: int = 100000):
+        self.bloom_enabled = bloom_enabled
+        self.bloom_capacity = bloom_capacity
+        self.lock = threading.Lock()
+        self._bloom: Optional[RevocationBloomFilter] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_purge: Dict = {}
+
+    # ------------------------------------------------------------------
+    # 블룸 필터
+    # ------------------------------------------------------------------
+
+    def _remember_revoked(self, token_hashes: Iterable[str]) -> None:
+        with self.lock:
+            if self._bloom is not None:
+                for token_hash in token_hashes:
+                    self._bloom.add(token_hash)
+
+    def _maybe_revoked(self, token_hash: str) -> bool:
+        with self.lock:
+            return self._bloom is not None and token_hash in self._bloom
+
+    def rebuild_bloom(self, db: Session, now: Optional[datetime] = None) -> int:
+        """
+        아직 만료되지 않은 무효화 토큰으로 블룸 필터 재구성 (시작 시 / 정리 후)
+
+        만료된 토큰은 JWT exp 검증에서 거절되므로 넣지 않습니다 (필터가 포화되지 않도록).
+
+        Returns:
+            int: 필터에 넣은 토큰 수
+        """
+        if not self.bloom_enabled:
+            return 0
+        now = now or datetime.utcnow()
+        bloom = RevocationBloomFilter(self.bloom_capacity)
+        rows = (
+            db.query(RefreshToken.token_hash)
+            .filter(RefreshToken.revoked == True, RefreshToken.expires_at > now)  # noqa: E712
+            .yield_per(5000)
+        )
+        for (token_hash,) in rows:
+            bloom.add(token_hash)
+        with self.lock:
+            self._bloom = bloom
+        if bloom.count > bloom.capacity:
+            logger.warning(
+                f"⚠️ refresh 토큰 블룸 필터 용량 초과: {bloom.count}/{bloom.capacity} "
+                f"(오탐 증가, REFRESH_TOKEN_BLOOM_CAPACITY 조정 필요)"
+            )
+        return bloom.count
+
+    # ------------------------------------------------------------------
+    # 발급 / 교체 / 무효화
+    # ------------------------------------------------------------------
+
+    def add(self, db: Session, user_id: int, token: str) -> RefreshToken:
+        """새 refresh 토큰 해시 저장 (커밋은 호출자)"""
+        db_token = RefreshToken(
+            user_id=user_id,
+            token_hash=hash_token(token),
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+        db.add(db_token)
+        return db_token
+
+    def consume(self, db: Session, user_id: int, token: str) -> bool:
+        """
+        토큰 교체용 확인 + 무효화 (조건부 UPDATE 1회)
+
+        Args:
+            db: 데이터베이스 세션 (커밋은 호출자)
+            user_id: 토큰 subject 의 사용자 ID
+            token: refresh 토큰 원문
+
+        Returns:
+            bool: 유효한 토큰이었고 이번 호출에서 무효화했으면 True
+        """
+        token_hash = hash_token(token)
+        now = datetime.utcnow()
+        active = (
+            RefreshToken.user_id == user_id,
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked == False,  # noqa: E712
+            RefreshToken.expires_at > now,
+        )
+
+        if self._maybe_revoked(token_hash):
+            # 재사용 가능성: 잠금 없는 조회로 먼저 확인 (오탐이면 아래 UPDATE 로 진행)
+            if db.query(RefreshToken.id).filter(*active).first() is None:
+                REFRESH_TOKEN_CHECKS.labels("bloom_rejected").inc()
+                logger.warning(f"무효화된 refresh 토큰 재사용 시도: user_id={user_id}")
+                return False
+            REFRESH_TOKEN_CHECKS.labels("bloom_false_positive").inc()
+
+        result = db.execute(
+            update(RefreshToken)
+            .where(*active)
+            .values(revoked=True, revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            REFRESH_TOKEN_CHECKS.labels("rejected").inc()
+            return False
+
+        self._remember_revoked([token_hash])
+        REFRESH_TOKEN_CHECKS.labels("rotated").inc()
+        return True
+
+    def revoke(self, db: Session, user_id: int, token: str) -> bool:
+        """로그아웃: 토큰 1개 무효화 (커밋은 호출자)"""
+        token_hash = hash_token(token)
+        result = db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked == False,  # noqa: E712
+            )
+            .values(revoked=True, revoked_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            self._remember_revoked([token_hash])
+        return bool(result.rowcount)
+
+    def revoke_all(self, db: Session, user_id: int) -> int:
+        """
+        사용자의 모든 유효 세션 무효화 (비밀번호 변경 / 전체 로그아웃 / 관리자 강제 로그아웃)
+
+        (user_id, revoked, expires_at) 인덱스 범위만 읽고 갱신합니다. 커밋은 호출자.
+
+        Returns:
+            int: 무효화한 토큰 수
+        """
+        now = datetime.utcnow()
+        active = (
+            RefreshToken.user_id == user_id,
+            RefreshToken.revoked == False,  # noqa: E712
+            RefreshToken.expires_at > now,
+        )
+        if self.bloom_enabled:
+            self._remember_revoked(
+                token_hash for (token_hash,) in db.query(RefreshToken.token_hash).filter(*active)
+            )
+        result = db.execute(
+            update(RefreshToken)
+            .where(*active)
+            .values(revoked=True, revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+
+    def _purge(self, db: Session, *filters) -> int:
+        """조건에 맞는 행을 청크 단위로 삭제 (청크마다 커밋해 잠금 시간 제한)"""
+        chunk_size = settings.REFRESH_TOKEN_PURGE_CHUNK_SIZE
+        deleted = 0
+        while True:
+            ids = [row[0] for row in db.query(RefreshToken.id).filter(*filters).limit(chunk_size).all()]
+            if not ids:
+                break
+            db.query(RefreshToken).filter(RefreshToken.id.in_(ids)).delete(synchronize_session=False)
+            db.commit()
+            deleted += len(ids)
+            if len(ids) < chunk_size:
+                break
+            time.sleep(_PURGE_PAUSE_SECONDS)
+        return deleted
+
+    def purge(self, db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        만료된 행 + 보관 기간이 지난 무효화 행 삭제
+
+        무효화 행은 무효화 시각 (revoked_at) 기준으로 REFRESH_TOKEN_REVOKED_RETENTION_HOURS 동안
+        남겨 재사용 시도를 확인할 수 있게 합니다. revoked_at 이 없는 (컬럼 추가 전에 무효화된) 행은 만료 시 삭제됩니다.
+
+        Returns:
+            Dict: 종류별 삭제된 행 수
+        """
+        now = now or datetime.utcnow()
+        retention = timedelta(hours=settings.REFRESH_TOKEN_REVOKED_RETENTION_HOURS)
+
+        deleted = {
+            "expired": self._purge(db, RefreshToken.expires_at <= now),
+            "revoked": self._purge(db, RefreshToken.revoked_at < now - retention),
+        }
+        REFRESH_TOKENS_PURGED.inc(sum(deleted.values()))
+        return deleted
+
+    def run_once(self) -> Dict:
+        """정리 + 블룸 필터 재구성 1회 실행 (백그라운드 스레드에서 호출)"""
+        db = IngestSessionLocal()
+        try:
+            start = time.time()
+            now = datetime.utcnow()
+            deleted = self.purge(db, now)
+            bloom_size = self.rebuild_bloom(db, now)
+            self.last_purge = {
+                "at": now.isoformat(),
+                "deleted": deleted,
+                "bloom_entries": bloom_size,
+                "elapsed_ms": round((time.time() - start) * 1000, 1),
+            }
+            if any(deleted.values()):
+                logger.info(
+                    f"🗂️ refresh 토큰 정리: 삭제 {deleted} ({self.last_purge['elapsed_ms']}ms)"
+                )
+            return self.last_purge
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 백그라운드 작업
+    # ------------------------------------------------------------------
+
+    async def _run_forever(self, interval: float):
+        while True:
+            try:
+                await run_in_threadpool(self.run_once)
+            except Exception as e:
+                logger.error(f"❌ refresh 토큰 정리 실패: {e}", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def start(self) -> None:
+        """주기 작업 시작 (lifespan 에서 호출, 첫 실행에서 블룸 필터 구성)"""
+        if self._task is None and settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS > 0:
+            self._task = asyncio.create_task(
+                self._run_forever(settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS)
+            )
+            logger.info(
+                f"refresh 토큰 정리 작업 시작 (주기 {settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS}초, "
+                f"블룸 필터 {'사용' if self.bloom_enabled else '미사용'})"
+            )
+
+    async def stop(self) -> None:
+        """주기 작업 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 전역 refresh 토큰 저장소 인스턴스
+refresh_token_store = RefreshTokenStore(
+    bloom_enabled=settings.REFRESH_TOKEN_BLOOM_ENABLED,
+    bloom_capacity=settings.REFRESH_TOKEN_BLOOM_CAPACITY,
+)
+
+
+def get_refresh_token_store() -> RefreshTokenStore:
+    """refresh 토큰 저장소 인스턴스 가져오기"""
+    return refresh_token_store
@@ -0,0 +1,442 @@
+"""
+장비 상태 보존 / 롤업 서비스
+device_status 는 장비당 10초마다 1행씩 쌓이므로 원시 데이터는 보존 기간만 유지하고
+1분 / 1시간 요약 (min / max / avg) 으로 다운샘플링
+"""
+import time
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, case
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import IngestSessionLocal
+from app.models import DeviceStatus, DeviceStatusRollup
+from app.utils.logger import logger
+
+
+RESOLUTIONS = {
+    "1m": timedelta(minutes=1),
+    "1h": timedelta(hours=1),
+}
+
+# 구간 키 포맷 (MySQL DATE_FORMAT / SQLite strftime), 시간대 변환 없이 문자열로 절삭
+_BUCKET_FORMATS = {
+    "1m": ("%Y-%m-%d %H:%i:00", "%Y-%m-%d %H:%M:00"),
+    "1h": ("%Y-%m-%d %H:00:00", "%Y-%m-%d %H:00:00"),
+}
+
+# 요약 대상 지표: (롤업 컬럼 접두어, 원시 컬럼)
+_METRICS = [
+    ("battery", DeviceStatus.battery_level),
+    ("temperature", DeviceStatus.temperature),
+    ("cpu", DeviceStatus.cpu_usage),
+    ("memory", DeviceStatus.memory_usage),
+]
+
+# 한 번에 롤업할 최대 구간 (최초 실행 시 밀린 이력도 작은 트랜잭션으로 처리)
+_ROLLUP_STEP = timedelta(hours=6)
+
+
+def _floor(value: datetime, resolution: str) -> datetime:
+    value = value.replace(second=0, microsecond=0)
+    if resolution == "1h":
+        value = value.replace(minute=0)
+    return value
+
+
+def _parse_bucket(value) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """시간대 정보가 있으면 UTC 로 변환 후 제거 (DB 는 naive UTC 저장)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class StatusRetentionService:
+    """
+    device_status 롤업 + 보존 기간 정리
+
+    1. 완료된 1분 구간을 원시 데이터에서 요약 → device_status_rollups (resolution="1m")
+    2. 완료된 1시간 구간을 1분 롤업에서 요약 (resolution="1h")
+    3. 보존 기간이 지나고 롤업까지 끝난 행만 청크 단위로 삭제
+    4. 조회 구간 길이에 따라 원시 / 1분 / 1시간 해상도 자동 선택
+    """
+
+    # 자동 해상도 선택 기준 (원시 데이터는 10초 간격)
+    RAW_MAX_WINDOW = timedelta(hours=6)
+    MINUTE_MAX_WINDOW = timedelta(days=3)
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Dict = {}
+
+    @property
+    def raw_retention(self) -> timedelta:
+        return timedelta(hours=settings.STATUS_RAW_RETENTION_HOURS)
+
+    @property
+    def rollup_retention(self) -> Dict[str, timedelta]:
+        return {
+            "1m": timedelta(days=settings.STATUS_ROLLUP_1M_RETENTION_DAYS),
+            "1h": timedelta(days=settings.STATUS_ROLLUP_1H_RETENTION_DAYS),
+        }
+
+    # ------------------------------------------------------------------
+    # 롤업
+    # ------------------------------------------------------------------
+
+    def _bucket_expr(self, db: Session, column, resolution: str):
+        mysql_format, sqlite_format = _BUCKET_FORMATS[resolution]
+        if db.bind.dialect.name == "mysql":
+            return func.date_format(column, mysql_format)
+        return func.strftime(sqlite_format, column)
+
+    def _watermark(self, db: Session, resolution: str) -> Optional[datetime]:
+        """롤업이 끝난 시각 (이 시각 이전 구간은 모두 요약됨)"""
+        last = (
+            db.query(func.max(DeviceStatusRollup.bucket_start))
+            .filter(DeviceStatusRollup.resolution == resolution)
+            .scalar()
+        )
+        return last + RESOLUTIONS[resolution] if last else None
+
+    def _store(self, db: Session, resolution: str, since: datetime, until: datetime, rows) -> int:
+        # 같은 구간을 다시 계산해도 중복되지 않도록 교체
+        db.query(DeviceStatusRollup).filter(
+            DeviceStatusRollup.resolution == resolution,
+            DeviceStatusRollup.bucket_start >= since,
+            DeviceStatusRollup.bucket_start < until,
+        ).delete(synchronize_session=False)
+
+        mappings = []
+        for row in rows:
+            mapping = {
+                "device_id": row.device_id,
+                "resolution": resolution,
+                "bucket_start": _parse_bucket(row.bucket),
+                "sample_count": row.sample_count,
+            }
+            for name, _ in _METRICS:
+                mapping[f"{name}_min"] = getattr(row, f"{name}_min")
+                mapping[f"{name}_max"] = getattr(row, f"{name}_max")
+                avg = getattr(row, f"{name}_avg")
+                mapping[f"{name}_avg"] = float(avg) if avg is not None else None
+            mappings.append(mapping)
+
+        if mappings:
+            db.bulk_insert_mappings(DeviceStatusRollup, mappings)
+        db.commit()
+        return len(mappings)
+
+    def _rollup_minutes(self, db: Session, since: datetime, until: datetime) -> int:
+        bucket = self._bucket_expr(db, DeviceStatus.recorded_at, "1m")
+        columns = [
+            DeviceStatus.device_id,
+            bucket.label("bucket"),
+            func.count(DeviceStatus.id).label("sample_count"),
+        ]
+        for name, column in _METRICS:
+            columns += [
+                func.min(column).label(f"{name}_min"),
+                func.max(column).label(f"{name}_max"),
+                func.avg(column).label(f"{name}_avg"),
+            ]
+
+        rows = (
+            db.query(*columns)
+            .filter(DeviceStatus.recorded_at >= since, DeviceStatus.recorded_at < until)
+            .group_by(DeviceStatus.device_id, "bucket")
+            .all()
+        )
+        return self._store(db, "1m", since, until, rows)
+
+    def _rollup_hours(self, db: Session, since: datetime, until: datetime) -> int:
+        minute = DeviceStatusRollup
+        bucket = self._bucket_expr(db, minute.bucket_start, "1h")
+        columns = [
+            minute.device_id,
+            bucket.label("bucket"),
+            func.sum(minute.sample_count).label("sample_count"),
+        ]
+        for name, _ in _METRICS:
+            avg_column = getattr(minute, f"{name}_avg")
+            # 1분 평균을 샘플 수로 가중 평균
+            columns += [
+                func.min(getattr(minute, f"{name}_min")).label(f"{name}_min"),
+                func.max(getattr(minute, f"{name}_max")).label(f"{name}_max"),
+                (
+                    func.sum(avg_column * minute.sample_count)
+                    / func.sum(case((avg_column.isnot(None), minute.sample_count)))
+                ).label(f"{name}_avg"),
+            ]
+
+        rows = (
+            db.query(*columns)
+            .filter(
+                minute.resolution == "1m",
+                minute.bucket_start >= since,
+                minute.bucket_start < until,
+            )
+            .group_by(minute.device_id, "bucket")
+            .all()
+        )
+        return self._store(db, "1h", since, until, rows)
+
+    def rollup(self, db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        완료된 구간만 요약 (진행 중인 분 / 시간은 다음 실행에서 처리)
+
+        Returns:
+            Dict: 해상도별 생성된 롤업 행 수
+        """
+        now = now or datetime.utcnow()
+        created = {"1m": 0, "1h": 0}
+
+        # 1분 롤업: 원시 데이터 기준
+        since = self._watermark(db, "1m")
+        if since is None:
+            first = db.query(func.min(DeviceStatus.recorded_at)).scalar()
+            since = _floor(first, "1m") if first else None
+        until = _floor(now, "1m")
+        while since is not None and since < until:
+            step_end = min(until, since + _ROLLUP_STEP)
+            created["1m"] += self._rollup_minutes(db, since, step_end)
+            since = step_end
+
+        # 1시간 롤업: 1분 롤업 기준 (해당 시간의 1분 롤업이 모두 끝난 경우만)
+        minute_watermark = self._watermark(db, "1m")
+        if minute_watermark is not None:
+            since = self._watermark(db, "1h")
+            if since is None:
+                first = (
+                    db.query(func.min(DeviceStatusRollup.bucket_start))
+                    .filter(DeviceStatusRollup.resolution == "1m")
+                    .scalar()
+                )
+                since = _floor(first, "1h")
+            until = _floor(minute_watermark, "1h")
+            while since < until:
+                step_end = min(until, since + _ROLLUP_STEP * 4)
+                created["1h"] += self._rollup_hours(db, since, step_end)
+                since = step_end
+
+        return created
+
+    # ------------------------------------------------------------------
+    # 보존 기간 정리
+    # ------------------------------------------------------------------
+
+    def _purge(self, db: Session, model, time_column, cutoff: datetime, *filters) -> int:
+        """cutoff 이전 행을 청크 단위로 삭제 (청크마다 커밋해 잠금 시간 제한)"""
+        chunk_size = settings.STATUS_PURGE_CHUNK_SIZE
+        deleted = 0
+        while True:
+            ids = [
+                row[0]
+                for row in db.query(model.id)
+                .filter(time_column < cutoff, *filters)
+                .limit(chunk_size)
+                .all()
+            ]
+            if not ids:
+                break
+            db.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+            db.commit()
+            deleted += len(ids)
+            if len(ids) < chunk_size:
+                break
+            time.sleep(settings.STATUS_PURGE_PAUSE_SECONDS)
+        return deleted
+
+    def purge(self, db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        보존 기간이 지난 행 삭제 (상위 해상도로 요약되지 않은 행은 남김)
+
+        Returns:
+            Dict: 종류별 삭제된 행 수
+        """
+        now = now or datetime.utcnow()
+        deleted = {"raw": 0, "1m": 0, "1h": 0}
+        retention = self.rollup_retention
+
+        minute_watermark = self._watermark(db, "1m")
+        if minute_watermark is not None:
+            cutoff = min(now - self.raw_retention, minute_watermark)
+            deleted["raw"] = self._purge(db, DeviceStatus, DeviceStatus.recorded_at, cutoff)
+
+        hour_watermark = self._watermark(db, "1h")
+        if hour_watermark is not None:
+            cutoff = min(now - retention["1m"], hour_watermark)
+            deleted["1m"] = self._purge(
+                db,
+                DeviceStatusRollup,
+                DeviceStatusRollup.bucket_start,
+                cutoff,
+                DeviceStatusRollup.resolution == "1m",
+            )
+
+        deleted["1h"] = self._purge(
+            db,
+            DeviceStatusRollup,
+            DeviceStatusRollup.bucket_start,
+            now - retention["1h"],
+            DeviceStatusRollup.resolution == "1h",
+        )
+        return deleted
+
+    def run_once(self) -> Dict:
+        """롤업 후 정리 1회 실행 (백그라운드 스레드에서 호출)"""
+        db = IngestSessionLocal()
+        try:
+            start = time.time()
+            now = datetime.utcnow()
+            created = self.rollup(db, now)
+            deleted = self.purge(db, now)
+            self.last_run = {
+                "at": now.isoformat(),
+                "created": created,
+                "deleted": deleted,
+                "elapsed_ms": round((time.time() - start) * 1000, 1),
+            }
+            if any(created.values()) or any(deleted.values()):
+                logger.info(
+                    f"🗂️ 장비 상태 롤업: 생성 {created}, 삭제 {deleted} "
+                    f"({self.last_run['elapsed_ms']}ms)"
+                )
+            return self.last_run
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 백그라운드 작업
+    # ------------------------------------------------------------------
+
+    async def _run_forever(self, interval: float):
+        while True:
+            try:
+                await run_in_threadpool(self.run_once)
+            except Exception as e:
+                logger.error(f"❌ 장비 상태 롤업 실패: {e}", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def start(self) -> None:
+        """주기 작업 시작 (lifespan 에서 호출)"""
+        if self._task is None and settings.STATUS_ROLLUP_ENABLED:
+            self._task = asyncio.create_task(
+                self._run_forever(settings.STATUS_ROLLUP_INTERVAL_SECONDS)
+            )
+            logger.info(
+                f"장비 상태 롤업 작업 시작 (주기 {settings.STATUS_ROLLUP_INTERVAL_SECONDS}초, "
+                f"원시 보존 {settings.STATUS_RAW_RETENTION_HOURS}시간)"
+            )
+
+    async def stop(self) -> None:
+        """주기 작업 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ------------------------------------------------------------------
+    # 구간 조회
+    # ------------------------------------------------------------------
+
+    def choose_resolution(self, start: datetime, end: datetime, now: Optional[datetime] = None) -> str:
+        """조회 구간 길이 / 보존 기간에 맞는 해상도 선택"""
+        now = now or datetime.utcnow()
+        window = end - start
+        if window <= self.RAW_MAX_WINDOW and start >= now - self.raw_retention:
+            return "raw"
+        if window <= self.MINUTE_MAX_WINDOW and start >= now - self.rollup_retention["1m"]:
+            return "1m"
+        return "1h"
+
+    def query_range(
+        self,
+        db: Session,
+        device_id: int,
+        start: datetime,
+        end: datetime,
+        resolution: str = "auto",
+    ) -> Tuple[str, List[Dict]]:
+        """
+        장비 상태 구간 조회
+
+        Args:
+            db: 데이터베이스 세션
+            device_id: 장비 ID (DB PK)
+            start / end: 조회 구간 (naive UTC)
+            resolution: "auto" / "raw" / "1m" / "1h"
+
+        Returns:
+            (선택된 해상도, 시간순 포인트 리스트)
+        """
+        if resolution == "auto":
+            resolution = self.choose_resolution(start, end)
+
+        if resolution == "raw":
+            rows = (
+                db.query(DeviceStatus)
+                .filter(
+                    DeviceStatus.device_id == device_id,
+                    DeviceStatus.recorded_at >= start,
+                    DeviceStatus.recorded_at < end,
+                )
+                .order_by(DeviceStatus.recorded_at)
+                .all()
+            )
+            points = []
+            for row in rows:
+                point = {"timestamp": row.recorded_at, "sample_count": 1}
+                for name, column in _METRICS:
+                    value = getattr(row, column.key)
+                    point[f"{name}_min"] = value
+                    point[f"{name}_max"] = value
+                    point[f"{name}_avg"] = value
+                points.append(point)
+            return resolution, points
+
+        rows = (
+            db.query(DeviceStatusRollup)
+            .filter(
+                DeviceStatusRollup.device_id == device_id,
+                DeviceStatusRollup.resolution == resolution,
+                DeviceStatusRollup.bucket_start >= _floor(start, resolution),
+                DeviceStatusRollup.bucket_start < end,
+            )
+            .order_by(DeviceStatusRollup.bucket_start)
+            .all()
+        )
+        points = []
+        for row in rows:
+            point = {"timestamp": row.bucket_start, "sample_count": row.sample_count}
+            for name, _ in _METRICS:
+                for suffix in ("min", "max", "avg"):
+                    key = f"{name}_{suffix}"
+                    point[key] = getattr(row, key)
+            points.append(point)
+        return resolution, points
+
+
+# 전역 보존 / 롤업 서비스 인스턴스
+status_retention_service = StatusRetentionService()
+
+
+def get_status_retention_service() -> StatusRetentionService:
+    """장비 상태 보존 서비스 인스턴스 가져오기"""
+    return status_retention_service
@@ -2,12 +2,22 @@
 WebSocket 서비스
 실시간 장비 상태 업데이트
 """
-from typing import Dict, Set
+from typing import Dict, Set, Optional
 from fastapi import WebSocket
 import json
+import time
 import asyncio
 
 from app.utils.logger import logger
+from app.utils.metrics import WS_CONNECTIONS, WS_SEND_INFLIGHT, WS_SEND_SECONDS
+from app.utils.tracing import tracer
+
+
+# 응급 알림을 구독과 관계없이 받는 역할
+EMERGENCY_RECEIVER_ROLES = {"admin", "operator"}
+
+# 응급 알림 소켓당 전송 대기 상한 (느린 연결이 다른 연결을 막지 않도록)
+EMERGENCY_SEND_TIMEOUT = 2.0
 
 
 class WebSocketManager:
@@ -19,19 +29,27 @@ class WebSocketManager:
         
         # 장비별 구독: {device_id: {user_id, user_id, ...}}
         self.device_subscriptions: Dict[int, Set[int]] = {}
+        
+        # 운영자 연결 (응급 전용 채널): {websocket: user_id}
+        self.operator_connections: Dict[WebSocket, int] = {}
     
-    async def connect(self, websocket: WebSocket, user_id: int):
-        """WebSocket 연결 추가"""
+    async def connect(self, websocket: WebSocket, user_id: int, role: Optional[str] = None):
+        """WebSocket 연결 추가 (admin / operator 는 응급 채널에도 등록)"""
         await websocket.accept()
         
         if user_id not in self.active_connections:
             self.active_connections[user_id] = set()
         
         self.active_connections[user_id].add(websocket)
-        logger.info(f"WebSocket 연결: user_id={user_id}")
+        if role in EMERGENCY_RECEIVER_ROLES:
+            self.operator_connections[websocket] = user_id
+        self._update_connection_gauges()
+        logger.info(f"WebSocket 연결: user_id={user_id}, role={role}")
     
     def disconnect(self, websocket: WebSocket, user_id: int):
         """WebSocket 연결 제거"""
+        self.operator_connections.pop(websocket, None)
+        
         if user_id in self.active_connections:
             self.active_connections[user_id].discard(websocket)
             
@@ -46,8 +64,20 @@ class WebSocketManager:
                 if not self.device_subscriptions[device_id]:
                     del self.device_subscriptions[device_id]
         
+        self._update_connection_gauges()
         logger.info(f"WebSocket 연결 해제: user_id={user_id}")
     
+    def _update_connection_gauges(self) -> None:
+        WS_CONNECTIONS.labels("all").set(sum(len(conns) for conns in self.active_connections.values()))
+        WS_CONNECTIONS.labels("operator").set(len(self.operator_connections))
+    
+    async def _send_text(self, websocket: WebSocket, message_str: str) -> None:
+        """전송 1건 (진행 중 전송 수 / 전송 시간 기록)"""
+        start = time.perf_counter()
+        with WS_SEND_INFLIGHT.track_inprogress():
+            await websocket.send_text(message_str)
+        WS_SEND_SECONDS.observe(time.perf_counter() - start)
+    
     def subscribe_device(self, user_id: int, device_id: int):
         """장비 상태 구독"""
         if device_id not in self.device_subscriptions:
@@ -77,7 +107,7 @@ class WebSocketManager:
         disconnected = []
         for websocket in self.active_connections[user_id]:
             try:
-                await websocket.send_text(message_str)
+                await self._send_text(websocket, message_str)
             except Exception as e:
                 logger.error(f"메시지 전송 실패: {e}")
                 disconnected.append(websocket)
@@ -87,11 +117,22 @@ class WebSocketManager:
             self.disconnect(websocket, user_id)
     
     async def broadcast_to_subscribers(self, device_id: int, message: dict):
-        """장비를 구독 중인 사용자들에게 브로드캐스트"""
+        """장비를 구독 중인 사용자들에게 브로드캐스트 (결과 수신 trace 안이면 span 기록)"""
+        span = tracer.child_span("ws.broadcast_to_subscribers", device_id=device_id)
+        sent = 0
+        try:
+            sent = await self._broadcast_to_subscribers(device_id, message)
+        finally:
+            if span is not None:
+                span.set("sent", sent)
+                span.end()
+    
+    async def _broadcast_to_subscribers(self, device_id: int, message: dict) -> int:
         if device_id not in self.device_subscriptions:
-            return
+            return 0
         
         message_str = json.dumps(message)
+        sent = 0
         
         for user_id in self.device_subscriptions[device_id]:
             if user_id not in self.active_connections:
@@ -100,7 +141,8 @@ class WebSocketManager:
             disconnected = []
             for websocket in self.active_connections[user_id]:
                 try:
-                    await websocket.send_text(message_str)
+                    await self._send_text(websocket, message_str)
+                    sent += 1
                 except Exception as e:
                     logger.error(f"브로드캐스트 실패: {e}")
                     disconnected.append(websocket)
@@ -108,6 +150,8 @@ class WebSocketManager:
             # 실패한 연결 제거
             for websocket in disconnected:
                 self.disconnect(websocket, user_id)
+        
+        return sent
     
     async def broadcast_all(self, message: dict):
         """모든 연결된 클라이언트에게 브로드캐스트"""
@@ -117,7 +161,7 @@ class WebSocketManager:
             disconnected = []
             for websocket in connections:
                 try:
-                    await websocket.send_text(message_str)
+                    await self._send_text(websocket, message_str)
                 except Exception as e:
                     logger.error(f"브로드캐스트 실패: {e}")
                     disconnected.append(websocket)
@@ -126,6 +170,55 @@ class WebSocketManager:
             for websocket in disconnected:
                 self.disconnect(websocket, user_id)
     
+    async def _send_emergency(self, websocket: WebSocket, message_str: str) -> None:
+        await asyncio.wait_for(self._send_text(websocket, message_str), timeout=EMERGENCY_SEND_TIMEOUT)
+    
+    async def broadcast_emergency(self, device_id: int, message: dict) -> int:
+        """
+        응급 알림 전송 (우선 경로)
+        
+        모든 운영자 연결 + 해당 장비 구독자에게 동시에 전송합니다.
+        연결별 전송은 병렬로 진행되며 느린 연결은 EMERGENCY_SEND_TIMEOUT 후 끊습니다.
+        
+        Returns:
+            int: 전송 성공한 연결 수
+        """
+        span = tracer.child_span("ws.broadcast_emergency", device_id=device_id)
+        delivered = 0
+        try:
+            delivered = await self._broadcast_emergency(device_id, message)
+            return delivered
+        finally:
+            if span is not None:
+                span.set("delivered", delivered)
+                span.end()
+    
+    async def _broadcast_emergency(self, device_id: int, message: dict) -> int:
+        targets: Dict[WebSocket, int] = dict(self.operator_connections)
+        for user_id in self.device_subscriptions.get(device_id, set()):
+            for websocket in self.active_connections.get(user_id, set()):
+                targets[websocket] = user_id
+        
+        if not targets:
+            return 0
+        
+        message_str = json.dumps(message)
+        connections = list(targets.items())
+        results = await asyncio.gather(
+            *(self._send_emergency(websocket, message_str) for websocket, _ in connections),
+            return_exceptions=True
+        )
+        
+        delivered = 0
+        for (websocket, user_id), result in zip(connections, results):
+            if isinstance(result, BaseException):
+                logger.error(f"응급 알림 전송 실패: user_id={user_id}, {result!r}")
+                self.disconnect(websocket, user_id)
+            else:
+                delivered += 1
+        
+        return delivered
+    
     async def send_device_status(self, device_id: int, status: dict):
         """장비 상태 업데이트 전송"""
         message = {
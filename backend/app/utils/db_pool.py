@@ -0,0 +1,227 @@
+"""
+DB 커넥션 풀 계측
+풀별 체크아웃 대기 시간, 사용 중 연결 수, 오버플로 / 타임아웃 이벤트 집계
+"""
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+from app.utils.latency import LatencyTracker
+from app.utils.logger import logger
+from app.utils.metrics import DB_POOL_CHECKOUT_SECONDS, DB_QUERY_SECONDS
+
+
+class PoolMetrics:
+    """커넥션 풀 1개의 누적 지표"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.checkout_wait = LatencyTracker()
+        self.checkouts = 0
+        self.connects = 0
+        self.overflow_events = 0   # pool_size 를 넘어 오버플로 연결을 만든 횟수
+        self.timeouts = 0          # pool_timeout 초과로 체크아웃 실패
+        self.invalidations = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self.max_in_use = 0
+        self.pool = None
+        self.checkout_histogram = DB_POOL_CHECKOUT_SECONDS.labels(name)
+
+    def incr(self, field: str, amount: int = 1) -> None:
+        with self.lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def stats(self) -> Dict:
+        pool = self.pool
+        with self.lock:
+            counters = {
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "overflow_events": self.overflow_events,
+                "timeouts": self.timeouts,
+                "invalidations": self.invalidations,
+                "pings": self.pings,
+                "ping_failures": self.ping_failures,
+                "max_in_use": self.max_in_use,
+            }
+        return {
+            "size": pool.size() if pool is not None else None,
+            "in_use": pool.checkedout() if pool is not None else None,
+            "idle": pool.checkedin() if pool is not None else None,
+            "overflow": max(pool.overflow(), 0) if pool is not None else None,
+            **counters,
+            "checkout_wait": self.checkout_wait.summary(),
+        }
+
+
+class _InstrumentedPoolMixin:
+    """
+    체크아웃 대기 시간 측정
+
+    풀 이벤트는 연결을 얻은 뒤(checkout)에만 발생하므로, 대기 시작 시점은 _do_get 에서 측정
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super()._do_get()
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            metrics.incr("timeouts")
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.checkout_wait.record(elapsed * 1000)
+            metrics.checkout_histogram.observe(elapsed)
+        return record
+
+    def recreate(self):
+        # engine.dispose() 후 새 풀에도 같은 지표 연결
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool"""
+
+
+# 하위 클래스 풀 로거는 app.* 아래에 생기므로 기본 sqlalchemy.pool 로거처럼 WARNING 이상만 출력
+for _pool_class in (InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool):
+    logging.getLogger(f"{_pool_class.__module__}.{_pool_class.__name__}").setLevel(logging.WARNING)
+
+
+# 풀 이름 → 지표
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(
+    engine: Engine,
+    name: str,
+    pre_ping: str = "idle",
+    ping_idle_seconds: float = 300,
+) -> PoolMetrics:
+    """
+    엔진 풀에 지표 수집 이벤트 훅 등록
+
+    Args:
+        engine: 동기 엔진 (비동기 엔진은 async_engine.sync_engine)
+        name: 지표 이름 (request / ingest / async)
+        pre_ping: "always" 는 엔진의 pool_pre_ping, "idle" 은 ping_idle_seconds 이상 놀던 연결만 확인
+        ping_idle_seconds: "idle" 전략에서 확인할 최소 유휴 시간
+
+    Returns:
+        PoolMetrics: 등록된 지표
+    """
+    metrics = PoolMetrics(name)
+    metrics.pool = engine.pool
+    engine.pool.metrics = metrics
+    pool_metrics[name] = metrics
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.incr("connects")
+        # 오버플로 카운터가 pool_size 를 넘은 상태에서 만든 연결
+        if engine.pool.overflow() > 0:
+            metrics.incr("overflow_events")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        in_use = engine.pool.checkedout()
+        with metrics.lock:
+            metrics.checkouts += 1
+            metrics.max_in_use = max(metrics.max_in_use, in_use)
+
+        if pre_ping != "idle":
+            return
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < ping_idle_seconds:
+            return
+        metrics.incr("pings")
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception as e:
+            metrics.incr("ping_failures")
+            logger.warning(f"⚠️ DB 풀({name}) 유휴 연결 끊김, 재연결: {e}")
+            # 풀이 이 연결을 버리고 새 연결로 체크아웃 재시도
+            raise exc.DisconnectionError() from e
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        if connection_record is not None:
+            connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
+
+    query_histogram = DB_QUERY_SECONDS.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        query_histogram.observe(time.perf_counter() - conn.info["query_start"].pop())
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각만 정리
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
+
+    return metrics
+
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """풀별 지표 스냅샷"""
+    return {name: metrics.stats() for name, metrics in pool_metrics.items()}
+
+
+class PoolCollector:
+    """GET /metrics 수집 시점에 풀 상태 (사용 중 / 유휴 / 오버플로) 와 누적 이벤트 수 노출"""
+
+    def collect(self):
+        gauges = {
+            field: GaugeMetricFamily(f"db_pool_{field}", f"커넥션 풀 {field} 연결 수", labels=["pool"])
+            for field in ("size", "in_use", "idle", "overflow")
+        }
+        counters = {
+            field: CounterMetricFamily(f"db_pool_{field}", f"커넥션 풀 누적 {field}", labels=["pool"])
+            for field in ("overflow_events", "timeouts", "invalidations", "pings")
+        }
+        for name, stats in get_pool_stats().items():
+            for field, family in gauges.items():
+                if stats[field] is not None:
+                    family.add_metric([name], stats[field])
+            for field, family in counters.items():
+                family.add_metric([name], stats[field])
+        yield from gauges.values()
+        yield from counters.values()
+
+
+REGISTRY.register(PoolCollector())
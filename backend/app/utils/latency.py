@@ -0,0 +1,38 @@
+"""
+지연 시간 집계 유틸리티
+"""
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+
+class LatencyTracker:
+    """최근 N건 지연 시간 (ms) 백분위 집계"""
+
+    def __init__(self, history: int = 1000):
+        self.lock = threading.Lock()
+        self._samples = deque(maxlen=history)
+        self.count = 0
+
+    def record(self, latency_ms: float) -> None:
+        with self.lock:
+            self._samples.append(latency_ms)
+            self.count += 1
+
+    def summary(self) -> Dict:
+        with self.lock:
+            samples = sorted(self._samples)
+            count = self.count
+
+        def percentile(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))], 2)
+
+        return {
+            "count": count,
+            "window": len(samples),
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(samples[-1], 2) if samples else None,
+        }
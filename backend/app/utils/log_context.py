@@ -0,0 +1,126 @@
+"""
+로그 상관관계 컨텍스트
+요청 / MQTT 메시지 / ASR 세션 단위로 request_id, device_id, session_id, topic 을 contextvar 에 묶어
+그 안에서 남긴 모든 로그에 자동으로 붙입니다 (LOG_FORMAT=json 이면 JSON 필드).
+
+contextvar 는 asyncio 태스크 생성 시 복사되므로 요청 / 메시지 처리 중 만든 태스크의 로그에도 이어집니다.
+
+    with log_context(device_id=device_id, topic=topic):
+        logger.info("상태 저장")   # {"msg": "상태 저장", "device_id": ..., "topic": ...}
+"""
+import time
+import uuid
+import logging
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict
+
+from fastapi import Request
+
+# 현재 컨텍스트 필드 (바꿀 때마다 새 dict 로 교체, 기존 dict 는 수정하지 않음)
+_EMPTY: Dict[str, Any] = {}
+_log_context: contextvars.ContextVar = contextvars.ContextVar("log_context", default=_EMPTY)
+
+access_logger = logging.getLogger("app.http.access")
+
+
+def get_log_context() -> Dict[str, Any]:
+    """현재 컨텍스트 필드 (읽기 전용으로 사용)"""
+    return _log_context.get()
+
+
+def bind_log_context(**fields) -> contextvars.Token:
+    """
+    컨텍스트 필드 추가 (None 값은 무시)
+
+    Returns:
+        reset_log_context 에 넘길 토큰
+    """
+    current = _log_context.get()
+    merged = dict(current)
+    merged.update((key, value) for key, value in fields.items() if value is not None)
+    return _log_context.set(merged)
+
+
+def reset_log_context(token: contextvars.Token) -> None:
+    """bind_log_context 이전 상태로 복원"""
+    _log_context.reset(token)
+
+
+@contextmanager
+def log_context(**fields):
+    """with 블록 동안 컨텍스트 필드 추가"""
+    token = bind_log_context(**fields)
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+async def bind_path_context(request: Request) -> None:
+    """
+    라우터 dependency: 경로의 device_id / session_id 를 로그 컨텍스트에 추가
+
+    미들웨어는 라우팅 전에 실행되어 경로 파라미터를 모르므로 라우터 단위로 연결합니다.
+    (요청 종료 시 RequestContextMiddleware 가 컨텍스트를 원래대로 되돌림)
+    """
+    params = request.path_params
+    if "device_id" in params or "session_id" in params:
+        bind_log_context(device_id=params.get("device_id"), session_id=params.get("session_id"))
+
+
+class RequestContextMiddleware:
+    """
+    요청마다 request_id 를 컨텍스트에 묶고 처리 결과를 구조화 로그로 남김 (순수 ASGI 미들웨어)
+
+    - 클라이언트가 보낸 X-Request-ID 가 있으면 그대로 사용 (프록시 / 프런트엔드와 상관관계 유지)
+    - 응답 헤더에 X-Request-ID 추가
+    - 요청 종료 시 app.http.access 로거로 method / route / status / latency_ms 기록
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex[:16]
+
+        token = bind_log_context(request_id=request_id)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-request-id", request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if scope["type"] == "http" and access_logger.isEnabledFor(logging.INFO):
+                route = scope.get("route")
+                device_id = scope.get("path_params", {}).get("device_id")
+                access_logger.info(
+                    "HTTP 요청 처리",
+                    extra={
+                        "method": scope["method"],
+                        "route": route.path if route is not None else scope["path"],
+                        "status": status_code,
+                        "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+                        "device_id": device_id,
+                    },
+                )
+            _log_context.reset(token)
@@ -1,13 +1,30 @@
 """
 로깅 유틸리티
 보안 가이드라인 5 준수: 민감정보 로그 제외
+
+로그 호출 스레드 (이벤트 루프, paho 네트워크 스레드) 는 레코드를 큐에 넣기만 하고,
+민감정보 마스킹 / 포맷팅 / 콘솔·파일 출력은 QueueListener 스레드에서 처리합니다.
+
+LOG_FORMAT=json 이면 한 줄에 JSON 1개 (orjson) 로 출력하며, 호출 시점의 상관관계 컨텍스트
+(app.utils.log_context: request_id, device_id, session_id, topic) 와 extra 필드가 함께 기록됩니다.
+컨텍스트 / extra 값도 메시지와 같은 규칙으로 마스킹하며, 민감 키 이름의 필드는 값 전체를 가립니다.
+extra={"latency_from": <time.time() 시각>} 은 출력할 때 latency_ms (레코드 생성 시각까지 ms) 로 바뀝니다.
 """
-import logging
+import re
 import sys
+import atexit
+import queue
+import logging
+import itertools
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import orjson
 
 from app.config import settings
+from app.utils.log_context import get_log_context
 
 
 # 민감 정보 키워드 (로그에서 필터링)
@@ -16,67 +33,261 @@ SENSITIVE_KEYS = {
     "secret", "api_key", "authorization", "cookie", "jwt"
 }
 
+# 마스킹할 값을 찾는 단일 패턴 (대소문자 무시 플래그는 위치마다 비교 비용이 커서,
+# 소문자로 바꾼 메시지에 플래그 없이 적용). 그룹 2 / 3 / 4 중 일치한 값만 *** 로 바꿈
+# 1) 키=값, 키: 값, "키": "값" (긴 키 우선). 키 앞 경계는 영숫자만 보고 뒤에는 접미어를 허용하므로
+#    new_password, reset_token, secret_key, token_hash 같은 필드 이름도 포함 (_ 와 - 는 같게 취급: api-key)
+# 2) 키 없이 쓰인 Bearer 토큰
+# 3) 키 없이 쓰인 JWT (eyJ... 로 시작하는 점 3구간)
+_SENSITIVE_KEY_SOURCE = (
+    r"(?<![a-z0-9])(?:"
+    + "|".join(key.replace("_", "[_-]") for key in sorted(SENSITIVE_KEYS, key=len, reverse=True))
+    + r")"
+)
+_SENSITIVE_SOURCE = (
+    r"(" + _SENSITIVE_KEY_SOURCE + r"[a-z0-9_-]*"
+    r"[\"']?\s*[:=]\s*[\"']?)"
+    r"((?:bearer\s+)?[^\s\"',;&}]+)"
+    r"|(?<![a-z0-9])bearer\s+([^\s\"',;&}]+)"
+    r"|(?<![a-z0-9_-])(eyj[a-z0-9_-]{4,}\.[a-z0-9_-]{4,}\.[a-z0-9_-]*)"
+)
+_SENSITIVE_PATTERN = re.compile(_SENSITIVE_SOURCE)
+_SENSITIVE_PATTERN_IGNORECASE = re.compile(_SENSITIVE_SOURCE, re.IGNORECASE)
+# extra / 컨텍스트 필드 이름 (값 전체 마스킹)
+_SENSITIVE_KEY_PATTERN = re.compile(_SENSITIVE_KEY_SOURCE + r"(?![a-z0-9])")
+
+
+def _value_span(match: re.Match):
+    """일치한 대안의 값 위치 (키 / Bearer 접두어는 남김)"""
+    for group in (2, 3, 4):
+        if match.start(group) != -1:
+            return match.start(group), match.end(group)
+
+
+def redact(text: str) -> str:
+    """민감 정보 값 마스킹 (키는 남김: password=***)"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # 소문자 변환으로 길이가 바뀌는 문자가 있으면 위치를 맞출 수 없으므로 대소문자 무시 패턴 사용
+        lowered, pattern = text, _SENSITIVE_PATTERN_IGNORECASE
+    else:
+        pattern = _SENSITIVE_PATTERN
+
+    match = pattern.search(lowered)
+    if match is None:
+        return text
+
+    parts = []
+    last = 0
+    while match is not None:
+        start, end = _value_span(match)
+        parts.append(text[last:start])
+        parts.append("***")
+        last = end
+        match = pattern.search(lowered, max(last, match.end()))
+    parts.append(text[last:])
+    return "".join(parts)
+
 
 class SensitiveDataFilter(logging.Filter):
     """민감 정보 필터링 로그 필터"""
-    
+
     def filter(self, record: logging.LogRecord) -> bool:
-        """로그 레코드에서 민감 정보 마스킹"""
-        # 메시지 필터링
-        if hasattr(record, 'msg'):
-            msg_lower = str(record.msg).lower()
-            for key in SENSITIVE_KEYS:
-                if key in msg_lower:
-                    record.msg = f"[FILTERED] 민감정보 포함된 로그"
-                    break
-        
+        """로그 레코드에서 민감 정보 값만 마스킹 (나머지 메시지는 유지)"""
+        message = record.getMessage()
+        masked = redact(message)
+        if masked != message:
+            record.msg = masked
+            record.args = None
         return True
 
 
+class SamplingFilter(logging.Filter):
+    """
+    고빈도 로그 샘플링 (N 건 중 1 건만 통과)
+
+    WARNING 이상은 샘플링하지 않습니다.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        if self.every == 0:
+            return False
+        return next(self._counter) % self.every == 0
+
+
+# LogRecord 기본 속성 (이외의 속성은 extra 로 넘어온 구조화 필드)
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "log_context"}
+
+
+def _redact_field(key: str, value: Any) -> Any:
+    """extra / 컨텍스트 필드 값 마스킹 (숫자 / bool 은 그대로)"""
+    if _SENSITIVE_KEY_PATTERN.search(key.lower()):
+        return "***"
+    if isinstance(value, (bool, int, float)):
+        return value
+    text = value if isinstance(value, str) else str(value)
+    masked = redact(text)
+    return value if masked == text else masked
+
+
+def _extra_fields(record: logging.LogRecord) -> dict:
+    """레코드의 상관관계 컨텍스트 + extra 필드 (None 값 제외, 민감 정보 마스킹)"""
+    fields = {}
+    context = getattr(record, "log_context", None) or {}
+    extra = ((key, value) for key, value in record.__dict__.items() if key not in _RECORD_ATTRS)
+    for key, value in itertools.chain(context.items(), extra):
+        if value is None:
+            continue
+        if key == "latency_from":
+            fields["latency_ms"] = round((record.created - value) * 1000, 2)
+            continue
+        fields[key] = _redact_field(key, value)
+    return fields
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 1개 (ts, level, logger, msg + 컨텍스트 / extra 필드)"""
+
+    def to_event(self, record: logging.LogRecord) -> dict:
+        event = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        event.update(_extra_fields(record))
+        if record.exc_info:
+            event["exc_info"] = self.formatException(record.exc_info)
+        return event
+
+    def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps(self.to_event(record), default=str).decode("utf-8")
+
+
+class ContextTextFormatter(logging.Formatter):
+    """기존 텍스트 형식 + 컨텍스트 / extra 필드 (key=value)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = _extra_fields(record)
+        if not fields:
+            return line
+        return line + " [" + " ".join(f"{key}={value}" for key, value in fields.items()) + "]"
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """레코드를 큐에 넣기만 하는 핸들러 (포맷팅은 리스너 스레드에서)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스 안의 큐이므로 pickle 대비 포맷팅은 생략하고,
+        # 인자가 나중에 바뀌어도 로그 내용이 달라지지 않도록 메시지만 확정
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        # contextvar 는 리스너 스레드에서 보이지 않으므로 호출 시점 컨텍스트를 레코드에 보관
+        record.log_context = get_log_context()
+        return record
+
+
+class _RedactingQueueListener(QueueListener):
+    """출력 전에 민감 정보를 한 번만 마스킹하는 리스너 (핸들러마다 반복하지 않음)"""
+
+    def __init__(self, log_queue, *handlers):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._redactor = SensitiveDataFilter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        self._redactor.filter(record)
+        return record
+
+
+_listener: Optional[QueueListener] = None
+
+
 def setup_logger(name: str = "app") -> logging.Logger:
     """
     로거 설정
-    
+
     Args:
         name: 로거 이름
-    
+
     Returns:
         logging.Logger: 설정된 로거
     """
+    global _listener
+
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, settings.LOG_LEVEL))
-    
-    # 기존 핸들러 제거 (중복 방지)
+
+    # 기존 핸들러 / 리스너 제거 (중복 방지)
     logger.handlers.clear()
-    
+    if _listener is not None:
+        _listener.stop()
+
     # 포맷 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
+    if settings.LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = ContextTextFormatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(SensitiveDataFilter())
-    logger.addHandler(console_handler)
-    
-    # 파일 핸들러 (프로덕션 환경)
+    handlers = [console_handler]
+
+    # 파일 핸들러 (프로덕션 환경, 크기 기준 회전)
     if settings.ENVIRONMENT == "production":
         log_file = Path(settings.LOG_FILE)
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(SensitiveDataFilter())
-        logger.addHandler(file_handler)
-    
+        handlers.append(file_handler)
+
+    # 호출 스레드는 큐에 넣기만 하고 출력은 리스너 스레드에서
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(_NonBlockingQueueHandler(log_queue))
+    _listener = _RedactingQueueListener(log_queue, *handlers)
+    _listener.start()
+
+    # 고빈도 하위 로거 샘플링 (예: app.mqtt.message)
+    for logger_name, rate in settings.log_sample_rates.items():
+        sampled_logger = logging.getLogger(logger_name)
+        sampled_logger.filters = [f for f in sampled_logger.filters if not isinstance(f, SamplingFilter)]
+        sampled_logger.addFilter(SamplingFilter(rate))
+
     return logger
 
 
+def shutdown_logger() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 # 전역 로거 인스턴스
 logger = setup_logger()
 
+# 종료 시 큐에 남은 로그 출력
+atexit.register(shutdown_logger)
+
 
 def log_audit(user_id: int, action: str, resource_type: str = None, 
                resource_id: str = None, ip_address: str = None) -> None:
@@ -0,0 +1,158 @@
+"""
+Prometheus 지표
+요청 / MQTT / WebSocket / DB / 응급 경로 지표 정의와 GET /metrics 노출
+
+prometheus_client 의 Counter / Histogram / Gauge 는 내부 lock 으로 갱신되므로
+이벤트 루프, paho 네트워크 스레드, 스레드풀 어디서 갱신해도 안전합니다.
+"""
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+# 짧은 구간 (DB 쿼리, 풀 체크아웃, 소켓 전송) 용 버킷 (초)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# HTTP
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (라우트 템플릿별)",
+    ["method", "route", "status"],
+)
+
+# MQTT
+MQTT_MESSAGES = Counter(
+    "mqtt_messages_total",
+    "수신한 MQTT 메시지 수 (구독 패턴별)",
+    ["pattern"],
+)
+MQTT_HANDLER_SECONDS = Histogram(
+    "mqtt_handler_duration_seconds",
+    "MQTT 메시지 핸들러 실행 시간",
+    ["pattern"],
+    buckets=FAST_BUCKETS,
+)
+
+# WebSocket
+WS_CONNECTIONS = Gauge(
+    "websocket_connections",
+    "활성 WebSocket 연결 수 (all: 전체, operator: 응급 채널)",
+    ["channel"],
+)
+WS_SEND_INFLIGHT = Gauge(
+    "websocket_send_inflight",
+    "전송 대기 / 진행 중인 WebSocket 메시지 수 (송신 큐 깊이)",
+)
+WS_SEND_SECONDS = Histogram(
+    "websocket_send_duration_seconds",
+    "WebSocket 메시지 1건 전송 시간",
+    buckets=FAST_BUCKETS,
+)
+
+# DB
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "SQL 문 실행 시간 (커넥션 풀별)",
+    ["pool"],
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀 체크아웃 대기 시간",
+    ["pool"],
+    buckets=FAST_BUCKETS,
+)
+
+# 인증 캐시
+AUTH_CACHE_REQUESTS = Counter(
+    "auth_cache_requests_total",
+    "인증 캐시 조회 수 (cache: token / principal, result: hit / miss)",
+    ["cache", "result"],
+)
+
+# 비밀번호 해싱 (bcrypt 전용 스레드 풀)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt 작업 1건 실행 시간 (op: hash / verify)",
+    ["op"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "대기 / 실행 중인 bcrypt 작업 수",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "대기 한도 초과로 거절한 bcrypt 작업 수 (503 응답)",
+)
+
+# Refresh 토큰
+REFRESH_TOKEN_CHECKS = Counter(
+    "refresh_token_checks_total",
+    "refresh 토큰 사용 (rotated: 정상 교체, rejected: 무효 / 만료 / 재사용, "
+    "bloom_rejected: 블룸 필터 적중 후 DB 확인으로 거절, bloom_false_positive: 블룸 오탐)",
+    ["result"],
+)
+REFRESH_TOKENS_PURGED = Counter(
+    "refresh_tokens_purged_total",
+    "정리 작업으로 삭제한 refresh 토큰 행 수",
+)
+
+# 응급 경로
+EMERGENCY_DELIVERY_SECONDS = Histogram(
+    "emergency_delivery_seconds",
+    "응급 알림 지연 (ingest: 구간 종료→수신, fanout: 수신→전송 완료, end_to_end: 구간 종료→전송 완료)",
+    ["stage"],
+    buckets=FAST_BUCKETS + (5.0, 10.0),
+)
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 처리 시간 기록 (순수 ASGI 미들웨어)
+
+    라벨은 실제 경로 대신 라우트 템플릿 (/devices/{device_id}) 을 사용해 시계열 수를 제한
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status_code),
+            ).observe(time.perf_counter() - start)
+
+
+def render_metrics():
+    """
+    Prometheus 텍스트 형식 지표
+
+    Returns:
+        (본문 bytes, Content-Type)
+    """
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
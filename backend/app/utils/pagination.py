@@ -0,0 +1,62 @@
+"""
+커서(keyset) 페이지네이션 유틸리티
+OFFSET 대신 마지막 행의 정렬 키 이후부터 조회 (깊은 페이지도 인덱스 범위 스캔)
+"""
+import json
+import base64
+from datetime import datetime
+from typing import Any, List
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    정렬 키 값 → 불투명 커서 문자열
+
+    Args:
+        values: 마지막 행의 정렬 키 (예: [registered_at, id])
+
+    Returns:
+        str: URL-safe base64 커서
+    """
+    payload = [
+        {"t": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    커서 문자열 → 정렬 키 값
+
+    Args:
+        cursor: encode_cursor() 결과
+        size: 정렬 키 개수
+
+    Returns:
+        List: 정렬 키 값
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("유효하지 않은 커서입니다") from e
+
+    if not isinstance(payload, list) or len(payload) != size:
+        raise ValueError("유효하지 않은 커서입니다")
+
+    values = []
+    for value in payload:
+        if isinstance(value, dict):
+            try:
+                value = datetime.fromisoformat(value["t"])
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError("유효하지 않은 커서입니다") from e
+        elif not isinstance(value, (int, str)):
+            raise ValueError("유효하지 않은 커서입니다")
+        values.append(value)
+    return values
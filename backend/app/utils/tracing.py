@@ -0,0 +1,47 @@
+"""
+경량 분산 추적 (W3C traceparent 호환)
+
+ASR 서버가 보낸 traceparent 헤더를 이어 받아 결과 수신 / WebSocket 브로드캐스트 구간을
+ASR 서버의 발화 trace (VAD / 디코딩 / 전송) 와 같은 trace 로 기록합니다.
+trace_summary.py 로 두 서버의 span 을 합쳐 구간별 지연을 볼 수 있습니다.
+
+Span / Tracer / 내보내기 구현은 rk3588asr/asr_engine/tracing.py 를 그대로 사용하고,
+여기서는 백엔드 설정으로 전역 tracer 만 만듭니다.
+
+내보내기 (TRACE_EXPORTER):
+- off  : 기록하지 않음 (기본)
+- file : TRACE_FILE 에 span 1개당 JSON 1줄
+- otlp : TRACE_OTLP_ENDPOINT 로 OTLP/HTTP JSON 전송 (OpenTelemetry Collector 또는 simple_trace_collector.py)
+
+    from app.utils.tracing import tracer
+    with tracer.start_span("backend.receive_asr_result", parent=request.headers.get("traceparent")):
+        ...
+        span = tracer.child_span("ws.broadcast_to_subscribers")  # 기록 중인 trace 안에서만 생성 (아니면 None)
+"""
+from rk3588asr.asr_engine.tracing import Span, Tracer, create_exporter, parse_traceparent
+
+from app.config import settings
+from app.utils.logger import logger
+
+__all__ = ["Span", "Tracer", "parse_traceparent", "tracer", "get_tracer"]
+
+
+# 전역 tracer
+tracer = Tracer(
+    settings.TRACE_SERVICE_NAME,
+    create_exporter(
+        {
+            "service_name": settings.TRACE_SERVICE_NAME,
+            "exporter": settings.TRACE_EXPORTER,
+            "file": settings.TRACE_FILE,
+            "otlp_endpoint": settings.TRACE_OTLP_ENDPOINT,
+        },
+        log=logger,
+    ),
+    settings.TRACE_SAMPLE_RATE,
+)
+
+
+def get_tracer() -> Tracer:
+    """tracer 인스턴스 반환"""
+    return tracer
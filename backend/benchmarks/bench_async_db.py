@@ -0,0 +1,201 @@
+"""
+동기 / 비동기 DB 세션 처리량 비교 (고정 동시 요청 수)
+
+MySQL 대신 SQLite 파일 DB 를 쓰고, 쿼리마다 --db-latency-ms 만큼 지연을 넣어 네트워크 왕복을 흉내냅니다.
+- 동기 모드: 이전 구현과 같은 `async def` + 동기 Session (지연 동안 이벤트 루프가 멈춤, time.sleep)
+- 비동기 모드: 현재 앱 라우트 + AsyncSession (aiosqlite, 지연 동안 다른 요청 처리, asyncio.sleep)
+
+두 모드 모두 같은 엔드포인트를 호출합니다: GET /devices/{id}, GET /devices/?page_size=20
+
+실행:
+    cd backend
+    python benchmarks/bench_async_db.py --concurrency 32 --requests 2000 --db-latency-ms 5
+"""
+import os
+import sys
+import time
+import socket
+import asyncio
+import tempfile
+import argparse
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import aiosqlite  # noqa: E402
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException, Query  # noqa: E402
+from sqlalchemy import create_engine, desc, event  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+from sqlalchemy.pool import AsyncAdaptedQueuePool  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import Base, get_async_db  # noqa: E402
+from app.models import Device  # noqa: E402
+from app.schemas.device import DeviceResponse, DeviceListResponse  # noqa: E402
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(p * len(samples)))] if samples else float("nan")
+
+
+def start_server(target):
+    """lifespan(MySQL / MQTT 연결) 없이 앱만 별도 프로세스에서 실행 (부하 생성기와 GIL 분리)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    def serve():
+        uvicorn.run(target, host="127.0.0.1", port=port, lifespan="off", log_level="warning")
+
+    process = multiprocessing.get_context("fork").Process(target=serve, daemon=True)
+    process.start()
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                break
+        except OSError:
+            time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", process
+
+
+def build_sync_app(SessionLocal) -> FastAPI:
+    """이전 구현 (async def 핸들러 안에서 동기 Session 사용)"""
+    sync_app = FastAPI()
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @sync_app.get("/devices/", response_model=DeviceListResponse)
+    async def list_devices(
+        page: int = Query(1, ge=1),
+        page_size: int = Query(10, ge=1, le=100),
+        db: Session = Depends(get_db),
+    ):
+        query = db.query(Device)
+        total = query.count()
+        devices = (
+            query.order_by(desc(Device.registered_at))
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        return DeviceListResponse(devices=devices, total=total, page=page, page_size=page_size)
+
+    @sync_app.get("/devices/{device_id}", response_model=DeviceResponse)
+    async def get_device(device_id: int, db: Session = Depends(get_db)):
+        device = db.query(Device).filter(Device.id == device_id).first()
+        if not device:
+            raise HTTPException(status_code=404)
+        return device
+
+    return sync_app
+
+
+async def load(base_url: str, concurrency: int, total: int, devices: int):
+    latencies = []
+    counter = iter(range(total))
+
+    async def worker(client):
+        for i in counter:
+            path = f"/devices/{i % devices + 1}" if i % 2 else "/devices/?page_size=20"
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await client.get("/devices/1")  # 연결 / 캐시 워밍업
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return total / elapsed, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기 / 비동기 DB 세션 처리량 비교")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=2000, help="모드별 요청 수")
+    parser.add_argument("--db-latency-ms", type=float, default=5.0, help="쿼리당 DB 왕복 지연 (ms)")
+    parser.add_argument("--devices", type=int, default=1000, help="장비 수")
+    args = parser.parse_args()
+    latency = args.db_latency_ms / 1000
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    # 동기 풀도 동시 요청 수만큼 확보 (기본 5 + 10 이면 풀이 바닥난 뒤 이벤트 루프 안에서 체크아웃을 기다리다
+    # 연결 반환(스레드풀에서 실행되는 의존성 정리)까지 막혀 pool_timeout 까지 멈춤)
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, pool_size=args.concurrency
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with SessionLocal() as db:
+        db.bulk_insert_mappings(
+            Device,
+            [{"device_id": f"bench-{i:05d}", "device_name": f"bench {i}"} for i in range(args.devices)],
+        )
+        db.commit()
+
+    # 동기 모드 지연: 드라이버 호출이 스레드를 막는 것과 동일
+    @event.listens_for(engine, "before_cursor_execute")
+    def sync_latency(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(latency)
+
+    # 비동기 모드 지연: aiosqlite 커서 실행 앞에서 await
+    original_execute = aiosqlite.Cursor.execute
+
+    async def async_latency_execute(self, sql, parameters=None):
+        await asyncio.sleep(latency)
+        return await original_execute(self, sql, parameters)
+
+    aiosqlite.Cursor.execute = async_latency_execute
+
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}", poolclass=AsyncAdaptedQueuePool, pool_size=args.concurrency
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    results = {}
+    for mode, target in [("sync", build_sync_app(SessionLocal)), ("async", app)]:
+        base_url, process = start_server(target)
+        rps, latencies = asyncio.run(load(base_url, args.concurrency, args.requests, args.devices))
+        results[mode] = (rps, latencies)
+        process.terminate()
+
+    print(
+        f"\n[DB 세션 처리량] 동시 {args.concurrency}, 모드별 {args.requests}요청, "
+        f"쿼리당 지연 {args.db_latency_ms}ms"
+    )
+    for mode, label in [("sync", "동기 Session (이전)"), ("async", "AsyncSession")]:
+        rps, latencies = results[mode]
+        print(
+            f"  {label:<20} {rps:>8.1f} req/s   p50 {percentile(latencies, 0.5):>7.1f}ms   "
+            f"p99 {percentile(latencies, 0.99):>7.1f}ms"
+        )
+    print(f"  처리량 배율: {results['async'][0] / results['sync'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
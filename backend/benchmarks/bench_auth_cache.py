@@ -0,0 +1,185 @@
+"""
+인증 캐시 벤치마크 (get_current_user)
+
+SQLite 파일 DB 에 사용자 N명을 만들고 access 토큰을 돌려 쓰며 인증 비용을 비교합니다.
+쿼리마다 --db-latency-ms 만큼 지연을 넣어 MySQL 왕복을 흉내냅니다.
+
+1) 의존성만: get_current_user 를 직접 호출 (JWT 서명 검증 + User 조회)
+2) 요청: GET /auth/me 동시 요청 (uvicorn 별도 프로세스 + httpx)
+   get_current_user 는 async def 안에서 동기 조회를 하므로 캐시가 없으면 조회 동안 이벤트 루프가 멈춥니다.
+
+각각 캐시 끔 (이전과 동일: 요청마다 검증 + 조회) / 캐시 켬 으로 실행합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_auth_cache.py --users 50 --requests 5000 --concurrency 16 --db-latency-ms 1
+"""
+import os
+import sys
+import time
+import socket
+import asyncio
+import tempfile
+import argparse
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.api import auth  # noqa: E402
+from app.database import Base, get_db  # noqa: E402
+from app.dependencies import get_current_user  # noqa: E402
+from app.models import User, UserRole  # noqa: E402
+from app.security import create_access_token  # noqa: E402
+from app.services.auth_cache import get_auth_cache  # noqa: E402
+
+
+def start_server(target):
+    """앱만 별도 프로세스에서 실행 (부하 생성기와 GIL 분리, 캐시 설정은 fork 시점 상태)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    def serve():
+        uvicorn.run(target, host="127.0.0.1", port=port, lifespan="off", log_level="warning")
+
+    process = multiprocessing.get_context("fork").Process(target=serve, daemon=True)
+    process.start()
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                break
+        except OSError:
+            time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", process
+
+
+async def load(base_url: str, tokens, concurrency: int, total: int) -> float:
+    """GET /auth/me 를 concurrency 개 연결로 total 회, 소요 시간 (초)"""
+    counter = iter(range(total))
+
+    async def worker(client):
+        for i in counter:
+            response = await client.get("/auth/me", headers={"Authorization": f"Bearer {tokens[i % len(tokens)]}"})
+            response.raise_for_status()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await client.get("/auth/me", headers={"Authorization": f"Bearer {tokens[0]}"})  # 연결 워밍업
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+def configure_cache(enabled: bool) -> None:
+    """전역 인증 캐시 켜기 / 끄기 (끄면 이전 구현과 같은 경로)"""
+    cache = get_auth_cache()
+    cache.token_cache_size = 10000 if enabled else 0
+    cache.principal_ttl_seconds = 10.0 if enabled else 0
+    cache.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 캐시 벤치마크 (get_current_user)")
+    parser.add_argument("--users", type=int, default=50, help="사용자 (토큰) 수")
+    parser.add_argument("--requests", type=int, default=5000, help="구성별 인증 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="GET /auth/me 동시 요청 수")
+    parser.add_argument("--db-latency-ms", type=float, default=1.0, help="쿼리당 DB 왕복 지연 (ms)")
+    args = parser.parse_args()
+    latency = args.db_latency_ms / 1000
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, pool_size=args.concurrency
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with SessionLocal() as db:
+        db.bulk_insert_mappings(
+            User,
+            [
+                {
+                    "username": f"bench{i}",
+                    "email": f"bench{i}@example.com",
+                    "password_hash": "x",
+                    "role": UserRole.VIEWER,
+                }
+                for i in range(args.users)
+            ],
+        )
+        db.commit()
+        users = db.query(User).all()
+        tokens = [
+            create_access_token({"sub": str(user.id), "username": user.username, "role": user.role.value})
+            for user in users
+        ]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def db_latency(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(latency)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    bench_app = FastAPI()
+    bench_app.include_router(auth.router)
+    bench_app.dependency_overrides[get_db] = override_get_db
+
+    async def run_dependency() -> float:
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            for i in range(args.requests):
+                credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=tokens[i % len(tokens)])
+                await get_current_user(credentials, db)
+                db.expunge_all()  # 요청마다 새 세션과 같은 상태
+            return time.perf_counter() - start
+        finally:
+            db.close()
+
+    results = []
+    for enabled in (False, True):
+        configure_cache(enabled)
+        dependency_elapsed = asyncio.run(run_dependency())
+        stats = get_auth_cache().stats()
+        configure_cache(enabled)
+        base_url, process = start_server(bench_app)
+        request_elapsed = asyncio.run(load(base_url, tokens, args.concurrency, args.requests))
+        process.terminate()
+        results.append((enabled, dependency_elapsed, request_elapsed, stats))
+
+    print(
+        f"\n[인증] 사용자 {args.users}명, 구성별 {args.requests:,}회, 동시 {args.concurrency}, "
+        f"쿼리당 지연 {args.db_latency_ms}ms"
+    )
+    print(f"  {'구성':<10} {'의존성만 /s':>14} {'GET /auth/me /s':>18} {'토큰 적중률':>12} {'사용자 적중률':>14}")
+    for enabled, dependency_elapsed, request_elapsed, stats in results:
+        label = "캐시 켬" if enabled else "캐시 끔"
+        print(
+            f"  {label:<10} {args.requests / dependency_elapsed:>14,.0f} {args.requests / request_elapsed:>18,.0f} "
+            f"{stats['token_hit_rate']:>12.1%} {stats['principal_hit_rate']:>14.1%}"
+        )
+    base, cached = results
+    print(f"  요청 처리량 배율: {base[2] / cached[2]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+DB 커넥션 풀 구성 벤치마크
+
+SQLite 파일 DB 의 커서 실행마다 --rtt-ms 만큼 지연을 넣어 MySQL 왕복을 흉내냅니다 (pre-ping 의 SELECT 1 포함).
+1) 공유 풀 vs 분리 풀: 요청 스레드와 MQTT 수신 스레드가 같은 풀을 쓸 때 요청 체크아웃 대기 시간
+2) pre-ping always vs idle: 체크아웃마다 왕복 1회 추가 여부에 따른 처리량
+
+실행:
+    cd backend
+    python benchmarks/bench_db_pool.py --request-threads 16 --ingest-threads 8 --rtt-ms 2
+"""
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import argparse
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from app.utils.db_pool import InstrumentedQueuePool, instrument_engine  # noqa: E402
+
+RTT = 0.002
+
+
+class SlowCursor(sqlite3.Cursor):
+    """네트워크 왕복 지연을 흉내내는 커서"""
+
+    def execute(self, *args, **kwargs):
+        time.sleep(RTT)
+        return super().execute(*args, **kwargs)
+
+
+class SlowConnection(sqlite3.Connection):
+    def cursor(self, factory=SlowCursor):
+        return super().cursor(factory)
+
+
+def make_engine(db_path: str, name: str, size: int, overflow: int, pre_ping: str):
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=size,
+        max_overflow=overflow,
+        pool_timeout=30,
+        pool_pre_ping=pre_ping == "always",
+        connect_args={"check_same_thread": False, "factory": SlowConnection},
+    )
+    metrics = instrument_engine(engine, name, pre_ping=pre_ping, ping_idle_seconds=300)
+    return engine, metrics
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(p * len(samples)))] if samples else float("nan")
+
+
+def run_load(request_engine, ingest_engine, request_threads: int, ingest_threads: int, duration: float):
+    """
+    duration 초 동안 요청(쿼리 1회) / 수신(쿼리 3회) 반복
+
+    Returns:
+        (요청/s, 수신 메시지/s, 요청 체크아웃 대기 목록 ms)
+    """
+    stop = threading.Event()
+    handled = [0] * request_threads
+    ingested = [0] * ingest_threads
+    waits = [[] for _ in range(request_threads)]
+
+    def request_worker(index):
+        while not stop.is_set():
+            start = time.perf_counter()
+            with request_engine.connect() as conn:
+                waits[index].append((time.perf_counter() - start) * 1000)
+                conn.execute(text("SELECT id FROM devices WHERE id = :id"), {"id": index + 1}).fetchall()
+            handled[index] += 1
+            time.sleep(0.002)  # 요청 사이 응답 직렬화 / 네트워크 시간
+
+    def ingest_worker(index):
+        # 장비 조회 / 상태 INSERT / COMMIT 왕복 3회 (연결을 잡고 있는 시간이 요청보다 김)
+        while not stop.is_set():
+            with ingest_engine.connect() as conn:
+                for _ in range(3):
+                    conn.execute(text("SELECT id FROM devices WHERE id = :id"), {"id": index + 1}).fetchall()
+            ingested[index] += 1
+            time.sleep(0.001)  # 다음 MQTT 메시지 도착
+
+    threads = [threading.Thread(target=request_worker, args=(i,)) for i in range(request_threads)]
+    threads += [threading.Thread(target=ingest_worker, args=(i,)) for i in range(ingest_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(handled) / duration, sum(ingested) / duration, [w for ws in waits for w in ws]
+
+
+def main():
+    global RTT
+    parser = argparse.ArgumentParser(description="DB 커넥션 풀 구성 벤치마크")
+    parser.add_argument("--request-threads", type=int, default=16, help="요청 처리 스레드 수")
+    parser.add_argument("--ingest-threads", type=int, default=8, help="MQTT 수신 스레드 수")
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="DB 왕복 지연 (ms)")
+    parser.add_argument("--duration", type=float, default=3.0, help="구성별 실행 시간 (초)")
+    args = parser.parse_args()
+    RTT = args.rtt_ms / 1000
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE devices (id INTEGER PRIMARY KEY, device_id TEXT)")
+        conn.executemany("INSERT INTO devices VALUES (?, ?)", [(i, f"bench-{i}") for i in range(1, 1001)])
+
+    print(
+        f"\n[풀 구성] 요청 스레드 {args.request_threads}, 수신 스레드 {args.ingest_threads}, "
+        f"왕복 {args.rtt_ms}ms, 구성별 {args.duration}초"
+    )
+    print(
+        f"  {'구성':<28} {'요청/s':>7} {'수신/s':>7} {'요청 대기 p50':>12} {'p99':>8} {'max':>8} "
+        f"{'오버플로':>6} {'ping':>6}"
+    )
+
+    # 같은 총 연결 수 (10 + 5) 로 비교
+    shared, shared_metrics = make_engine(db_path, "shared", 10, 5, "idle")
+    split_request, split_metrics = make_engine(db_path, "request", 10, 0, "idle")
+    split_ingest, _ = make_engine(db_path, "ingest", 5, 0, "idle")
+    always_request, always_metrics = make_engine(db_path, "request-always", 10, 0, "always")
+    always_ingest, _ = make_engine(db_path, "ingest-always", 5, 0, "always")
+
+    scenarios = [
+        ("공유 풀 (10 + 5), idle ping", shared, shared, shared_metrics, False),
+        ("분리 풀 (10 / 5), idle ping", split_request, split_ingest, split_metrics, False),
+        ("분리 풀 (10 / 5), always ping", always_request, always_ingest, always_metrics, True),
+    ]
+    for label, request_engine, ingest_engine, metrics, ping_every_checkout in scenarios:
+        rps, ingest_rps, waits = run_load(
+            request_engine, ingest_engine, args.request_threads, args.ingest_threads, args.duration
+        )
+        stats = metrics.stats()
+        # always 전략은 SQLAlchemy 내부 pre-ping (체크아웃마다 1회)
+        pings = stats["checkouts"] if ping_every_checkout else stats["pings"]
+        print(
+            f"  {label:<28} {rps:>7.0f} {ingest_rps:>7.0f} {percentile(waits, 0.5):>10.2f}ms "
+            f"{percentile(waits, 0.99):>6.1f}ms {max(waits):>6.1f}ms {stats['overflow_events']:>6} {pings:>6}"
+        )
+
+    for engine in (shared, split_request, split_ingest, always_request, always_ingest):
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+장비 목록 페이지네이션 벤치마크 (10만 대)
+
+SQLite 파일 DB 에 장비 N대를 채운 뒤 GET /devices/ 와 같은 쿼리를 비교합니다.
+- OFFSET 페이지네이션: 앞 / 중간 / 마지막 페이지 (요청마다 COUNT 포함)
+- 커서 페이지네이션: 같은 위치의 페이지 (캐시된 개수)
+- is_online 필터 + 복합 인덱스 사용 여부 (EXPLAIN QUERY PLAN)
+
+실행:
+    cd backend
+    python benchmarks/bench_device_listing.py --devices 100000
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+
+from sqlalchemy import create_engine, desc, text, or_  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import Device  # noqa: E402
+from app.services.count_cache import CountCache  # noqa: E402
+from app.utils.pagination import encode_cursor, decode_cursor  # noqa: E402
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="장비 목록 페이지네이션 벤치마크")
+    parser.add_argument("--devices", type=int, default=100000, help="장비 수")
+    parser.add_argument("--page-size", type=int, default=50, help="페이지 크기")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    print(f"📥 장비 {args.devices:,}대 채우는 중")
+    base = datetime(2024, 1, 1)
+    db.bulk_insert_mappings(
+        Device,
+        [
+            {
+                "device_id": f"bench-{i:06d}",
+                "device_name": f"bench {i}",
+                "device_type": "CoreS3" if i % 4 else "RK3588",
+                "is_online": i % 3 == 0,
+                # 같은 시각에 여러 대 등록 (id 로 순서 결정되는지 확인)
+                "registered_at": base + timedelta(seconds=i // 5),
+            }
+            for i in range(args.devices)
+        ],
+    )
+    db.commit()
+    db.execute(text("ANALYZE"))
+
+    page_size = args.page_size
+    cache = CountCache(ttl_seconds=30)
+
+    def base_query(is_online=None):
+        query = db.query(Device)
+        if is_online is not None:
+            query = query.filter(Device.is_online == is_online)
+        return query
+
+    def offset_page(page, is_online=None):
+        query = base_query(is_online)
+        total = query.count()
+        rows = (
+            query.order_by(desc(Device.registered_at), desc(Device.id))
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        return total, rows
+
+    def cursor_page(cursor, is_online=None):
+        query = base_query(is_online)
+        total = cache.get(db, ("devices", is_online, None), lambda s: query.with_session(s).count())
+        query = query.order_by(desc(Device.registered_at), desc(Device.id))
+        if cursor:
+            registered_at, last_id = decode_cursor(cursor, 2)
+            query = query.filter(
+                Device.registered_at <= registered_at,
+                or_(Device.registered_at < registered_at, Device.id < last_id),
+            )
+        rows = query.limit(page_size + 1).all()
+        next_cursor = None
+        if len(rows) > page_size:
+            last = rows[page_size - 1]
+            next_cursor = encode_cursor([last.registered_at, last.id])
+        return total, rows[:page_size], next_cursor
+
+    # 각 페이지 시작 위치의 커서 (마지막 행 기준)
+    def cursor_before(page, is_online=None):
+        if page == 1:
+            return None
+        _, rows = offset_page(page - 1, is_online)
+        last = rows[-1]
+        return encode_cursor([last.registered_at, last.id])
+
+    # 정확성: 커서로 끝까지 순회하면 모든 장비를 정확히 1번씩 본다
+    seen, cursor, pages = set(), None, 0
+    while True:
+        _, rows, cursor = cursor_page(cursor)
+        seen.update(row.id for row in rows)
+        pages += 1
+        if cursor is None:
+            break
+    assert len(seen) == args.devices, f"커서 순회 누락: {len(seen)} / {args.devices}"
+    print(f"   커서 전체 순회: {pages:,}페이지, 장비 {len(seen):,}대 (중복 / 누락 없음)")
+
+    for label, is_online in [("필터 없음", None), ("is_online=true", True)]:
+        count = args.devices if is_online is None else len(range(0, args.devices, 3))
+        pages_total = (count + page_size - 1) // page_size
+        print(f"\n[{label}: {count:,}대, page_size={page_size}]")
+        print(f"  {'페이지':>8} | {'OFFSET + COUNT':>14} | {'커서 + 캐시 개수':>14}")
+        for page in [1, pages_total // 2, pages_total]:
+            cursor = cursor_before(page, is_online)
+            (_, offset_rows), offset_ms = timed(lambda: offset_page(page, is_online))
+            (_, cursor_rows, _), cursor_ms = timed(lambda: cursor_page(cursor, is_online))
+            assert [r.id for r in offset_rows] == [r.id for r in cursor_rows]
+            print(f"  {page:>8} | {offset_ms:>12.1f}ms | {cursor_ms:>12.1f}ms")
+
+    print("\n[쿼리 계획: is_online=true 커서 페이지]")
+    sql = (
+        "EXPLAIN QUERY PLAN SELECT id FROM devices WHERE is_online = 1 "
+        "AND registered_at <= '2024-06-01 00:00:00.000000' "
+        "AND (registered_at < '2024-06-01 00:00:00.000000' OR id < 1000000) "
+        "ORDER BY registered_at DESC, id DESC LIMIT 51"
+    )
+    for row in db.execute(text(sql)):
+        print(f"  {row[-1]}")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+응급 우선 경로 지연 시간 벤치마크
+
+FastAPI 앱을 로컬 포트에 띄우고(uvicorn, SQLite) 운영자 WebSocket 연결 N개를 맺은 뒤,
+일반 결과를 계속 보내는 중에 응급 결과를 보내 다음을 측정합니다.
+- 응급: 음성 구간 종료(segment_end) → 운영자 소켓 수신 p50 / p99
+- 일반: segment_end → 구독자 소켓 수신 p50 / p99 (비교용)
+
+실행:
+    cd backend
+    python benchmarks/bench_emergency_path.py --operators 8 --emergencies 200
+"""
+import os
+import sys
+import json
+import time
+import socket
+import tempfile
+import argparse
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+
+import requests  # noqa: E402
+import uvicorn  # noqa: E402
+from websockets.sync.client import connect  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import Base, get_db, get_async_db  # noqa: E402
+from app.models import Device, EmergencyEvent  # noqa: E402
+from app.security import create_access_token  # noqa: E402
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(p * len(samples)))] if samples else float("nan")
+
+
+def start_server() -> str:
+    """lifespan(MySQL / MQTT 연결) 없이 앱만 백그라운드 스레드에서 실행"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, lifespan="off", log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"127.0.0.1:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응급 우선 경로 지연 시간 벤치마크")
+    parser.add_argument("--operators", type=int, default=8, help="운영자 WebSocket 연결 수")
+    parser.add_argument("--emergencies", type=int, default=200, help="응급 결과 수")
+    parser.add_argument("--normal-per-emergency", type=int, default=5, help="응급 1건당 일반 결과 수")
+    args = parser.parse_args()
+
+    # SQLite 파일 DB (스레드풀 저장 경로 포함)
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with SessionLocal() as db:
+        device = Device(device_id="bench_device", device_name="Bench-01")
+        db.add(device)
+        db.commit()
+        device_pk = device.id
+
+    address = start_server()
+    http = requests.Session()
+    latencies = {"emergency": [], "normal": []}
+    lock = threading.Lock()
+    expected = args.emergencies * args.operators
+    done = threading.Event()
+
+    def receiver(ws, kind_filter):
+        while not done.is_set():
+            try:
+                message = json.loads(ws.recv())
+            except Exception:
+                return
+            if message.get("type") != "asr_result" or not message.get("segment_end"):
+                continue
+            kind = "emergency" if message.get("is_emergency") else "normal"
+            if kind != kind_filter:
+                continue
+            with lock:
+                latencies[kind].append((time.time() - message["segment_end"]) * 1000)
+                if len(latencies["emergency"]) >= expected:
+                    done.set()
+
+    sockets = []
+    threads = []
+    # 운영자: 응급 채널 (구독 없음)
+    for i in range(args.operators):
+        token = create_access_token({"sub": str(1000 + i), "role": "operator"})
+        ws = connect(f"ws://{address}/ws?token={token}")
+        ws.recv()  # connected
+        sockets.append(ws)
+        threads.append(threading.Thread(target=receiver, args=(ws, "emergency"), daemon=True))
+
+    # 뷰어: 장비 구독 (일반 결과 수신)
+    token = create_access_token({"sub": "1", "role": "viewer"})
+    viewer = connect(f"ws://{address}/ws?token={token}")
+    viewer.recv()
+    viewer.send(json.dumps({"type": "subscribe_device", "device_id": device_pk}))
+    viewer.recv()  # subscribed
+    sockets.append(viewer)
+    threads.append(threading.Thread(target=receiver, args=(viewer, "normal"), daemon=True))
+
+    for thread in threads:
+        thread.start()
+
+    def payload(i, emergency):
+        return {
+            "device_id": "bench_device",
+            "session_id": "bench-session",
+            "text": "도와줘 사람이 쓰러졌어" if emergency else f"일반 발화 {i}",
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "duration": 1.5,
+            "is_emergency": emergency,
+            "emergency_keywords": ["도와줘"] if emergency else [],
+            "segment_end": time.time(),
+        }
+
+    start = time.time()
+    for i in range(args.emergencies):
+        for j in range(args.normal_per_emergency):
+            http.post(f"http://{address}/asr/result", json=payload(i * args.normal_per_emergency + j, False))
+        response = http.post(f"http://{address}/asr/result", json=payload(i, True))
+        response.raise_for_status()
+    done.wait(timeout=30)
+    elapsed = time.time() - start
+
+    stats = http.get(f"http://{address}/asr/emergency/stats").json()
+    with SessionLocal() as db:
+        persisted = db.query(EmergencyEvent).count()
+
+    print(f"\n[응급 우선 경로] 운영자 {args.operators}명, 응급 {args.emergencies}건, "
+          f"일반 {args.emergencies * args.normal_per_emergency}건 ({elapsed:.1f}초)")
+    for kind, label in (("emergency", "응급 → 운영자"), ("normal", "일반 → 구독자")):
+        samples = latencies[kind]
+        print(f"  {label:<14} 수신 {len(samples):>5}건  p50 {percentile(samples, 0.5):7.2f}ms  "
+              f"p99 {percentile(samples, 0.99):7.2f}ms")
+    print(f"  서버 측 end_to_end: {stats['end_to_end']}")
+    print(f"  서버 측 fanout:     {stats['fanout']}")
+    print(f"  저장된 응급 이벤트: {persisted}건")
+
+    for ws in sockets:
+        ws.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+장비 최신 상태 조회 벤치마크
+
+SQLite 파일 DB 에 장비 N대 × 상태 M건을 채운 뒤 대시보드 1회 로딩 비용을 비교합니다.
+- 기존: 장비마다 ORDER BY recorded_at DESC LIMIT 1 (N번 쿼리)
+- 프로젝션 테이블: device_latest_status 전체 1번 조회
+- 메모리 미러: LatestStatusService.get_many()
+
+측정 전에 순서가 뒤바뀐 upsert (MQTT / HTTP 기록이 섞여 커밋되는 경우) 가
+최신 상태를 덮어쓰지 않는지 확인합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_latest_status.py --devices 2000 --history 50
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+
+from sqlalchemy import create_engine, desc  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import Device, DeviceStatus, DeviceLatestStatus  # noqa: E402
+from app.services.latest_status_service import LatestStatusService  # noqa: E402
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return result, best
+
+
+def check_out_of_order(db, device_id: int) -> bool:
+    """status_id 가 큰 상태를 먼저 upsert 한 뒤 작은 상태를 upsert → 프로젝션은 큰 쪽 유지"""
+    service = LatestStatusService()
+    older = DeviceStatus(device_id=device_id, battery_level=10, recorded_at=datetime.utcnow())
+    newer = DeviceStatus(device_id=device_id, battery_level=90, recorded_at=datetime.utcnow())
+    db.add_all([older, newer])
+    db.flush()
+    for status in (newer, older):
+        service.remember(service.upsert(db, status))
+    db.commit()
+
+    row = db.get(DeviceLatestStatus, device_id)
+    db.refresh(row)
+    mirror = service._cache[device_id]
+    ok = row.status_id == newer.id and row.battery_level == 90 and mirror["id"] == newer.id
+    print(
+        f"🔀 순서 뒤바뀐 upsert: 테이블 status_id={row.status_id}, 미러 id={mirror['id']} "
+        f"(기대 {newer.id}) {'✅' if ok else '❌'}"
+    )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="장비 최신 상태 조회 벤치마크")
+    parser.add_argument("--devices", type=int, default=2000, help="장비 수")
+    parser.add_argument("--history", type=int, default=50, help="장비당 상태 이력 수")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    db.bulk_insert_mappings(
+        Device,
+        [{"device_id": f"bench-{i:05d}", "device_name": f"bench {i}"} for i in range(args.devices)],
+    )
+    db.commit()
+    device_ids = [row[0] for row in db.query(Device.id).all()]
+
+    if not check_out_of_order(db, device_ids[0]):
+        raise SystemExit(1)
+    db.query(DeviceStatus).delete()
+    db.query(DeviceLatestStatus).delete()
+    db.commit()
+
+    print(f"📥 device_status 채우는 중: {args.devices}대 × {args.history}건")
+    now = datetime.utcnow().replace(microsecond=0)
+    batch = []
+    for step in range(args.history):
+        recorded_at = now - timedelta(seconds=(args.history - step) * 10)
+        for device_id in device_ids:
+            batch.append({
+                "device_id": device_id,
+                "battery_level": 100 - step % 100,
+                "temperature": 36.5,
+                "cpu_usage": step % 100,
+                "camera_status": "stopped",
+                "mic_status": "stopped",
+                "recorded_at": recorded_at,
+            })
+    db.bulk_insert_mappings(DeviceStatus, batch)
+    db.commit()
+
+    service = LatestStatusService()
+    _, ms = timed(lambda: service.initialize(db), repeat=1)
+    print(f"   프로젝션 생성 + 로드: {ms:.0f}ms")
+
+    def per_device():
+        return [
+            db.query(DeviceStatus)
+            .filter(DeviceStatus.device_id == device_id)
+            .order_by(desc(DeviceStatus.recorded_at))
+            .first()
+            for device_id in device_ids
+        ]
+
+    print(f"\n[대시보드 1회 로딩: 장비 {args.devices}대]")
+    rows, ms = timed(per_device, repeat=1)
+    print(f"  장비별 LIMIT 1 쿼리 ({len(rows)}번): {ms:.1f}ms")
+    rows, ms = timed(lambda: db.query(DeviceLatestStatus).all())
+    print(f"  프로젝션 테이블 1번 조회 ({len(rows)}행): {ms:.1f}ms")
+    rows, ms = timed(lambda: service.get_many(db))
+    print(f"  메모리 미러 get_many ({len(rows)}개): {ms:.1f}ms")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
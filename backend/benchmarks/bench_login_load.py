@@ -0,0 +1,192 @@
+"""
+로그인 부하 중 이벤트 루프 응답성 벤치마크 (bcrypt 오프로드)
+
+앱을 별도 프로세스 (uvicorn, SQLite) 로 띄우고 WebSocket 연결 N개가 ping 을 계속 보내는 동안
+동시 로그인 요청을 보내 다음을 비교합니다.
+- WebSocket ping → pong 왕복 시간 p50 / p99 / max (이벤트 루프가 멈추면 그대로 늘어남)
+- 로그인 처리량, 503 (bcrypt 대기 한도 초과) 응답 수
+
+1) 이전: async 로그인 핸들러 안에서 bcrypt 검증 (루프에서 직접 실행)
+2) 풀: 현재 구현 (bcrypt 전용 스레드 풀 + 대기 한도)
+
+동시 로그인 수가 DB 풀 (DB_POOL_SIZE + DB_MAX_OVERFLOW) 을 넘으면 두 모드 모두
+동기 Session 체크아웃 대기로 루프가 멈추므로 (bench_async_db.py 참고) 풀보다 작게 설정하세요.
+
+실행:
+    cd backend
+    python benchmarks/bench_login_load.py --logins 8 --sockets 20 --duration 10
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import tempfile
+import argparse
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+import websockets  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.api import auth  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import Base, get_db  # noqa: E402
+from app.models import User, UserRole  # noqa: E402
+from app.security import create_access_token, get_password_hash  # noqa: E402
+from app.security.password import verify_and_update_password  # noqa: E402
+
+PASSWORD = "Bench1234!"
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(p * len(samples)))] if samples else float("nan")
+
+
+async def inline_verify_and_update(plain_password, hashed_password):
+    """이전 구현: 이벤트 루프에서 bcrypt 를 직접 실행"""
+    return verify_and_update_password(plain_password, hashed_password)
+
+
+def start_server(inline: bool):
+    """lifespan(MySQL / MQTT 연결) 없이 앱만 별도 프로세스에서 실행 (부하 생성기와 GIL 분리)"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    def serve():
+        if inline:
+            auth.verify_and_update_password_async = inline_verify_and_update
+        uvicorn.run(app, host="127.0.0.1", port=port, lifespan="off", log_level="warning")
+
+    process = multiprocessing.get_context("fork").Process(target=serve, daemon=True)
+    process.start()
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                break
+        except OSError:
+            time.sleep(0.05)
+    return f"127.0.0.1:{port}", process
+
+
+async def run_load(address: str, usernames, sockets: int, logins: int, duration: float, ping_interval: float):
+    """WebSocket ping 왕복 시간 + 로그인 결과 수집"""
+    rtts = []
+    results = {"ok": 0, "busy": 0, "error": 0}
+    deadline = time.perf_counter() + duration
+
+    async def pinger(index):
+        token = create_access_token({"sub": str(index + 1), "role": "viewer"})
+        # 클라이언트 keepalive 는 끔 (루프가 멈춘 서버에서 연결이 끊기지 않고 지연으로 측정되도록)
+        async with websockets.connect(f"ws://{address}/ws?token={token}", ping_interval=None, open_timeout=None) as ws:
+            await ws.recv()  # connected
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                await ws.send(json.dumps({"type": "ping"}))
+                await ws.recv()
+                rtts.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(ping_interval)
+
+    async def login_worker(client, index):
+        username = usernames[index % len(usernames)]
+        while time.perf_counter() < deadline:
+            response = await client.post("/auth/login", json={"username": username, "password": PASSWORD})
+            if response.status_code == 200:
+                results["ok"] += 1
+            elif response.status_code == 503:
+                results["busy"] += 1
+                await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+            else:
+                results["error"] += 1
+
+    limits = httpx.Limits(max_connections=logins, max_keepalive_connections=logins)
+    async with httpx.AsyncClient(base_url=f"http://{address}", limits=limits, timeout=120) as client:
+        await asyncio.gather(
+            *(pinger(i) for i in range(sockets)),
+            *(login_worker(client, i) for i in range(logins)),
+        )
+    return rtts, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 부하 중 이벤트 루프 응답성 (bcrypt 오프로드)")
+    parser.add_argument("--logins", type=int, default=8, help="동시 로그인 요청 수 (DB 풀 크기보다 작게)")
+    parser.add_argument("--sockets", type=int, default=20, help="ping 을 보내는 WebSocket 연결 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="모드별 측정 시간 (초)")
+    parser.add_argument("--ping-interval-ms", type=float, default=50.0, help="WebSocket ping 간격")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    # 운영과 같은 풀 크기 (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    password_hash = get_password_hash(PASSWORD)
+    usernames = [f"bench{i}" for i in range(args.logins)]
+    with SessionLocal() as db:
+        db.bulk_insert_mappings(
+            User,
+            [
+                {"username": name, "email": f"{name}@example.com", "password_hash": password_hash, "role": UserRole.VIEWER}
+                for name in usernames
+            ],
+        )
+        db.commit()
+
+    results = {}
+    for mode in ("inline", "pool"):
+        address, process = start_server(inline=mode == "inline")
+        try:
+            results[mode] = asyncio.run(
+                run_load(address, usernames, args.sockets, args.logins, args.duration, args.ping_interval_ms / 1000)
+            )
+        finally:
+            process.kill()  # uvicorn 은 SIGTERM 에 남은 연결이 닫힐 때까지 기다리므로 바로 종료
+            process.join()
+
+    print(
+        f"\n[로그인 부하] 동시 로그인 {args.logins}, WebSocket {args.sockets}개 "
+        f"(ping {args.ping_interval_ms:.0f}ms 간격), 모드별 {args.duration:.0f}초, CPU {os.cpu_count()}개"
+    )
+    print(f"  {'구성':<16} {'ping p50':>10} {'ping p99':>10} {'ping max':>10} {'로그인/s':>10} {'503':>6}")
+    for mode, label in [("inline", "이전 (루프 안)"), ("pool", "bcrypt 풀")]:
+        rtts, counts = results[mode]
+        print(
+            f"  {label:<16} {percentile(rtts, 0.5):>8.1f}ms {percentile(rtts, 0.99):>8.1f}ms "
+            f"{max(rtts, default=float('nan')):>8.1f}ms {counts['ok'] / args.duration:>10.1f} {counts['busy']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
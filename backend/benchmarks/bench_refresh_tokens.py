@@ -0,0 +1,188 @@
+"""
+Refresh 토큰 저장소 벤치마크
+
+SQLite 파일 DB 에 사용자 U명 x 토큰 이력 N건 (대부분 무효화 / 만료) 을 만들고 비교합니다.
+쿼리마다 --db-latency-ms 만큼 지연을 넣어 MySQL 왕복을 흉내냅니다.
+
+1) 재사용된 (이미 교체된) 토큰 갱신 요청
+   - 이전: ORM SELECT → 행 없음 확인
+   - 저장소 (블룸 필터 끔): 조건부 UPDATE 1회 (잠금)
+   - 저장소 (블룸 필터 켬): 필터 적중 → 잠금 없는 확인 SELECT
+2) 정상 교체: 이전 (SELECT + flush UPDATE) / 저장소 consume (UPDATE 1회)
+3) revoke_all 실행 계획 (user_id, revoked, expires_at 인덱스 사용 여부)
+4) purge: 청크 단위 삭제 시간, 남은 행 수
+5) 블룸 필터: 메모리, 실측 오탐률
+
+실행:
+    cd backend
+    python benchmarks/bench_refresh_tokens.py --users 200 --tokens 200000 --checks 2000
+"""
+import os
+import sys
+import time
+import random
+import secrets
+import tempfile
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import User, UserRole, RefreshToken  # noqa: E402
+from app.security import hash_token  # noqa: E402
+from app.services.refresh_token_store import RefreshTokenStore  # noqa: E402
+
+
+def legacy_consume(db, user_id: int, token: str) -> bool:
+    """이전 구현: SELECT 후 ORM 으로 revoked 변경"""
+    db_token = db.query(RefreshToken).filter(
+        RefreshToken.user_id == user_id,
+        RefreshToken.token_hash == hash_token(token),
+        RefreshToken.revoked == False,  # noqa: E712
+        RefreshToken.expires_at > datetime.utcnow(),
+    ).first()
+    if not db_token:
+        return False
+    db_token.revoked = True
+    db.flush()
+    return True
+
+
+def seed(SessionLocal, users: int, tokens: int):
+    """사용자 + 토큰 이력 생성. (무효화 토큰 원문 목록, 유효 토큰 원문 목록) 반환"""
+    now = datetime.utcnow()
+    lifetime = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    revoked, active, rows = [], [], []
+    for i in range(tokens):
+        token = secrets.token_hex(24)
+        user_id = i % users + 1
+        issued = now - timedelta(seconds=random.uniform(0, lifetime.total_seconds() * 3))
+        is_active = random.random() < 0.02
+        (active if is_active else revoked).append((user_id, token, issued + lifetime > now))
+        rows.append({
+            "user_id": user_id,
+            "token_hash": hash_token(token),
+            "expires_at": issued + lifetime,
+            "revoked": not is_active,
+            "revoked_at": None if is_active else issued + (now - issued) * random.random(),
+            "created_at": issued,
+        })
+    with SessionLocal() as db:
+        db.bulk_insert_mappings(
+            User,
+            [
+                {"username": f"bench{i}", "email": f"bench{i}@example.com", "password_hash": "x", "role": UserRole.VIEWER}
+                for i in range(users)
+            ],
+        )
+        for start in range(0, len(rows), 20000):
+            db.bulk_insert_mappings(RefreshToken, rows[start:start + 20000])
+        db.commit()
+    # 재사용 시나리오는 아직 만료되지 않은 무효화 토큰 (만료 토큰은 JWT exp 에서 먼저 거절)
+    return [(u, t) for u, t, alive in revoked if alive], [(u, t) for u, t, alive in active if alive]
+
+
+def timed(SessionLocal, fn, samples):
+    """samples 마다 fn(db, user_id, token) 실행 후 롤백, 평균 ms"""
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        for user_id, token in samples:
+            fn(db, user_id, token)
+            db.rollback()
+        return (time.perf_counter() - start) * 1000 / len(samples)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh 토큰 저장소 벤치마크")
+    parser.add_argument("--users", type=int, default=200, help="사용자 수")
+    parser.add_argument("--tokens", type=int, default=200000, help="토큰 이력 행 수")
+    parser.add_argument("--checks", type=int, default=2000, help="시나리오별 갱신 요청 수")
+    parser.add_argument("--db-latency-ms", type=float, default=0.5, help="쿼리당 DB 왕복 지연 (ms)")
+    args = parser.parse_args()
+    latency = args.db_latency_ms / 1000
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    start = time.perf_counter()
+    revoked, active = seed(SessionLocal, args.users, args.tokens)
+    print(f"\n[데이터] 토큰 {args.tokens:,}건 (유효 {len(active):,}, 재사용 대상 {len(revoked):,}) 생성 {time.perf_counter() - start:.1f}초")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def db_latency(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(latency)
+
+    store = RefreshTokenStore(bloom_enabled=False)
+    bloom_store = RefreshTokenStore(bloom_enabled=True, bloom_capacity=max(len(revoked), 1))
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        bloom_entries = bloom_store.rebuild_bloom(db)
+        bloom_ms = (time.perf_counter() - start) * 1000
+
+    replay = random.sample(revoked, min(args.checks, len(revoked)))
+    rotate = random.sample(active, min(args.checks, len(active)))
+    print(f"\n[갱신 요청] 시나리오별 {len(replay):,} / {len(rotate):,}회, 쿼리당 지연 {args.db_latency_ms}ms")
+    print(f"  {'구성':<24} {'재사용 거절 ms':>14} {'정상 교체 ms':>14}")
+    for label, fn in [
+        ("이전 (SELECT+UPDATE)", legacy_consume),
+        ("저장소", store.consume),
+        ("저장소 + 블룸 필터", bloom_store.consume),
+    ]:
+        print(f"  {label:<24} {timed(SessionLocal, fn, replay):>14.3f} {timed(SessionLocal, fn, rotate):>14.3f}")
+
+    event.remove(engine, "before_cursor_execute", db_latency)
+
+    with engine.connect() as conn:
+        plan = conn.execute(text(
+            "EXPLAIN QUERY PLAN UPDATE refresh_tokens SET revoked = 1 "
+            "WHERE user_id = 1 AND revoked = 0 AND expires_at > :now"
+        ), {"now": datetime.utcnow()}).fetchall()
+    print("\n[revoke_all 실행 계획]")
+    for row in plan:
+        print(f"  {row[-1]}")
+
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        revoked_count = sum(store.revoke_all(db, user_id) for user_id in range(1, args.users + 1))
+        db.rollback()
+        print(f"  사용자 {args.users}명 revoke_all: {revoked_count:,}건, {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    # 오탐률: 필터에 없는 임의 해시 조회
+    probes = 100000
+    false_positives = sum(hash_token(secrets.token_hex(24)) in bloom_store._bloom for _ in range(probes))
+    bloom = bloom_store._bloom
+    print(
+        f"\n[블룸 필터] 항목 {bloom_entries:,}, {len(bloom._bits) / 1024:.1f} KiB, 해시 {bloom.hash_count}개, "
+        f"구성 {bloom_ms:.0f}ms, 오탐률 {false_positives / probes:.3%} (목표 0.100%)"
+    )
+
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        deleted = store.purge(db)
+        remaining = db.query(RefreshToken).count()
+    print(
+        f"\n[정리] 청크 {settings.REFRESH_TOKEN_PURGE_CHUNK_SIZE}, 삭제 {deleted}, 남은 행 {remaining:,}, "
+        f"{time.perf_counter() - start:.1f}초 (청크 사이 대기 포함)"
+    )
+
+
+if __name__ == "__main__":
+    main()
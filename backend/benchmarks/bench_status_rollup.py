@@ -0,0 +1,144 @@
+"""
+장비 상태 롤업 / 보존 기간 정리 벤치마크
+
+SQLite 파일 DB 에 장비 N대 × D일 분량의 device_status (10초 간격)를 채운 뒤 측정합니다.
+- 원시 테이블 구간 조회 / count() 시간 (롤업 이전)
+- 1분 / 1시간 롤업 생성 시간
+- 청크 단위 삭제: 전체 시간과 청크 1개당 최대 시간 (잠금 유지 시간 상한)
+- 자동 해상도 구간 조회 시간과 반환 포인트 수
+
+실행:
+    cd backend
+    python benchmarks/bench_status_rollup.py --devices 20 --days 3
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크 전용 설정 (.env 없이 실행)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DB_USER", "bench")
+os.environ.setdefault("DB_PASSWORD", "bench")
+os.environ.setdefault("DB_NAME", "bench")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import Device, DeviceStatus, DeviceStatusRollup  # noqa: E402
+from app.services.status_retention_service import StatusRetentionService  # noqa: E402
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="장비 상태 롤업 / 정리 벤치마크")
+    parser.add_argument("--devices", type=int, default=20, help="장비 수")
+    parser.add_argument("--days", type=float, default=3, help="채울 이력 기간 (일)")
+    parser.add_argument("--retention-hours", type=int, default=24, help="원시 데이터 보존 기간")
+    parser.add_argument("--chunk", type=int, default=5000, help="삭제 청크 크기")
+    args = parser.parse_args()
+
+    settings.STATUS_RAW_RETENTION_HOURS = args.retention_hours
+    settings.STATUS_PURGE_CHUNK_SIZE = args.chunk
+    settings.STATUS_PURGE_PAUSE_SECONDS = 0
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    # 청크 DELETE 1회당 시간 측정
+    chunk_times = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE FROM device_status "):
+            chunk_times.append((time.perf_counter() - conn.info["query_start"]) * 1000)
+
+    devices = [Device(device_id=f"bench-{i:03d}", device_name=f"bench {i}") for i in range(args.devices)]
+    db.add_all(devices)
+    db.commit()
+
+    now = datetime.utcnow().replace(microsecond=0)
+    start = now - timedelta(days=args.days)
+    steps = int(args.days * 86400 / 10)
+    print(f"📥 device_status 채우는 중: {args.devices}대 × {steps}건 = {args.devices * steps:,}행")
+    seed_start = time.perf_counter()
+    batch = []
+    for step in range(steps):
+        recorded_at = start + timedelta(seconds=step * 10)
+        for device in devices:
+            batch.append({
+                "device_id": device.id,
+                "battery_level": 100 - (step // 360) % 100,
+                "memory_usage": 180000 + (step * 37 + device.id) % 20000,
+                "storage_usage": 500000,
+                "temperature": 35.0 + ((step + device.id) % 100) / 10,
+                "cpu_usage": (step * 7 + device.id) % 100,
+                "camera_status": "stopped",
+                "mic_status": "stopped",
+                "recorded_at": recorded_at,
+            })
+        if len(batch) >= 50000:
+            db.bulk_insert_mappings(DeviceStatus, batch)
+            db.commit()
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(DeviceStatus, batch)
+        db.commit()
+    print(f"   {time.perf_counter() - seed_start:.1f}s")
+
+    service = StatusRetentionService()
+    device_id = devices[0].id
+    window_start = now - timedelta(days=args.days)
+
+    print("\n[롤업 이전]")
+    total, ms = timed(db.query(DeviceStatus).filter(DeviceStatus.device_id == device_id).count)
+    print(f"  장비 1대 count(): {total:,}행, {ms:.1f}ms")
+    (_, points), ms = timed(service.query_range, db, device_id, window_start, now, "raw")
+    print(f"  {args.days}일 원시 구간 조회: {len(points):,}포인트, {ms:.1f}ms")
+
+    print("\n[롤업]")
+    created, ms = timed(service.rollup, db, now)
+    print(f"  생성 {created}, {ms:.0f}ms")
+    created, ms = timed(service.rollup, db, now)
+    print(f"  재실행 (증분 없음) {created}, {ms:.1f}ms")
+
+    print("\n[보존 기간 정리]")
+    deleted, ms = timed(service.purge, db, now)
+    print(f"  삭제 {deleted}, 전체 {ms:.0f}ms")
+    if chunk_times:
+        print(
+            f"  청크 {len(chunk_times)}개 (최대 {args.chunk}행): "
+            f"DELETE 평균 {sum(chunk_times) / len(chunk_times):.1f}ms, 최대 {max(chunk_times):.1f}ms"
+        )
+    remaining = db.query(DeviceStatus).count()
+    rollups = db.query(DeviceStatusRollup).count()
+    print(f"  남은 원시 행 {remaining:,}, 롤업 행 {rollups:,}")
+
+    print("\n[자동 해상도 구간 조회]")
+    for label, window in [("1시간", timedelta(hours=1)), ("12시간", timedelta(hours=12)), (f"{args.days}일", now - window_start)]:
+        (resolution, points), ms = timed(service.query_range, db, device_id, now - window, now)
+        print(f"  {label:>6}: {resolution:>3}, {len(points):,}포인트, {ms:.1f}ms")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
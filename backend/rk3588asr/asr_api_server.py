@@ -26,9 +26,12 @@ import asyncio
 import json
 import base64
 import uuid
+import time
 from datetime import datetime
-from typing import Dict, Optional, List
+from functools import partial
+from typing import Callable, Dict, Optional, List
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import requests
 
@@ -52,24 +55,24 @@ from fastapi import (
     Request,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 import uvicorn
 
-# 기존 demo_vad_final.py의 모듈 import
+# 인식 코어 import (asr_engine: Gradio / 데모 UI 의존성 없음)
 try:
-    import demo_vad_final
-    from demo_vad_final import (
-        VADStreamingProcessor,
-        load_model,
-        matcher,
-        logger as demo_logger,
-        EMERGENCY_API_CONFIG,
-        send_emergency_alert,
-    )
+    from asr_engine import model as engine_model
+    from asr_engine.vad import VADStreamingProcessor
+    from asr_engine.matcher import matcher
+    from asr_engine import alerts
+    from asr_engine.alerts import send_emergency_alert
+    from asr_engine import metrics
+    from asr_engine.tracing import tracer
+
+    load_model = engine_model.load_model
 
     # 모델 즉시 로드 (서버 시작 전에 초기화)
-    if demo_vad_final.recognizer is None:
+    if engine_model.recognizer is None:
         logger.info("📦 음성인식 모델 초기 로딩 중...")
         try:
             load_model()
@@ -79,8 +82,8 @@ try:
             logger.warning("⚠️ 서버는 시작되지만 세션 생성이 실패할 수 있습니다.")
 
 except ImportError as e:
-    print(f"❌ demo_vad_final.py 모듈 import 실패: {e}")
-    print("💡 asr_api_server.py와 demo_vad_final.py가 같은 디렉토리에 있어야 합니다.")
+    print(f"❌ asr_engine 패키지 import 실패: {e}")
+    print("💡 asr_api_server.py와 asr_engine/ 이 같은 디렉토리에 있어야 합니다.")
     sys.exit(1)
 
 # ====================
@@ -101,6 +104,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# HTTP 요청 처리 시간 (라우트 템플릿별, GET /metrics)
+app.add_middleware(metrics.MetricsMiddleware)
+
+
 # ====================
 # 설정
 # ====================
@@ -111,6 +118,17 @@ ASR_RESULT_ENDPOINT = f"{BACKEND_URL}/asr/result"
 logger.info(f"📡 백엔드 URL: {BACKEND_URL}")
 logger.info(f"📤 결과 전송 엔드포인트: {ASR_RESULT_ENDPOINT}")
 
+# VAD / 디코딩 / 언어별 모델 로드를 실행하는 스레드 수
+# (이벤트 루프를 막지 않고, 여러 세션이 recognizer 풀 인스턴스를 동시에 사용)
+ASR_WORKER_THREADS = int(os.getenv("ASR_WORKER_THREADS", "8"))
+_worker_executor = ThreadPoolExecutor(max_workers=ASR_WORKER_THREADS, thread_name_prefix="asr-worker")
+
+
+async def run_blocking(fn: Callable, *args, **kwargs):
+    """블로킹 작업 (디코딩, 모델 로드) 을 작업 스레드에서 실행하고 결과 대기"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_worker_executor, partial(fn, *args, **kwargs))
+
 # ====================
 # 음성인식 결과 전송 함수
 # ====================
@@ -124,6 +142,9 @@ async def send_recognition_result_to_backend(
     duration: float,
     is_emergency: bool = False,
     emergency_keywords: Optional[List[str]] = None,
+    segment_end: Optional[float] = None,
+    traceparent: Optional[str] = None,
+    on_complete: Optional[Callable[[], None]] = None,
 ):
     """
     음성인식 결과를 백엔드로 전송
@@ -136,6 +157,9 @@ async def send_recognition_result_to_backend(
         duration: 음성 길이 (초)
         is_emergency: 응급 상황 여부
         emergency_keywords: 응급 키워드 목록
+        segment_end: 음성 구간 종료 시각 (epoch 초, 백엔드 응급 경로 지연 측정용)
+        traceparent: 발화 trace 컨텍스트 (있으면 전송 구간을 span 으로 남기고 헤더로 백엔드에 전달)
+        on_complete: 전송이 끝난 뒤 (성공 / 실패 무관) 전송 스레드에서 호출 - 발화 span 종료용
     """
     try:
         payload = {
@@ -146,18 +170,34 @@ async def send_recognition_result_to_backend(
             "duration": duration,
             "is_emergency": is_emergency,
             "emergency_keywords": emergency_keywords or [],
+            "segment_end": segment_end,
         }
 
         # 비동기로 백엔드에 전송 (응답 대기 안 함)
         def _send():
+            span = (
+                tracer.start_span("asr.send_result", parent=traceparent, is_emergency=is_emergency)
+                if traceparent
+                else None
+            )
+            headers = {"traceparent": span.traceparent()} if span is not None else None
             try:
-                response = requests.post(ASR_RESULT_ENDPOINT, json=payload, timeout=5)
+                response = requests.post(ASR_RESULT_ENDPOINT, json=payload, headers=headers, timeout=5)
+                if span is not None:
+                    span.set("status", response.status_code)
                 if response.status_code == 200:
                     logger.info(f"✅ 결과 전송 완료: {device_id} - '{text[:50]}'")
                 else:
                     logger.warning(f"⚠️ 백엔드 응답 오류: {response.status_code}")
             except Exception as e:
+                if span is not None:
+                    span.set("error", repr(e))
                 logger.error(f"❌ 결과 전송 실패: {e}")
+            finally:
+                if span is not None:
+                    span.end()
+                if on_complete is not None:
+                    on_complete()
 
         # 스레드에서 실행 (블로킹 안 함)
         import threading
@@ -239,16 +279,26 @@ class ASRSession:
         self.created_at = datetime.now()
 
         # VAD Processor 생성
-        if demo_vad_final.recognizer is None:
+        if engine_model.recognizer is None:
             raise RuntimeError(
                 "❌ Recognizer가 초기화되지 않았습니다. load_model()을 먼저 실행하세요."
             )
 
-        self.processor = VADStreamingProcessor(
-            recognizer=demo_vad_final.recognizer,
-            sample_rate=sample_rate,
-            vad_enabled=vad_enabled,
-        )
+        # 언어를 고정한 세션은 언어별 recognizer 풀 사용 ("auto" = 기본 풀)
+        # 세션이 끝날 때까지 잡아 두어 상주 상한 초과 시에도 언로드되지 않게 함 (stop 에서 반환)
+        recognizer = engine_model.acquire_recognizer(language)
+        self._recognizer_held = True
+        try:
+            self.processor = VADStreamingProcessor(
+                recognizer=recognizer,
+                sample_rate=sample_rate,
+                vad_enabled=vad_enabled,
+                trace_attributes={"session_id": session_id, "device_id": device_id},
+                defer_utterance_end=True,  # 발화 span 은 결과 전송 후 종료 (finish_utterance_trace)
+            )
+        except Exception:
+            self._release_recognizer()
+            raise
 
         # WebSocket 연결
         self.websocket: Optional[WebSocket] = None
@@ -265,9 +315,18 @@ class ASRSession:
 
     def stop(self):
         """세션 종료"""
-        self.processor.stop_session()
+        try:
+            self.processor.stop_session()
+        finally:
+            self._release_recognizer()
         logger.info(f"🛑 세션 종료: {self.session_id}")
 
+    def _release_recognizer(self):
+        """언어별 풀 반환 (한 번만)"""
+        if self._recognizer_held:
+            self._recognizer_held = False
+            engine_model.release_recognizer(self.language)
+
     async def process_audio_chunk(self, audio_data: np.ndarray) -> Optional[Dict]:
         """
         오디오 청크 처리
@@ -278,26 +337,32 @@ class ASRSession:
         Returns:
             인식 결과 딕셔너리 또는 None
         """
-        result = self.processor.process_audio_chunk(audio_data)
+        # 구간을 끝낸 청크의 수신 시각 = 음성 구간 종료 시각
+        chunk_received_at = time.time()
+        # 음성 구간이 끝나면 디코딩까지 수행하므로 작업 스레드에서 실행
+        result = await run_blocking(
+            self.processor.add_audio_chunk, audio_data, received_at=chunk_received_at
+        )
 
         if result:
+            result.setdefault("segment_end", chunk_received_at)
+
             # 응급 상황 감지
             text = result.get("text", "")
             if text:
-                match_result = matcher.find_best_match(text)
+                match_result = matcher.find_best_match(text, detailed=False)
 
                 result["is_emergency"] = match_result.get("is_emergency", False)
                 result["emergency_keywords"] = match_result.get(
                     "emergency_keywords", []
                 )
 
-                # 응급 상황 감지 시 API 호출
+                # 응급 상황 감지 시 API 호출 (디스패처 큐에 넣고 바로 반환)
                 if result["is_emergency"]:
                     logger.warning(f"🚨 응급 상황 감지! {result['emergency_keywords']}")
-                    try:
-                        send_emergency_alert(text, result["emergency_keywords"])
-                    except Exception as e:
-                        logger.error(f"❌ 응급 알림 전송 실패: {e}")
+                    send_emergency_alert(
+                        text, result["emergency_keywords"], device_id=self.device_id
+                    )
 
                 # 결과 저장
                 self.recognition_results.append(result)
@@ -359,18 +424,17 @@ class SessionManager:
         return self.sessions.get(session_id)
 
     def remove_session(self, session_id: str):
-        """세션 제거"""
-        if session_id in self.sessions:
-            session = self.sessions[session_id]
+        """세션 제거 (작업 스레드에서 호출될 수 있으므로 먼저 목록에서 뺀 뒤 종료)"""
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
             session.stop()
-            del self.sessions[session_id]
             logger.info(
                 f"🗑️ 세션 제거: {session_id} (남은 세션: {len(self.sessions)}개)"
             )
 
     def get_all_sessions(self) -> List[Dict]:
         """모든 세션 목록"""
-        return [session.get_status() for session in self.sessions.values()]
+        return [session.get_status() for session in list(self.sessions.values())]
 
 
 # 전역 세션 관리자
@@ -380,6 +444,13 @@ session_manager = SessionManager()
 _server_host = "localhost"
 _server_port = 8001
 
+@app.on_event("shutdown")
+async def shutdown_alert_dispatcher():
+    """전송 중인 응급 알림 마무리"""
+    alerts.dispatcher.close(wait=True)
+    _worker_executor.shutdown(wait=False)
+
+
 # ====================
 # API 엔드포인트
 # ====================
@@ -407,11 +478,20 @@ async def health_check():
     """헬스 체크"""
     return {
         "status": "healthy",
-        "recognizer_loaded": demo_vad_final.recognizer is not None,
+        "recognizer_loaded": engine_model.recognizer is not None,
+        "recognizer_pool": engine_model.pool_stats(),
+        "emergency_alerts": alerts.dispatcher.stats(),
         "active_sessions": len(session_manager.sessions),
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus 지표 (오디오 수신, VAD 구간, 디코딩 지연 / RTF, 응급 알림 전송)"""
+    body, content_type = metrics.render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.post("/asr/session/start", response_model=SessionStartResponse)
 async def start_session(request: SessionStartRequest, http_request: Request):
     """
@@ -421,10 +501,10 @@ async def start_session(request: SessionStartRequest, http_request: Request):
     """
     try:
         # Recognizer 초기화 확인
-        if demo_vad_final.recognizer is None:
+        if engine_model.recognizer is None:
             logger.warning("⚠️ Recognizer가 초기화되지 않았습니다. 모델을 로드합니다...")
             try:
-                load_model()
+                await run_blocking(load_model)
                 logger.info("✅ 모델 로드 완료")
             except Exception as e:
                 logger.error(f"❌ 모델 로딩 실패: {e}", exc_info=True)
@@ -433,8 +513,9 @@ async def start_session(request: SessionStartRequest, http_request: Request):
                     detail=f"음성인식 모델을 로드할 수 없습니다: {str(e)}",
                 )
 
-        # 세션 생성
-        session = session_manager.create_session(
+        # 세션 생성 (언어별 풀을 처음 쓰면 모델 로드 + 웜업이 걸리므로 작업 스레드에서 실행)
+        session = await run_blocking(
+            session_manager.create_session,
             device_id=request.device_id,
             language=request.language,
             sample_rate=request.sample_rate,
@@ -527,7 +608,8 @@ async def stop_session(session_id: str):
         )
 
     segments_count = len(session.recognition_results)
-    session_manager.remove_session(session_id)
+    # 남은 음성 구간 디코딩이 있을 수 있으므로 작업 스레드에서 실행
+    await run_blocking(session_manager.remove_session, session_id)
 
     return SessionStopResponse(
         session_id=session_id,
@@ -548,6 +630,24 @@ async def list_sessions():
     }
 
 
+@app.get("/asr/keywords")
+async def list_emergency_keywords():
+    """
+    현재 로드된 응급 키워드 목록
+    """
+    entries = matcher.keyword_matcher.entries
+    return {"total": len(entries), "keywords": entries}
+
+
+@app.post("/asr/keywords/reload")
+async def reload_emergency_keywords():
+    """
+    응급 키워드 설정 파일 다시 로드 (서버 재시작 불필요)
+    """
+    count = matcher.reload_emergency_keywords()
+    return {"status": "reloaded", "total": count}
+
+
 # ====================
 # WebSocket 엔드포인트
 # ====================
@@ -601,6 +701,7 @@ async def websocket_asr_endpoint(websocket: WebSocket, session_id: str):
         }
     )
 
+    metrics.WS_CONNECTIONS.labels("asr").inc()
     try:
         while True:
             # 클라이언트로부터 메시지 수신
@@ -622,6 +723,8 @@ async def websocket_asr_endpoint(websocket: WebSocket, session_id: str):
                     # bytes → numpy array (int16 → float32)
                     audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
                     audio_float32 = audio_int16.astype(np.float32) / 32768.0
+                    metrics.AUDIO_CHUNKS.labels("asr").inc()
+                    metrics.AUDIO_SECONDS.labels("asr").inc(len(audio_int16) / session.sample_rate)
 
                     logger.debug(f"🎵 오디오 수신: {len(audio_float32)} samples")
 
@@ -641,7 +744,10 @@ async def websocket_asr_endpoint(websocket: WebSocket, session_id: str):
                             "emergency_keywords": result.get("emergency_keywords", []),
                         }
 
-                        await websocket.send_json(response)
+                        try:
+                            await websocket.send_json(response)
+                        finally:
+                            session.processor.finish_utterance_trace(result.get("traceparent"))
                         logger.info(f"✅ 인식 결과 전송: {result['text']}")
                     else:
                         # 처리 중 상태 전송 (선택적)
@@ -692,6 +798,7 @@ async def websocket_asr_endpoint(websocket: WebSocket, session_id: str):
     finally:
         # 세션 정리
         session.websocket = None
+        metrics.WS_CONNECTIONS.labels("asr").dec()
         logger.info(f"🧹 WebSocket 정리 완료: {session_id}")
 
 
@@ -723,6 +830,7 @@ async def websocket_audio_endpoint(websocket: WebSocket, session_id: str):
     # WebSocket 연결 수락
     await websocket.accept()
     session.websocket = websocket
+    metrics.WS_CONNECTIONS.labels("audio").inc()
 
     logger.info(f"🔗 오디오 WebSocket 연결: {session_id} (device: {session.device_id})")
 
@@ -748,6 +856,8 @@ async def websocket_audio_endpoint(websocket: WebSocket, session_id: str):
             # bytes → numpy array (int16 → float32)
             audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
             audio_float32 = audio_int16.astype(np.float32) / 32768.0
+            metrics.AUDIO_CHUNKS.labels("audio").inc()
+            metrics.AUDIO_SECONDS.labels("audio").inc(len(audio_int16) / session.sample_rate)
 
             # 오디오 처리 중 상태 전송
             try:
@@ -775,6 +885,11 @@ async def websocket_audio_endpoint(websocket: WebSocket, session_id: str):
                         duration=result.get("duration", 0.0),
                         is_emergency=result.get("is_emergency", False),
                         emergency_keywords=result.get("emergency_keywords", []),
+                        segment_end=result.get("segment_end"),
+                        traceparent=result.get("traceparent"),
+                        on_complete=partial(
+                            session.processor.finish_utterance_trace, result.get("traceparent")
+                        ),
                     )
 
                     # 로컬 WebSocket에도 전송 (선택사항)
@@ -811,6 +926,7 @@ async def websocket_audio_endpoint(websocket: WebSocket, session_id: str):
     finally:
         # 세션 정리
         session.websocket = None
+        metrics.WS_CONNECTIONS.labels("audio").dec()
         logger.info(f"🧹 오디오 WebSocket 정리 완료: {session_id}")
 
 
@@ -839,7 +955,7 @@ def start_server(host: str = "0.0.0.0", port: int = 8001):
     logger.info("=" * 60 + "\n")
 
     # Recognizer 로드 확인 (이미 모듈 로드 시 초기화됨)
-    if demo_vad_final.recognizer is None:
+    if engine_model.recognizer is None:
         logger.warning(
             "⚠️ Recognizer가 초기화되지 않았습니다. 모델을 다시 로드합니다..."
         )
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+RK3588 음성인식 엔진 패키지
+
+데모 UI(demo_vad_final)와 API 서버(asr_api_server)가 공유하는 인식 코어입니다.
+Gradio 등 UI 의존성 없이 import 할 수 있으며, 하위 모듈과 무거운 선택적 의존성
+(sherpa_onnx, jiwer, requests, soundfile, scipy, pyarrow)은 실제로 사용할 때 로드됩니다.
+
+    from asr_engine import load_model, matcher, VADStreamingProcessor
+"""
+
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈 (처음 접근할 때 import)
+_EXPORTS = {
+    "load_model": "model",
+    "get_recognizer": "model",
+    "acquire_recognizer": "model",
+    "release_recognizer": "model",
+    "pool_stats": "model",
+    "RecognizerPool": "recognizer_pool",
+    "RecognizerRegistry": "recognizer_pool",
+    "VADStreamingProcessor": "vad",
+    "SpeechRecognitionMatcher": "matcher",
+    "matcher": "matcher",
+    "send_emergency_alert": "alerts",
+    "EMERGENCY_API_CONFIG": "config",
+    "GROUND_TRUTHS": "config",
+    "LABELS": "config",
+    "EvaluationCollector": "evaluation_collector",
+    "EmergencyKeywordMatcher": "emergency_keywords",
+    "GroundTruthIndex": "ground_truth_index",
+    "StreamingResampler": "resampler",
+    "TranscriptionCache": "transcription_cache",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+응급 상황 알림 전송
+
+응급 키워드가 감지되면 EMERGENCY_API_CONFIG 에 등록된 API로 이벤트를 전송합니다.
+
+🎯 AlertDispatcher:
+1. send_emergency_alert() 는 큐에 넣고 바로 반환 (이벤트 루프 / UI 핸들러 블로킹 없음)
+2. 활성화된 모든 api_endpoints 로 병렬 전송 (fan-out), 엔드포인트별 결과 로그
+3. 연결 재사용 (requests.Session 커넥션 풀)
+4. 타임아웃 / 연결 오류 / 5xx / 429 는 지수 백오프로 재시도
+5. 장비 + 키워드 별 억제 구간: 같은 장비에서 같은 키워드는 suppress_seconds 동안 1번만 전송
+   (전송 중에는 억제, 모든 엔드포인트 전송이 실패하면 억제 해제 → 다음 알림은 다시 전송)
+"""
+
+import time
+import uuid
+import random
+import logging
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .config import EMERGENCY_API_CONFIG, EMERGENCY_ALERT_DISPATCH
+from .metrics import EMERGENCY_ALERT_PENDING, EMERGENCY_ALERT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+def _endpoint_url(endpoint: Dict, watch_id: str) -> str:
+    api_url = endpoint["url"]
+    if "{watchId}" in api_url:
+        api_url = api_url.replace("{watchId}", watch_id)
+    elif watch_id not in api_url:
+        if not api_url.endswith("/"):
+            api_url += "/"
+        api_url += watch_id
+    return api_url
+
+
+def build_alert_request(
+    endpoint: Dict,
+    recognized_text: str,
+    emergency_keywords: List[str],
+    event_id: str,
+    config: Optional[Dict] = None,
+) -> Tuple[str, Dict]:
+    """
+    엔드포인트 형식(json / multipart)에 맞는 요청 구성
+
+    Returns:
+        (URL, requests.post 키워드 인자)
+    """
+    config = config or EMERGENCY_API_CONFIG
+    watch_id = config.get("watch_id", "watch_default")
+    sender_id = config.get("sender_id", "voice_asr_system")
+    note = f"응급 상황 감지: {recognized_text} (키워드: {', '.join(emergency_keywords)})"
+    api_url = _endpoint_url(endpoint, watch_id)
+
+    if endpoint.get("type") == "json":
+        # 이미지 URL 생성 (선택적)
+        image_url = None
+        if config.get("include_image_url", False):
+            image_base = config.get("image_base_url", "http://10.10.11.79:8080/api/images")
+            image_url = f"{image_base}/emergency_{event_id.split('-')[0]}.jpeg"
+
+        # 서버가 기대하는 형식으로만 데이터 구성
+        request_data = {
+            "senderId": sender_id,
+            "note": note,
+            "imageUrl": image_url,  # null 가능
+        }
+        return api_url, {"json": request_data, "headers": {"Content-Type": "application/json"}}
+
+    # Multipart 방식: senderId / note 는 쿼리 파라미터, image 는 빈 값
+    query_params = {"senderId": sender_id, "note": note}
+    api_url_with_params = f"{api_url}?{urllib.parse.urlencode(query_params)}"
+    return api_url_with_params, {"files": {"image": ("", "")}}
+
+
+class AlertDispatcher:
+    """응급 알림 비동기 전송기 (fan-out + 재시도 + 억제 구간)"""
+
+    def __init__(
+        self,
+        config: Optional[Dict] = None,
+        workers: int = 4,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        suppress_seconds: float = 60.0,
+    ):
+        """
+        Args:
+            config: EMERGENCY_API_CONFIG 형식 설정 (None이면 전역 설정)
+            workers: 전송 스레드 수 (엔드포인트 병렬 전송)
+            max_retries: 엔드포인트당 재시도 횟수
+            backoff_seconds: 첫 재시도 대기 (이후 2배씩, ±50% 지터)
+            connect_timeout / read_timeout: HTTP 타임아웃 (초)
+            suppress_seconds: 같은 장비 + 키워드 재전송 억제 구간 (0이면 억제 안 함)
+        """
+        self.config = config or EMERGENCY_API_CONFIG
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = (connect_timeout, read_timeout)
+        self.suppress_seconds = suppress_seconds
+
+        self.lock = threading.Lock()
+        self._last_sent: Dict[Tuple[str, str], float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._session = None
+        self.stats_counts = {
+            "submitted": 0,
+            "suppressed": 0,
+            "delivered": 0,
+            "failed": 0,
+            "retries": 0,
+        }
+
+    def _ensure_started(self):
+        """첫 전송 시 HTTP 세션과 전송 스레드 생성 (lock 보유 상태에서 호출)"""
+        if self._executor is not None:
+            return
+        import requests  # 응급 상황에서만 필요하므로 지연 import
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self._session = session
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="emergency-alert")
+
+    def _reserve(self, device_id: str, keywords: List[str], now: float) -> Optional[List[Tuple[str, str]]]:
+        """
+        억제 구간 확인 + 새 키 예약 (lock 보유 상태에서 호출)
+
+        Returns:
+            모든 키워드가 억제 구간 안이면 None, 아니면 이번 알림이 새로 기록한 키 목록
+            (전송이 모두 실패하면 _release 로 되돌림)
+        """
+        if self.suppress_seconds <= 0:
+            return []
+
+        # 만료된 항목 정리 (억제 테이블 크기 제한)
+        expired = [key for key, sent in self._last_sent.items() if now - sent >= self.suppress_seconds]
+        for key in expired:
+            del self._last_sent[key]
+
+        keys = [(device_id, keyword) for keyword in (keywords or [""])]
+        new_keys = [key for key in keys if key not in self._last_sent]
+        if not new_keys:
+            return None
+        for key in new_keys:
+            self._last_sent[key] = now
+        return new_keys
+
+    def _release(self, keys: List[Tuple[str, str]], reserved_at: float):
+        """전송 실패한 알림의 억제 키 해제 (lock 보유 상태에서 호출, 이후 다시 예약된 키는 유지)"""
+        for key in keys:
+            if self._last_sent.get(key) == reserved_at:
+                del self._last_sent[key]
+
+    def submit(
+        self,
+        recognized_text: str,
+        emergency_keywords: List[str],
+        device_id: Optional[str] = None,
+    ) -> bool:
+        """
+        응급 알림 전송 예약 (즉시 반환)
+
+        Returns:
+            전송 예약 여부 (비활성화 / 엔드포인트 없음 / 억제 구간이면 False)
+        """
+        if not self.config.get("enabled", False):
+            logger.info("⚠️ 응급 API 호출이 비활성화되어 있습니다.")
+            return False
+
+        endpoints = [ep for ep in self.config.get("api_endpoints", []) if ep.get("enabled", False)]
+        if not endpoints:
+            logger.warning("⚠️ 활성화된 API 엔드포인트가 없습니다.")
+            return False
+
+        device_id = device_id or "local"
+        submitted_at = time.time()
+        with self.lock:
+            self.stats_counts["submitted"] += 1
+            reserved = self._reserve(device_id, emergency_keywords, submitted_at)
+            if reserved is None:
+                self.stats_counts["suppressed"] += 1
+                logger.info(f"🔕 응급 알림 억제 ({device_id}: {', '.join(emergency_keywords)})")
+                return False
+            self._ensure_started()
+            executor, session = self._executor, self._session
+
+        event_id = str(uuid.uuid4())
+        logger.info(f"🚨 응급 상황 감지! API 호출 예약: {len(endpoints)}개 엔드포인트")
+        logger.info(f"   - 장비: {device_id}, Event ID: {event_id}")
+        logger.info(f"   - 인식 텍스트: {recognized_text}")
+        logger.info(f"   - 감지 키워드: {', '.join(emergency_keywords)}")
+
+        # 알림 1건의 엔드포인트별 전송 결과 (마지막 전송이 끝날 때 억제 키 유지 / 해제 결정)
+        event = {"pending": len(endpoints), "delivered": False, "keys": reserved, "reserved_at": submitted_at}
+        for endpoint in endpoints:
+            url, kwargs = build_alert_request(endpoint, recognized_text, emergency_keywords, event_id, self.config)
+            EMERGENCY_ALERT_PENDING.inc()
+            executor.submit(
+                self._deliver, session, endpoint.get("name", url), url, kwargs, event_id, submitted_at, event
+            )
+        return True
+
+    def _deliver(
+        self,
+        session,
+        name: str,
+        url: str,
+        kwargs: Dict,
+        event_id: str,
+        submitted_at: Optional[float] = None,
+        event: Optional[Dict] = None,
+    ) -> bool:
+        """엔드포인트 1곳 전송 + 예약부터 응답까지 지연 기록"""
+        delivered = False
+        try:
+            delivered = self._deliver_with_retries(session, name, url, kwargs, event_id)
+            return delivered
+        finally:
+            EMERGENCY_ALERT_PENDING.dec()
+            if submitted_at is not None:
+                outcome = "delivered" if delivered else "failed"
+                EMERGENCY_ALERT_SECONDS.labels(outcome).observe(time.time() - submitted_at)
+            if event is not None:
+                self._finish_event(event, delivered, event_id)
+
+    def _finish_event(self, event: Dict, delivered: bool, event_id: str):
+        """엔드포인트 전송 1곳 완료 처리: 모두 끝났는데 성공한 곳이 없으면 억제 해제"""
+        with self.lock:
+            event["pending"] -= 1
+            event["delivered"] = event["delivered"] or delivered
+            if event["pending"] > 0 or event["delivered"] or not event["keys"]:
+                return
+            self._release(event["keys"], event["reserved_at"])
+        logger.warning(f"⚠️ 모든 엔드포인트 전송 실패 - 억제 해제, 다음 알림은 다시 전송 (Event ID: {event_id})")
+
+    def _deliver_with_retries(self, session, name: str, url: str, kwargs: Dict, event_id: str) -> bool:
+        """엔드포인트 1곳 전송 (재시도 포함)"""
+        import requests
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                delay = self.backoff_seconds * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+                with self.lock:
+                    self.stats_counts["retries"] += 1
+                time.sleep(delay)
+
+            try:
+                start = time.time()
+                response = session.post(url=url, timeout=self.timeout, **kwargs)
+                elapsed = time.time() - start
+            except requests.exceptions.Timeout:
+                logger.error(f"❌ [{name}] API 호출 타임아웃 (시도 {attempt + 1})")
+                continue
+            except requests.exceptions.ConnectionError:
+                logger.error(f"❌ [{name}] API 연결 오류 (시도 {attempt + 1})")
+                continue
+            except Exception as e:
+                logger.error(f"❌ [{name}] API 호출 중 오류 발생: {e}", exc_info=True)
+                break
+
+            if response.status_code < 400:
+                logger.info(f"✅ [{name}] API 호출 성공 (Status: {response.status_code}, {elapsed * 1000:.0f}ms)")
+                logger.info(f"   - Event ID: {event_id}")
+                logger.info(f"   - Response: {response.text[:200]}")
+                with self.lock:
+                    self.stats_counts["delivered"] += 1
+                return True
+
+            logger.warning(f"⚠️ [{name}] API 응답 오류 (Status: {response.status_code}, 시도 {attempt + 1})")
+            if response.status_code not in RETRY_STATUS:
+                break
+
+        with self.lock:
+            self.stats_counts["failed"] += 1
+        logger.error(f"❌ [{name}] 응급 알림 전송 실패 (Event ID: {event_id})")
+        return False
+
+    def stats(self) -> Dict:
+        with self.lock:
+            stats = dict(self.stats_counts)
+            stats["suppression_entries"] = len(self._last_sent)
+        stats["suppress_seconds"] = self.suppress_seconds
+        return stats
+
+    def close(self, wait: bool = True):
+        """전송 중인 알림 마무리 후 종료"""
+        with self.lock:
+            executor, session = self._executor, self._session
+            self._executor = None
+            self._session = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        if session is not None:
+            session.close()
+
+
+# 전역 디스패처
+dispatcher = AlertDispatcher(**EMERGENCY_ALERT_DISPATCH)
+
+
+def send_emergency_alert(
+    recognized_text: str,
+    emergency_keywords: List[str],
+    device_id: Optional[str] = None,
+) -> bool:
+    """
+    응급 상황 감지 시 API로 이벤트 전송 (비동기, 즉시 반환)
+
+    Args:
+        recognized_text: 음성 인식 결과 텍스트
+        emergency_keywords: 감지된 응급 키워드 리스트
+        device_id: 장비 ID (억제 구간 키, 없으면 "local")
+
+    Returns:
+        전송 예약 여부
+    """
+    try:
+        return dispatcher.submit(recognized_text, emergency_keywords, device_id)
+    except Exception as e:
+        logger.error(f"❌ 응급 알림 예약 실패: {e}", exc_info=True)
+        return False
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+오디오 파일 입출력 유틸리티
+
+🎯 기능:
+1. WAV/오디오 파일 읽기 (soundfile → wave 모듈 폴백)
+2. 모노 변환 및 16kHz 리샘플링 (resampler 모듈의 폴리페이즈 필터)
+"""
+
+import wave
+import logging
+from typing import Tuple
+
+import numpy as np
+import soundfile as sf
+
+from .resampler import resample
+
+logger = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE = 16000
+
+
+def resample_audio(audio_data, orig_sr, target_sr=16000):
+    """오디오 리샘플링 (캐시된 폴리페이즈 필터, 파일 / 전체 신호용)"""
+    if orig_sr == target_sr:
+        return audio_data
+    return resample(audio_data, orig_sr, target_sr)
+
+
+def read_wave(wave_filename: str):
+    """Wave 파일 읽기"""
+    with wave.open(wave_filename) as f:
+        if f.getnchannels() != 1:
+            raise ValueError(f"모노 오디오만 지원. 채널: {f.getnchannels()}")
+        if f.getsampwidth() != 2:
+            raise ValueError(f"16비트 오디오만 지원. 샘플폭: {f.getsampwidth()}")
+
+        num_samples = f.getnframes()
+        samples = f.readframes(num_samples)
+        samples_int16 = np.frombuffer(samples, dtype=np.int16)
+        samples_float32 = samples_int16.astype(np.float32) / 32768.0
+        return samples_float32, f.getframerate()
+
+
+def read_audio_file(file_path: str) -> Tuple[np.ndarray, int]:
+    """
+    오디오 파일 읽기 + 모노 변환 (리샘플링 없음)
+
+    Returns:
+        (float32 샘플, 원본 샘플레이트)
+    """
+    try:
+        audio_data, sr = sf.read(file_path, dtype="float32")
+        if len(audio_data.shape) > 1:
+            audio_data = np.mean(audio_data, axis=1)
+        return audio_data.astype(np.float32, copy=False), sr
+    except Exception as e1:
+        logger.warning(f"soundfile 실패: {e1}, wave 시도")
+        try:
+            return read_wave(file_path)
+        except Exception as e2:
+            raise Exception(f"파일 읽기 실패. soundfile: {e1}, wave: {e2}")
+
+
+def load_audio_file(file_path: str, target_sr: int = TARGET_SAMPLE_RATE) -> Tuple[np.ndarray, int]:
+    """
+    오디오 파일 읽기 + 모노 변환 + 리샘플링
+
+    Args:
+        file_path: 오디오 파일 경로
+        target_sr: 목표 샘플레이트
+
+    Returns:
+        (float32 샘플, 샘플레이트)
+    """
+    samples, sample_rate = read_audio_file(file_path)
+    return to_target_rate(samples, sample_rate, target_sr)
+
+
+def to_target_rate(samples: np.ndarray, sample_rate: int, target_sr: int = TARGET_SAMPLE_RATE) -> Tuple[np.ndarray, int]:
+    """필요한 경우에만 리샘플링"""
+    if sample_rate != target_sr:
+        samples = np.asarray(resample_audio(samples, sample_rate, target_sr), dtype=np.float32)
+    return samples, target_sr
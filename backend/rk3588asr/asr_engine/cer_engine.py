@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+CER 편집거리 엔진
+
+🎯 기능:
+1. S/D/I/N 계산을 위한 단일 편집거리 엔진 (Levenshtein)
+2. O(min(r, h)) 메모리: 전체 DP 테이블/traceback 없이
+   각 셀이 선택한 경로의 (S, D, I) 개수를 두 행에 실어 나름
+3. NumPy 코드포인트 배열 위에서 행 단위 벡터화
+   (행 내부 삽입 의존성은 prefix-min 으로 처리)
+4. 여러 (hyp, ref) 쌍을 한 번에 계산하는 배치 API
+5. 후보 검색용 밴드(banded) 거리 계산
+
+경로 선택 규칙은 기존 traceback 과 동일합니다 (끝에서부터 삭제 → 삽입 → 대각선 우선).
+각 셀에서 같은 우선순위로 선행 셀을 고르면 (r, h) 에서 거꾸로 따라간 경로가
+traceback 경로와 일치하므로 S/D/I 분해도 기존 구현과 같습니다.
+"""
+
+from typing import List, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 이보다 작은 DP 영역(r * h)은 순수 파이썬 커널이 더 빠름
+_SMALL_PROBLEM_CELLS = 128 * 128
+
+# 배치 계산 시 한 번에 처리하는 쌍 개수
+_BATCH_CHUNK = 256
+
+
+def to_codepoints(text: str) -> np.ndarray:
+    """문자열 → 유니코드 코드포인트 배열 (int32)"""
+    if not text:
+        return np.zeros(0, dtype=np.int32)
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int32)
+
+
+# ====================
+# 순수 파이썬 커널 (짧은 문장용)
+# ====================
+# 경로별 (S, D, I) 개수를 정수 하나에 묶어 저장 (튜플 할당 회피)
+_PACK_I = 1
+_PACK_D = 1 << 21
+_PACK_S = 1 << 42
+
+
+def _small_edit_ops(ref: Sequence, hyp: Sequence) -> Tuple[int, int, int]:
+    """두 행 DP + 경로별 (S, D, I) 누적. ref 를 행, hyp 를 열로 사용"""
+    h = len(hyp)
+    prev_cost = list(range(h + 1))
+    prev_ops = list(range(h + 1))  # 첫 행은 모두 삽입
+    for rc in ref:
+        left_cost = prev_cost[0] + 1
+        left_ops = prev_ops[0] + _PACK_D
+        cur_cost = [left_cost]
+        cur_ops = [left_ops]
+        for j in range(1, h + 1):
+            mismatch = rc != hyp[j - 1]
+            up = prev_cost[j] + 1
+            ins = left_cost + 1
+            diag = prev_cost[j - 1] + mismatch
+            if up <= ins and up <= diag:
+                left_cost = up
+                left_ops = prev_ops[j] + _PACK_D
+            elif ins <= diag:
+                left_cost = ins
+                left_ops = left_ops + _PACK_I
+            else:
+                left_cost = diag
+                left_ops = prev_ops[j - 1] + (_PACK_S if mismatch else 0)
+            cur_cost.append(left_cost)
+            cur_ops.append(left_ops)
+        prev_cost = cur_cost
+        prev_ops = cur_ops
+    packed = prev_ops[h]
+    return packed >> 42, (packed >> 21) & (_PACK_D - 1), packed & (_PACK_D - 1)
+
+
+# ====================
+# NumPy 행 벡터화 커널
+# ====================
+def _vector_edit_ops(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    row_lens: np.ndarray,
+    col_lens: np.ndarray,
+    transposed: bool = False,
+) -> np.ndarray:
+    """
+    (B, R) x (B, C) 배치 편집거리
+
+    Args:
+        rows: 행 방향 문자열 배열 (패딩 포함)
+        cols: 열 방향 문자열 배열 (패딩 포함)
+        row_lens, col_lens: 각 쌍의 실제 길이
+        transposed: False 이면 rows=ref/cols=hyp, True 이면 rows=hyp/cols=ref
+
+    Returns:
+        (B, 3) 배열 [S, D, I]
+    """
+    B, C = cols.shape
+    R = rows.shape[1]
+    col_idx = np.arange(C + 1, dtype=np.int64)
+    batch_idx = np.arange(B)
+
+    cost = np.tile(col_idx, (B, 1))
+    subs = np.zeros((B, C + 1), dtype=np.int64)
+    downs = np.zeros((B, C + 1), dtype=np.int64)   # 행 문자 소비
+    lefts = np.tile(col_idx, (B, 1))               # 열 문자 소비
+
+    out = np.zeros((B, 3), dtype=np.int64)
+
+    def _capture(mask):
+        if not mask.any():
+            return
+        b = batch_idx[mask]
+        c = col_lens[mask]
+        dn = downs[b, c]
+        lf = lefts[b, c]
+        out[b, 0] = subs[b, c]
+        out[b, 1] = lf if transposed else dn
+        out[b, 2] = dn if transposed else lf
+
+    _capture(row_lens == 0)
+
+    for i in range(1, R + 1):
+        mismatch = (cols != rows[:, i - 1:i]).astype(np.int64)
+        down = cost + 1
+        diag = cost[:, :-1] + mismatch
+
+        base = down.copy()
+        np.minimum(base[:, 1:], diag, out=base[:, 1:])
+        new_cost = np.minimum.accumulate(base - col_idx, axis=1) + col_idx
+
+        is_down = new_cost == down
+        is_left = np.zeros_like(is_down)
+        is_left[:, 1:] = new_cost[:, 1:] == new_cost[:, :-1] + 1
+
+        if transposed:
+            # 원래 규칙의 "삭제 우선" = 열 방향(ref) 이동 우선
+            choose_left = is_left
+            choose_down = is_down & ~is_left
+        else:
+            choose_down = is_down
+            choose_left = is_left & ~is_down
+        choose_left[:, 0] = False
+        choose_down[:, 0] = True
+
+        # 삽입(left)이 아닌 셀의 누적 값
+        new_subs = subs.copy()
+        new_downs = downs + 1
+        new_lefts = lefts.copy()
+        choose_diag = ~(choose_down | choose_left)
+        diag_mask = choose_diag[:, 1:]
+        new_subs[:, 1:] = np.where(diag_mask, subs[:, :-1] + mismatch, new_subs[:, 1:])
+        new_downs[:, 1:] = np.where(diag_mask, downs[:, :-1], new_downs[:, 1:])
+        new_lefts[:, 1:] = np.where(diag_mask, lefts[:, :-1], new_lefts[:, 1:])
+
+        # left 연쇄: 가장 가까운 왼쪽 비-left 셀에서 (j - k) 만큼 이동
+        anchor = np.maximum.accumulate(
+            np.where(choose_left, 0, col_idx), axis=1
+        )
+        subs = np.take_along_axis(new_subs, anchor, axis=1)
+        downs = np.take_along_axis(new_downs, anchor, axis=1)
+        lefts = np.take_along_axis(new_lefts, anchor, axis=1) + (col_idx - anchor)
+        cost = new_cost
+
+        _capture(row_lens == i)
+
+    return out
+
+
+def _pad(seqs: List[np.ndarray], fill: int) -> np.ndarray:
+    width = max((len(s) for s in seqs), default=0)
+    arr = np.full((len(seqs), width), fill, dtype=np.int32)
+    for k, s in enumerate(seqs):
+        arr[k, :len(s)] = s
+    return arr
+
+
+def _result(S: int, D: int, I: int, N: int) -> Dict[str, float]:
+    return {
+        "CER": float(S + D + I) / N if N > 0 else 0.0,
+        "S": int(S),
+        "D": int(D),
+        "I": int(I),
+        "N": int(N),
+    }
+
+
+# ====================
+# 공개 API
+# ====================
+def edit_ops(hyp: str, ref: str) -> Tuple[int, int, int]:
+    """
+    편집 연산 개수 계산
+
+    Args:
+        hyp: 인식 결과 (전처리 완료)
+        ref: 정답 (전처리 완료)
+
+    Returns:
+        (S, D, I)
+    """
+    r, h = len(ref), len(hyp)
+    if r == 0:
+        return 0, 0, h
+    if h == 0:
+        return 0, r, 0
+    if r * h <= _SMALL_PROBLEM_CELLS:
+        return _small_edit_ops(ref, hyp)
+
+    ref_cp = to_codepoints(ref)[None, :]
+    hyp_cp = to_codepoints(hyp)[None, :]
+    if h <= r:
+        out = _vector_edit_ops(ref_cp, hyp_cp, np.array([r]), np.array([h]))
+    else:
+        # 짧은 쪽을 열로 두어 메모리를 O(min(r, h)) 로 유지
+        out = _vector_edit_ops(hyp_cp, ref_cp, np.array([h]), np.array([r]), transposed=True)
+    S, D, I = out[0]
+    return int(S), int(D), int(I)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein 거리"""
+    return sum(edit_ops(a, b))
+
+
+def cer(hyp: str, ref: str) -> Dict[str, float]:
+    """
+    CER = (S + D + I) / N
+
+    Returns:
+        {"CER", "S", "D", "I", "N"}
+    """
+    S, D, I = edit_ops(hyp, ref)
+    return _result(S, D, I, len(ref))
+
+
+def batch_cer(pairs: Sequence[Tuple[str, str]]) -> List[Dict[str, float]]:
+    """
+    여러 (hyp, ref) 쌍의 CER 을 한 번에 계산
+
+    길이가 비슷한 쌍끼리 묶어 (B, R) x (B, C) 배열로 한 행씩 동시에 계산합니다.
+
+    Args:
+        pairs: (인식 결과, 정답) 튜플 목록 (전처리 완료)
+
+    Returns:
+        입력 순서대로 {"CER", "S", "D", "I", "N"} 리스트
+    """
+    results: List[Optional[Dict[str, float]]] = [None] * len(pairs)
+    order = sorted(range(len(pairs)), key=lambda k: (len(pairs[k][1]), len(pairs[k][0])))
+
+    for start in range(0, len(order), _BATCH_CHUNK):
+        chunk = order[start:start + _BATCH_CHUNK]
+        refs = [to_codepoints(pairs[k][1]) for k in chunk]
+        hyps = [to_codepoints(pairs[k][0]) for k in chunk]
+        # 패딩 값이 서로/실제 문자와 일치하지 않도록 음수 사용
+        out = _vector_edit_ops(
+            _pad(refs, -2),
+            _pad(hyps, -1),
+            np.array([len(s) for s in refs]),
+            np.array([len(s) for s in hyps]),
+        )
+        for k, (S, D, I) in zip(chunk, out):
+            results[k] = _result(S, D, I, len(pairs[k][1]))
+
+    return results
+
+
+def banded_levenshtein(a: str, b: str, max_dist: int) -> Optional[int]:
+    """
+    밴드 제한 Levenshtein 거리 (Ukkonen)
+
+    |i - j| <= max_dist 영역만 계산하므로 O(max_dist * len) 시간이 걸립니다.
+
+    Returns:
+        거리가 max_dist 이하이면 거리, 초과하면 None
+    """
+    la, lb = len(a), len(b)
+    if abs(la - lb) > max_dist:
+        return None
+    if la == 0:
+        return lb
+    if lb == 0:
+        return la
+
+    inf = max_dist + 1
+    prev = [j if j <= max_dist else inf for j in range(lb + 1)]
+
+    for i in range(1, la + 1):
+        lo = max(1, i - max_dist)
+        hi = min(lb, i + max_dist)
+        cur = [inf] * (lb + 1)
+        cur[0] = i if i <= max_dist else inf
+        row_min = cur[0] if lo == 1 else inf
+        ca = a[i - 1]
+
+        for j in range(lo, hi + 1):
+            cost = prev[j - 1] + (ca != b[j - 1])
+            d = prev[j] + 1
+            if d < cost:
+                cost = d
+            d = cur[j - 1] + 1
+            if d < cost:
+                cost = d
+            if cost > inf:
+                cost = inf
+            cur[j] = cost
+            if cost < row_min:
+                row_min = cost
+
+        if row_min > max_dist:
+            return None
+        prev = cur
+
+    return prev[lb] if prev[lb] <= max_dist else None
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+음성인식 엔진 설정
+
+모델 경로, recognizer 옵션, 응급 API, 정답 데이터 등
+데모 UI와 API 서버가 공유하는 설정값
+"""
+
+import os
+
+# ====================
+# 모델 설정
+# ====================
+# rknn: RK3588 NPU (model.rknn), cpu: ONNX Runtime (model.int8.onnx / model.onnx)
+RECOGNIZER_PROVIDER = os.getenv("ASR_PROVIDER", "rknn")
+
+_DEFAULT_MODEL_NAME = (
+    "sherpa-onnx-rk3588-30-seconds-sense-voice-zh-en-ja-ko-yue-2024-07-17"
+    if RECOGNIZER_PROVIDER == "rknn"
+    else "sherpa-onnx-sense-voice-zh-en-ja-ko-yue-2024-07-17"
+)
+MODEL_DIR = os.getenv("ASR_MODEL_DIR") or os.path.join(os.getcwd(), "models", _DEFAULT_MODEL_NAME)
+
+
+def _onnx_model_path(model_dir: str) -> str:
+    int8_path = os.path.join(model_dir, "model.int8.onnx")
+    return int8_path if os.path.exists(int8_path) else os.path.join(model_dir, "model.onnx")
+
+
+MODEL_PATH = (
+    os.path.join(MODEL_DIR, "model.rknn")
+    if RECOGNIZER_PROVIDER == "rknn"
+    else _onnx_model_path(MODEL_DIR)
+)
+TOKENS_PATH = os.path.join(MODEL_DIR, "tokens.txt")
+
+# 인식 결과에 영향을 주는 recognizer 설정 (인식 캐시 키에 포함)
+RECOGNIZER_CONFIG = {
+    "language": "",   # "" = 자동 감지
+    "use_itn": True,
+}
+
+# ====================
+# 🔹 Recognizer 풀
+# ====================
+RECOGNIZER_POOL_CONFIG = {
+    "size": int(os.getenv("ASR_RECOGNIZER_POOL", "1")),             # 모델당 인스턴스 수
+    "num_threads": int(os.getenv("ASR_NUM_THREADS", "4")),           # 인스턴스당 스레드 수
+    "warmup": os.getenv("ASR_RECOGNIZER_WARMUP", "1") != "0",       # 시작 시 합성 발화로 웜업
+    "checkout_timeout": float(os.getenv("ASR_POOL_TIMEOUT", "30")),  # 유휴 인스턴스 대기 상한 (초)
+    "max_resident_models": int(os.getenv("ASR_MAX_RESIDENT_MODELS", "2")),  # 언어별 모델 상주 상한
+}
+
+# 세션별 언어 고정을 허용하는 언어 (그 외 / "auto" 는 기본 모델 사용)
+SUPPORTED_LANGUAGES = ["zh", "en", "ja", "ko", "yue"]
+
+# ====================
+# 🔹 인식 결과 캐시 (같은 오디오 재인식 방지)
+# ====================
+TRANSCRIPT_CACHE_DIR = os.getenv("ASR_TRANSCRIPT_CACHE_DIR", os.path.join(os.getcwd(), ".asr_cache"))
+TRANSCRIPT_CACHE_MAX_MB = int(os.getenv("ASR_TRANSCRIPT_CACHE_MB", "256"))  # 0이면 사용 안 함
+
+# 평가 결과는 최근 ASR_EVALUATION_HISTORY 건만 보관 (0이면 수집 안 함)
+EVALUATION_HISTORY = int(os.getenv("ASR_EVALUATION_HISTORY", "1000"))
+
+# ====================
+# 🔹 응급 상황 API 설정
+# ====================
+EMERGENCY_API_CONFIG = {
+    "enabled": True,  # API 호출 활성화 여부
+    "api_endpoints": [
+        {
+            "name": "Emergency Alert API (JSON)",
+            "url": "http://10.10.11.23:10008/api/emergency/quick",
+            "enabled": True,
+            "method": "POST",
+            "type": "json"
+        },
+        {
+            "name": "Emergency Alert API (Multipart)",
+            "url": "http://10.10.11.23:10008/api/emergency/quick/{watchId}",
+            "enabled": True,
+            "method": "POST",
+            "type": "multipart"
+        }
+    ],
+    "watch_id": "watch_1764653561585_7956",
+    "sender_id": "voice_asr_system",
+    "include_image_url": True,
+    "image_base_url": "http://10.10.11.79:8080/api/images",
+    "fcm_project_id": "emergency-alert-system-f27e6",
+}
+
+# 응급 알림 전송 (AlertDispatcher)
+EMERGENCY_ALERT_DISPATCH = {
+    "workers": int(os.getenv("ASR_ALERT_WORKERS", "4")),                      # 병렬 전송 스레드
+    "max_retries": int(os.getenv("ASR_ALERT_RETRIES", "3")),                  # 엔드포인트당 재시도
+    "backoff_seconds": float(os.getenv("ASR_ALERT_BACKOFF", "0.5")),          # 첫 재시도 대기 (지수 증가)
+    "connect_timeout": float(os.getenv("ASR_ALERT_CONNECT_TIMEOUT", "3")),
+    "read_timeout": float(os.getenv("ASR_ALERT_READ_TIMEOUT", "10")),
+    "suppress_seconds": float(os.getenv("ASR_ALERT_SUPPRESS_SECONDS", "60")), # 장비+키워드 재전송 억제
+}
+
+# 발화 단위 지연 추적 (asr_engine.tracing)
+TRACING_CONFIG = {
+    "service_name": os.getenv("ASR_TRACE_SERVICE_NAME", "rk3588-asr"),
+    "exporter": os.getenv("ASR_TRACE_EXPORTER", "off"),                       # off | file | otlp
+    "file": os.getenv("ASR_TRACE_FILE", "./logs/traces.jsonl"),
+    "otlp_endpoint": os.getenv("ASR_TRACE_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"),
+    "sample_rate": float(os.getenv("ASR_TRACE_SAMPLE_RATE", "1.0")),          # 새 trace 샘플링 비율
+}
+
+# ====================
+# 정답 데이터 (Ground Truth)
+# ====================
+GROUND_TRUTHS = [
+    # 일상 상황 10개
+    "회의는 오후 세 시에 시작해 알림 설정해 줘",
+    "내일 아침 일곱 시에 기상 알람을 추가해",
+    "거실 불 끄고 공기청정기 약하게 켜",
+    "오늘 점심은 김치볶음밥 두 개 주문할까",
+    "블루투스 이어폰 배터리 잔량 얼마야",
+    "일정에 고객 미팅 오후 두 시로 등록해",
+    "와이파이가 자꾸 끊겨 속도 테스트 해봐",
+    "영수증 사진을 스캔해서 이메일로 보내",
+    "주말에 가족 영화 추천해 줘 액션 말고",
+    "날씨 어때 우산 챙겨야 할까",
+    # 응급 상황 10개
+    "도와줘 사람이 쓰러졌어",
+    "119에 바로 신고해 호흡이 멈춘 것 같아",
+    "불이야 주방에서 연기가 나",
+    "심장이 아파 가슴이 조여 와",
+    "큰 사고야 피가 많이 나 위치 전송해 줘",
+    "알러지 반응이야 숨쉬기 힘들어.",
+    "어지럽고 구토가 나 구급차 호출해",
+    "노약자가 계단에서 넘어졌어 의식이 희미해",
+    "가스 냄새가 심해 즉시 환기하고 신고해",
+    "아이 체온이 40도야 응급실 안내해 줘",
+]
+
+LABELS = ["일상"] * 10 + ["응급"] * 10
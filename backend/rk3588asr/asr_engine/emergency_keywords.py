@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+응급 키워드 다중 패턴 매처 (Aho–Corasick)
+
+🎯 기능:
+1. 키워드 목록(가중치, 카테고리 포함)으로 오토마톤을 한 번만 빌드
+2. 띄어쓰기 정규화 ("살려 줘" == "살려줘")
+3. 한글 자모 분해 매칭 ("도와줘" 키워드가 "도와줬어"에도 매칭)
+4. 원문 기준 매칭 위치(start, end) 반환
+5. 설정 파일 변경 시 재시작 없이 핫 리로드
+
+키워드 수와 무관하게 입력 텍스트 길이에 비례하는 시간으로 동작합니다.
+
+설정 파일 형식 (JSON):
+{
+    "keywords": [
+        {"keyword": "도와줘", "category": "구조요청", "weight": 1.0, "jamo": true},
+        {"keyword": "119", "category": "신고", "weight": 1.0}
+    ]
+}
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from typing import List, Dict, Optional, Tuple, Iterable
+
+logger = logging.getLogger(__name__)
+
+# 설정 파일이 없을 때 사용하는 기본 키워드
+DEFAULT_EMERGENCY_KEYWORDS = [
+    "도와줘", "살려줘", "119", "응급", "불이야", "화재",
+    "심장", "호흡", "출혈", "사고", "구급차", "응급실",
+    "알러지", "구토", "의식", "가스",
+]
+
+DEFAULT_KEYWORDS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "emergency_keywords.json"
+)
+
+# ====================
+# 한글 자모 분해
+# ====================
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ",
+              "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ",
+              "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+
+def decompose_hangul(ch: str) -> str:
+    """한글 음절 1자를 호환 자모 문자열로 분해 (한글이 아니면 그대로 반환)"""
+    code = ord(ch)
+    if code < _HANGUL_BASE or code > _HANGUL_LAST:
+        return ch
+    offset = code - _HANGUL_BASE
+    cho, rest = divmod(offset, 21 * 28)
+    jung, jong = divmod(rest, 28)
+    return _CHOSEONG[cho] + _JUNGSEONG[jung] + _JONGSEONG[jong]
+
+
+def normalize_for_matching(text: str, jamo: bool = False) -> Tuple[str, List[int]]:
+    """
+    매칭용 정규화 텍스트와 원문 인덱스 매핑 생성
+
+    - 공백 제거 (띄어쓰기 정규화)
+    - 소문자 변환
+    - jamo=True이면 한글 음절을 자모로 분해
+
+    Returns:
+        (정규화 텍스트, 정규화 텍스트의 각 문자 → 원문 인덱스 리스트)
+    """
+    chars = []
+    index_map = []
+    for idx, ch in enumerate(text):
+        if ch.isspace():
+            continue
+        ch = ch.lower()
+        if jamo:
+            for j in decompose_hangul(ch):
+                chars.append(j)
+                index_map.append(idx)
+        else:
+            chars.append(ch)
+            index_map.append(idx)
+    return "".join(chars), index_map
+
+
+# ====================
+# Aho–Corasick 오토마톤
+# ====================
+class AhoCorasickAutomaton:
+    """
+    다중 패턴 문자열 매칭 오토마톤
+
+    상태 전이는 dict 리스트로 표현하며, 빌드 이후에는 읽기 전용이므로
+    여러 스레드에서 동시에 검색해도 안전합니다.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, object]]):
+        """
+        Args:
+            patterns: (패턴 문자열, 페이로드) 튜플 목록
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 각 상태에서 출력되는 (패턴 길이, 페이로드) 목록
+        self._output: List[List[Tuple[int, object]]] = [[]]
+        self.pattern_count = 0
+
+        for pattern, payload in patterns:
+            if pattern:
+                self._add(pattern, payload)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, payload) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._output[state].append((len(pattern), payload))
+        self.pattern_count += 1
+
+    def _build_failure_links(self) -> None:
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                # 실패 링크의 출력 병합 (접미사 패턴)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def iter_matches(self, text: str):
+        """
+        텍스트에서 모든 패턴 매칭 위치 반환
+
+        Yields:
+            (시작 인덱스, 끝 인덱스(exclusive), 페이로드)
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for length, payload in output[state]:
+                    yield pos - length + 1, pos + 1, payload
+
+
+# ====================
+# 응급 키워드 매처
+# ====================
+class EmergencyKeywordMatcher:
+    """
+    설정 가능한 응급 키워드 매처
+
+    - 공백 정규화 오토마톤: 모든 키워드
+    - 자모 오토마톤: jamo=true 로 지정된 키워드만 (활용형 매칭용)
+
+    두 오토마톤은 reload 시 통째로 교체되므로 검색 중인 스레드는
+    이전 스냅샷을 그대로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        keywords_path: Optional[str] = None,
+        default_keywords: Optional[List[str]] = None,
+        reload_interval: float = 2.0,
+    ):
+        """
+        Args:
+            keywords_path: 키워드 JSON 파일 경로 (없으면 기본 키워드 사용)
+            default_keywords: 파일이 없을 때 사용할 키워드 목록
+            reload_interval: 파일 변경 확인 주기 (초, 0 이하이면 자동 리로드 안 함)
+        """
+        self.keywords_path = keywords_path
+        self.default_keywords = list(default_keywords or DEFAULT_EMERGENCY_KEYWORDS)
+        self.reload_interval = reload_interval
+
+        self._lock = threading.Lock()
+        self._file_mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._snapshot = None  # (entries, plain_automaton, jamo_automaton)
+
+        self.reload()
+
+    # --------------------
+    # 설정 로딩
+    # --------------------
+    def _load_entries(self) -> List[Dict]:
+        """키워드 설정 파일 로드 (실패 시 기본 키워드)"""
+        raw_entries = None
+        if self.keywords_path and os.path.exists(self.keywords_path):
+            with open(self.keywords_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            raw_entries = data.get("keywords", []) if isinstance(data, dict) else data
+
+        if raw_entries is None:
+            raw_entries = self.default_keywords
+
+        entries = []
+        seen = set()
+        for item in raw_entries:
+            if isinstance(item, str):
+                item = {"keyword": item}
+            keyword = str(item.get("keyword", "")).strip()
+            if not keyword or keyword in seen:
+                continue
+            seen.add(keyword)
+            entries.append({
+                "keyword": keyword,
+                "category": item.get("category", "일반"),
+                "weight": float(item.get("weight", 1.0)),
+                "jamo": bool(item.get("jamo", False)),
+            })
+        return entries
+
+    @staticmethod
+    def _build(entries: List[Dict]):
+        plain = AhoCorasickAutomaton(
+            (normalize_for_matching(e["keyword"])[0], e) for e in entries
+        )
+        jamo = AhoCorasickAutomaton(
+            (normalize_for_matching(e["keyword"], jamo=True)[0], e)
+            for e in entries if e["jamo"]
+        )
+        return entries, plain, jamo
+
+    def reload(self) -> int:
+        """
+        키워드 설정 다시 로드 및 오토마톤 재빌드
+
+        로드 실패 시 기존 오토마톤을 유지합니다.
+
+        Returns:
+            로드된 키워드 개수
+        """
+        with self._lock:
+            try:
+                mtime = None
+                if self.keywords_path and os.path.exists(self.keywords_path):
+                    mtime = os.path.getmtime(self.keywords_path)
+                entries = self._load_entries()
+                self._snapshot = self._build(entries)
+                self._file_mtime = mtime
+                logger.info(f"✅ 응급 키워드 로드 완료: {len(entries)}개")
+            except Exception as e:
+                logger.error(f"❌ 응급 키워드 로드 실패: {e}", exc_info=True)
+                if self._snapshot is None:
+                    self._snapshot = self._build(
+                        [{"keyword": k, "category": "일반", "weight": 1.0, "jamo": False}
+                         for k in self.default_keywords]
+                    )
+            self._next_check = time.monotonic() + self.reload_interval
+            return len(self._snapshot[0])
+
+    def _maybe_reload(self) -> None:
+        """reload_interval 주기로 파일 변경 여부 확인"""
+        if self.reload_interval <= 0 or not self.keywords_path:
+            return
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.reload_interval
+        try:
+            mtime = os.path.getmtime(self.keywords_path)
+        except OSError:
+            mtime = None
+        if mtime != self._file_mtime:
+            logger.info(f"🔄 응급 키워드 파일 변경 감지: {self.keywords_path}")
+            self.reload()
+
+    # --------------------
+    # 조회
+    # --------------------
+    @property
+    def keywords(self) -> List[str]:
+        """현재 로드된 키워드 목록"""
+        return [e["keyword"] for e in self._snapshot[0]]
+
+    @property
+    def entries(self) -> List[Dict]:
+        """현재 로드된 키워드 설정 (가중치, 카테고리 포함)"""
+        return [dict(e) for e in self._snapshot[0]]
+
+    def find_matches(self, text: str) -> List[Dict]:
+        """
+        텍스트에서 응급 키워드 매칭
+
+        Args:
+            text: 인식된 텍스트
+
+        Returns:
+            매칭 리스트 (원문 등장 순서). 각 항목:
+            {keyword, category, weight, start, end, matched_text}
+            start/end는 원문 text 기준 인덱스 (end exclusive)
+        """
+        if not text:
+            return []
+
+        self._maybe_reload()
+        _, plain, jamo = self._snapshot
+
+        found = {}
+
+        def _collect(automaton: AhoCorasickAutomaton, normalized: str, index_map: List[int]):
+            for n_start, n_end, entry in automaton.iter_matches(normalized):
+                start = index_map[n_start]
+                end = index_map[n_end - 1] + 1
+                prev = found.get(entry["keyword"])
+                if prev is None or start < prev["start"]:
+                    found[entry["keyword"]] = {
+                        "keyword": entry["keyword"],
+                        "category": entry["category"],
+                        "weight": entry["weight"],
+                        "start": start,
+                        "end": end,
+                        "matched_text": text[start:end],
+                    }
+
+        if plain.pattern_count:
+            _collect(plain, *normalize_for_matching(text))
+        if jamo.pattern_count:
+            _collect(jamo, *normalize_for_matching(text, jamo=True))
+
+        return sorted(found.values(), key=lambda m: (m["start"], m["end"]))
+
+    def detect(self, text: str) -> List[str]:
+        """매칭된 키워드 문자열 목록만 반환"""
+        return [m["keyword"] for m in self.find_matches(text)]
+
+    @staticmethod
+    def score(matches: List[Dict]) -> float:
+        """매칭 결과의 가중치 합"""
+        return sum(m["weight"] for m in matches)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+음성인식 평가 결과 수집기 (메모리 상한 고정)
+
+🎯 기능:
+1. 최근 N개 평가 결과만 링 버퍼에 보관 (스칼라 필드만, 중첩 구조/raw_measures 제외)
+2. 전체 기간 스트리밍 집계: 건수, 평균 CER, 라벨별 건수, 응급 건수, S/D/I 합계
+
+서버를 오래 띄워 두어도 메모리 사용량이 일정하게 유지됩니다.
+"""
+
+import threading
+from collections import deque
+from typing import List, Dict, Optional
+
+
+class EvaluationCollector:
+    """평가 결과 링 버퍼 + 스트리밍 집계"""
+
+    # 링 버퍼에 보관하는 필드
+    RECORD_FIELDS = (
+        "recognized", "best_match", "index", "label",
+        "similarity", "accuracy", "cer", "cer_jiwer",
+        "is_emergency", "emergency_keywords",
+    )
+
+    def __init__(self, max_records: int = 1000):
+        """
+        Args:
+            max_records: 링 버퍼에 보관할 최근 결과 개수
+        """
+        self.max_records = max_records
+        self.lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._reset_aggregates()
+
+    def _reset_aggregates(self):
+        self.count = 0
+        self.cer_count = 0
+        self.cer_sum = 0.0
+        self.emergency_count = 0
+        self.label_counts: Dict[str, int] = {}
+        self.totals = {"S": 0, "D": 0, "I": 0, "N": 0}
+
+    def record(self, result: Dict) -> None:
+        """find_best_match 결과 1건 기록"""
+        compact = {key: result.get(key) for key in self.RECORD_FIELDS}
+        cer_direct = result.get("cer_direct")
+
+        with self.lock:
+            self._records.append(compact)
+            self.count += 1
+
+            label = compact.get("label") or "unknown"
+            self.label_counts[label] = self.label_counts.get(label, 0) + 1
+
+            if compact.get("is_emergency"):
+                self.emergency_count += 1
+
+            if compact.get("cer") is not None:
+                self.cer_count += 1
+                self.cer_sum += compact["cer"]
+
+            if cer_direct:
+                for key in self.totals:
+                    self.totals[key] += cer_direct.get(key, 0)
+
+    def records(self, limit: Optional[int] = None) -> List[Dict]:
+        """최근 평가 결과 (오래된 순)"""
+        with self.lock:
+            items = list(self._records)
+        return items[-limit:] if limit else items
+
+    def summary(self) -> Dict:
+        """누적 집계"""
+        with self.lock:
+            totals = dict(self.totals)
+            return {
+                "count": self.count,
+                "buffered": len(self._records),
+                "mean_cer": self.cer_sum / self.cer_count if self.cer_count else None,
+                "corpus_cer": (
+                    (totals["S"] + totals["D"] + totals["I"]) / totals["N"]
+                    if totals["N"] else None
+                ),
+                "emergency_count": self.emergency_count,
+                "label_counts": dict(self.label_counts),
+                "totals": totals,
+            }
+
+    def reset(self) -> None:
+        """버퍼와 집계 초기화"""
+        with self.lock:
+            self._records.clear()
+            self._reset_aggregates()
+
+    def __len__(self) -> int:
+        return len(self._records)
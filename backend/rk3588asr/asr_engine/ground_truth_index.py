@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+정답 문장(Ground Truth) 후보 인덱스
+
+🎯 기능:
+1. 문자 n-gram 역색인으로 후보 정답 문장을 top-k 개만 추림
+2. 후보에 대해서만 밴드(banded) 편집거리로 정확한 점수 계산
+3. 현재까지의 최선 거리로 밴드 폭을 줄여 나머지 후보를 조기 탈락
+
+정답 문장이 수만 개로 늘어나도 전체를 비교하지 않고
+질의와 n-gram을 공유하는 문장만 평가합니다.
+"""
+
+import re
+from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
+
+from .cer_engine import banded_levenshtein
+
+
+def _strip_spaces(text: str) -> str:
+    return re.sub(r"\s+", "", text)
+
+
+def char_ngrams(text: str, n: int) -> set:
+    """공백 제거 텍스트의 문자 n-gram 집합"""
+    text = _strip_spaces(text)
+    if len(text) < n:
+        return set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class GroundTruthIndex:
+    """
+    문자 n-gram 역색인 기반 최근접 정답 문장 검색
+
+    - 1차: 질의와 공유하는 n-gram 수로 Dice 점수 계산 → top-k 후보
+    - 2차: 후보에 대해 정규화 편집거리 (1 - dist / max_len) 로 정확 점수 계산
+    """
+
+    def __init__(self, references: List[str], n: int = 2, top_k: int = 8):
+        """
+        Args:
+            references: 정답 문장 목록 (전처리된 문장)
+            n: n-gram 크기
+            top_k: 정확 점수를 계산할 후보 개수
+        """
+        self.n = n
+        self.top_k = top_k
+        self.references = list(references)
+        self._gram_counts: List[int] = []
+        self._unigram_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._unigram_postings: Dict[str, List[int]] = defaultdict(list)
+
+        for idx, ref in enumerate(self.references):
+            grams = char_ngrams(ref, n)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(idx)
+            chars = char_ngrams(ref, 1)
+            self._unigram_counts.append(len(chars))
+            for ch in chars:
+                self._unigram_postings[ch].append(idx)
+
+    def __len__(self) -> int:
+        return len(self.references)
+
+    def candidates(self, query: str, top_k: Optional[int] = None) -> List[int]:
+        """
+        n-gram 공유 점수 기준 상위 후보 인덱스
+
+        n-gram을 공유하는 문장이 없으면 문자(unigram) 색인으로 대체합니다.
+        """
+        top_k = top_k or self.top_k
+        grams = char_ngrams(query, self.n)
+        postings = self._postings
+        ref_counts = self._gram_counts
+
+        if not any(g in postings for g in grams):
+            grams = char_ngrams(query, 1)
+            postings = self._unigram_postings
+            ref_counts = self._unigram_counts
+        q_count = len(grams)
+
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for idx in postings.get(gram, ()):
+                shared[idx] += 1
+
+        if not shared:
+            return []
+
+        def _dice(item: Tuple[int, int]) -> float:
+            idx, count = item
+            return 2.0 * count / (q_count + ref_counts[idx])
+
+        ranked = sorted(shared.items(), key=_dice, reverse=True)
+        return [idx for idx, _ in ranked[:top_k]]
+
+    def best_match(self, query: str, top_k: Optional[int] = None) -> Tuple[int, float, int]:
+        """
+        가장 가까운 정답 문장 검색
+
+        Args:
+            query: 전처리된 인식 결과
+
+        Returns:
+            (정답 인덱스, 정확도 1 - dist/max_len, 편집거리)
+            후보가 없으면 (-1, 0.0, -1)
+        """
+        best_idx = -1
+        best_acc = 0.0
+        best_dist = -1
+
+        for idx in self.candidates(query, top_k):
+            ref = self.references[idx]
+            max_len = max(len(query), len(ref))
+            if max_len == 0:
+                return idx, 1.0, 0
+
+            # 현재 최선 정확도를 넘으려면 필요한 최대 거리
+            if best_idx < 0:
+                limit = max_len
+            else:
+                limit = int((1.0 - best_acc) * max_len)
+                if (1.0 - limit / max_len) <= best_acc:
+                    limit -= 1
+                if limit < 0:
+                    continue
+
+            dist = banded_levenshtein(query, ref, limit)
+            if dist is None:
+                continue
+
+            acc = 1.0 - dist / max_len
+            if best_idx < 0 or acc > best_acc:
+                best_idx, best_acc, best_dist = idx, acc, dist
+
+        return best_idx, max(0.0, best_acc), best_dist
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+음성인식 결과 ↔ 정답 문장 매칭
+
+🎯 기능:
+1. n-gram 색인 기반 최근접 정답 문장 검색
+2. 응급 키워드 감지 (Aho–Corasick)
+3. CER 계산 (cer_engine, 선택적으로 jiwer)
+
+jiwer 는 CER 상세 평가에서만 쓰이므로 처음 사용할 때 import 합니다.
+"""
+
+import os
+import re
+import logging
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional
+
+from . import cer_engine
+from .config import GROUND_TRUTHS, LABELS, EVALUATION_HISTORY
+from .ground_truth_index import GroundTruthIndex
+from .evaluation_collector import EvaluationCollector
+from .emergency_keywords import (
+    EmergencyKeywordMatcher,
+    DEFAULT_EMERGENCY_KEYWORDS,
+    DEFAULT_KEYWORDS_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _load_jiwer():
+    """jiwer는 선택적 의존성으로 처리 (없으면 None)"""
+    try:
+        from jiwer import compute_measures
+        return compute_measures
+    except ImportError:
+        logger.warning("[WARN] jiwer 라이브러리를 찾을 수 없습니다. `pip install jiwer` 로 설치하세요.")
+        return None
+
+
+class SpeechRecognitionMatcher:
+    """음성인식 결과와 정답 문장을 비교하는 클래스"""
+
+    # 키워드 설정 파일이 없을 때 사용하는 기본 목록
+    EMERGENCY_KEYWORDS = DEFAULT_EMERGENCY_KEYWORDS
+
+    def __init__(
+        self,
+        ground_truths: List[str],
+        labels: List[str] = None,
+        keywords_path: Optional[str] = None,
+        collector: Optional[EvaluationCollector] = None,
+    ):
+        self.ground_truths = ground_truths
+        self.labels = labels if labels else ["일상"] * len(ground_truths)
+        self._label_by_gt = dict(zip(ground_truths, self.labels))
+
+        # 🔹 평가 결과 수집기 (선택적, 메모리 상한 고정). None이면 기록하지 않음
+        self.collector = collector
+
+        # 🔹 정답 문장 n-gram 역색인 (후보만 정확 점수 계산)
+        self.gt_index = GroundTruthIndex([self.preprocess(gt) for gt in ground_truths])
+
+        # 🔹 응급 키워드 오토마톤 (설정 파일 변경 시 자동 리로드)
+        self.keyword_matcher = EmergencyKeywordMatcher(
+            keywords_path=keywords_path or os.getenv("EMERGENCY_KEYWORDS_PATH", DEFAULT_KEYWORDS_PATH),
+            default_keywords=self.EMERGENCY_KEYWORDS,
+        )
+
+    @property
+    def jiwer_available(self) -> bool:
+        return _load_jiwer() is not None
+
+    def label_of(self, ground_truth: str) -> str:
+        """정답 문장의 라벨 (등록되지 않은 문장은 "unknown")"""
+        return self._label_by_gt.get(ground_truth, "unknown")
+
+    def preprocess(self, text: str) -> str:
+        text = re.sub(r"\s+", " ", text)
+        return text.strip()
+
+    def calculate_similarity(self, text1: str, text2: str) -> float:
+        return SequenceMatcher(None, text1, text2).ratio()
+
+    def levenshtein_distance(self, s1: str, s2: str) -> int:
+        return cer_engine.edit_distance(s1, s2)
+
+    def character_accuracy(self, recognized: str, ground_truth: str) -> float:
+        recognized = self.preprocess(recognized)
+        ground_truth = self.preprocess(ground_truth)
+        lev_dist = self.levenshtein_distance(recognized, ground_truth)
+        max_len = max(len(recognized), len(ground_truth))
+        if max_len == 0:
+            return 1.0
+        accuracy = 1.0 - (lev_dist / max_len)
+        return max(0.0, accuracy)
+
+    def detect_emergency_keywords(self, text: str) -> List[str]:
+        return self.keyword_matcher.detect(text)
+
+    def match_emergency_keywords(self, text: str) -> List[Dict]:
+        """응급 키워드 매칭 상세 (카테고리, 가중치, 원문 위치 포함)"""
+        return self.keyword_matcher.find_matches(text)
+
+    def reload_emergency_keywords(self) -> int:
+        """응급 키워드 설정 파일 다시 로드"""
+        return self.keyword_matcher.reload()
+
+    @property
+    def evaluation_results(self) -> List[Dict]:
+        """수집기에 보관된 최근 평가 결과 (수집기가 없으면 빈 리스트)"""
+        return self.collector.records() if self.collector else []
+
+    def find_best_match(self, recognized_text: str, detailed: bool = True) -> Dict:
+        """
+        최근접 정답 문장 및 응급 키워드 검색 (부수효과 없음)
+
+        Args:
+            recognized_text: 인식 결과
+            detailed: False이면 CER/jiwer/유사도 계산을 생략하는 운영용 경량 경로
+
+        Returns:
+            매칭 결과 딕셔너리 (detailed=False이면 CER 관련 필드 제외)
+        """
+        recognized_text = self.preprocess(recognized_text)
+
+        # 🔹 n-gram 후보 추림 + 밴드 편집거리로 최근접 정답 검색
+        best_index, best_accuracy, _ = self.gt_index.best_match(recognized_text)
+        best_match = self.ground_truths[best_index] if best_index >= 0 else ""
+
+        emergency_matches = self.match_emergency_keywords(recognized_text)
+        emergency_keywords = [m["keyword"] for m in emergency_matches]
+        is_emergency = len(emergency_keywords) > 0
+
+        result = {
+            "recognized": recognized_text,
+            "best_match": best_match,
+            "accuracy": best_accuracy,
+            "index": best_index,
+            "label": self.labels[best_index] if best_index >= 0 else "unknown",
+            "emergency_keywords": emergency_keywords,
+            "emergency_matches": emergency_matches,
+            "emergency_score": EmergencyKeywordMatcher.score(emergency_matches),
+            "is_emergency": is_emergency,
+        }
+        if not detailed:
+            return result
+
+        # 🔹 best_match에 대해 유사도 / CER 계산
+        best_similarity = (
+            self.calculate_similarity(recognized_text, self.gt_index.references[best_index])
+            if best_index >= 0 else 0.0
+        )
+        cer_direct = None
+        cer_jiwer_result = None
+        if best_match:
+            cer_direct = self.cer_direct(recognized_text, best_match)
+            cer_jiwer_result = self.cer_jiwer(recognized_text, best_match)
+
+        result.update({
+            "similarity": best_similarity,
+            # 🔹 추가된 필드들
+            "cer": cer_direct["CER"] if cer_direct else None,  # CER 값만 표시 (0.xx 형식)
+            "cer_direct": cer_direct,         # 전체 정보 (S, D, I, N 포함)
+            "cer_jiwer": cer_jiwer_result["CER"] if cer_jiwer_result else None,  # jiwer CER 값만
+            "cer_jiwer_full": cer_jiwer_result,    # jiwer 기반 전체 결과 (또는 None)
+        })
+        return result
+
+    def evaluate(self, recognized_text: str) -> Dict:
+        """
+        상세 매칭(CER 포함) 후 수집기에 기록
+
+        수집기가 없으면 find_best_match(detailed=True)와 동일합니다.
+        """
+        result = self.find_best_match(recognized_text, detailed=True)
+        if self.collector is not None:
+            self.collector.record(result)
+        return result
+
+    def evaluation_summary(self) -> Optional[Dict]:
+        """수집기 누적 집계 (평균 CER, 라벨별 건수 등)"""
+        return self.collector.summary() if self.collector else None
+
+    def reset_evaluation(self):
+        if self.collector is not None:
+            self.collector.reset()
+
+    # ============================
+    # 🔹 (A) 직접 구현한 CER 계산
+    # ============================
+    def cer_direct(
+        self,
+        recognized: str,
+        ground_truth: str,
+        ignore_spaces: bool = True,
+    ) -> Dict[str, float]:
+        """
+        CER 엔진(cer_engine)으로 CER 계산 - O(min(r, h)) 메모리
+        CER = (S + D + I) / N
+          - N: 정답(GT) 전체 음절 수
+          - S: 치환(substitution) 개수
+          - D: 삭제(deletion) 개수
+          - I: 삽입(insertion) 개수
+        """
+        rec, gt = self._cer_transform(recognized, ground_truth, ignore_spaces)
+        return cer_engine.cer(rec, gt)
+
+    def cer_direct_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        ignore_spaces: bool = True,
+    ) -> List[Dict[str, float]]:
+        """
+        여러 (인식 결과, 정답) 쌍의 CER을 한 번에 계산
+
+        Returns:
+            입력 순서대로 cer_direct와 같은 형식의 결과 리스트
+        """
+        return cer_engine.batch_cer(
+            [self._cer_transform(rec, gt, ignore_spaces) for rec, gt in pairs]
+        )
+
+    def _cer_transform(self, recognized: str, ground_truth: str, ignore_spaces: bool) -> Tuple[str, str]:
+        rec = self.preprocess(recognized)
+        gt = self.preprocess(ground_truth)
+        if ignore_spaces:
+            rec = rec.replace(" ", "")
+            gt = gt.replace(" ", "")
+        return rec, gt
+
+    # ============================
+    # 🔹 (B) jiwer 기반 CER 계산
+    # ============================
+    def cer_jiwer(
+        self,
+        recognized: str,
+        ground_truth: str,
+        ignore_spaces: bool = True,
+    ) -> Optional[Dict[str, float]]:
+        """
+        jiwer 라이브러리를 이용한 CER 계산
+        (jiwer가 설치되어 있지 않으면 None 반환)
+        """
+
+        compute_measures = _load_jiwer()
+        if compute_measures is None:
+            # jiwer 미설치 시에는 None 반환 (또는 예외 발생시켜도 됨)
+            logging.warning(
+                "jiwer 라이브러리가 설치되어 있지 않습니다. `pip install jiwer` 후 사용하세요."
+            )
+            return None
+
+        def char_transform(s: str):
+            s = self.preprocess(s)
+            if ignore_spaces:
+                s = s.replace(" ", "")
+            return list(s)
+
+        measures = compute_measures(
+            truth=ground_truth,
+            hypothesis=recognized,
+            truth_transform=char_transform,
+            hypothesis_transform=char_transform,
+        )
+
+        S = measures["substitutions"]
+        D = measures["deletions"]
+        I = measures["insertions"]
+        N = measures["reference_length"]
+        cer = (S + D + I) / N if N > 0 else 0.0
+
+        return {
+            "CER": cer,
+            "S": S,
+            "D": D,
+            "I": I,
+            "N": N,
+            "raw_measures": measures,
+        }
+
+
+# 평가 결과는 최근 EVALUATION_HISTORY 건만 보관 (0이면 수집 안 함)
+matcher = SpeechRecognitionMatcher(
+    GROUND_TRUTHS,
+    LABELS,
+    collector=EvaluationCollector(EVALUATION_HISTORY) if EVALUATION_HISTORY > 0 else None,
+)
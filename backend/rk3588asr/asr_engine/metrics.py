@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+인식 경로 Prometheus 지표
+
+오디오 청크 수신, VAD 구간 길이, 디코딩 지연 / 실시간 배율(RTF), 응급 알림 전송 지연을 기록합니다.
+prometheus_client 가 없으면 (데모 UI 등) 모든 지표가 아무 일도 하지 않는 객체로 대체됩니다.
+
+    from asr_engine.metrics import DECODE_SECONDS
+    DECODE_SECONDS.observe(elapsed)
+"""
+
+import time
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+
+    METRICS_AVAILABLE = True
+except ImportError:  # 선택적 의존성
+    METRICS_AVAILABLE = False
+
+
+class _NoopMetric:
+    """prometheus_client 미설치 시 지표 자리 표시 (호출 비용만 남김)"""
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+    def set(self, value):
+        pass
+
+    def observe(self, value):
+        pass
+
+    def track_inprogress(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _metric(kind: str, *args, **kwargs):
+    if not METRICS_AVAILABLE:
+        return _NoopMetric()
+    return {"counter": Counter, "gauge": Gauge, "histogram": Histogram}[kind](*args, **kwargs)
+
+
+# HTTP
+HTTP_REQUEST_SECONDS = _metric(
+    "histogram", "asr_http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 템플릿별)", ["method", "route", "status"]
+)
+
+# 오디오 수신
+AUDIO_CHUNKS = _metric("counter", "asr_audio_chunks_total", "수신한 오디오 청크 수", ["endpoint"])
+AUDIO_SECONDS = _metric("counter", "asr_audio_received_seconds_total", "수신한 오디오 길이 (초)", ["endpoint"])
+WS_CONNECTIONS = _metric("gauge", "asr_websocket_connections", "활성 오디오 WebSocket 연결 수", ["endpoint"])
+
+# VAD / 디코딩
+VAD_SEGMENT_SECONDS = _metric(
+    "histogram",
+    "asr_vad_segment_duration_seconds",
+    "VAD 가 잘라낸 음성 구간 길이",
+    buckets=(0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 12.0, 20.0, 30.0, 60.0),
+)
+DECODE_SECONDS = _metric(
+    "histogram",
+    "asr_decode_duration_seconds",
+    "음성 구간 1개 디코딩 시간",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0),
+)
+REAL_TIME_FACTOR = _metric(
+    "histogram",
+    "asr_real_time_factor",
+    "디코딩 시간 / 오디오 길이 (1 미만이면 실시간보다 빠름)",
+    buckets=(0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0),
+)
+
+# 응급 알림
+EMERGENCY_ALERT_SECONDS = _metric(
+    "histogram",
+    "asr_emergency_alert_delivery_seconds",
+    "응급 알림 예약 → 엔드포인트 응답까지 (대기 / 재시도 포함)",
+    ["outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+EMERGENCY_ALERT_PENDING = _metric(
+    "gauge", "asr_emergency_alert_pending", "전송 대기 / 진행 중인 응급 알림 (엔드포인트 단위)"
+)
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 처리 시간 기록 (순수 ASGI 미들웨어, BaseHTTPMiddleware 요청당 오버헤드 없음)
+
+    라벨은 실제 경로 대신 라우트 템플릿을 사용해 시계열 수를 제한
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_AVAILABLE:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status_code),
+            ).observe(time.perf_counter() - start)
+
+
+def render_metrics():
+    """
+    Prometheus 텍스트 형식 지표
+
+    Returns:
+        (본문 bytes, Content-Type) - prometheus_client 가 없으면 빈 본문
+    """
+    if not METRICS_AVAILABLE:
+        return b"# prometheus_client not installed\n", "text/plain; charset=utf-8"
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Sherpa-ONNX Offline Recognizer 로딩
+
+sherpa_onnx 는 load_model() 호출 시점에 import 합니다.
+전역 recognizer 는 RecognizerPool 로, 기존 recognizer 처럼
+create_stream / decode_stream / decode_streams 를 그대로 호출하면 됩니다.
+언어를 고정한 세션은 acquire_recognizer(language) 로 언어별 풀을 받고,
+세션이 끝나면 release_recognizer(language) 로 반환합니다 (사용 중인 풀은 언로드하지 않음).
+"""
+
+import os
+import logging
+from typing import Dict, Optional
+
+from .recognizer_pool import RecognizerPool, RecognizerRegistry
+from .config import (
+    MODEL_DIR,
+    MODEL_PATH,
+    TOKENS_PATH,
+    RECOGNIZER_PROVIDER,
+    RECOGNIZER_CONFIG,
+    RECOGNIZER_POOL_CONFIG,
+    SUPPORTED_LANGUAGES,
+    TRANSCRIPT_CACHE_DIR,
+    TRANSCRIPT_CACHE_MAX_MB,
+)
+
+logger = logging.getLogger(__name__)
+
+# 전역 recognizer 변수 (기본 모델 RecognizerPool)
+recognizer = None
+
+# 언어별 풀 상주 관리 (기본 모델은 고정)
+registry: Optional[RecognizerRegistry] = None
+
+DEFAULT_POOL_KEY = "auto"
+
+# load_model() 에서 생성 (TranscriptionCache)
+transcription_cache = None
+
+
+def _import_sherpa_onnx():
+    try:
+        import sherpa_onnx
+    except ImportError:
+        raise ImportError(
+            "sherpa-onnx를 찾을 수 없습니다.\n"
+            "다음 명령어로 설치해주세요:\n"
+            "pip install sherpa-onnx -f https://k2-fsa.github.io/sherpa/onnx/rk-npu.html"
+        )
+    return sherpa_onnx
+
+
+def _create_pool(language: str, sherpa_onnx) -> RecognizerPool:
+    """language 로 고정한 recognizer 풀 생성 ("" / "auto" = 자동 감지)"""
+    language = "" if language == DEFAULT_POOL_KEY else language
+
+    def factory():
+        return sherpa_onnx.OfflineRecognizer.from_sense_voice(
+            model=MODEL_PATH,
+            tokens=TOKENS_PATH,
+            num_threads=RECOGNIZER_POOL_CONFIG["num_threads"],
+            provider=RECOGNIZER_PROVIDER,
+            language=language,
+            use_itn=RECOGNIZER_CONFIG["use_itn"],
+            debug=False,
+        )
+
+    return RecognizerPool(
+        factory,
+        size=RECOGNIZER_POOL_CONFIG["size"],
+        name=language or DEFAULT_POOL_KEY,
+        warmup=RECOGNIZER_POOL_CONFIG["warmup"],
+        checkout_timeout=RECOGNIZER_POOL_CONFIG["checkout_timeout"],
+    )
+
+
+def load_model():
+    """Offline Recognizer 로드"""
+    global recognizer, registry, transcription_cache
+
+    logger.info("=" * 60)
+    logger.info("🔄 Sherpa-ONNX Sense-Voice RKNN 모델 로딩 중...")
+    logger.info("📦 모델: sense-voice (zh, en, ja, ko, yue)")
+    logger.info("🖥️ 플랫폼: RK3588 - NPU 최적화")
+    logger.info("=" * 60)
+
+    sherpa_onnx = _import_sherpa_onnx()
+
+    if not os.path.exists(MODEL_DIR):
+        raise FileNotFoundError(f"모델 디렉토리 없음: {MODEL_DIR}")
+
+    required_files = {
+        "RKNN Model" if RECOGNIZER_PROVIDER == "rknn" else "ONNX Model": MODEL_PATH,
+        "Tokens": TOKENS_PATH,
+    }
+
+    logger.info("📁 모델 파일 확인:")
+    for name, path in required_files.items():
+        if os.path.exists(path):
+            size = os.path.getsize(path) / (1024**2)
+            logger.info(f"  ✅ {name}: {os.path.basename(path)} ({size:.2f} MB)")
+        else:
+            raise FileNotFoundError(f"필수 파일 없음: {name}")
+
+    logger.info(
+        f"⚙️ Offline Recognizer 초기화 중... (provider={RECOGNIZER_PROVIDER}, "
+        f"풀 {RECOGNIZER_POOL_CONFIG['size']}개 x {RECOGNIZER_POOL_CONFIG['num_threads']}스레드)"
+    )
+    try:
+        recognizer = _create_pool(RECOGNIZER_CONFIG["language"], sherpa_onnx)
+        registry = RecognizerRegistry(
+            lambda key: _create_pool(key, sherpa_onnx),
+            max_resident=RECOGNIZER_POOL_CONFIG["max_resident_models"],
+            pinned=DEFAULT_POOL_KEY,
+        )
+        registry.add(DEFAULT_POOL_KEY, recognizer)
+        logger.info("✅ Offline Recognizer 로딩 완료!")
+
+        if TRANSCRIPT_CACHE_MAX_MB > 0:
+            from .transcription_cache import TranscriptionCache, model_fingerprint
+
+            transcription_cache = TranscriptionCache(
+                TRANSCRIPT_CACHE_DIR,
+                fingerprint=model_fingerprint(MODEL_PATH, **RECOGNIZER_CONFIG),
+                max_bytes=TRANSCRIPT_CACHE_MAX_MB * 1024 * 1024,
+            )
+
+    except Exception as e:
+        logger.error(f"❌ Recognizer 로딩 실패: {e}", exc_info=True)
+        raise
+
+    logger.info("=" * 60)
+    logger.info("✅ 모델 로딩 완료!")
+    logger.info("=" * 60)
+    return recognizer
+
+
+def get_recognizer(language: Optional[str] = None) -> Optional[RecognizerPool]:
+    """
+    recognizer 풀 조회 (load_model() 전이면 None)
+
+    Args:
+        language: SUPPORTED_LANGUAGES 중 하나면 해당 언어로 고정한 풀
+                  (처음 요청 시 로드, 상주 상한 초과 시 LRU 언로드),
+                  None / "auto" / 미지원 언어면 기본 풀
+    """
+    key = _pool_key(language)
+    if key is None:
+        return recognizer
+    return registry.get(key)
+
+
+def acquire_recognizer(language: Optional[str] = None) -> Optional[RecognizerPool]:
+    """
+    get_recognizer() + 사용 중 표시 (세션용)
+
+    언어별 풀은 release_recognizer(language) 전까지 언로드되지 않습니다.
+    첫 요청 시 모델 로드 + 웜업이 동기로 실행되므로 이벤트 루프에서는 스레드로 호출하세요.
+    """
+    key = _pool_key(language)
+    if key is None:
+        return recognizer
+    return registry.acquire(key)
+
+
+def release_recognizer(language: Optional[str] = None) -> None:
+    """acquire_recognizer() 로 받은 풀 반환 (기본 풀이면 무시)"""
+    key = _pool_key(language)
+    if key is not None:
+        registry.release(key)
+
+
+def _pool_key(language: Optional[str]) -> Optional[str]:
+    """언어별 풀 키 (기본 풀을 쓰면 None)"""
+    if recognizer is None or registry is None:
+        return None
+    if not language or language == DEFAULT_POOL_KEY or language == RECOGNIZER_CONFIG["language"]:
+        return None
+    if language not in SUPPORTED_LANGUAGES:
+        logger.warning(f"⚠️ 지원하지 않는 언어 '{language}', 기본 모델 사용")
+        return None
+    return language
+
+
+def pool_stats() -> Optional[Dict]:
+    """상주 중인 풀별 크기 / 체크아웃 대기 시간 통계"""
+    if registry is None:
+        return None
+    stats = registry.stats()
+    stats["provider"] = RECOGNIZER_PROVIDER
+    return stats
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Recognizer 풀 (웜업 + 체크아웃 + 다중 모델 상주)
+
+🎯 기능:
+1. RecognizerPool: 같은 설정의 recognizer N개를 시작 시 생성하고 합성 발화로 웜업
+   → 첫 디코딩 지연 제거, 세션들이 인스턴스 1개를 두고 경합하지 않음
+2. 디코딩할 때마다 유휴 인스턴스를 체크아웃 (없으면 대기, 대기 시간 통계)
+3. create_stream / decode_stream / decode_streams 를 그대로 제공하므로
+   기존 recognizer 자리에 풀을 넘기면 됨 (VADStreamingProcessor, 배치 파이프라인 등)
+4. RecognizerRegistry: 여러 모델(예: 언어별)을 키로 상주시키고 상한 초과 시 LRU 언로드
+   (세션이 acquire 한 풀은 release 될 때까지 언로드하지 않음)
+
+OfflineStream 은 모델 설정(특징 추출)만 참조하므로 같은 풀의 어느 인스턴스로 만든
+스트림이든 다른 인스턴스에서 디코딩할 수 있습니다.
+"""
+
+import time
+import queue
+import logging
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def synthetic_utterance(sample_rate: int = 16000, seconds: float = 1.0) -> np.ndarray:
+    """웜업용 합성 발화 (기본 주파수 + 배음 + 약한 잡음, 음절 단위 진폭 변화)"""
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    f0 = 140 + 30 * np.sin(2 * np.pi * 1.5 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 * (1 - np.cos(2 * np.pi * 4 * t))
+    rng = np.random.default_rng(0)
+    audio = 0.2 * envelope * voiced + 0.005 * rng.standard_normal(len(t))
+    return audio.astype(np.float32)
+
+
+class RecognizerPool:
+    """같은 설정의 recognizer 인스턴스 풀"""
+
+    def __init__(
+        self,
+        factory: Callable[[], object],
+        size: int = 1,
+        name: str = "default",
+        warmup: bool = True,
+        checkout_timeout: Optional[float] = 30.0,
+        sample_rate: int = 16000,
+        wait_history: int = 1000,
+    ):
+        """
+        Args:
+            factory: recognizer 1개를 생성하는 함수
+            size: 인스턴스 수
+            name: 로그/통계용 이름
+            warmup: 생성 직후 합성 발화로 1회 디코딩
+            checkout_timeout: 유휴 인스턴스 대기 상한 (초, None이면 무한 대기)
+            sample_rate: 웜업 오디오 샘플레이트
+            wait_history: p50/p95 계산에 쓰는 최근 대기 시간 개수
+        """
+        if size < 1:
+            raise ValueError(f"풀 크기는 1 이상이어야 합니다: {size}")
+
+        self.name = name
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.sample_rate = sample_rate
+
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._instances: List[object] = []
+        self.lock = threading.Lock()
+        self._waits = deque(maxlen=wait_history)
+        self.checkouts = 0
+        self.waited = 0            # 즉시 얻지 못하고 대기한 횟수
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.warmup_seconds: List[float] = []
+
+        start = time.time()
+        for _ in range(size):
+            instance = factory()
+            if warmup:
+                self.warmup_seconds.append(self._warmup(instance))
+            self._instances.append(instance)
+            self._idle.put(instance)
+
+        warm = f", 웜업 {max(self.warmup_seconds):.2f}초" if self.warmup_seconds else ""
+        logger.info(f"✅ Recognizer 풀 '{name}' 준비: {size}개 ({time.time() - start:.2f}초{warm})")
+
+    def _warmup(self, instance) -> float:
+        start = time.time()
+        stream = instance.create_stream()
+        stream.accept_waveform(self.sample_rate, synthetic_utterance(self.sample_rate))
+        instance.decode_stream(stream)
+        return time.time() - start
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None):
+        """
+        유휴 인스턴스 하나를 빌려 씀
+
+            with pool.checkout() as recognizer:
+                recognizer.decode_stream(stream)
+
+        Raises:
+            TimeoutError: timeout 안에 유휴 인스턴스를 얻지 못한 경우
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            instance = self._idle.get_nowait()
+        except queue.Empty:
+            try:
+                instance = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(
+                    f"Recognizer 풀 '{self.name}' 대기 시간 초과 ({timeout}초, 크기 {self.size})"
+                )
+        wait = time.perf_counter() - start
+
+        with self.lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self._waits.append(wait)
+            if wait > 0.001:
+                self.waited += 1
+
+        try:
+            yield instance
+        finally:
+            self._idle.put(instance)
+
+    # ====================
+    # recognizer 호환 인터페이스
+    # ====================
+    def create_stream(self):
+        # 스트림 생성은 추론 없이 설정만 사용하므로 체크아웃 불필요
+        return self._instances[0].create_stream()
+
+    def decode_stream(self, stream):
+        with self.checkout() as recognizer:
+            recognizer.decode_stream(stream)
+
+    def decode_streams(self, streams):
+        """배치 하나는 인스턴스 하나에서 일괄 디코딩"""
+        with self.checkout() as recognizer:
+            if hasattr(recognizer, "decode_streams"):
+                recognizer.decode_streams(streams)
+            else:
+                for stream in streams:
+                    recognizer.decode_stream(stream)
+
+    def stats(self) -> Dict:
+        """풀 크기, 유휴 수, 체크아웃 대기 시간 (ms)"""
+        with self.lock:
+            waits = sorted(self._waits)
+            checkouts = self.checkouts
+            waited = self.waited
+            total_wait = self.total_wait
+            max_wait = self.max_wait
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(p * len(waits)))] * 1000
+
+        return {
+            "name": self.name,
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "checkouts": checkouts,
+            "waited": waited,
+            "wait_ms_avg": (total_wait / checkouts * 1000) if checkouts else 0.0,
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p95": percentile(0.95),
+            "wait_ms_max": max_wait * 1000,
+            "warmup_seconds": round(max(self.warmup_seconds), 3) if self.warmup_seconds else None,
+        }
+
+
+class RecognizerRegistry:
+    """
+    키(예: 언어)별 RecognizerPool 상주 관리 (LRU 언로드)
+
+    세션은 acquire() / release() 로 풀을 잡고 놓습니다. 잡고 있는 세션이 있는 풀은
+    언로드하지 않으므로 (참조만 끊으면 세션이 계속 메모리에 붙잡고, 다음 세션이 같은 모델을
+    한 벌 더 로드함) 상한은 사용 중이 아닌 풀부터 적용되고, 모든 풀이 사용 중이면
+    마지막 세션이 release 할 때 언로드됩니다.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], RecognizerPool],
+        max_resident: int = 2,
+        pinned: Optional[str] = None,
+    ):
+        """
+        Args:
+            loader: 키를 받아 RecognizerPool 을 생성하는 함수
+            max_resident: 동시에 메모리에 둘 풀 개수 (pinned 포함)
+            pinned: 언로드하지 않는 키 (기본 모델)
+        """
+        self.loader = loader
+        self.max_resident = max(1, max_resident)
+        self.pinned = pinned
+        self.lock = threading.Lock()
+        self._pools: "OrderedDict[str, RecognizerPool]" = OrderedDict()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._holders: Dict[str, int] = {}
+        self.loads = 0
+        self.unloads = 0
+
+    def add(self, key: str, pool: RecognizerPool) -> None:
+        """이미 생성한 풀 등록"""
+        with self.lock:
+            self._pools[key] = pool
+            self._pools.move_to_end(key)
+            self._evict()
+
+    def get(self, key: str) -> RecognizerPool:
+        """키에 해당하는 풀 (없으면 로드, 같은 키는 한 번만 로드)"""
+        return self._get(key, hold=False)
+
+    def acquire(self, key: str) -> RecognizerPool:
+        """get() + 사용 중 표시 (release() 전까지 언로드하지 않음)"""
+        return self._get(key, hold=True)
+
+    def release(self, key: str) -> None:
+        """acquire() 한 풀 반환 (상한 초과 상태였으면 이때 언로드)"""
+        with self.lock:
+            holders = self._holders.get(key, 0) - 1
+            if holders > 0:
+                self._holders[key] = holders
+            else:
+                self._holders.pop(key, None)
+            self._evict()
+
+    def _use(self, key: str, hold: bool) -> Optional[RecognizerPool]:
+        """상주 중이면 최근 사용으로 옮기고 반환 (lock 보유 상태에서 호출)"""
+        pool = self._pools.get(key)
+        if pool is not None:
+            self._pools.move_to_end(key)
+            if hold:
+                self._holders[key] = self._holders.get(key, 0) + 1
+        return pool
+
+    def _get(self, key: str, hold: bool) -> RecognizerPool:
+        with self.lock:
+            pool = self._use(key, hold)
+            if pool is not None:
+                return pool
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self.lock:
+                pool = self._use(key, hold)
+                if pool is not None:
+                    return pool
+
+            logger.info(f"🔄 모델 '{key}' 로딩 (상주 {len(self._pools)}/{self.max_resident})")
+            pool = self.loader(key)
+
+            with self.lock:
+                self._pools[key] = pool
+                self._use(key, hold)
+                self._loading.pop(key, None)
+                self.loads += 1
+                self._evict(keep=key)
+        return pool
+
+    def _evict(self, keep: Optional[str] = None):
+        """
+        상한 초과분을 가장 오래 쓰지 않은 순서로 언로드 (lock 보유 상태에서 호출)
+
+        고정 키, 사용 중인 풀, 방금 로드한 keep 은 건너뜁니다 (모두 해당하면 상한을 잠시 넘김).
+        """
+        for key in list(self._pools):
+            if len(self._pools) <= self.max_resident:
+                break
+            if key in (self.pinned, keep) or self._holders.get(key):
+                continue
+            del self._pools[key]
+            self.unloads += 1
+            logger.info(f"🗑️ 모델 '{key}' 언로드 (LRU)")
+
+    def keys(self) -> List[str]:
+        with self.lock:
+            return list(self._pools)
+
+    def stats(self) -> Dict:
+        with self.lock:
+            pools = list(self._pools.items())
+            holders = dict(self._holders)
+            loads, unloads = self.loads, self.unloads
+        return {
+            "max_resident": self.max_resident,
+            "resident": len(pools),
+            "loads": loads,
+            "unloads": unloads,
+            "pools": [dict(pool.stats(), holders=holders.get(key, 0)) for key, pool in pools],
+        }
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+폴리페이즈 리샘플러
+
+🎯 기능:
+1. 샘플레이트 쌍마다 저역통과 FIR 필터를 한 번만 설계하고 캐시
+   (scipy.signal.resample_poly 와 같은 Kaiser(β=5) 설계)
+2. StreamingResampler: 청크 경계에서 필터 상태(이전 입력)를 이어받아
+   청크 단위로 처리해도 전체 신호를 한 번에 처리한 결과와 같은 출력을 생성
+3. resample(): 파일용 일괄 처리 (scipy 가 있으면 upfirdn C 구현 사용)
+
+FFT 기반 scipy.signal.resample 을 청크마다 호출하면 청크 경계마다
+주기 신호 가정으로 인한 왜곡이 생기므로 스트리밍 경로에서는 StreamingResampler 를 사용합니다.
+"""
+
+from functools import lru_cache
+from math import gcd
+from typing import Tuple
+
+import numpy as np
+
+# 청크 1회 처리 시 계산하는 최대 출력 샘플 수 (윈도우 행렬 메모리 상한)
+_MAX_BLOCK_OUTPUTS = 16384
+
+
+@lru_cache(maxsize=16)
+def _design(orig_sr: int, target_sr: int) -> Tuple[int, int, np.ndarray, np.ndarray, int]:
+    """
+    (up, down, 프로토타입 필터 h, 폴리페이즈 뱅크, 지연) 계산 (캐시)
+
+    폴리페이즈 뱅크는 위상 p 마다 h[p + j*up] 를 역순으로 담은 (up, taps) 배열입니다.
+    """
+    g = gcd(int(orig_sr), int(target_sr))
+    up, down = int(target_sr) // g, int(orig_sr) // g
+
+    max_rate = max(up, down)
+    cutoff = 1.0 / max_rate
+    half_len = 10 * max_rate
+    num_taps = 2 * half_len + 1
+
+    m = np.arange(num_taps) - half_len
+    h = cutoff * np.sinc(cutoff * m) * np.kaiser(num_taps, 5.0)
+    h = h / h.sum() * up
+
+    taps = -(-num_taps // up)  # ceil
+    padded = np.zeros(taps * up)
+    padded[:num_taps] = h
+    bank = padded.reshape(taps, up).T[:, ::-1].astype(np.float32)
+    bank = np.ascontiguousarray(bank)
+
+    h.setflags(write=False)
+    bank.setflags(write=False)
+    return up, down, h, bank, half_len
+
+
+class StreamingResampler:
+    """
+    상태를 유지하는 폴리페이즈 리샘플러
+
+    출력 y[k] = Σ x[n] · h[k·down + delay − n·up] 를 청크가 들어올 때마다
+    계산 가능한 k 까지만 계산하고, 필터 길이만큼의 입력 이력을 다음 청크로 넘깁니다.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int = 16000):
+        self.orig_sr = int(orig_sr)
+        self.target_sr = int(target_sr)
+        self.up, self.down, _, self.bank, self.delay = _design(self.orig_sr, self.target_sr)
+        self.taps = self.bank.shape[1]
+        self.reset()
+
+    def reset(self):
+        """스트림 상태 초기화 (새 세션 시작 시 호출)"""
+        # 버퍼 앞쪽 taps-1 개는 음수 인덱스 입력(0) 패딩
+        self._buffer = np.zeros(self.taps - 1, dtype=np.float32)
+        self._buffer_start = -(self.taps - 1)   # _buffer[0] 의 전역 입력 인덱스
+        self._consumed = 0                      # 지금까지 받은 입력 샘플 수
+        self._next_output = 0                   # 다음에 계산할 출력 인덱스
+
+    def _available_outputs(self, total_inputs: int) -> int:
+        """입력 total_inputs 개로 계산 가능한 출력 개수"""
+        # (k·down + delay) // up <= total_inputs - 1
+        limit = (total_inputs - 1) * self.up + (self.up - 1) - self.delay
+        if limit < 0:
+            return 0
+        return limit // self.down + 1
+
+    def _compute(self, k_start: int, k_end: int) -> np.ndarray:
+        out = np.empty(k_end - k_start, dtype=np.float32)
+        windows = np.lib.stride_tricks.sliding_window_view(self._buffer, self.taps)
+        for block in range(k_start, k_end, _MAX_BLOCK_OUTPUTS):
+            ks = np.arange(block, min(block + _MAX_BLOCK_OUTPUTS, k_end), dtype=np.int64)
+            pos = ks * self.down + self.delay
+            newest = pos // self.up
+            phase = pos % self.up
+            rows = windows[newest - (self.taps - 1) - self._buffer_start]
+            out[block - k_start:block - k_start + len(ks)] = np.einsum(
+                "ij,ij->i", rows, self.bank[phase]
+            )
+        return out
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        입력 청크 → 출력 샘플 (필터 지연만큼 뒤의 출력은 다음 청크 / flush 에서 나옴)
+        """
+        chunk = np.asarray(chunk, dtype=np.float32)
+        if self.up == self.down:
+            return chunk
+
+        self._buffer = np.concatenate([self._buffer, chunk])
+        self._consumed += len(chunk)
+
+        k_end = self._available_outputs(self._consumed)
+        out = self._compute(self._next_output, k_end) if k_end > self._next_output else \
+            np.zeros(0, dtype=np.float32)
+        self._next_output = max(self._next_output, k_end)
+
+        # 다음 출력 계산에 필요한 입력만 남김
+        next_newest = (self._next_output * self.down + self.delay) // self.up
+        keep_from = next_newest - (self.taps - 1)
+        drop = keep_from - self._buffer_start
+        if drop > 0:
+            self._buffer = self._buffer[drop:]
+            self._buffer_start += drop
+
+        return out
+
+    def flush(self) -> np.ndarray:
+        """스트림 종료: 남은 출력 계산 (전체 출력 길이 = ceil(입력 · up / down))"""
+        if self.up == self.down:
+            return np.zeros(0, dtype=np.float32)
+
+        total = -(-self._consumed * self.up // self.down)
+        consumed = self._consumed
+        tail = self.process(np.zeros(self.taps + self.delay // self.up + 1, dtype=np.float32))
+        self._consumed = consumed
+        remaining = total - (self._next_output - len(tail))
+        return tail[:max(0, remaining)]
+
+
+def resample(audio: np.ndarray, orig_sr: int, target_sr: int = 16000) -> np.ndarray:
+    """
+    파일 / 전체 신호 일괄 리샘플링 (캐시된 필터 사용)
+
+    scipy 가 있으면 upfirdn(C 구현), 없으면 StreamingResampler 로 처리합니다.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if int(orig_sr) == int(target_sr):
+        return audio
+
+    up, down, h, _, _ = _design(int(orig_sr), int(target_sr))
+    try:
+        from scipy.signal import resample_poly
+    except ImportError:
+        resampler = StreamingResampler(orig_sr, target_sr)
+        return np.concatenate([resampler.process(audio), resampler.flush()])
+
+    # resample_poly 는 전달한 필터에 up 을 곱하므로 정규화된 사본을 넘김
+    return resample_poly(audio, up, down, window=h / up).astype(np.float32, copy=False)
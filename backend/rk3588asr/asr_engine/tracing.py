@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+경량 분산 추적 (W3C traceparent 호환)
+
+발화 1개 = trace 1개. VAD 구간 / 디코딩 / 백엔드 전송 구간을 span 으로 기록하고,
+백엔드로 보내는 HTTP 요청에 traceparent 헤더를 실어 백엔드 span 과 같은 trace 로 이어 붙입니다.
+
+내보내기 (ASR_TRACE_EXPORTER):
+- off  : 기록하지 않음 (기본, span 생성 비용만 남음)
+- file : ASR_TRACE_FILE 에 span 1개당 JSON 1줄
+- otlp : ASR_TRACE_OTLP_ENDPOINT 로 OTLP/HTTP JSON 전송 (OpenTelemetry Collector 또는 simple_trace_collector.py)
+
+    from asr_engine.tracing import tracer
+    with tracer.start_span("asr.decode", parent=root, audio_seconds=2.1):
+        ...
+
+백엔드 (app/utils/tracing.py) 도 이 모듈의 Span / Tracer / 내보내기를 그대로 사용하고
+설정만 주입합니다 (create_exporter).
+"""
+
+import os
+import json
+import time
+import queue
+import random
+import logging
+import threading
+import contextvars
+import urllib.request
+from typing import Dict, List, Optional, Union
+
+from .config import TRACING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 현재 span (with 블록 안에서 parent 를 생략하면 사용)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """추적 구간 1개 (시각은 epoch ns, 서버 간 비교 가능)"""
+
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns",
+                 "attributes", "sampled", "_token")
+
+    def __init__(self, tracer, name, trace_id, span_id, parent_id, start_ns, attributes, sampled):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = None
+        self.attributes = attributes
+        self.sampled = sampled
+        self._token = None
+
+    def set(self, key: str, value) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def traceparent(self) -> str:
+        """다음 서비스로 넘길 W3C traceparent 헤더 값"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def end(self, end_time: Optional[float] = None) -> None:
+        """
+        구간 종료 + 내보내기
+
+        Args:
+            end_time: 종료 시각 (epoch 초, None 이면 지금)
+        """
+        if self.end_ns is not None:
+            return
+        self.end_ns = int(end_time * 1e9) if end_time is not None else _now_ns()
+        if self.sampled:
+            self.tracer.export(self)
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.set("error", repr(exc))
+        self.end()
+        return False
+
+    def to_dict(self) -> Dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "service": self.tracer.service,
+            "start": self.start_ns / 1e9,
+            "end": self.end_ns / 1e9,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+        }
+
+
+def _now_ns() -> int:
+    return time.time_ns()
+
+
+def _random_hex(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+def parse_traceparent(header: Optional[str]):
+    """
+    traceparent 헤더 → (trace_id, parent_span_id, sampled), 형식이 맞지 않으면 None
+    """
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        sampled = bool(int(parts[3], 16) & 1)
+    except ValueError:
+        return None
+    return parts[1], parts[2], sampled
+
+
+class _BackgroundExporter:
+    """span 을 큐에 넣고 별도 스레드에서 모아 내보내기 (호출 스레드 / 이벤트 루프를 막지 않음)"""
+
+    def __init__(self, batch_size: int = 100, interval: float = 1.0, log: Optional[logging.Logger] = None):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.log = log or logger
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=f"{type(self).__name__}", daemon=True)
+        self._thread.start()
+
+    def submit(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def _run(self):
+        while True:
+            batch: List[Span] = []
+            try:
+                batch.append(self._queue.get(timeout=self.interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            if batch:
+                try:
+                    self._flush(batch)
+                except Exception as e:
+                    self.log.warning(f"⚠️ span 내보내기 실패 ({len(batch)}개): {e}")
+
+    def _flush(self, batch: List[Span]) -> None:
+        raise NotImplementedError
+
+
+class FileSpanExporter(_BackgroundExporter):
+    """JSON Lines 파일로 내보내기"""
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(**kwargs)
+
+    def _flush(self, batch: List[Span]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for span in batch:
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False) + "\n")
+
+
+def _otlp_value(value) -> Dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OtlpSpanExporter(_BackgroundExporter):
+    """OTLP/HTTP JSON (POST /v1/traces) 로 내보내기"""
+
+    def __init__(self, endpoint: str, service: str, timeout: float = 3.0, **kwargs):
+        self.endpoint = endpoint
+        self.service = service
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def _flush(self, batch: List[Span]) -> None:
+        spans = [
+            {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "parentSpanId": span.parent_id or "",
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()],
+            }
+            for span in batch
+        ]
+        body = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service}}]},
+                    "scopeSpans": [{"scope": {"name": "cores3"}, "spans": spans}],
+                }
+            ]
+        }
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(body).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class Tracer:
+    """span 생성 / 샘플링 / 내보내기"""
+
+    def __init__(self, service: str, exporter: Optional[_BackgroundExporter] = None, sample_rate: float = 1.0):
+        self.service = service
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_span(
+        self,
+        name: str,
+        parent: Union[Span, str, None] = None,
+        start_time: Optional[float] = None,
+        **attributes,
+    ) -> Span:
+        """
+        span 시작
+
+        Args:
+            name: 구간 이름 (예: "asr.decode")
+            parent: 부모 Span 또는 traceparent 헤더 (None 이면 현재 span, 그것도 없으면 새 trace)
+            start_time: 시작 시각 (epoch 초, None 이면 지금) - 지난 구간을 나중에 기록할 때 사용
+            **attributes: span 속성
+        """
+        if parent is None:
+            parent = _current_span.get()
+
+        if isinstance(parent, Span):
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        else:
+            context = parse_traceparent(parent) if isinstance(parent, str) else None
+            if context is not None:
+                trace_id, parent_id, sampled = context
+            else:
+                trace_id, parent_id = _random_hex(16), None
+                sampled = self.enabled and random.random() < self.sample_rate
+
+        sampled = sampled and self.enabled
+        start_ns = int(start_time * 1e9) if start_time is not None else _now_ns()
+        return Span(self, name, trace_id, _random_hex(8), parent_id, start_ns,
+                    attributes if sampled else {}, sampled)
+
+    def child_span(self, name: str, **attributes) -> Optional[Span]:
+        """현재 span 이 기록 중일 때만 자식 span 시작 (아니면 None - 새 trace 를 만들지 않음)"""
+        parent = _current_span.get()
+        if parent is None or not parent.sampled:
+            return None
+        return self.start_span(name, parent=parent, **attributes)
+
+    def export(self, span: Span) -> None:
+        if self.exporter is not None:
+            self.exporter.submit(span)
+
+
+def create_exporter(config: Dict, log: Optional[logging.Logger] = None) -> Optional[_BackgroundExporter]:
+    """
+    설정으로 내보내기 생성
+
+    Args:
+        config: TRACING_CONFIG 형식 (service_name, exporter, file, otlp_endpoint)
+        log: 내보내기 실패를 기록할 로거 (None 이면 이 모듈 로거)
+
+    Returns:
+        내보내기 (exporter 가 off 면 None)
+    """
+    exporter = config.get("exporter", "off")
+    if exporter == "file":
+        return FileSpanExporter(config["file"], log=log)
+    if exporter == "otlp":
+        return OtlpSpanExporter(config["otlp_endpoint"], config["service_name"], log=log)
+    return None
+
+
+# 전역 tracer
+tracer = Tracer(TRACING_CONFIG["service_name"], create_exporter(TRACING_CONFIG), TRACING_CONFIG["sample_rate"])
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+음성인식 결과 디스크 캐시 (content-addressed)
+
+🎯 기능:
+1. 키 = SHA-256(모델 설정 + 샘플레이트 + 디코딩된 PCM)
+   → 파일명/경로가 달라도 같은 오디오면 같은 키
+2. 결과는 cache_dir/<앞 2자리>/<키>.json 에 저장
+3. 전체 크기 상한 초과 시 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+4. 적중/미스 통계
+
+모델 경로, 언어, use_itn 이 바뀌면 키가 달라지므로 이전 결과는 자연스럽게 무시되고
+LRU 정리로 사라집니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def model_fingerprint(model_path: str, language: str = "", use_itn: bool = True) -> str:
+    """인식 결과에 영향을 주는 모델 설정 식별자"""
+    try:
+        stat = os.stat(model_path)
+        # 같은 경로에 모델 파일을 교체한 경우도 구분
+        model_id = f"{os.path.abspath(model_path)}:{stat.st_size}:{int(stat.st_mtime)}"
+    except OSError:
+        model_id = os.path.abspath(model_path)
+    return f"{model_id}|lang={language or 'auto'}|itn={int(bool(use_itn))}"
+
+
+class TranscriptionCache:
+    """PCM 해시 기반 인식 결과 캐시 (디스크 + LRU 크기 제한)"""
+
+    def __init__(self, cache_dir: str, fingerprint: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            fingerprint: model_fingerprint() 결과
+            max_bytes: 캐시 전체 크기 상한
+        """
+        self.cache_dir = cache_dir
+        self.fingerprint = fingerprint
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        # key → 파일 크기 (오래 사용하지 않은 순)
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """기존 캐시 파일을 마지막 사용 시각 순으로 색인"""
+        found = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, name[:-5], stat.st_size))
+
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+        if found:
+            logger.info(f"💾 인식 캐시 로드: {len(found)}개 ({self._total_bytes / 1024:.1f} KB)")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def key_for(self, samples: np.ndarray, sample_rate: int) -> str:
+        """디코딩된 PCM → 캐시 키"""
+        digest = hashlib.sha256()
+        digest.update(self.fingerprint.encode("utf-8"))
+        digest.update(str(int(sample_rate)).encode("ascii"))
+        digest.update(np.ascontiguousarray(samples, dtype=np.float32).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 인식 텍스트 (없으면 None)"""
+        path = self._path(key)
+        with self.lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = json.load(f)["text"]
+            os.utime(path)  # LRU 사용 시각 갱신
+        except (OSError, ValueError, KeyError):
+            with self.lock:
+                self._drop(key)
+                self.misses += 1
+            return None
+
+        with self.lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """인식 결과 저장 (원자적 쓰기)"""
+        path = self._path(key)
+        payload = json.dumps({"text": text, "created_at": time.time()}, ensure_ascii=False)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            logger.warning(f"⚠️ 인식 캐시 저장 실패: {e}")
+            return
+
+        with self.lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+
+    def _drop(self, key: str):
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        """크기 상한 초과분을 LRU 순으로 삭제 (lock 보유 상태에서 호출)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._drop(key)
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self.lock:
+            for key in list(self._entries):
+                self._drop(key)
+            self.hits = 0
+            self.misses = 0
+
+    def hit_rate(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate(),
+            }
@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+"""
+VAD 기반 실시간 음성인식 프로세서
+
+에너지 기반 VAD 로 음성 구간을 감지하고, 구간이 끝나면 Offline Recognizer 로 디코딩합니다.
+발화마다 trace 를 하나 열어 발화 구간 / 침묵 대기 / 디코딩 시간을 span 으로 남깁니다 (asr_engine.tracing).
+defer_utterance_end=True 이면 발화 span 은 결과 전송이 끝난 뒤 finish_utterance_trace() 로 닫습니다
+(전송 span 이 부모 span 안에 들어가도록).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+from .metrics import DECODE_SECONDS, REAL_TIME_FACTOR, VAD_SEGMENT_SECONDS
+from .tracing import Span, tracer
+
+logger = logging.getLogger(__name__)
+
+# 전송 완료를 기다리는 발화 span 최대 수 (finish 가 호출되지 않아도 무한히 쌓이지 않도록)
+_MAX_PENDING_UTTERANCES = 32
+
+
+class VADStreamingProcessor:
+    """에너지 기반 간단한 VAD를 사용한 실시간 음성인식 프로세서"""
+
+    def __init__(
+        self,
+        recognizer,
+        sample_rate=16000,
+        vad_enabled=True,
+        trace_attributes: Optional[Dict] = None,
+        defer_utterance_end: bool = False,
+    ):
+        self.recognizer = recognizer
+        self.sample_rate = sample_rate
+        self.trace_attributes = trace_attributes or {}  # 발화 span 에 붙일 속성 (session_id, device_id 등)
+        # True: 인식 결과의 발화 span 을 결과 전송 후 finish_utterance_trace() 에서 종료
+        self.defer_utterance_end = defer_utterance_end
+        
+        # 간단한 에너지 기반 VAD 설정
+        self.vad_enabled = vad_enabled
+        self.energy_threshold = 0.01  # 에너지 임계값 (조정 가능)
+        self.silence_duration = 1.5  # 침묵 판단 시간 (초)
+        self.min_speech_duration = 0.5  # 최소 음성 길이 (초)
+        
+        # 음성 버퍼
+        self.audio_buffer = deque()
+        self.speech_segments = []  # 음성 구간 저장
+        
+        # 상태 관리
+        self.is_session_active = False  # 세션 활성화 상태
+        self.is_processing = False  # 음성 처리 중
+        self.silence_frames = 0  # 침묵 프레임 카운터
+        self.speech_frames = 0  # 음성 프레임 카운터
+        self.last_result = ""
+        self.lock = threading.Lock()
+
+        # 발화 추적 (음성 시작 청크 도착 ~ 디코딩 완료)
+        self._utterance_span: Optional[Span] = None
+        self._speech_started_at = 0.0
+        self._last_speech_at = 0.0
+        self._trace_lock = threading.Lock()
+        self._pending_utterances: "OrderedDict[str, Span]" = OrderedDict()  # traceparent → 발화 span
+        
+        logger.info(f"✅ VADStreamingProcessor 초기화 완료")
+        logger.info(f"   - VAD: 에너지 기반 간단한 VAD")
+        logger.info(f"   - 에너지 임계값: {self.energy_threshold}")
+        logger.info(f"   - 침묵 감지: {self.silence_duration}초")
+
+    def _calculate_energy(self, audio_chunk: np.ndarray) -> float:
+        """오디오 청크의 에너지 계산 (RMS)"""
+        return np.sqrt(np.mean(audio_chunk ** 2))
+
+    def _is_speech(self, audio_chunk: np.ndarray) -> bool:
+        """에너지 기반 음성 감지"""
+        if not self.vad_enabled:
+            return True
+        
+        energy = self._calculate_energy(audio_chunk)
+        return energy > self.energy_threshold
+
+    def start_session(self):
+        """음성인식 세션 시작 (마이크 계속 켜짐)"""
+        with self.lock:
+            if self.is_session_active:
+                logger.warning("⚠️ 이미 세션이 활성화되어 있습니다.")
+                return False
+            
+            self.is_session_active = True
+            self.is_processing = False
+            self.audio_buffer.clear()
+            self.speech_segments.clear()
+            self.last_result = ""
+            self.silence_frames = 0
+            self.speech_frames = 0
+            
+            logger.info("=" * 60)
+            logger.info("🎤 음성인식 세션 시작")
+            logger.info("   - 마이크 활성화: 계속 듣기 모드")
+            logger.info("   - 에너지 기반 VAD로 음성 자동 감지")
+            logger.info("=" * 60)
+            return True
+
+    def stop_session(self):
+        """음성인식 세션 종료 (마이크 끔)"""
+        with self.lock:
+            if not self.is_session_active:
+                logger.warning("⚠️ 활성화된 세션이 없습니다.")
+                return None
+            
+            logger.info("⏹️ 음성인식 세션 종료 요청")
+            
+            # 남은 버퍼가 있으면 처리
+            if len(self.audio_buffer) > 0 and self.is_processing:
+                speech_audio = np.array(self.audio_buffer)
+                duration = len(speech_audio) / self.sample_rate
+                
+                if duration >= self.min_speech_duration:
+                    # 종료 시 남은 구간은 전송되지 않으므로 발화 span 을 바로 닫음
+                    result = self._process_speech_segment(
+                        speech_audio, self._close_utterance_trace(time.time()), defer_end=False
+                    )
+                    if result:
+                        self.speech_segments.append(result)
+                else:
+                    self._end_utterance_trace("too_short")
+            
+            self.is_session_active = False
+            self.is_processing = False
+            
+            # 세션 통계
+            segment_count = len(self.speech_segments)
+            total_duration = sum(seg.get('duration', 0) for seg in self.speech_segments)
+            
+            logger.info(f"📊 세션 통계:")
+            logger.info(f"   - 감지된 음성 구간: {segment_count}개")
+            logger.info(f"   - 총 음성 길이: {total_duration:.1f}초")
+            
+            result = {
+                'segments': self.speech_segments.copy(),
+                'total_segments': segment_count,
+                'total_duration': total_duration
+            }
+            
+            self.audio_buffer.clear()
+            self.speech_segments.clear()
+            self.silence_frames = 0
+            self.speech_frames = 0
+            
+            return result
+
+    def add_audio_chunk(self, audio_chunk: np.ndarray, received_at: Optional[float] = None) -> Optional[Dict]:
+        """
+        오디오 청크 추가 및 VAD 기반 처리
+        
+        Args:
+            audio_chunk: float32 PCM 청크
+            received_at: 청크 도착 시각 (epoch 초, None 이면 지금) - 발화 추적용
+        
+        Returns:
+            음성 감지 및 인식 결과 딕셔너리 또는 None
+        """
+        with self.lock:
+            if not self.is_session_active:
+                return None
+            
+            try:
+                now = received_at if received_at is not None else time.time()
+
+                # 음성 활동 감지
+                is_speech = self._is_speech(audio_chunk)
+                
+                if is_speech:
+                    # 음성이 감지되면
+                    self.silence_frames = 0
+                    self.speech_frames += 1
+                    
+                    if not self.is_processing:
+                        # 새로운 음성 구간 시작
+                        self.is_processing = True
+                        self.audio_buffer.clear()
+                        self._utterance_span = tracer.start_span(
+                            "asr.utterance", start_time=now, **self.trace_attributes
+                        )
+                        self._speech_started_at = now
+                        logger.info("🗣️ 음성 감지 시작")
+                    
+                    self._last_speech_at = now
+                    self.audio_buffer.extend(audio_chunk)
+                else:
+                    # 침묵이 감지되면
+                    self.silence_frames += 1
+                    
+                    if self.is_processing:
+                        # 음성 처리 중인 경우 버퍼에 추가 (짧은 침묵 포함)
+                        self.audio_buffer.extend(audio_chunk)
+                        
+                        # 침묵 시간 계산
+                        silence_duration = (self.silence_frames * len(audio_chunk)) / self.sample_rate
+                        
+                        # 충분한 침묵이 감지되면 음성 구간 처리
+                        if silence_duration >= self.silence_duration:
+                            speech_audio = np.array(self.audio_buffer)
+                            duration = len(speech_audio) / self.sample_rate
+                            
+                            if duration >= self.min_speech_duration:
+                                result = self._process_speech_segment(
+                                    speech_audio, self._close_utterance_trace(now), self.defer_utterance_end
+                                )
+                                
+                                if result:
+                                    logger.info(f"✅ 음성 처리 완료 ({duration:.1f}초)")
+                                    self.speech_segments.append(result)
+                                    self.is_processing = False
+                                    self.audio_buffer.clear()
+                                    self.silence_frames = 0
+                                    self.speech_frames = 0
+                                    return result
+                            else:
+                                self._end_utterance_trace("too_short")
+                                logger.debug(f"⏭️ 너무 짧은 음성 무시 ({duration:.1f}초)")
+                            
+                            self.is_processing = False
+                            self.audio_buffer.clear()
+                            self.silence_frames = 0
+                            self.speech_frames = 0
+                
+            except Exception as e:
+                logger.error(f"❌ 오디오 처리 중 오류: {e}", exc_info=True)
+                return None
+        
+        return None
+
+    def _close_utterance_trace(self, closed_at: float) -> Optional[Span]:
+        """
+        구간 종료 시점에 발화 span 의 하위 구간 기록
+
+        - vad.speech: 첫 음성 청크 도착 → 마지막 음성 청크 도착
+        - vad.silence_wait: 마지막 음성 청크 → 침묵 판정으로 구간이 닫힌 청크 도착
+
+        Returns:
+            발화 span (디코딩 span 의 부모)
+        """
+        span = self._utterance_span
+        if span is not None and span.sampled:
+            tracer.start_span(
+                "vad.speech", parent=span, start_time=self._speech_started_at, speech_chunks=self.speech_frames
+            ).end(self._last_speech_at)
+            tracer.start_span(
+                "vad.silence_wait", parent=span, start_time=self._last_speech_at, silence_chunks=self.silence_frames
+            ).end(closed_at)
+        return span
+
+    def _end_utterance_trace(self, outcome: str, defer: bool = False):
+        """
+        발화 span 종료 (outcome: recognized / empty / too_short / error)
+
+        defer=True 이면 종료하지 않고 finish_utterance_trace() 를 기다림 (기록 중인 span 만)
+        """
+        span, self._utterance_span = self._utterance_span, None
+        if span is None:
+            return
+        span.set("outcome", outcome)
+        if not (defer and span.sampled):
+            span.end()
+            return
+
+        with self._trace_lock:
+            self._pending_utterances[span.traceparent()] = span
+            overflow = []
+            while len(self._pending_utterances) > _MAX_PENDING_UTTERANCES:
+                overflow.append(self._pending_utterances.popitem(last=False)[1])
+        for stale in overflow:
+            stale.set("send_unfinished", True)
+            stale.end()
+
+    def finish_utterance_trace(self, traceparent: Optional[str], **attributes):
+        """
+        결과 전송이 끝난 발화 span 종료 (defer_utterance_end=True 일 때 전송 쪽에서 호출)
+
+        Args:
+            traceparent: 인식 결과의 'traceparent' (없거나 이미 종료됐으면 무시)
+            **attributes: 발화 span 에 추가할 속성
+        """
+        if not traceparent:
+            return
+        with self._trace_lock:
+            span = self._pending_utterances.pop(traceparent, None)
+        if span is not None:
+            for key, value in attributes.items():
+                span.set(key, value)
+            span.end()
+
+    def _end_pending_utterances(self):
+        """전송을 기다리는 발화 span 모두 종료 (초기화 시)"""
+        with self._trace_lock:
+            pending = list(self._pending_utterances.values())
+            self._pending_utterances.clear()
+        for span in pending:
+            span.set("send_unfinished", True)
+            span.end()
+
+    def _process_speech_segment(
+        self, audio_data: np.ndarray, trace_parent: Optional[Span] = None, defer_end: bool = False
+    ) -> Optional[Dict]:
+        """
+        음성 구간 처리 및 인식
+
+        Args:
+            audio_data: 음성 구간 PCM
+            trace_parent: 발화 span (디코딩 span 의 부모)
+            defer_end: 인식 결과가 있으면 발화 span 종료를 finish_utterance_trace() 까지 미룸
+        """
+        outcome = "error"
+        try:
+            duration = len(audio_data) / self.sample_rate
+            
+            # 음성인식 수행
+            decode_span = tracer.start_span("asr.decode", parent=trace_parent, audio_seconds=round(duration, 3))
+            decode_start = time.perf_counter()
+            stream = self.recognizer.create_stream()
+            stream.accept_waveform(self.sample_rate, audio_data)
+            self.recognizer.decode_stream(stream)
+            result = stream.result
+            decode_seconds = time.perf_counter() - decode_start
+            decode_span.end()
+
+            VAD_SEGMENT_SECONDS.observe(duration)
+            DECODE_SECONDS.observe(decode_seconds)
+            if duration > 0:
+                REAL_TIME_FACTOR.observe(decode_seconds / duration)
+            
+            text = result.text.strip()
+            
+            if text:
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                
+                segment_result = {
+                    'timestamp': timestamp,
+                    'text': text,
+                    'duration': duration,
+                    'confidence': 1.0  # Sherpa-ONNX는 confidence score를 제공하지 않음
+                }
+                if trace_parent is not None and trace_parent.sampled:
+                    # 백엔드 전송 span 이 같은 trace 로 이어지도록 전달
+                    segment_result['traceparent'] = trace_parent.traceparent()
+                
+                logger.info(f"📝 인식 결과: {text}")
+                self.last_result = text
+                outcome = "recognized"
+                
+                return segment_result
+            else:
+                logger.debug("🔇 인식된 텍스트 없음")
+                outcome = "empty"
+                return None
+        
+        except Exception as e:
+            logger.error(f"❌ 음성 인식 오류: {e}", exc_info=True)
+            return None
+        finally:
+            if trace_parent is not None:
+                self._end_utterance_trace(outcome, defer=defer_end and outcome == "recognized")
+
+    def get_session_status(self) -> Dict:
+        """현재 세션 상태 반환"""
+        with self.lock:
+            return {
+                'is_active': self.is_session_active,
+                'is_processing': self.is_processing,
+                'segments_count': len(self.speech_segments),
+                'last_result': self.last_result
+            }
+
+    def reset(self):
+        """완전 초기화"""
+        with self.lock:
+            logger.info("🔄 VADStreamingProcessor 초기화")
+            self.is_session_active = False
+            self.is_processing = False
+            self.audio_buffer.clear()
+            self.speech_segments.clear()
+            self.last_result = ""
+            self.silence_frames = 0
+            self.speech_frames = 0
+            self._utterance_span = None
+        self._end_pending_utterances()
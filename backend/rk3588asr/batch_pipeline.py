@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+배치 음성인식 파이프라인
+
+🎯 기능:
+1. 리더 풀: 여러 스레드가 파일 읽기 / 모노 변환 / 리샘플링을 미리 수행
+2. 디코더: 제한된 큐에서 최대 batch_size 개씩 모아 recognizer.decode_streams() 로 일괄 디코딩
+   (인식 캐시 적중 시 리샘플링 / 디코딩 생략)
+3. 스코어러: 디코딩 결과에 대해 정답 매칭 / CER 계산
+4. 결과는 완료되는 즉시 제너레이터로 전달 (진행 상황 실시간 표시)
+
+디스크 I/O, NPU 디코딩, 점수 계산이 서로 겹쳐 실행되므로
+파일을 하나씩 처리하는 것보다 전체 처리 시간이 짧아집니다.
+큐 크기가 제한되어 있어 수천 개 파일을 처리해도 메모리에 올라가는 오디오는
+queue_size + batch_size 개를 넘지 않습니다.
+
+CLI 실행 (Gradio 없이 디렉토리 회귀 테스트):
+    python batch_pipeline.py ./testset --recursive --output results.csv
+"""
+
+import os
+import csv
+import glob
+import time
+import queue
+import logging
+import argparse
+import threading
+from typing import List, Dict, Optional, Callable, Iterable, Iterator
+
+from asr_engine.audio_io import read_audio_file, to_target_rate, TARGET_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+# 스테이지 종료 표시
+_SENTINEL = object()
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3", ".m4a")
+
+
+class BatchTranscriptionPipeline:
+    """리더 풀 → 배치 디코더 → 스코어러 파이프라인"""
+
+    def __init__(
+        self,
+        recognizer,
+        scorer: Optional[Callable[[str], Dict]] = None,
+        num_readers: int = 4,
+        batch_size: int = 8,
+        queue_size: int = 16,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+        cache=None,
+    ):
+        """
+        Args:
+            recognizer: sherpa_onnx.OfflineRecognizer
+            scorer: 인식 텍스트 → 매칭 결과 딕셔너리 (예: matcher.evaluate). None이면 생략
+            num_readers: 파일 읽기 / 리샘플링 스레드 수
+            batch_size: decode_streams 한 번에 디코딩할 최대 파일 수
+            queue_size: 디코딩 대기 오디오 최대 개수 (메모리 상한)
+            sample_rate: 디코딩 샘플레이트
+            cache: TranscriptionCache (None이면 캐시 사용 안 함)
+        """
+        self.recognizer = recognizer
+        self.scorer = scorer
+        self.num_readers = max(1, num_readers)
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.sample_rate = sample_rate
+        self.cache = cache
+
+        self._stop = threading.Event()
+        self.stats: Dict = {}
+
+    # ====================
+    # 큐 헬퍼 (중단 시 블로킹 방지)
+    # ====================
+    def _put(self, q: queue.Queue, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue):
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _SENTINEL
+
+    # ====================
+    # 스테이지
+    # ====================
+    def _reader_worker(self, path_queue: queue.Queue, audio_queue: queue.Queue):
+        """파일 읽기 + 리샘플링"""
+        while not self._stop.is_set():
+            try:
+                index, path = path_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            item = {
+                "index": index,
+                "path": path,
+                "file_name": os.path.basename(path),
+                "text": "",
+                "duration": 0.0,
+                "error": None,
+                "cached": False,
+            }
+            try:
+                samples, sr = read_audio_file(path)
+                item["duration"] = len(samples) / sr
+
+                if self.cache is not None:
+                    item["cache_key"] = self.cache.key_for(samples, sr)
+                    cached_text = self.cache.get(item["cache_key"])
+                    if cached_text is not None:
+                        item["text"] = cached_text
+                        item["cached"] = True
+
+                if not item["cached"]:
+                    item["samples"], _ = to_target_rate(samples, sr, self.sample_rate)
+            except Exception as e:
+                item["error"] = str(e)
+
+            if not self._put(audio_queue, item):
+                return
+
+        self._put(audio_queue, _SENTINEL)
+
+    def _decode_batch(self, batch: List[Dict]):
+        """batch 내 오디오를 decode_streams 로 일괄 디코딩"""
+        streams = []
+        for item in batch:
+            stream = self.recognizer.create_stream()
+            stream.accept_waveform(self.sample_rate, item.pop("samples"))
+            streams.append(stream)
+
+        if hasattr(self.recognizer, "decode_streams"):
+            self.recognizer.decode_streams(streams)
+        else:
+            for stream in streams:
+                self.recognizer.decode_stream(stream)
+
+        for item, stream in zip(batch, streams):
+            item["text"] = stream.result.text.strip()
+            if self.cache is not None:
+                self.cache.put(item["cache_key"], item["text"])
+
+    def _decoder_worker(self, audio_queue: queue.Queue, score_queue: queue.Queue):
+        """최대 batch_size 개씩 모아 디코딩"""
+        readers_done = 0
+        while readers_done < self.num_readers:
+            first = self._get(audio_queue)
+            if first is _SENTINEL:
+                if self._stop.is_set():
+                    return
+                readers_done += 1
+                continue
+
+            # 이미 준비된 오디오만 추가로 모음 (대기하지 않음)
+            pending = [first]
+            while len(pending) < self.batch_size:
+                try:
+                    item = audio_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _SENTINEL:
+                    readers_done += 1
+                    continue
+                pending.append(item)
+
+            batch = [item for item in pending if item["error"] is None and not item["cached"]]
+            if batch:
+                decode_start = time.time()
+                try:
+                    self._decode_batch(batch)
+                except Exception as e:
+                    logger.error(f"❌ 배치 디코딩 실패 ({len(batch)}개): {e}", exc_info=True)
+                    for item in batch:
+                        item.pop("samples", None)
+                        item["error"] = f"디코딩 실패: {e}"
+                self.stats["decode_batches"] += 1
+                self.stats["decode_time"] += time.time() - decode_start
+
+            for item in pending:
+                if not self._put(score_queue, item):
+                    return
+
+        self._put(score_queue, _SENTINEL)
+
+    def _scorer_worker(self, score_queue: queue.Queue, result_queue: queue.Queue):
+        """정답 매칭 / CER 계산"""
+        while True:
+            item = self._get(score_queue)
+            if item is _SENTINEL:
+                break
+            if self.scorer is not None and item["error"] is None:
+                try:
+                    item["match"] = self.scorer(item["text"])
+                except Exception as e:
+                    logger.error(f"❌ 매칭 실패: {item['file_name']} - {e}")
+            result_queue.put(item)
+
+        result_queue.put(_SENTINEL)
+
+    # ====================
+    # 실행
+    # ====================
+    def run(self, paths: Iterable[str]) -> Iterator[Dict]:
+        """
+        파이프라인 실행
+
+        Args:
+            paths: 오디오 파일 경로 목록
+
+        Yields:
+            완료 순서대로 파일별 결과
+            {"index", "path", "file_name", "text", "duration", "error", "cached", "match"}
+        """
+        paths = list(paths)
+        self._stop.clear()
+        self.stats = {
+            "files": len(paths),
+            "errors": 0,
+            "cache_hits": 0,
+            "audio_seconds": 0.0,
+            "decode_batches": 0,
+            "decode_time": 0.0,
+            "elapsed": 0.0,
+        }
+        start_time = time.time()
+
+        path_queue: queue.Queue = queue.Queue()
+        for index, path in enumerate(paths):
+            path_queue.put((index, path))
+        audio_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        score_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        result_queue: queue.Queue = queue.Queue()
+
+        threads = [
+            threading.Thread(
+                target=self._reader_worker,
+                args=(path_queue, audio_queue),
+                name=f"batch-reader-{i}",
+                daemon=True,
+            )
+            for i in range(self.num_readers)
+        ]
+        threads.append(threading.Thread(
+            target=self._decoder_worker,
+            args=(audio_queue, score_queue),
+            name="batch-decoder",
+            daemon=True,
+        ))
+        threads.append(threading.Thread(
+            target=self._scorer_worker,
+            args=(score_queue, result_queue),
+            name="batch-scorer",
+            daemon=True,
+        ))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = result_queue.get()
+                if item is _SENTINEL:
+                    break
+                if item["error"]:
+                    self.stats["errors"] += 1
+                if item["cached"]:
+                    self.stats["cache_hits"] += 1
+                self.stats["audio_seconds"] += item["duration"]
+                yield item
+        finally:
+            # 소비자가 중간에 멈춘 경우에도 스레드 정리
+            self._stop.set()
+            for thread in threads:
+                thread.join(timeout=5)
+            self.stats["elapsed"] = time.time() - start_time
+
+    def summary(self) -> Dict:
+        """마지막 실행 통계 (RTF = 처리 시간 / 오디오 길이)"""
+        stats = dict(self.stats)
+        audio_seconds = stats.get("audio_seconds", 0.0)
+        stats["rtf"] = stats.get("elapsed", 0.0) / audio_seconds if audio_seconds else None
+        readable = stats.get("files", 0) - stats.get("errors", 0)
+        stats["cache_hit_rate"] = (
+            stats.get("cache_hits", 0) / readable if self.cache is not None and readable else None
+        )
+        return stats
+
+
+def collect_audio_files(directory: str, recursive: bool = False) -> List[str]:
+    """디렉토리 내 오디오 파일 목록 (정렬)"""
+    pattern = os.path.join(directory, "**", "*") if recursive else os.path.join(directory, "*")
+    return sorted(
+        path for path in glob.glob(pattern, recursive=recursive)
+        if os.path.isfile(path) and path.lower().endswith(AUDIO_EXTENSIONS)
+    )
+
+
+# ====================
+# CLI (헤드리스 회귀 테스트)
+# ====================
+CLI_FIELDS = [
+    "file_name", "duration", "text", "best_match", "label",
+    "accuracy", "cer", "is_emergency", "emergency_keywords", "cached", "error",
+]
+
+
+def _result_row(item: Dict) -> Dict:
+    match = item.get("match") or {}
+    cer = match.get("cer")
+    accuracy = match.get("accuracy")
+    return {
+        "file_name": item["file_name"],
+        "duration": f"{item['duration']:.2f}",
+        "text": item["text"],
+        "best_match": match.get("best_match", ""),
+        "label": match.get("label", ""),
+        "accuracy": f"{accuracy:.4f}" if accuracy is not None else "",
+        "cer": f"{cer:.4f}" if cer is not None else "",
+        "is_emergency": match.get("is_emergency", False),
+        "emergency_keywords": ",".join(match.get("emergency_keywords", [])),
+        "cached": item["cached"],
+        "error": item["error"] or "",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배치 음성인식 회귀 테스트")
+    parser.add_argument("directory", help="오디오 파일 디렉토리")
+    parser.add_argument("--recursive", action="store_true", help="하위 디렉토리 포함")
+    parser.add_argument("--output", default=None, help="결과 CSV 경로 (기본: batch_cli_<시각>.csv)")
+    parser.add_argument("--readers", type=int, default=4, help="파일 읽기 스레드 수")
+    parser.add_argument("--batch-size", type=int, default=8, help="decode_streams 배치 크기")
+    parser.add_argument("--queue-size", type=int, default=16, help="디코딩 대기 큐 크기")
+    parser.add_argument("--no-cache", action="store_true", help="인식 캐시 사용 안 함")
+    args = parser.parse_args()
+
+    paths = collect_audio_files(args.directory, args.recursive)
+    if not paths:
+        logger.error(f"❌ 오디오 파일 없음: {args.directory}")
+        return 1
+
+    # 모델 / 정답 매처는 asr_engine 에서 로드 (Gradio 불필요)
+    from asr_engine import model as engine_model
+    from asr_engine.matcher import matcher
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    engine_model.load_model()
+    pipeline = BatchTranscriptionPipeline(
+        engine_model.recognizer,
+        scorer=matcher.evaluate,
+        num_readers=args.readers,
+        batch_size=args.batch_size,
+        queue_size=args.queue_size,
+        cache=None if args.no_cache else engine_model.transcription_cache,
+    )
+
+    output_path = args.output or f"batch_cli_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+    total = len(paths)
+    logger.info(f"🚀 배치 처리 시작: {total}개 파일")
+
+    with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=CLI_FIELDS)
+        writer.writeheader()
+        for done, item in enumerate(pipeline.run(paths), 1):
+            writer.writerow(_result_row(item))
+            status = f"❌ {item['error']}" if item["error"] else item["text"]
+            logger.info(f"[{done}/{total}] {item['file_name']}: {status}")
+
+    stats = pipeline.summary()
+    evaluation = matcher.evaluation_summary() or {}
+    logger.info("=" * 60)
+    logger.info(f"✅ 완료: {stats['files']}개 파일, 오류 {stats['errors']}개")
+    logger.info(f"⏱️ 처리 시간: {stats['elapsed']:.2f}초 / 오디오 {stats['audio_seconds']:.2f}초")
+    if stats["rtf"] is not None:
+        logger.info(f"⚡ RTF: {stats['rtf']:.3f} (디코딩 배치 {stats['decode_batches']}회)")
+    if stats["cache_hit_rate"] is not None:
+        logger.info(f"💾 캐시 적중률: {stats['cache_hit_rate']:.1%} ({stats['cache_hits']}개)")
+    if evaluation.get("corpus_cer") is not None:
+        logger.info(f"📊 Corpus CER: {evaluation['corpus_cer']:.4f}")
+    logger.info(f"📁 결과: {output_path}")
+    logger.info("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
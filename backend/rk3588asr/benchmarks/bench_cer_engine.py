@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+CER 엔진 벤치마크
+
+기존 cer_direct (전체 DP 테이블 + traceback), cer_engine, jiwer 를
+짧은 문장 / 긴 전사문 / 배치 입력에서 비교합니다.
+
+실행:
+    cd backend/rk3588asr
+    python benchmarks/bench_cer_engine.py --long-chars 5000 --pairs 2000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asr_engine import cer_engine  # noqa: E402
+
+try:
+    from jiwer import compute_measures
+
+    def jiwer_sdi(hyp: str, ref: str):
+        m = compute_measures(truth=" ".join(ref), hypothesis=" ".join(hyp))
+        return m["substitutions"], m["deletions"], m["insertions"]
+except ImportError:
+    try:
+        from jiwer import process_characters
+
+        def jiwer_sdi(hyp: str, ref: str):
+            out = process_characters(ref, hyp)
+            return out.substitutions, out.deletions, out.insertions
+    except ImportError:
+        jiwer_sdi = None
+
+
+def legacy_cer_direct(hyp: str, ref: str):
+    """기존 demo_vad_final.cer_direct 의 DP + traceback (비교 기준)"""
+    r, h = len(ref), len(hyp)
+    dp = [[0] * (h + 1) for _ in range(r + 1)]
+    for i in range(r + 1):
+        dp[i][0] = i
+    for j in range(h + 1):
+        dp[0][j] = j
+    for i in range(1, r + 1):
+        for j in range(1, h + 1):
+            cost = 0 if ref[i - 1] == hyp[j - 1] else 1
+            dp[i][j] = min(dp[i - 1][j] + 1, dp[i][j - 1] + 1, dp[i - 1][j - 1] + cost)
+    i, j = r, h
+    S = D = I = 0
+    while i > 0 or j > 0:
+        if i > 0 and dp[i][j] == dp[i - 1][j] + 1:
+            D += 1
+            i -= 1
+        elif j > 0 and dp[i][j] == dp[i][j - 1] + 1:
+            I += 1
+            j -= 1
+        else:
+            if i > 0 and j > 0 and ref[i - 1] != hyp[j - 1]:
+                S += 1
+            i -= 1
+            j -= 1
+    return S, D, I
+
+
+def make_pair(length: int, error_rate: float, rng: random.Random):
+    syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(400)]
+    ref = "".join(rng.choice(syllables) for _ in range(length))
+    hyp = []
+    for ch in ref:
+        roll = rng.random()
+        if roll < error_rate / 3:
+            continue                              # 삭제
+        if roll < 2 * error_rate / 3:
+            hyp.append(rng.choice(syllables))     # 치환
+        elif roll < error_rate:
+            hyp.append(ch)
+            hyp.append(rng.choice(syllables))     # 삽입
+        else:
+            hyp.append(ch)
+    return "".join(hyp), ref
+
+
+def measure(fn, *args, repeat: int = 1):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(*args)
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def report(name: str, elapsed: float, peak: int):
+    print(f"  {name:<22} {elapsed * 1000:10.2f} ms   peak {peak / 1024 / 1024:8.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CER 엔진 벤치마크")
+    parser.add_argument("--long-chars", type=int, default=3000, help="긴 전사문 길이 (음절)")
+    parser.add_argument("--pairs", type=int, default=1000, help="배치 쌍 개수")
+    parser.add_argument("--error-rate", type=float, default=0.15)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    print("\n[1] 짧은 문장 (20음절) x 1000")
+    short = [make_pair(20, args.error_rate, rng) for _ in range(1000)]
+    _, t_legacy, m_legacy = measure(lambda: [legacy_cer_direct(h, r) for h, r in short])
+    _, t_engine, m_engine = measure(lambda: [cer_engine.edit_ops(h, r) for h, r in short])
+    report("legacy cer_direct", t_legacy, m_legacy)
+    report("cer_engine.edit_ops", t_engine, m_engine)
+    if jiwer_sdi:
+        _, t_jiwer, m_jiwer = measure(lambda: [jiwer_sdi(h, r) for h, r in short])
+        report("jiwer", t_jiwer, m_jiwer)
+
+    print(f"\n[2] 긴 전사문 ({args.long_chars}음절) x 1")
+    hyp, ref = make_pair(args.long_chars, args.error_rate, rng)
+    expected, t_legacy, m_legacy = measure(legacy_cer_direct, hyp, ref)
+    got, t_engine, m_engine = measure(cer_engine.edit_ops, hyp, ref)
+    report("legacy cer_direct", t_legacy, m_legacy)
+    report("cer_engine.edit_ops", t_engine, m_engine)
+    if jiwer_sdi:
+        _, t_jiwer, m_jiwer = measure(jiwer_sdi, hyp, ref)
+        report("jiwer", t_jiwer, m_jiwer)
+    print(f"  S/D/I 일치: {tuple(got) == tuple(expected)}  {got}")
+
+    print(f"\n[3] 배치 ({args.pairs}쌍, 10~80음절)")
+    pairs = [make_pair(rng.randint(10, 80), args.error_rate, rng) for _ in range(args.pairs)]
+    expected, t_legacy, m_legacy = measure(lambda: [legacy_cer_direct(h, r) for h, r in pairs])
+    got, t_batch, m_batch = measure(cer_engine.batch_cer, pairs)
+    report("legacy cer_direct", t_legacy, m_legacy)
+    report("cer_engine.batch_cer", t_batch, m_batch)
+    if jiwer_sdi:
+        _, t_jiwer, m_jiwer = measure(lambda: [jiwer_sdi(h, r) for h, r in pairs])
+        report("jiwer", t_jiwer, m_jiwer)
+    mismatches = sum((g["S"], g["D"], g["I"]) != e for g, e in zip(got, expected))
+    print(f"  S/D/I 불일치: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
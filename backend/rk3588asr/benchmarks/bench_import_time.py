@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+import 시간 / 메모리 벤치마크
+
+API 서버가 쓰는 asr_engine 경로와 기존 demo_vad_final 경로의
+콜드 import 시간(초)과 최대 RSS(MB)를 새 인터프리터에서 측정합니다.
+
+실행:
+    cd backend/rk3588asr
+    python benchmarks/bench_import_time.py --repeat 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ("asr_engine (API 서버 경로)",
+     "from asr_engine import matcher, VADStreamingProcessor, send_emergency_alert, load_model"),
+    ("demo_vad_final (Gradio 데모)", "import demo_vad_final"),
+]
+
+# 측정 스크립트: import 후 시간, 최대 RSS, 무거운 모듈 로드 여부 출력
+PROBE = """
+import sys, time, json, resource
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = ["gradio", "sherpa_onnx", "jiwer", "requests", "soundfile", "scipy", "pyarrow"]
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "loaded": [m for m in heavy if m in sys.modules],
+}}))
+"""
+
+
+def measure(statement: str):
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        last = (proc.stderr.strip().splitlines() or ["알 수 없는 오류"])[-1]
+        return None, last
+    return json.loads(proc.stdout.strip().splitlines()[-1]), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import 시간 / 메모리 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    print(f"  {'경로':<30} {'import 초':>10} {'최대 RSS MB':>12}  로드된 무거운 모듈")
+    for name, statement in CASES:
+        runs = []
+        error = None
+        for _ in range(args.repeat):
+            result, error = measure(statement)
+            if result is None:
+                break
+            runs.append(result)
+
+        if not runs:
+            print(f"  {name:<30} {'실패':>10} {'-':>12}  {error}")
+            continue
+
+        runs.sort(key=lambda r: r["seconds"])
+        median = runs[len(runs) // 2]
+        loaded = ", ".join(median["loaded"]) or "-"
+        print(f"  {name:<30} {median['seconds']:10.3f} {median['max_rss_mb']:12.1f}  {loaded}")
+
+
+if __name__ == "__main__":
+    main()
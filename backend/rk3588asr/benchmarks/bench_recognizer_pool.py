@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Recognizer 풀 벤치마크 (CPU / ONNX provider 로 실행 가능)
+
+1. 웜업 없이 생성한 인스턴스의 첫 디코딩 지연 vs 웜업 후 디코딩 지연
+2. 풀 크기별로 동시 요청 처리량과 체크아웃 대기 시간 (p50 / p95)
+
+실행 (RK3588 가 아닌 PC에서는 CPU ONNX 모델 사용):
+    cd backend/rk3588asr
+    python benchmarks/bench_recognizer_pool.py \\
+        --model-dir models/sherpa-onnx-sense-voice-zh-en-ja-ko-yue-2024-07-17 \\
+        --provider cpu --pool-sizes 1,2,4 --concurrency 4 --requests 40
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asr_engine.recognizer_pool import RecognizerPool, synthetic_utterance  # noqa: E402
+
+SAMPLE_RATE = 16000
+
+
+def load_utterance(path: str) -> np.ndarray:
+    if not path:
+        return synthetic_utterance(SAMPLE_RATE, seconds=3.0)
+    from asr_engine.audio_io import read_audio_file, to_target_rate
+
+    audio, sr = read_audio_file(path)
+    return to_target_rate(audio, sr, SAMPLE_RATE)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recognizer 풀 벤치마크")
+    parser.add_argument("--model-dir", required=True, help="sense-voice 모델 디렉토리")
+    parser.add_argument("--provider", default="cpu", help="cpu / rknn")
+    parser.add_argument("--num-threads", type=int, default=2, help="인스턴스당 스레드 수")
+    parser.add_argument("--pool-sizes", default="1,2,4", help="비교할 풀 크기 (쉼표 구분)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=40, help="풀 크기당 요청 수")
+    parser.add_argument("--wav", default="", help="테스트 오디오 (없으면 합성 3초)")
+    args = parser.parse_args()
+
+    import sherpa_onnx
+
+    if args.provider == "rknn":
+        model = os.path.join(args.model_dir, "model.rknn")
+    else:
+        model = os.path.join(args.model_dir, "model.int8.onnx")
+        if not os.path.exists(model):
+            model = os.path.join(args.model_dir, "model.onnx")
+
+    def factory():
+        return sherpa_onnx.OfflineRecognizer.from_sense_voice(
+            model=model,
+            tokens=os.path.join(args.model_dir, "tokens.txt"),
+            num_threads=args.num_threads,
+            provider=args.provider,
+            use_itn=True,
+        )
+
+    audio = load_utterance(args.wav)
+
+    def decode(recognizer) -> float:
+        start = time.perf_counter()
+        stream = recognizer.create_stream()
+        stream.accept_waveform(SAMPLE_RATE, audio)
+        recognizer.decode_stream(stream)
+        return time.perf_counter() - start
+
+    # 1. 웜업 효과
+    cold = RecognizerPool(factory, size=1, name="cold", warmup=False)
+    first = decode(cold)
+    second = decode(cold)
+    warm = RecognizerPool(factory, size=1, name="warm", warmup=True)
+    warmed = decode(warm)
+    print(f"\n[웜업] 첫 디코딩 {first * 1000:.0f}ms → 두 번째 {second * 1000:.0f}ms, "
+          f"웜업 후 첫 디코딩 {warmed * 1000:.0f}ms (오디오 {len(audio) / SAMPLE_RATE:.1f}초)")
+    del cold, warm
+
+    # 2. 풀 크기별 동시 처리
+    print(f"\n[동시 {args.concurrency}, 요청 {args.requests}건]")
+    print(f"  {'풀 크기':>6} {'처리량 req/s':>13} {'지연 p95 ms':>12} {'대기 p50 ms':>12} {'대기 p95 ms':>12}")
+    for size in [int(s) for s in args.pool_sizes.split(",") if s]:
+        pool = RecognizerPool(factory, size=size, name=f"pool{size}", warmup=True)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            latencies = sorted(executor.map(lambda _: decode(pool), range(args.requests)))
+        elapsed = time.perf_counter() - start
+        stats = pool.stats()
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] * 1000
+        print(f"  {size:>6} {args.requests / elapsed:13.2f} {p95:12.0f} "
+              f"{stats['wait_ms_p50']:12.1f} {stats['wait_ms_p95']:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
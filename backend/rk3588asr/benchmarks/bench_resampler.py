@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+리샘플러 벤치마크
+
+44.1kHz / 48kHz → 16kHz 변환에서 오디오 1초당 CPU 시간과
+청크 단위 처리 시 경계 왜곡(전체 신호 일괄 처리 대비 오차)을 비교합니다.
+
+- scipy.signal.resample (기존 폴백, 청크마다 FFT)
+- librosa.resample (기존 기본값, 설치된 경우)
+- scipy.signal.resample_poly (호출마다 필터 설계)
+- resampler.resample (캐시된 필터, 파일용)
+- resampler.StreamingResampler (청크 간 상태 유지)
+
+실행:
+    cd backend/rk3588asr
+    python benchmarks/bench_resampler.py --seconds 30 --chunk-ms 100
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asr_engine.resampler import StreamingResampler, resample  # noqa: E402
+
+TARGET_SR = 16000
+
+
+def make_signal(sr: int, seconds: float, rng: np.random.Generator) -> np.ndarray:
+    """음성 대역 사인파 합성 + 약한 잡음"""
+    t = np.arange(int(sr * seconds)) / sr
+    freqs = rng.uniform(100, 4000, size=8)
+    x = sum(np.sin(2 * np.pi * f * t + rng.uniform(0, np.pi)) for f in freqs) / len(freqs)
+    x += 0.01 * rng.standard_normal(len(t))
+    return x.astype(np.float32)
+
+
+def chunked(x: np.ndarray, size: int):
+    for start in range(0, len(x), size):
+        yield x[start:start + size]
+
+
+def cpu_time(fn) -> float:
+    start = time.process_time()
+    fn()
+    return time.process_time() - start
+
+
+def run_chunked(method, x: np.ndarray, sr: int, chunk: int) -> np.ndarray:
+    return np.concatenate([method(c, sr) for c in chunked(x, chunk)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리샘플러 벤치마크")
+    parser.add_argument("--seconds", type=float, default=30.0, help="테스트 신호 길이 (초)")
+    parser.add_argument("--chunk-ms", type=int, default=100, help="스트리밍 청크 길이 (ms)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    from scipy import signal
+
+    def fft_resample(c, sr):
+        return signal.resample(c, int(len(c) * TARGET_SR / sr)).astype(np.float32)
+
+    def poly_uncached(c, sr):
+        g = np.gcd(sr, TARGET_SR)
+        return signal.resample_poly(c, TARGET_SR // g, sr // g).astype(np.float32)
+
+    try:
+        import librosa
+
+        def librosa_resample(c, sr):
+            return librosa.resample(c, orig_sr=sr, target_sr=TARGET_SR)
+    except ImportError:
+        librosa_resample = None
+
+    for sr in (44100, 48000):
+        x = make_signal(sr, args.seconds, rng)
+        reference = resample(x, sr)
+        chunk = sr * args.chunk_ms // 1000
+
+        print(f"\n[{sr} Hz → {TARGET_SR} Hz] {args.seconds:.0f}초, 청크 {args.chunk_ms}ms")
+        print(f"  {'방식':<34} {'CPU ms/오디오초':>14} {'최대 오차':>12}")
+
+        def report(name, elapsed, out):
+            n = min(len(out), len(reference))
+            err = float(np.max(np.abs(out[:n] - reference[:n]))) if n else float("nan")
+            print(f"  {name:<34} {elapsed * 1000 / args.seconds:14.3f} {err:12.2e}")
+
+        # 일괄 (파일) 처리
+        out = None
+
+        def _batch():
+            nonlocal out
+            out = resample(x, sr)
+        report("resample (캐시 필터, 일괄)", cpu_time(_batch), out)
+
+        # 청크 처리
+        for name, method in [
+            ("scipy.signal.resample (청크)", fft_resample),
+            ("resample_poly (청크, 필터 재설계)", poly_uncached),
+            ("librosa.resample (청크)", librosa_resample),
+            ("resample (청크, 캐시 필터)", resample),
+        ]:
+            if method is None:
+                continue
+
+            def _run():
+                nonlocal out
+                out = run_chunked(method, x, sr, chunk)
+            report(name, cpu_time(_run), out)
+
+        def _stream():
+            nonlocal out
+            resampler = StreamingResampler(sr, TARGET_SR)
+            parts = [resampler.process(c) for c in chunked(x, chunk)]
+            parts.append(resampler.flush())
+            out = np.concatenate(parts)
+        report("StreamingResampler (청크, 상태 유지)", cpu_time(_stream), out)
+
+
+if __name__ == "__main__":
+    main()
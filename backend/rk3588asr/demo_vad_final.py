@@ -16,8 +16,6 @@ import warnings
 import gradio as gr
 import numpy as np
 from datetime import datetime
-import soundfile as sf
-import wave
 import queue
 import threading
 import time
@@ -48,23 +46,28 @@ try:
 except ImportError:
     pass
 
-from difflib import SequenceMatcher
 from typing import List, Tuple, Dict, Optional
-import re
 import json
 import logging
-import csv
-import uuid
-import requests
 
-# jiwer는 선택적 의존성으로 처리
-try:
-    from jiwer import compute_measures
-    JIWER_AVAILABLE = True
-except ImportError:
-    compute_measures = None
-    JIWER_AVAILABLE = False
-    print("[WARN] jiwer 라이브러리를 찾을 수 없습니다. `pip install jiwer` 로 설치하세요.")
+# 인식 코어 (asr_engine). 설정 / 매처 / 알림 이름은 기존 import 경로 호환을 위해 재노출
+from asr_engine.config import (  # noqa: F401
+    MODEL_DIR,
+    MODEL_PATH,
+    TOKENS_PATH,
+    EMERGENCY_API_CONFIG,
+    GROUND_TRUTHS,
+    LABELS,
+)
+from asr_engine import model as engine_model
+from asr_engine.alerts import send_emergency_alert
+from asr_engine.matcher import SpeechRecognitionMatcher, matcher  # noqa: F401
+from asr_engine.vad import VADStreamingProcessor
+from asr_engine.audio_io import read_audio_file, to_target_rate
+from asr_engine.resampler import StreamingResampler
+from batch_pipeline import BatchTranscriptionPipeline
+from report_writer import write_cer_report
+from file_streaming import StreamingFileRecognizer, audio_duration, format_timestamp
 
 
 warnings.filterwarnings("ignore")
@@ -79,188 +82,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# sherpa-onnx import
-try:
-    import sherpa_onnx
-except ImportError:
-    raise ImportError(
-        "sherpa-onnx를 찾을 수 없습니다.\n"
-        "다음 명령어로 설치해주세요:\n"
-        "pip install sherpa-onnx -f https://k2-fsa.github.io/sherpa/onnx/rk-npu.html"
-    )
-
-# ====================
-# 전역 설정
-# ====================
-MODEL_DIR = os.path.join(
-    os.getcwd(),
-    "models",
-    "sherpa-onnx-rk3588-30-seconds-sense-voice-zh-en-ja-ko-yue-2024-07-17",
-)
-
-MODEL_PATH = os.path.join(MODEL_DIR, "model.rknn")
-TOKENS_PATH = os.path.join(MODEL_DIR, "tokens.txt")
-
-# 전역 recognizer 변수
+# 전역 recognizer 변수 (load_model() 에서 설정)
 recognizer = None
 
-# ====================
-# 🔹 응급 상황 API 설정
-# ====================
-EMERGENCY_API_CONFIG = {
-    "enabled": True,  # API 호출 활성화 여부
-    "api_endpoints": [
-        {
-            "name": "Emergency Alert API (JSON)",
-            "url": "http://10.10.11.23:10008/api/emergency/quick",
-            "enabled": True,
-            "method": "POST",
-            "type": "json"
-        },
-        {
-            "name": "Emergency Alert API (Multipart)",
-            "url": "http://10.10.11.23:10008/api/emergency/quick/{watchId}",
-            "enabled": True,
-            "method": "POST",
-            "type": "multipart"
-        }
-    ],
-    "watch_id": "watch_1764653561585_7956",
-    "sender_id": "voice_asr_system",
-    "include_image_url": True,
-    "image_base_url": "http://10.10.11.79:8080/api/images",
-    "fcm_project_id": "emergency-alert-system-f27e6",
-}
-
-
-def send_emergency_alert(recognized_text: str, emergency_keywords: List[str]):
-    """
-    응급 상황 감지 시 API로 이벤트 전송
-    
-    Args:
-        recognized_text: 음성 인식 결과 텍스트
-        emergency_keywords: 감지된 응급 키워드 리스트
-    """
-    if not EMERGENCY_API_CONFIG.get("enabled", False):
-        logger.info("⚠️ 응급 API 호출이 비활성화되어 있습니다.")
-        return
-    
-    config = EMERGENCY_API_CONFIG
-    enabled_endpoints = [ep for ep in config.get("api_endpoints", []) if ep.get("enabled", False)]
-    
-    if not enabled_endpoints:
-        logger.warning("⚠️ 활성화된 API 엔드포인트가 없습니다.")
-        return
-    
-    # JSON 타입 API 우선 선택
-    selected_api = None
-    for ep in enabled_endpoints:
-        if ep.get("type") == "json":
-            selected_api = ep
-            break
-    
-    if not selected_api and enabled_endpoints:
-        selected_api = enabled_endpoints[0]
-    
-    if not selected_api:
-        logger.warning("⚠️ 사용 가능한 API 엔드포인트가 없습니다.")
-        return
-    
-    try:
-        logger.info(f"🚨 응급 상황 감지! API 호출 시작: {selected_api['name']}")
-        logger.info(f"   - 인식 텍스트: {recognized_text}")
-        logger.info(f"   - 감지 키워드: {', '.join(emergency_keywords)}")
-        
-        # 이벤트 데이터 생성
-        event_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-        watch_id = config.get("watch_id", "watch_default")
-        sender_id = config.get("sender_id", "voice_asr_system")
-        
-        if selected_api.get("type") == "json":
-            # JSON 방식
-            api_url = selected_api['url']
-            if '{watchId}' in api_url:
-                api_url = api_url.replace('{watchId}', watch_id)
-            elif watch_id not in api_url:
-                if not api_url.endswith('/'):
-                    api_url += '/'
-                api_url += watch_id
-            
-            # 이미지 URL 생성 (선택적)
-            image_url = None
-            if config.get("include_image_url", False):
-                image_base = config.get("image_base_url", "http://10.10.11.79:8080/api/images")
-                image_filename = f"emergency_{event_id.split('-')[0]}.jpeg"
-                image_url = f"{image_base}/{image_filename}"
-            
-            # 서버가 기대하는 형식으로만 데이터 구성
-            request_data = {
-                "senderId": sender_id,
-                "note": f"응급 상황 감지: {recognized_text} (키워드: {', '.join(emergency_keywords)})",
-                "imageUrl": image_url  # null 가능
-            }
-            
-            logger.info(f"📤 API 요청 URL: {api_url}")
-            logger.info(f"📤 요청 데이터: {request_data}")
-
-            # ✅ 수정: api_url 사용 및 requests.post() 사용
-            response = requests.post(
-                url=api_url,  # ✅ 수정: api_url 사용
-                json=request_data,  # ✅ 수정: 서버가 기대하는 필드만
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            
-            logger.info(f"✅ API 호출 성공 (Status: {response.status_code})")
-            logger.info(f"   - Event ID: {event_id}")
-            logger.info(f"   - Response: {response.text[:200]}")
-        
-        else:
-            # Multipart 방식
-            api_url = selected_api['url']
-            if '{watchId}' in api_url:
-                api_url = api_url.replace('{watchId}', watch_id)
-            elif watch_id not in api_url:
-                if not api_url.endswith('/'):
-                    api_url += '/'
-                api_url += watch_id
-            
-            # 쿼리 파라미터로 senderId와 note 추가
-            import urllib.parse
-            note_text = f"응급 상황 감지: {recognized_text} (키워드: {', '.join(emergency_keywords)})"
-            query_params = {
-                'senderId': sender_id,
-                'note': note_text
-            }
-            api_url_with_params = f"{api_url}?{urllib.parse.urlencode(query_params)}"
-            
-            # multipart/form-data 형식으로 전송 (image는 빈 값)
-            files = {
-                'image': ('', '')  # 빈 이미지 파일
-            }
-            
-            logger.info(f"📤 API 요청 URL: {api_url_with_params}")
-            logger.info(f"📤 Multipart files: {files}")
-
-            # ✅ 수정: requests.post() 사용
-            response = requests.post(
-                url=api_url_with_params,
-                files=files,
-                timeout=10
-            )
-            
-            logger.info(f"✅ API 호출 성공 (Status: {response.status_code})")
-            logger.info(f"   - Response: {response.text[:200]}")
-    
-    except requests.exceptions.Timeout:
-        logger.error("❌ API 호출 타임아웃")
-    
-    except requests.exceptions.ConnectionError:
-        logger.error("❌ API 연결 오류")
-    
-    except Exception as e:
-        logger.error(f"❌ API 호출 중 오류 발생: {e}", exc_info=True)
+# 인식 결과 캐시 (load_model() 에서 설정)
+transcription_cache = None
 
 # 언어 매핑
 LANGUAGE_MAP = {
@@ -272,37 +98,6 @@ LANGUAGE_MAP = {
     "광동어": "yue",
 }
 
-# ====================
-# 정답 데이터 (Ground Truth)
-# ====================
-GROUND_TRUTHS = [
-    # 일상 상황 10개
-    "회의는 오후 세 시에 시작해 알림 설정해 줘",
-    "내일 아침 일곱 시에 기상 알람을 추가해",
-    "거실 불 끄고 공기청정기 약하게 켜",
-    "오늘 점심은 김치볶음밥 두 개 주문할까",
-    "블루투스 이어폰 배터리 잔량 얼마야",
-    "일정에 고객 미팅 오후 두 시로 등록해",
-    "와이파이가 자꾸 끊겨 속도 테스트 해봐",
-    "영수증 사진을 스캔해서 이메일로 보내",
-    "주말에 가족 영화 추천해 줘 액션 말고",
-    "날씨 어때 우산 챙겨야 할까",
-    # 응급 상황 10개
-    "도와줘 사람이 쓰러졌어",
-    "119에 바로 신고해 호흡이 멈춘 것 같아",
-    "불이야 주방에서 연기가 나",
-    "심장이 아파 가슴이 조여 와",
-    "큰 사고야 피가 많이 나 위치 전송해 줘",
-    "알러지 반응이야 숨쉬기 힘들어.",
-    "어지럽고 구토가 나 구급차 호출해",
-    "노약자가 계단에서 넘어졌어 의식이 희미해",
-    "가스 냄새가 심해 즉시 환기하고 신고해",
-    "아이 체온이 40도야 응급실 안내해 줘",
-]
-
-LABELS = ["일상"] * 10 + ["응급"] * 10
-
-
 # ====================
 # 🔹 세션 결과 저장소 (마이크 실시간 음성인식용)
 # ====================
@@ -415,10 +210,14 @@ def format_vad_chat_history() -> str:
 # ====================
 # 🔹 CSV 리포트 생성 함수
 # ====================
+# 컬럼 포맷 동시 출력 ("parquet" / "arrow", 빈 값이면 CSV만)
+REPORT_COLUMNAR_FORMAT = os.getenv("ASR_REPORT_COLUMNAR", "") or None
+
 def generate_mic_session_csv_report(
     sessions: List[Dict],
     matcher,  # SpeechRecognitionMatcher 객체
-    output_csv_path: str = None
+    output_csv_path: str = None,
+    columnar_format: Optional[str] = None,
 ) -> str:
     """
     마이크 실시간 음성인식 세션 결과에 대한 CSV 리포트 생성
@@ -427,6 +226,7 @@ def generate_mic_session_csv_report(
         sessions: 세션 결과 리스트 (각 dict는 session_id, timestamp, duration, ground_truth, asr_result 포함)
         matcher: SpeechRecognitionMatcher 객체
         output_csv_path: 저장될 CSV 경로 (None이면 자동 생성)
+        columnar_format: "parquet" / "arrow" 지정 시 컬럼 포맷 파일도 생성
 
     Returns:
         생성된 CSV 파일 경로
@@ -441,69 +241,30 @@ def generate_mic_session_csv_report(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_csv_path = f"mic_session_cer_report_{timestamp}.csv"
 
-    rows = []
-
-    for session in sessions:
-        session_id = session.get("session_id", "N/A")
-        timestamp = session.get("timestamp", "N/A")
-        duration = session.get("duration", 0.0)
-        gt = session.get("ground_truth", "")
-        asr = session.get("asr_result", "")
-
-        # CER 직접 계산
-        cer_direct = matcher.cer_direct(asr, gt)
-
-        # jiwer CER 계산
-        cer_jiwer_data = matcher.cer_jiwer(asr, gt)
-
-        row = {
-            "session_id": session_id,
-            "timestamp": timestamp,
-            "duration_sec": f"{duration:.2f}",
-            "ground_truth": gt,
-            "asr": asr,
-
-            # 직접 CER
-            "cer_direct": f"{cer_direct['CER']:.4f}",
-            "S_direct": cer_direct["S"],
-            "D_direct": cer_direct["D"],
-            "I_direct": cer_direct["I"],
-            "N_direct": cer_direct["N"],
+    rows = (
+        {
+            "session_id": session.get("session_id", "N/A"),
+            "timestamp": session.get("timestamp", "N/A"),
+            "duration_sec": float(session.get("duration", 0.0)),
+            "ground_truth": session.get("ground_truth", ""),
+            "asr": session.get("asr_result", ""),
+            "label": matcher.label_of(session.get("ground_truth", "")),
         }
+        for session in sessions
+    )
 
-        # jiwer CER 존재 여부 체크
-        if cer_jiwer_data:
-            row.update({
-                "cer_jiwer": f"{cer_jiwer_data['CER']:.4f}",
-                "S_jiwer": cer_jiwer_data["S"],
-                "D_jiwer": cer_jiwer_data["D"],
-                "I_jiwer": cer_jiwer_data["I"],
-                "N_jiwer": cer_jiwer_data["N"],
-            })
-        else:
-            row.update({
-                "cer_jiwer": "",
-                "S_jiwer": "",
-                "D_jiwer": "",
-                "I_jiwer": "",
-                "N_jiwer": "",
-            })
-
-        rows.append(row)
-
-    # CSV 저장
-    header = [
-        "session_id", "timestamp", "duration_sec", "ground_truth", "asr",
-        "cer_direct", "S_direct", "D_direct", "I_direct", "N_direct",
-        "cer_jiwer",  "S_jiwer", "D_jiwer", "I_jiwer", "N_jiwer"
-    ]
-
-    with open(output_csv_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=header)
-        writer.writeheader()
-        writer.writerows(rows)
+    report = write_cer_report(
+        rows,
+        output_csv_path,
+        base_fields=["session_id", "timestamp", "duration_sec", "ground_truth", "asr"],
+        matcher=matcher,
+        columnar_format=columnar_format or REPORT_COLUMNAR_FORMAT,
+    )
 
-    logger.info(f"[✔] 마이크 세션 CSV 리포트 생성 완료 → {output_csv_path}")
+    logger.info(
+        f"[✔] 마이크 세션 CSV 리포트 생성 완료 → {output_csv_path} "
+        f"(Corpus CER {report['overall']['corpus_cer']:.4f})"
+    )
     return output_csv_path
 
 
@@ -512,7 +273,8 @@ def generate_batch_csv_report(
     ground_truths: List[str],
     asr_results: List[str],
     matcher,  # SpeechRecognitionMatcher 객체
-    output_csv_path: str = None
+    output_csv_path: str = None,
+    columnar_format: Optional[str] = None,
 ) -> str:
     """
     배치 파일 음성 인식 결과에 대한 CSV 리포트 생성
@@ -523,6 +285,7 @@ def generate_batch_csv_report(
         asr_results: ASR 인식 결과 리스트
         matcher: SpeechRecognitionMatcher 객체
         output_csv_path: 저장될 CSV 경로 (None이면 자동 생성)
+        columnar_format: "parquet" / "arrow" 지정 시 컬럼 포맷 파일도 생성
 
     Returns:
         생성된 CSV 파일 경로
@@ -538,539 +301,27 @@ def generate_batch_csv_report(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_csv_path = f"batch_cer_report_{timestamp}.csv"
 
-    rows = []
-
-    for idx, (fname, gt, asr) in enumerate(zip(file_names, ground_truths, asr_results)):
-        # CER 직접 계산
-        cer_direct = matcher.cer_direct(asr, gt)
-
-        # jiwer CER 계산
-        cer_jiwer_data = matcher.cer_jiwer(asr, gt)
-
-        row = {
-            "file_name": fname,
-            "ground_truth": gt,
-            "asr": asr,
-
-            # 직접 CER
-            "cer_direct": f"{cer_direct['CER']:.4f}",
-            "S_direct": cer_direct["S"],
-            "D_direct": cer_direct["D"],
-            "I_direct": cer_direct["I"],
-            "N_direct": cer_direct["N"],
-        }
-
-        # jiwer CER 존재 여부 체크
-        if cer_jiwer_data:
-            row.update({
-                "cer_jiwer": f"{cer_jiwer_data['CER']:.4f}",
-                "S_jiwer": cer_jiwer_data["S"],
-                "D_jiwer": cer_jiwer_data["D"],
-                "I_jiwer": cer_jiwer_data["I"],
-                "N_jiwer": cer_jiwer_data["N"],
-            })
-        else:
-            row.update({
-                "cer_jiwer": "",
-                "S_jiwer": "",
-                "D_jiwer": "",
-                "I_jiwer": "",
-                "N_jiwer": "",
-            })
-
-        rows.append(row)
-
-    # CSV 저장
-    header = [
-        "file_name", "ground_truth", "asr",
-        "cer_direct", "S_direct", "D_direct", "I_direct", "N_direct",
-        "cer_jiwer",  "S_jiwer", "D_jiwer", "I_jiwer", "N_jiwer"
-    ]
+    rows = (
+        {"file_name": fname, "ground_truth": gt, "asr": asr, "label": matcher.label_of(gt)}
+        for fname, gt, asr in zip(file_names, ground_truths, asr_results)
+    )
 
-    with open(output_csv_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=header)
-        writer.writeheader()
-        writer.writerows(rows)
+    report = write_cer_report(
+        rows,
+        output_csv_path,
+        base_fields=["file_name", "ground_truth", "asr"],
+        matcher=matcher,
+        columnar_format=columnar_format or REPORT_COLUMNAR_FORMAT,
+    )
 
-    logger.info(f"[✔] 배치 CSV 리포트 생성 완료 → {output_csv_path}")
+    logger.info(
+        f"[✔] 배치 CSV 리포트 생성 완료 → {output_csv_path} "
+        f"(Corpus CER {report['overall']['corpus_cer']:.4f})"
+    )
     return output_csv_path
 
 
-# ====================
-# 매칭 시스템
-# ====================
-class SpeechRecognitionMatcher:
-    """음성인식 결과와 정답 문장을 비교하는 클래스"""
-
-    EMERGENCY_KEYWORDS = [
-        "도와줘", "살려줘", "119", "응급", "불이야", "화재",
-        "심장", "호흡", "출혈", "사고", "구급차", "응급실",
-        "알러지", "구토", "의식", "가스",
-    ]
-
-    def __init__(self, ground_truths: List[str], labels: List[str] = None):
-        self.ground_truths = ground_truths
-        self.labels = labels if labels else ["일상"] * len(ground_truths)
-        self.evaluation_results = []
-
-    def preprocess(self, text: str) -> str:
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
-
-    def calculate_similarity(self, text1: str, text2: str) -> float:
-        return SequenceMatcher(None, text1, text2).ratio()
-
-    def levenshtein_distance(self, s1: str, s2: str) -> int:
-        if len(s1) < len(s2):
-            return self.levenshtein_distance(s2, s1)
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        return previous_row[-1]
-
-    def character_accuracy(self, recognized: str, ground_truth: str) -> float:
-        recognized = self.preprocess(recognized)
-        ground_truth = self.preprocess(ground_truth)
-        lev_dist = self.levenshtein_distance(recognized, ground_truth)
-        max_len = max(len(recognized), len(ground_truth))
-        if max_len == 0:
-            return 1.0
-        accuracy = 1.0 - (lev_dist / max_len)
-        return max(0.0, accuracy)
-
-    def detect_emergency_keywords(self, text: str) -> List[str]:
-        detected = []
-        text = self.preprocess(text)
-        for keyword in self.EMERGENCY_KEYWORDS:
-            if keyword in text:
-                detected.append(keyword)
-        return detected
-
-    def find_best_match(self, recognized_text: str) -> Dict:
-        recognized_text = self.preprocess(recognized_text)
-        best_match = ""
-        best_similarity = 0.0
-        best_index = -1
-        best_accuracy = 0.0
-
-        for idx, ground_truth in enumerate(self.ground_truths):
-            gt = self.preprocess(ground_truth)
-            similarity = self.calculate_similarity(recognized_text, gt)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = ground_truth
-                best_index = idx
-                best_accuracy = self.character_accuracy(recognized_text, ground_truth)
-
-        emergency_keywords = self.detect_emergency_keywords(recognized_text)
-        is_emergency = len(emergency_keywords) > 0
-
-
-        # 🔹 best_match에 대해 CER 계산
-        cer_direct = None
-        cer_jiwer_result = None
-        if best_match:
-            cer_direct = self.cer_direct(recognized_text, best_match)
-            cer_jiwer_result = self.cer_jiwer(recognized_text, best_match)
-
-        result = {
-            "recognized": recognized_text,
-            "best_match": best_match,
-            "similarity": best_similarity,
-            "accuracy": best_accuracy,
-            "index": best_index,
-            "label": self.labels[best_index] if best_index >= 0 else "unknown",
-            "emergency_keywords": emergency_keywords,
-            "is_emergency": is_emergency,
-            # 🔹 추가된 필드들
-            "cer": cer_direct["CER"] if cer_direct else None,  # CER 값만 표시 (0.xx 형식)
-            "cer_direct": cer_direct,         # 전체 정보 (S, D, I, N 포함)
-            "cer_jiwer": cer_jiwer_result["CER"] if cer_jiwer_result else None,  # jiwer CER 값만
-            "cer_jiwer_full": cer_jiwer_result,    # jiwer 기반 전체 결과 (또는 None)
-        }
-        self.evaluation_results.append(result)
-        return result
-
-
-    def reset_evaluation(self):
-        self.evaluation_results = []
-
-    # ============================
-    # 🔹 (A) 직접 구현한 CER 계산
-    # ============================
-    def cer_direct(
-        self,
-        recognized: str,
-        ground_truth: str,
-        ignore_spaces: bool = True,
-    ) -> Dict[str, float]:
-        """
-        직접 구현한 Levenshtein DP + traceback으로 CER 계산
-        CER = (S + D + I) / N
-          - N: 정답(GT) 전체 음절 수
-          - S: 치환(substitution) 개수
-          - D: 삭제(deletion) 개수
-          - I: 삽입(insertion) 개수
-        """
-
-        # 전처리
-        rec = self.preprocess(recognized)
-        gt = self.preprocess(ground_truth)
-
-        if ignore_spaces:
-            rec = rec.replace(" ", "")
-            gt = gt.replace(" ", "")
-
-        ref_chars = list(gt)   # 정답(GT)
-        hyp_chars = list(rec)  # 인식 결과
-
-        r = len(ref_chars)
-        h = len(hyp_chars)
-
-        # DP 테이블 생성
-        dp = [[0] * (h + 1) for _ in range(r + 1)]
-        for i in range(r + 1):
-            dp[i][0] = i   # 삭제
-        for j in range(h + 1):
-            dp[0][j] = j   # 삽입
-
-        # DP 채우기
-        for i in range(1, r + 1):
-            for j in range(1, h + 1):
-                cost = 0 if ref_chars[i - 1] == hyp_chars[j - 1] else 1
-                dp[i][j] = min(
-                    dp[i - 1][j] + 1,      # 삭제 D
-                    dp[i][j - 1] + 1,      # 삽입 I
-                    dp[i - 1][j - 1] + cost,  # 치환 S or 일치(hit)
-                )
-
-        # traceback 으로 S, D, I 계산
-        i, j = r, h
-        S = D = I = 0
-
-        while i > 0 or j > 0:
-            # 삭제
-            if i > 0 and dp[i][j] == dp[i - 1][j] + 1:
-                D += 1
-                i -= 1
-            # 삽입
-            elif j > 0 and dp[i][j] == dp[i][j - 1] + 1:
-                I += 1
-                j -= 1
-            else:
-                # 대각선 이동: 치환 또는 일치
-                if i > 0 and j > 0 and ref_chars[i - 1] != hyp_chars[j - 1]:
-                    S += 1
-                i -= 1
-                j -= 1
-
-        N = r  # 정답 길이
-        cer = (S + D + I) / N if N > 0 else 0.0
-
-        return {
-            "CER": cer,
-            "S": S,
-            "D": D,
-            "I": I,
-            "N": N,
-        }
-
-    # ============================
-    # 🔹 (B) jiwer 기반 CER 계산
-    # ============================
-    def cer_jiwer(
-        self,
-        recognized: str,
-        ground_truth: str,
-        ignore_spaces: bool = True,
-    ) -> Optional[Dict[str, float]]:
-        """
-        jiwer 라이브러리를 이용한 CER 계산
-        (jiwer가 설치되어 있지 않으면 None 반환)
-        """
-
-        if not JIWER_AVAILABLE:
-            # jiwer 미설치 시에는 None 반환 (또는 예외 발생시켜도 됨)
-            logging.warning(
-                "jiwer 라이브러리가 설치되어 있지 않습니다. `pip install jiwer` 후 사용하세요."
-            )
-            return None
-
-        def char_transform(s: str):
-            s = self.preprocess(s)
-            if ignore_spaces:
-                s = s.replace(" ", "")
-            return list(s)
-
-        measures = compute_measures(
-            truth=ground_truth,
-            hypothesis=recognized,
-            truth_transform=char_transform,
-            hypothesis_transform=char_transform,
-        )
-
-        S = measures["substitutions"]
-        D = measures["deletions"]
-        I = measures["insertions"]
-        N = measures["reference_length"]
-        cer = (S + D + I) / N if N > 0 else 0.0
-
-        return {
-            "CER": cer,
-            "S": S,
-            "D": D,
-            "I": I,
-            "N": N,
-            "raw_measures": measures,
-        }
-
-
-matcher = SpeechRecognitionMatcher(GROUND_TRUTHS, LABELS)
-
-
-# ====================
-# Streaming Processor with VAD (Voice Activity Detection)
-# ====================
-class VADStreamingProcessor:
-    """에너지 기반 간단한 VAD를 사용한 실시간 음성인식 프로세서"""
-
-    def __init__(self, recognizer, sample_rate=16000, vad_enabled=True):
-        self.recognizer = recognizer
-        self.sample_rate = sample_rate
-        
-        # 간단한 에너지 기반 VAD 설정
-        self.vad_enabled = vad_enabled
-        self.energy_threshold = 0.01  # 에너지 임계값 (조정 가능)
-        self.silence_duration = 1.5  # 침묵 판단 시간 (초)
-        self.min_speech_duration = 0.5  # 최소 음성 길이 (초)
-        
-        # 음성 버퍼
-        self.audio_buffer = deque()
-        self.speech_segments = []  # 음성 구간 저장
-        
-        # 상태 관리
-        self.is_session_active = False  # 세션 활성화 상태
-        self.is_processing = False  # 음성 처리 중
-        self.silence_frames = 0  # 침묵 프레임 카운터
-        self.speech_frames = 0  # 음성 프레임 카운터
-        self.last_result = ""
-        self.lock = threading.Lock()
-        
-        logger.info(f"✅ VADStreamingProcessor 초기화 완료")
-        logger.info(f"   - VAD: 에너지 기반 간단한 VAD")
-        logger.info(f"   - 에너지 임계값: {self.energy_threshold}")
-        logger.info(f"   - 침묵 감지: {self.silence_duration}초")
-
-    def _calculate_energy(self, audio_chunk: np.ndarray) -> float:
-        """오디오 청크의 에너지 계산 (RMS)"""
-        return np.sqrt(np.mean(audio_chunk ** 2))
-
-    def _is_speech(self, audio_chunk: np.ndarray) -> bool:
-        """에너지 기반 음성 감지"""
-        if not self.vad_enabled:
-            return True
-        
-        energy = self._calculate_energy(audio_chunk)
-        return energy > self.energy_threshold
-
-    def start_session(self):
-        """음성인식 세션 시작 (마이크 계속 켜짐)"""
-        with self.lock:
-            if self.is_session_active:
-                logger.warning("⚠️ 이미 세션이 활성화되어 있습니다.")
-                return False
-            
-            self.is_session_active = True
-            self.is_processing = False
-            self.audio_buffer.clear()
-            self.speech_segments.clear()
-            self.last_result = ""
-            self.silence_frames = 0
-            self.speech_frames = 0
-            
-            logger.info("=" * 60)
-            logger.info("🎤 음성인식 세션 시작")
-            logger.info("   - 마이크 활성화: 계속 듣기 모드")
-            logger.info("   - 에너지 기반 VAD로 음성 자동 감지")
-            logger.info("=" * 60)
-            return True
-
-    def stop_session(self):
-        """음성인식 세션 종료 (마이크 끔)"""
-        with self.lock:
-            if not self.is_session_active:
-                logger.warning("⚠️ 활성화된 세션이 없습니다.")
-                return None
-            
-            logger.info("⏹️ 음성인식 세션 종료 요청")
-            
-            # 남은 버퍼가 있으면 처리
-            if len(self.audio_buffer) > 0 and self.is_processing:
-                speech_audio = np.array(self.audio_buffer)
-                duration = len(speech_audio) / self.sample_rate
-                
-                if duration >= self.min_speech_duration:
-                    result = self._process_speech_segment(speech_audio)
-                    if result:
-                        self.speech_segments.append(result)
-            
-            self.is_session_active = False
-            self.is_processing = False
-            
-            # 세션 통계
-            segment_count = len(self.speech_segments)
-            total_duration = sum(seg.get('duration', 0) for seg in self.speech_segments)
-            
-            logger.info(f"📊 세션 통계:")
-            logger.info(f"   - 감지된 음성 구간: {segment_count}개")
-            logger.info(f"   - 총 음성 길이: {total_duration:.1f}초")
-            
-            result = {
-                'segments': self.speech_segments.copy(),
-                'total_segments': segment_count,
-                'total_duration': total_duration
-            }
-            
-            self.audio_buffer.clear()
-            self.speech_segments.clear()
-            self.silence_frames = 0
-            self.speech_frames = 0
-            
-            return result
-
-    def add_audio_chunk(self, audio_chunk: np.ndarray) -> Optional[Dict]:
-        """
-        오디오 청크 추가 및 VAD 기반 처리
-        
-        Returns:
-            음성 감지 및 인식 결과 딕셔너리 또는 None
-        """
-        with self.lock:
-            if not self.is_session_active:
-                return None
-            
-            try:
-                # 음성 활동 감지
-                is_speech = self._is_speech(audio_chunk)
-                
-                if is_speech:
-                    # 음성이 감지되면
-                    self.silence_frames = 0
-                    self.speech_frames += 1
-                    
-                    if not self.is_processing:
-                        # 새로운 음성 구간 시작
-                        self.is_processing = True
-                        self.audio_buffer.clear()
-                        logger.info("🗣️ 음성 감지 시작")
-                    
-                    self.audio_buffer.extend(audio_chunk)
-                else:
-                    # 침묵이 감지되면
-                    self.silence_frames += 1
-                    
-                    if self.is_processing:
-                        # 음성 처리 중인 경우 버퍼에 추가 (짧은 침묵 포함)
-                        self.audio_buffer.extend(audio_chunk)
-                        
-                        # 침묵 시간 계산
-                        silence_duration = (self.silence_frames * len(audio_chunk)) / self.sample_rate
-                        
-                        # 충분한 침묵이 감지되면 음성 구간 처리
-                        if silence_duration >= self.silence_duration:
-                            speech_audio = np.array(self.audio_buffer)
-                            duration = len(speech_audio) / self.sample_rate
-                            
-                            if duration >= self.min_speech_duration:
-                                result = self._process_speech_segment(speech_audio)
-                                
-                                if result:
-                                    logger.info(f"✅ 음성 처리 완료 ({duration:.1f}초)")
-                                    self.speech_segments.append(result)
-                                    self.is_processing = False
-                                    self.audio_buffer.clear()
-                                    self.silence_frames = 0
-                                    self.speech_frames = 0
-                                    return result
-                            else:
-                                logger.debug(f"⏭️ 너무 짧은 음성 무시 ({duration:.1f}초)")
-                            
-                            self.is_processing = False
-                            self.audio_buffer.clear()
-                            self.silence_frames = 0
-                            self.speech_frames = 0
-                
-            except Exception as e:
-                logger.error(f"❌ 오디오 처리 중 오류: {e}", exc_info=True)
-                return None
-        
-        return None
-
-    def _process_speech_segment(self, audio_data: np.ndarray) -> Optional[Dict]:
-        """음성 구간 처리 및 인식"""
-        try:
-            duration = len(audio_data) / self.sample_rate
-            
-            # 음성인식 수행
-            stream = self.recognizer.create_stream()
-            stream.accept_waveform(self.sample_rate, audio_data)
-            self.recognizer.decode_stream(stream)
-            result = stream.result
-            
-            text = result.text.strip()
-            
-            if text:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                segment_result = {
-                    'timestamp': timestamp,
-                    'text': text,
-                    'duration': duration,
-                    'confidence': 1.0  # Sherpa-ONNX는 confidence score를 제공하지 않음
-                }
-                
-                logger.info(f"📝 인식 결과: {text}")
-                self.last_result = text
-                
-                return segment_result
-            else:
-                logger.debug("🔇 인식된 텍스트 없음")
-                return None
-        
-        except Exception as e:
-            logger.error(f"❌ 음성 인식 오류: {e}", exc_info=True)
-            return None
-
-    def get_session_status(self) -> Dict:
-        """현재 세션 상태 반환"""
-        with self.lock:
-            return {
-                'is_active': self.is_session_active,
-                'is_processing': self.is_processing,
-                'segments_count': len(self.speech_segments),
-                'last_result': self.last_result
-            }
-
-    def reset(self):
-        """완전 초기화"""
-        with self.lock:
-            logger.info("🔄 VADStreamingProcessor 초기화")
-            self.is_session_active = False
-            self.is_processing = False
-            self.audio_buffer.clear()
-            self.speech_segments.clear()
-            self.last_result = ""
-            self.silence_frames = 0
-            self.speech_frames = 0
+# VADStreamingProcessor 는 asr_engine.vad 모듈에 정의
 
 
 # 기존 StreamingProcessor는 하위 호환성을 위해 유지
@@ -1257,95 +508,49 @@ class StreamingProcessor:
 vad_stream_processor: Optional[VADStreamingProcessor] = None
 stream_processor: Optional[StreamingProcessor] = None
 
+# 🔹 마이크 스트림별 리샘플러 (청크 경계에서 필터 상태 유지)
+_stream_resamplers: Dict[str, StreamingResampler] = {}
 
-# ====================
-# 모델 로딩
-# ====================
-def load_model():
-    """Offline Recognizer 로드"""
-    global recognizer, vad_stream_processor
 
-    logger.info("=" * 60)
-    logger.info("🔄 Sherpa-ONNX Sense-Voice RKNN 모델 로딩 중...")
-    logger.info("📦 모델: sense-voice (zh, en, ja, ko, yue)")
-    logger.info("🖥️ 플랫폼: RK3588 - NPU 최적화")
-    logger.info("=" * 60)
-
-    if not os.path.exists(MODEL_DIR):
-        raise FileNotFoundError(f"모델 디렉토리 없음: {MODEL_DIR}")
+def _resample_stream(stream_key: str, audio_data: np.ndarray, sr: int) -> np.ndarray:
+    """마이크 청크를 16kHz로 연속 리샘플링 (샘플레이트가 바뀌면 새로 생성)"""
+    if sr == 16000:
+        return audio_data
+    resampler = _stream_resamplers.get(stream_key)
+    if resampler is None or resampler.orig_sr != sr:
+        resampler = StreamingResampler(sr, 16000)
+        _stream_resamplers[stream_key] = resampler
+    return resampler.process(audio_data)
 
-    required_files = {
-        "RKNN Model": MODEL_PATH,
-        "Tokens": TOKENS_PATH,
-    }
 
-    logger.info("📁 모델 파일 확인:")
-    for name, path in required_files.items():
-        if os.path.exists(path):
-            size = os.path.getsize(path) / (1024**2)
-            logger.info(f"  ✅ {name}: {os.path.basename(path)} ({size:.2f} MB)")
-        else:
-            raise FileNotFoundError(f"필수 파일 없음: {name}")
+def _reset_stream_resampler(stream_key: str):
+    """새 세션 시작 시 이전 스트림의 필터 상태 제거"""
+    _stream_resamplers.pop(stream_key, None)
 
-    logger.info("⚙️ Offline Recognizer 초기화 중...")
-    try:
-        recognizer = sherpa_onnx.OfflineRecognizer.from_sense_voice(
-            model=MODEL_PATH,
-            tokens=TOKENS_PATH,
-            num_threads=4,
-            provider="rknn",
-            use_itn=True,
-            debug=False,
-        )
-        logger.info("✅ Offline Recognizer 로딩 완료!")
 
-        # 🔧 VAD 기반 스트림 프로세서 생성
-        vad_stream_processor = VADStreamingProcessor(
-            recognizer, 
-            sample_rate=16000,
-            vad_enabled=True  # VAD 활성화
-        )
-        logger.info("✅ VADStreamingProcessor 생성 완료 (VAD 지원)")
+# ====================
+# 모델 로딩
+# ====================
+def load_model():
+    """Offline Recognizer 로드 (asr_engine) + UI용 프로세서 생성"""
+    global recognizer, vad_stream_processor, transcription_cache
 
-    except Exception as e:
-        logger.error(f"❌ Recognizer 로딩 실패: {e}", exc_info=True)
-        raise
+    recognizer = engine_model.load_model()
+    transcription_cache = engine_model.transcription_cache
 
-    logger.info("=" * 60)
-    logger.info("✅ 모델 로딩 완료!")
-    logger.info("=" * 60)
+    # 🔧 VAD 기반 스트림 프로세서 생성
+    vad_stream_processor = VADStreamingProcessor(
+        recognizer,
+        sample_rate=16000,
+        vad_enabled=True  # VAD 활성화
+    )
+    logger.info("✅ VADStreamingProcessor 생성 완료 (VAD 지원)")
 
 
 # ====================
 # 오디오 처리 함수
 # ====================
-def resample_audio(audio_data, orig_sr, target_sr=16000):
-    """오디오 리샘플링"""
-    if orig_sr == target_sr:
-        return audio_data
-
-    try:
-        import librosa
-        return librosa.resample(audio_data, orig_sr=orig_sr, target_sr=target_sr)
-    except ImportError:
-        from scipy import signal
-        num_samples = int(len(audio_data) * target_sr / orig_sr)
-        return signal.resample(audio_data, num_samples)
-
-
-def read_wave(wave_filename: str):
-    """Wave 파일 읽기"""
-    with wave.open(wave_filename) as f:
-        if f.getnchannels() != 1:
-            raise ValueError(f"모노 오디오만 지원. 채널: {f.getnchannels()}")
-        if f.getsampwidth() != 2:
-            raise ValueError(f"16비트 오디오만 지원. 샘플폭: {f.getsampwidth()}")
-
-        num_samples = f.getnframes()
-        samples = f.readframes(num_samples)
-        samples_int16 = np.frombuffer(samples, dtype=np.int16)
-        samples_float32 = samples_int16.astype(np.float32) / 32768.0
-        return samples_float32, f.getframerate()
+# resample_audio / read_wave / load_audio_file 은 audio_io 모듈에 정의
 
 
 # ====================
@@ -1375,6 +580,7 @@ def start_vad_session_handler():
     
     # 세션 시작
     success = vad_stream_processor.start_session()
+    _reset_stream_resampler("vad")
     
     if success:
         session_count = mic_session_recorder.get_session_count()
@@ -1453,7 +659,7 @@ def stop_vad_session_handler(ground_truth_input):
                 result_text += f"    {text}\n\n"
                 
                 # 🚨 응급 상황 체크
-                match_result = matcher.find_best_match(text)
+                match_result = matcher.find_best_match(text, detailed=False)
                 if match_result.get("is_emergency", False):
                     emergency_detected = True
                     emergency_keywords = match_result.get("emergency_keywords", [])
@@ -1534,6 +740,7 @@ def start_recording_handler():
     if stream_processor is not None:
         logger.debug("기존 StreamingProcessor 재사용")
         stream_processor.prepare()
+        _reset_stream_resampler("legacy")
     else:
         # 초기화되지 않은 경우에만 생성 (일반적으로 발생하지 않음)
         logger.warning("StreamingProcessor가 None, 새로 생성")
@@ -1605,7 +812,7 @@ def stop_recording_handler(ground_truth_input):
             timestamp=timestamp
         )
 
-        match_result = matcher.find_best_match(final_text)
+        match_result = matcher.find_best_match(final_text, detailed=False)
         logger.info(f"⏹️ 최종 결과 ({duration:.1f}초): {match_result}")
 
         # 🚨 응급 상황 감지 시 API 호출
@@ -1676,6 +883,7 @@ def auto_start_vad_session():
     
     # 세션 시작
     success = vad_stream_processor.start_session()
+    _reset_stream_resampler("vad")
     
     if success:
         session_count = mic_session_recorder.get_session_count()
@@ -1751,10 +959,6 @@ def process_vad_audio_stream(audio_stream, language):
         elif audio_data.dtype != np.float32:
             audio_data = audio_data.astype(np.float32)
 
-        # 16kHz 리샘플링
-        if sr != 16000:
-            audio_data = resample_audio(audio_data, sr, 16000)
-
         # 프로세서 확인
         if not vad_stream_processor:
             yield ""
@@ -1765,6 +969,7 @@ def process_vad_audio_stream(audio_stream, language):
         if not status['is_active']:
             logger.info("🎤 오디오 스트림 감지 - 자동으로 세션 시작")
             vad_stream_processor.start_session()
+            _reset_stream_resampler("vad")
             clear_vad_chat_history()  # 히스토리 초기화
             
             session_count = mic_session_recorder.get_session_count()
@@ -1776,6 +981,9 @@ def process_vad_audio_stream(audio_stream, language):
             )
             status = vad_stream_processor.get_session_status()
 
+        # 16kHz 리샘플링 (스트리밍 폴리페이즈)
+        audio_data = _resample_stream("vad", audio_data, sr)
+
         # 오디오 청크 처리 (VAD 기반)
         result = vad_stream_processor.add_audio_chunk(audio_data)
         
@@ -1789,7 +997,7 @@ def process_vad_audio_stream(audio_stream, language):
             timestamp = result.get('timestamp', '')
             
             # 🚨 응급 상황 실시간 체크
-            match_result = matcher.find_best_match(text)
+            match_result = matcher.find_best_match(text, detailed=False)
             is_emergency = False
             emergency_keywords = []
             
@@ -1870,9 +1078,9 @@ def collect_and_process_audio(audio_stream, language):
         elif audio_data.dtype != np.float32:
             audio_data = audio_data.astype(np.float32)
 
-        # 16kHz 리샘플링
+        # 16kHz 리샘플링 (스트리밍 폴리페이즈)
         if sr != 16000:
-            audio_data = resample_audio(audio_data, sr, 16000)
+            audio_data = _resample_stream("legacy", audio_data, sr)
             logger.debug(f"리샘플링: {sr}Hz → 16000Hz")
 
         # 프로세서 준비 확인
@@ -1886,7 +1094,7 @@ def collect_and_process_audio(audio_stream, language):
         duration = stream_processor.get_current_duration()
 
         if result_text:
-            match_result = matcher.find_best_match(result_text)
+            match_result = matcher.find_best_match(result_text, detailed=False)
             logger.info(f"🎤 실시간 인식 ({duration:.1f}초): {match_result}")
             
             # 🚨 응급 상황 감지 시 API 호출
@@ -1938,38 +1146,35 @@ def transcribe_file(audio_file, language):
         logger.info(f"⏱️ 파일 처리 시작: {file_path}")
 
         # 파일 읽기
-        try:
-            audio_data, sr = sf.read(file_path)
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
-            samples = audio_data.astype(np.float32)
-            sample_rate = sr
-        except Exception as e1:
-            logger.warning(f"soundfile 실패: {e1}, wave 시도")
-            try:
-                samples, sample_rate = read_wave(file_path)
-            except Exception as e2:
-                raise Exception(f"파일 읽기 실패. soundfile: {e1}, wave: {e2}")
+        samples, sample_rate = read_audio_file(file_path)
+        duration = len(samples) / sample_rate
 
-        # 16kHz 리샘플링
-        if sample_rate != 16000:
-            logger.info(f"🔄 리샘플링: {sample_rate} Hz → 16000 Hz")
-            samples = resample_audio(samples, sample_rate, 16000)
-            sample_rate = 16000
+        # 인식 캐시 확인 (같은 오디오면 리샘플링 / 디코딩 생략)
+        cache_key = None
+        text = None
+        if transcription_cache is not None:
+            cache_key = transcription_cache.key_for(samples, sample_rate)
+            text = transcription_cache.get(cache_key)
 
-        duration = len(samples) / sample_rate
-        logger.info(f"🎤 음성인식 시작 - 길이: {duration:.2f}초")
+        if text is not None:
+            logger.info(f"💾 캐시 적중 - 길이: {duration:.2f}초")
+        else:
+            # 16kHz 리샘플링
+            samples, sample_rate = to_target_rate(samples, sample_rate, 16000)
+            logger.info(f"🎤 음성인식 시작 - 길이: {duration:.2f}초")
 
-        # Offline Recognizer로 처리
-        stream = recognizer.create_stream()
-        stream.accept_waveform(sample_rate, samples)
-        recognizer.decode_stream(stream)
-        result = stream.result
+            # Offline Recognizer로 처리
+            stream = recognizer.create_stream()
+            stream.accept_waveform(sample_rate, samples)
+            recognizer.decode_stream(stream)
+            result = stream.result
 
-        text = result.text.strip()
+            text = result.text.strip()
+            if cache_key is not None:
+                transcription_cache.put(cache_key, text)
 
-        # 정답 매칭
-        match_result = matcher.find_best_match(text)
+        # 정답 매칭 (평가 수집기에 기록)
+        match_result = matcher.evaluate(text)
 
         if not text:
             text = "⚠️ 음성을 인식하지 못했습니다."
@@ -1988,6 +1193,52 @@ def transcribe_file(audio_file, language):
         return f"❌ 오류: {str(e)}"
 
 
+# 이 길이(초)를 넘는 파일은 블록 읽기 + VAD 구간 단위로 스트리밍 인식
+LONG_FILE_SECONDS = float(os.getenv("ASR_LONG_FILE_SECONDS", "60"))
+
+
+def transcribe_file_streaming(audio_file, language):
+    """
+    파일 업로드 음성인식 (긴 파일은 구간별 스트리밍)
+
+    짧은 파일은 transcribe_file 과 같고, 긴 파일은 전체를 메모리에 올리지 않고
+    음성 구간이 인식될 때마다 타임스탬프와 함께 결과를 누적 표시합니다.
+    """
+    file_path = _resolve_file_path(audio_file) if audio_file is not None else None
+    duration = audio_duration(file_path) if file_path and os.path.exists(file_path) else None
+
+    if duration is None or duration <= LONG_FILE_SECONDS:
+        yield transcribe_file(audio_file, language)
+        return
+
+    logger.info(f"📼 긴 파일 스트리밍 인식 시작: {file_path} ({duration:.1f}초)")
+    start_time = time.time()
+    lines = []
+    try:
+        file_recognizer = StreamingFileRecognizer(recognizer)
+        for segment in file_recognizer.transcribe(file_path):
+            if not segment["text"]:
+                continue
+
+            match_result = matcher.find_best_match(segment["text"], detailed=False)
+            prefix = "🚨 " if match_result.get("is_emergency") else ""
+            lines.append(
+                f"[{format_timestamp(segment['start'])} → {format_timestamp(segment['end'])}] "
+                f"{prefix}{segment['text']}"
+            )
+            progress = min(segment["end"] / duration, 1.0)
+            yield f"⏳ 인식 중... {progress:.0%}\n\n" + "\n".join(lines)
+
+        total_time = time.time() - start_time
+        logger.info(f"⏱️ 스트리밍 인식 완료: {len(lines)}개 구간, {total_time:.2f}초")
+        body = "\n".join(lines) if lines else "⚠️ 음성을 인식하지 못했습니다."
+        yield f"✅ 변환 완료 ({format_timestamp(duration)}, {len(lines)}개 구간)\n\n" + body
+
+    except Exception as e:
+        logger.error(f"파일 처리 오류: {e}", exc_info=True)
+        yield f"❌ 오류: {str(e)}"
+
+
 # ====================
 # 🔹 배치 처리 (CSV 생성 기능 통합)
 # ====================
@@ -1998,80 +1249,77 @@ batch_results_storage = {
     "asr_results": []
 }
 
+# 배치 파이프라인 설정
+BATCH_PIPELINE_CONFIG = {
+    "num_readers": int(os.getenv("ASR_BATCH_READERS", "4")),   # 파일 읽기 / 리샘플링 스레드
+    "batch_size": int(os.getenv("ASR_BATCH_SIZE", "8")),       # decode_streams 배치 크기
+    "queue_size": int(os.getenv("ASR_BATCH_QUEUE", "16")),     # 디코딩 대기 큐 (메모리 상한)
+}
 
-def batch_transcribe(files, language):
-    """배치 파일 처리"""
-    global batch_results_storage
-
-    if not files:
-        return "⚠️ 파일을 업로드해주세요."
 
-    # 결과 초기화
-    batch_results_storage = {
-        "file_names": [],
-        "ground_truths": [],
-        "asr_results": []
-    }
+def _format_batch_item(item: Dict) -> str:
+    """배치 결과 1건 표시 문자열"""
+    if item["error"]:
+        return f"📁 **{item['file_name']}**\n❌ 오류: {item['error']}\n"
+    return f"📁 **{item['file_name']}**\n{item['text'] or '(음성 인식 실패)'}\n"
 
-    results = []
-    total = len(files)
 
-    for idx, file in enumerate(files, 1):
-        try:
-            file_path = _resolve_file_path(file)
-            file_name = os.path.basename(file_path)
-            logger.info(f"[{idx}/{total}] 처리 중: {file_name}")
+def batch_transcribe(files, language):
+    """
+    배치 파일 처리 (파이프라인)
 
-            # 파일 읽기
-            try:
-                audio_data, sr = sf.read(file_path)
-                if len(audio_data.shape) > 1:
-                    audio_data = np.mean(audio_data, axis=1)
-                samples = audio_data.astype(np.float32)
-                sample_rate = sr
-            except Exception:
-                try:
-                    samples, sample_rate = read_wave(file_path)
-                except Exception as e:
-                    raise Exception(f"파일 읽기 실패: {e}")
-
-            if sample_rate != 16000:
-                samples = resample_audio(samples, sample_rate, 16000)
-                sample_rate = 16000
-
-            # Offline 처리
-            stream = recognizer.create_stream()
-            stream.accept_waveform(sample_rate, samples)
-            recognizer.decode_stream(stream)
-            result = stream.result
-            text = result.text.strip()
+    리더 풀 / 배치 디코딩 / 매칭 단계를 겹쳐 실행하고
+    파일이 완료될 때마다 진행 상황을 갱신합니다 (Gradio 제너레이터 출력).
+    """
+    global batch_results_storage
 
-            # 정답 매칭
-            match_result = matcher.find_best_match(text)
-            best_match = match_result.get("best_match", "")
+    if not files:
+        yield "⚠️ 파일을 업로드해주세요."
+        return
 
-            if not text:
-                text = "(음성 인식 실패)"
+    paths = [_resolve_file_path(file) for file in files]
+    total = len(paths)
 
-            # 결과 저장
-            batch_results_storage["file_names"].append(file_name)
-            batch_results_storage["ground_truths"].append(best_match)
-            batch_results_storage["asr_results"].append(text)
+    pipeline = BatchTranscriptionPipeline(
+        recognizer,
+        scorer=matcher.evaluate,
+        num_readers=BATCH_PIPELINE_CONFIG["num_readers"],
+        batch_size=BATCH_PIPELINE_CONFIG["batch_size"],
+        queue_size=BATCH_PIPELINE_CONFIG["queue_size"],
+        cache=transcription_cache,
+    )
 
-            results.append(f"📁 **{file_name}**\n{text}\n")
-            logger.info(f"📁 **{file_name}**\n{match_result}\n")
+    completed: List[Dict] = []
+    for item in pipeline.run(paths):
+        completed.append(item)
+        if item["error"]:
+            logger.error(f"파일 처리 실패: {item['file_name']} - {item['error']}")
+        else:
+            logger.info(f"[{len(completed)}/{total}] 📁 **{item['file_name']}**\n{item.get('match')}\n")
 
-        except Exception as e:
-            results.append(f"📁 **{file_name}**\n❌ 오류: {str(e)}\n")
-            logger.error(f"파일 처리 실패: {file_name} - {e}")
+        yield f"⏳ 처리 중... {len(completed)}/{total}\n\n" + "\n".join(
+            _format_batch_item(done) for done in completed
+        )
 
-            # 오류 발생 시에도 저장
-            batch_results_storage["file_names"].append(file_name)
-            batch_results_storage["ground_truths"].append("")
-            batch_results_storage["asr_results"].append(f"ERROR: {str(e)}")
+    # 입력 순서대로 결과 저장
+    completed.sort(key=lambda done: done["index"])
+    batch_results_storage = {
+        "file_names": [done["file_name"] for done in completed],
+        "ground_truths": [(done.get("match") or {}).get("best_match", "") for done in completed],
+        "asr_results": [
+            f"ERROR: {done['error']}" if done["error"] else (done["text"] or "(음성 인식 실패)")
+            for done in completed
+        ],
+    }
 
-    output = f"✅ 총 {total}개 파일 처리 완료\n\n" + "\n".join(results)
-    return output
+    stats = pipeline.summary()
+    header = f"✅ 총 {total}개 파일 처리 완료 ({stats['elapsed']:.1f}초"
+    if stats["rtf"] is not None:
+        header += f", RTF {stats['rtf']:.3f}"
+    if stats["cache_hit_rate"] is not None:
+        header += f", 캐시 적중률 {stats['cache_hit_rate']:.0%} ({stats['cache_hits']}/{total})"
+    header += ")\n\n"
+    yield header + "\n".join(_format_batch_item(done) for done in completed)
 
 
 def generate_batch_csv_handler():
@@ -2394,7 +1642,7 @@ def create_ui():
                         )
 
                 transcribe_btn.click(
-                    fn=transcribe_file,
+                    fn=transcribe_file_streaming,
                     inputs=[audio_file, language_file],
                     outputs=output_file,
                 )
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+긴 오디오 파일 스트리밍 인식
+
+🎯 기능:
+1. 파일을 블록 단위로 읽기 (soundfile 블록 읽기, 실패 시 wave 모듈)
+2. 블록마다 StreamingResampler 로 16kHz 변환 (청크 경계 왜곡 없음)
+3. 에너지 기반 VAD 로 음성 구간 분할 (VADStreamingProcessor 와 같은 기본값)
+4. 구간이 끝날 때마다 디코딩하여 파일 기준 타임스탬프와 함께 결과 전달
+
+메모리는 파일 길이와 무관하게 블록 1개 + 최대 구간 길이(max_segment_seconds)로 제한됩니다.
+
+CLI 실행:
+    python file_streaming.py long_recording.wav
+"""
+
+import os
+import sys
+import wave
+import logging
+import argparse
+from typing import List, Dict, Optional, Iterator, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from asr_engine.resampler import StreamingResampler
+
+logger = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE = 16000
+
+
+def iter_audio_blocks(file_path: str, block_seconds: float = 1.0) -> Iterator[Tuple[np.ndarray, int]]:
+    """
+    오디오 파일을 블록 단위로 읽기 (모노 float32)
+
+    Yields:
+        (블록 샘플, 원본 샘플레이트)
+    """
+    try:
+        sound_file = sf.SoundFile(file_path)
+    except RuntimeError as e:
+        logger.warning(f"soundfile 열기 실패: {e}, wave 시도")
+    else:
+        with sound_file as f:
+            sr = f.samplerate
+            blocksize = max(1, int(sr * block_seconds))
+            for block in f.blocks(blocksize=blocksize, dtype="float32", always_2d=True):
+                yield block.mean(axis=1) if block.shape[1] > 1 else block[:, 0], sr
+        return
+
+    with wave.open(file_path) as f:
+        if f.getsampwidth() != 2:
+            raise ValueError(f"16비트 오디오만 지원. 샘플폭: {f.getsampwidth()}")
+        sr = f.getframerate()
+        channels = f.getnchannels()
+        blocksize = max(1, int(sr * block_seconds))
+        while True:
+            frames = f.readframes(blocksize)
+            if not frames:
+                break
+            block = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+            if channels > 1:
+                block = block.reshape(-1, channels).mean(axis=1)
+            yield block, sr
+
+
+class EnergyVADSegmenter:
+    """
+    에너지 기반 음성 구간 분할기 (파일 샘플 위치 추적)
+
+    프레임 RMS 가 임계값을 넘으면 구간 시작, silence_duration 이상 침묵이면 구간 종료.
+    max_segment_seconds 를 넘는 구간은 강제로 잘라 메모리와 모델 입력 길이를 제한합니다.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+        energy_threshold: float = 0.01,
+        silence_duration: float = 1.5,
+        min_speech_duration: float = 0.5,
+        max_segment_seconds: float = 25.0,
+        frame_seconds: float = 0.1,
+    ):
+        self.sample_rate = sample_rate
+        self.energy_threshold = energy_threshold
+        self.silence_samples = int(silence_duration * sample_rate)
+        self.min_speech_samples = int(min_speech_duration * sample_rate)
+        self.max_segment_samples = int(max_segment_seconds * sample_rate)
+        self.frame_samples = max(1, int(frame_seconds * sample_rate))
+
+        self._pending = np.zeros(0, dtype=np.float32)  # 프레임 미만 잔여 샘플
+        self._position = 0                              # 다음 프레임의 시작 샘플 위치
+        self._segment: List[np.ndarray] = []
+        self._segment_start = 0
+        self._segment_samples = 0
+        self._silence = 0
+
+    def _close_segment(self) -> Optional[Dict]:
+        samples = self._segment_samples
+        segment = None
+        if samples >= self.min_speech_samples:
+            segment = {
+                "start": self._segment_start / self.sample_rate,
+                "end": (self._segment_start + samples) / self.sample_rate,
+                "audio": np.concatenate(self._segment),
+            }
+        self._segment = []
+        self._segment_samples = 0
+        self._silence = 0
+        return segment
+
+    def feed(self, audio: np.ndarray) -> List[Dict]:
+        """
+        샘플 추가
+
+        Returns:
+            완료된 구간 목록 [{"start", "end", "audio"}]
+        """
+        audio = np.concatenate([self._pending, audio]) if len(self._pending) else audio
+        n_frames = len(audio) // self.frame_samples
+        self._pending = audio[n_frames * self.frame_samples:]
+
+        segments = []
+        for i in range(n_frames):
+            frame = audio[i * self.frame_samples:(i + 1) * self.frame_samples]
+            is_speech = float(np.sqrt(np.mean(frame ** 2))) > self.energy_threshold
+
+            if self._segment:
+                self._segment.append(frame)
+                self._segment_samples += len(frame)
+                self._silence = 0 if is_speech else self._silence + len(frame)
+
+                if self._silence >= self.silence_samples or self._segment_samples >= self.max_segment_samples:
+                    segment = self._close_segment()
+                    if segment:
+                        segments.append(segment)
+            elif is_speech:
+                self._segment = [frame]
+                self._segment_start = self._position
+                self._segment_samples = len(frame)
+                self._silence = 0
+
+            self._position += len(frame)
+
+        return segments
+
+    def flush(self) -> List[Dict]:
+        """파일 끝: 진행 중인 구간 마무리"""
+        if len(self._pending):
+            if self._segment:
+                self._segment.append(self._pending)
+                self._segment_samples += len(self._pending)
+            self._position += len(self._pending)
+            self._pending = np.zeros(0, dtype=np.float32)
+        if not self._segment:
+            return []
+        segment = self._close_segment()
+        return [segment] if segment else []
+
+
+class StreamingFileRecognizer:
+    """블록 읽기 → 리샘플링 → VAD 분할 → 구간별 디코딩"""
+
+    def __init__(
+        self,
+        recognizer,
+        block_seconds: float = 1.0,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+        **vad_options,
+    ):
+        """
+        Args:
+            recognizer: sherpa_onnx.OfflineRecognizer
+            block_seconds: 파일 읽기 블록 길이 (초)
+            vad_options: EnergyVADSegmenter 옵션
+        """
+        self.recognizer = recognizer
+        self.block_seconds = block_seconds
+        self.sample_rate = sample_rate
+        self.vad_options = vad_options
+
+    def _decode(self, segment: Dict) -> Dict:
+        stream = self.recognizer.create_stream()
+        stream.accept_waveform(self.sample_rate, segment["audio"])
+        self.recognizer.decode_stream(stream)
+        return {
+            "start": segment["start"],
+            "end": segment["end"],
+            "duration": segment["end"] - segment["start"],
+            "text": stream.result.text.strip(),
+        }
+
+    def transcribe(self, file_path: str) -> Iterator[Dict]:
+        """
+        파일 스트리밍 인식
+
+        Yields:
+            음성 구간별 {"start", "end", "duration", "text"} (초 단위, 파일 기준)
+        """
+        segmenter = EnergyVADSegmenter(sample_rate=self.sample_rate, **self.vad_options)
+        resampler = None
+
+        for block, sr in iter_audio_blocks(file_path, self.block_seconds):
+            if sr != self.sample_rate:
+                if resampler is None:
+                    resampler = StreamingResampler(sr, self.sample_rate)
+                block = resampler.process(block)
+            for segment in segmenter.feed(block):
+                yield self._decode(segment)
+
+        tail = segmenter.feed(resampler.flush()) if resampler is not None else []
+        for segment in tail + segmenter.flush():
+            yield self._decode(segment)
+
+
+def audio_duration(file_path: str) -> Optional[float]:
+    """파일 전체를 읽지 않고 길이(초) 확인"""
+    try:
+        info = sf.info(file_path)
+        return info.frames / info.samplerate
+    except RuntimeError:
+        try:
+            with wave.open(file_path) as f:
+                return f.getnframes() / f.getframerate()
+        except Exception:
+            return None
+
+
+def format_timestamp(seconds: float) -> str:
+    """초 → HH:MM:SS.s"""
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{int(hours):02d}:{int(minutes):02d}:{secs:04.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="긴 오디오 파일 스트리밍 인식")
+    parser.add_argument("file", help="오디오 파일 경로")
+    parser.add_argument("--block-seconds", type=float, default=1.0, help="파일 읽기 블록 길이 (초)")
+    parser.add_argument("--max-segment", type=float, default=25.0, help="최대 구간 길이 (초)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file):
+        logger.error(f"❌ 파일 없음: {args.file}")
+        return 1
+
+    from asr_engine import model as engine_model
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    file_recognizer = StreamingFileRecognizer(
+        engine_model.load_model(),
+        block_seconds=args.block_seconds,
+        max_segment_seconds=args.max_segment,
+    )
+
+    for result in file_recognizer.transcribe(args.file):
+        if result["text"]:
+            print(f"[{format_timestamp(result['start'])} → {format_timestamp(result['end'])}] {result['text']}")
+            sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
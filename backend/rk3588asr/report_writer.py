@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 CER 리포트 작성기
+
+🎯 기능:
+1. 입력 행을 청크 단위로 나눠 워커 풀에서 CER 계산
+   (직접 CER은 cer_engine 배치 API, jiwer CER은 행 단위)
+2. 계산이 끝난 청크부터 입력 순서대로 CSV에 바로 기록 (전체 행을 메모리에 쌓지 않음)
+3. 한 번의 순회로 요약 행 계산: Corpus CER, S/D/I/N 합계, 라벨별 분석
+4. 선택적으로 Parquet / Arrow(Feather) 컬럼 포맷 동시 출력 (pyarrow 설치 시)
+
+요약 행은 같은 헤더를 사용하고 첫 번째 컬럼에 "[TOTAL] (N건)", "[LABEL] <라벨> (N건)" 을 기록합니다.
+"""
+
+import csv
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Optional, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# pyarrow는 선택적 의존성으로 처리
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.ipc as pa_ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    PYARROW_AVAILABLE = False
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+CER_FIELDS = [
+    "cer_direct", "S_direct", "D_direct", "I_direct", "N_direct",
+    "cer_jiwer", "S_jiwer", "D_jiwer", "I_jiwer", "N_jiwer",
+]
+_COUNT_KEYS = ("S", "D", "I", "N")
+
+
+def _chunks(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Totals:
+    """S/D/I/N 누적"""
+
+    def __init__(self):
+        self.count = 0
+        self.direct = dict.fromkeys(_COUNT_KEYS, 0)
+        self.jiwer = dict.fromkeys(_COUNT_KEYS, 0)
+        self.jiwer_count = 0
+        self.cer_sum = 0.0
+
+    def add(self, row: Dict):
+        self.count += 1
+        self.cer_sum += row["cer_direct"]
+        for key in _COUNT_KEYS:
+            self.direct[key] += row[f"{key}_direct"]
+        if row["cer_jiwer"] is not None:
+            self.jiwer_count += 1
+            for key in _COUNT_KEYS:
+                self.jiwer[key] += row[f"{key}_jiwer"]
+
+    @staticmethod
+    def _corpus_cer(counts: Dict[str, int]) -> float:
+        return (counts["S"] + counts["D"] + counts["I"]) / counts["N"] if counts["N"] else 0.0
+
+    def summary_row(self) -> Dict:
+        row = {
+            "cer_direct": self._corpus_cer(self.direct),
+            **{f"{key}_direct": value for key, value in self.direct.items()},
+            "cer_jiwer": None,
+            **{f"{key}_jiwer": None for key in _COUNT_KEYS},
+        }
+        if self.jiwer_count:
+            row["cer_jiwer"] = self._corpus_cer(self.jiwer)
+            row.update({f"{key}_jiwer": value for key, value in self.jiwer.items()})
+        return row
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "corpus_cer": self._corpus_cer(self.direct),
+            "mean_cer": self.cer_sum / self.count if self.count else None,
+            "totals": dict(self.direct),
+            "corpus_cer_jiwer": self._corpus_cer(self.jiwer) if self.jiwer_count else None,
+        }
+
+
+class _ColumnarSink:
+    """Parquet / Arrow IPC 증분 기록 (청크 = row group / record batch)"""
+
+    def __init__(self, path: str, fmt: str, fieldnames: List[str]):
+        self.path = path
+        self.fmt = fmt
+        self.fieldnames = fieldnames
+        self.writer = None
+        self._sink = None
+
+    def _schema(self):
+        fields = []
+        for name in self.fieldnames:
+            if name.startswith(("cer_", "duration")):
+                fields.append(pa.field(name, pa.float64()))
+            elif name[:2] in ("S_", "D_", "I_", "N_"):
+                fields.append(pa.field(name, pa.int64()))
+            else:
+                fields.append(pa.field(name, pa.string()))
+        return pa.schema(fields)
+
+    def write(self, rows: List[Dict]):
+        if self.writer is None:
+            schema = self._schema()
+            if self.fmt == "parquet":
+                self.writer = pq.ParquetWriter(self.path, schema)
+            else:
+                self._sink = pa.OSFile(self.path, "wb")
+                self.writer = pa_ipc.new_file(self._sink, schema)
+            self.schema = schema
+
+        columns = {}
+        for field in self.schema:
+            values = [row.get(field.name) for row in rows]
+            if pa.types.is_string(field.type):
+                values = [None if v is None else str(v) for v in values]
+            columns[field.name] = values
+        self.writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+
+def _format_csv_row(row: Dict) -> Dict:
+    formatted = dict(row)
+    for key in ("cer_direct", "cer_jiwer"):
+        value = row.get(key)
+        formatted[key] = f"{value:.4f}" if value is not None else ""
+    for key in CER_FIELDS:
+        if formatted.get(key) is None:
+            formatted[key] = ""
+    if isinstance(row.get("duration_sec"), float):
+        formatted["duration_sec"] = f"{row['duration_sec']:.2f}"
+    return formatted
+
+
+def write_cer_report(
+    rows: Iterable[Dict],
+    output_csv_path: str,
+    base_fields: List[str],
+    matcher,
+    chunk_size: int = 256,
+    max_workers: int = 2,
+    columnar_format: Optional[str] = None,
+) -> Dict:
+    """
+    CER 리포트 스트리밍 작성
+
+    Args:
+        rows: 입력 행 (base_fields + "ground_truth", "asr", 선택적 "label")
+        output_csv_path: CSV 경로
+        base_fields: CER 컬럼 앞에 기록할 컬럼 (첫 번째 컬럼에 요약 표시)
+        matcher: SpeechRecognitionMatcher 객체 (cer_direct_batch / cer_jiwer 사용)
+        chunk_size: 워커 1회 처리 행 수
+        max_workers: CER 계산 워커 수
+        columnar_format: "parquet" / "arrow" / None
+
+    Returns:
+        {"csv_path", "columnar_path", "rows", "overall", "labels"}
+    """
+    header = list(base_fields) + CER_FIELDS
+    if "label" not in header:
+        header.append("label")
+    key_field = base_fields[0]
+    use_jiwer = getattr(matcher, "jiwer_available", False)
+
+    def score_chunk(chunk: List[Dict]) -> List[Dict]:
+        pairs = [(row.get("asr", ""), row.get("ground_truth", "")) for row in chunk]
+        directs = matcher.cer_direct_batch(pairs)
+        scored = []
+        for row, (asr, gt), direct in zip(chunk, pairs, directs):
+            jiwer_data = matcher.cer_jiwer(asr, gt) if use_jiwer else None
+            out = {field: row.get(field, "") for field in header if field not in CER_FIELDS}
+            out["label"] = row.get("label") or "unknown"
+            out["cer_direct"] = direct["CER"]
+            for key in _COUNT_KEYS:
+                out[f"{key}_direct"] = direct[key]
+                out[f"{key}_jiwer"] = jiwer_data[key] if jiwer_data else None
+            out["cer_jiwer"] = jiwer_data["CER"] if jiwer_data else None
+            scored.append(out)
+        return scored
+
+    columnar = None
+    columnar_path = None
+    if columnar_format:
+        if columnar_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"지원하지 않는 포맷: {columnar_format} (가능: {COLUMNAR_FORMATS})")
+        if PYARROW_AVAILABLE:
+            ext = ".parquet" if columnar_format == "parquet" else ".arrow"
+            columnar_path = output_csv_path.rsplit(".", 1)[0] + ext
+            columnar = _ColumnarSink(columnar_path, columnar_format, header)
+        else:
+            logger.warning("⚠️ pyarrow가 없어 컬럼 포맷 출력을 건너뜁니다. `pip install pyarrow`")
+
+    overall = _Totals()
+    per_label: Dict[str, _Totals] = {}
+
+    with open(output_csv_path, "w", newline="", encoding="utf-8-sig") as f, \
+            ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        writer = csv.DictWriter(f, fieldnames=header)
+        writer.writeheader()
+
+        # 진행 중인 청크 수를 제한해 메모리 상한 유지 (결과는 입력 순서대로 기록)
+        in_flight = deque()
+        chunk_iter = _chunks(rows, chunk_size)
+
+        def _drain_one():
+            scored = in_flight.popleft().result()
+            for row in scored:
+                overall.add(row)
+                per_label.setdefault(row["label"], _Totals()).add(row)
+                writer.writerow(_format_csv_row(row))
+            if columnar is not None:
+                columnar.write(scored)
+
+        try:
+            for chunk in chunk_iter:
+                in_flight.append(executor.submit(score_chunk, chunk))
+                if len(in_flight) >= max_workers * 2:
+                    _drain_one()
+            while in_flight:
+                _drain_one()
+        finally:
+            if columnar is not None:
+                columnar.close()
+
+        # 요약 행
+        if overall.count:
+            writer.writerow({})
+            summary_rows = [("[TOTAL]", "", overall)] + [
+                (f"[LABEL] {label}", label, totals) for label, totals in sorted(per_label.items())
+            ]
+            for name, label, totals in summary_rows:
+                row = {key_field: f"{name} ({totals.count}건)", "label": label, **totals.summary_row()}
+                writer.writerow(_format_csv_row(row))
+
+    return {
+        "csv_path": output_csv_path,
+        "columnar_path": columnar_path,
+        "rows": overall.count,
+        "overall": overall.to_dict(),
+        "labels": {label: totals.to_dict() for label, totals in per_label.items()},
+    }
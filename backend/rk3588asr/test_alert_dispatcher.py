@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+응급 알림 디스패처 테스트 스크립트 (로컬 스텁 HTTP 서버)
+
+스텁 서버를 띄우고 EMERGENCY_API_CONFIG 와 같은 형식의 엔드포인트 2개(json / multipart)로
+알림을 보내 다음을 확인합니다.
+- send 호출이 즉시 반환되는지 (응답 지연과 무관)
+- 모든 엔드포인트로 전송되는지 (fan-out)
+- 503 응답 후 재시도로 전송되는지
+- 같은 장비 + 키워드 반복 알림이 억제되는지
+- 모든 엔드포인트 전송이 실패하면 억제가 풀려 다음 알림이 다시 전송되는지
+
+사용법:
+    python test_alert_dispatcher.py --delay 0.5 --fail-first 2
+"""
+
+import time
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from asr_engine.alerts import AlertDispatcher
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """응급 API 스텁: delay 초 후 응답, 경로별 처음 fail_first 건은 503"""
+
+    delay = 0.0
+    fail_first = 0
+    received = Counter()
+    lock = threading.Lock()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        path = self.path.split("?")[0]
+
+        with self.lock:
+            self.received[path] += 1
+            count = self.received[path]
+
+        time.sleep(self.delay)
+        status = 503 if count <= self.fail_first else 200
+        body = b'{"ok": true}' if status == 200 else b'{"error": "unavailable"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응급 알림 디스패처 테스트")
+    parser.add_argument("--delay", type=float, default=0.5, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument("--fail-first", type=int, default=2, help="엔드포인트별 처음 N건 503 응답")
+    parser.add_argument("--repeat", type=int, default=20, help="장비별 반복 알림 수")
+    args = parser.parse_args()
+
+    StubHandler.delay = args.delay
+    StubHandler.fail_first = args.fail_first
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"🧪 스텁 서버: {base_url} (지연 {args.delay}초, 처음 {args.fail_first}건 503)")
+
+    config = {
+        "enabled": True,
+        "api_endpoints": [
+            {"name": "stub-json", "url": f"{base_url}/api/emergency/quick", "enabled": True, "type": "json"},
+            {"name": "stub-multipart", "url": f"{base_url}/api/emergency/quick/{{watchId}}",
+             "enabled": True, "type": "multipart"},
+        ],
+        "watch_id": "watch_test",
+        "sender_id": "voice_asr_test",
+        "include_image_url": False,
+    }
+    dispatcher = AlertDispatcher(config, backoff_seconds=0.1, suppress_seconds=30)
+
+    # 장비 2대가 같은 키워드로 repeat 번씩, 장비 1대는 새 키워드 1번
+    calls = [("device_a", ["도와줘"])] * args.repeat + [("device_b", ["도와줘"])] * args.repeat
+    calls.append(("device_a", ["불이야"]))
+
+    start = time.perf_counter()
+    scheduled = sum(dispatcher.submit("도와줘 사람이 쓰러졌어", keywords, device) for device, keywords in calls)
+    submit_ms = (time.perf_counter() - start) * 1000 / len(calls)
+
+    dispatcher.close(wait=True)
+    elapsed = time.perf_counter() - start
+
+    stats = dispatcher.stats()
+    print(f"\n📤 알림 호출 {len(calls)}건 → 전송 예약 {scheduled}건, 억제 {stats['suppressed']}건")
+    print(f"⏱️ 호출당 평균 {submit_ms:.2f}ms (응답 지연 {args.delay * 1000:.0f}ms 와 무관)")
+    print(f"📬 스텁 수신: {dict(StubHandler.received)}")
+    print(f"✅ 전송 성공 {stats['delivered']}, 실패 {stats['failed']}, 재시도 {stats['retries']} "
+          f"(전체 {elapsed:.2f}초)")
+
+    expected = 3 * len(config["api_endpoints"])
+    ok = scheduled == 3 and stats["delivered"] == expected and stats["failed"] == 0
+
+    # 전송 실패: 모든 엔드포인트가 계속 503 → 같은 장비 + 키워드의 다음 알림도 억제되지 않아야 함
+    StubHandler.delay = 0.0
+    StubHandler.fail_first = 10 ** 9
+    failing = AlertDispatcher(config, max_retries=1, backoff_seconds=0.05, suppress_seconds=30)
+    first = failing.submit("도와줘", ["도와줘"], "device_c")
+    failing.close(wait=True)
+    second = failing.submit("도와줘", ["도와줘"], "device_c")
+    failing.close(wait=True)
+    server.shutdown()
+
+    failing_stats = failing.stats()
+    print(f"\n🚫 전송 실패 후 재알림: 첫 알림 예약 {first}, 두 번째 알림 예약 {second} "
+          f"(실패 {failing_stats['failed']}, 억제 {failing_stats['suppressed']})")
+    ok = ok and first and second and failing_stats["suppressed"] == 0
+
+    print("🎉 통과" if ok else "❌ 실패")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Recognizer 풀 / 레지스트리 테스트 스크립트 (모델 없이 가짜 recognizer 사용)
+
+가짜 recognizer 는 decode_stream 에서 --decode-ms 만큼 잠들어 (GIL 해제) 디코딩을 흉내냅니다.
+다음을 확인합니다.
+- 레지스트리: 세션이 잡고 있는 언어 풀은 상주 상한을 넘어도 언로드되지 않고,
+  다시 요청해도 한 벌 더 로드하지 않으며, 마지막 세션이 반환할 때 언로드되는지
+- API 서버: 두 세션이 동시에 음성 구간을 끝내면 풀 크기 2 에서는 디코딩이 병렬로 실행되고
+  (풀 크기 1 대비 소요 시간), 디코딩 / 언어별 모델 로드 중에도 이벤트 루프가 멈추지 않는지
+
+사용법:
+    python test_recognizer_pool.py --decode-ms 300
+"""
+
+import time
+import asyncio
+import argparse
+
+import numpy as np
+
+from asr_engine import model as engine_model
+from asr_engine.recognizer_pool import RecognizerPool, RecognizerRegistry
+
+SAMPLE_RATE = 16000
+CHUNK_SECONDS = 0.5
+
+
+class FakeResult:
+    text = "안녕하세요"  # 응급 키워드가 아닌 문장 (알림 전송 없음)
+
+
+class FakeStream:
+    result = FakeResult()
+
+    def accept_waveform(self, sample_rate, samples):
+        pass
+
+
+class FakeRecognizer:
+    """decode_stream 이 delay 초 걸리는 recognizer"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def create_stream(self):
+        return FakeStream()
+
+    def decode_stream(self, stream):
+        time.sleep(self.delay)
+
+
+def fake_pool(name: str, size: int, delay: float, load_seconds: float = 0.0) -> RecognizerPool:
+    time.sleep(load_seconds)
+    return RecognizerPool(lambda: FakeRecognizer(delay), size=size, name=name, warmup=False)
+
+
+def check(failures, ok: bool, message: str):
+    print(f"  {'✅' if ok else '❌'} {message}")
+    if not ok:
+        failures.append(message)
+
+
+def test_registry(failures):
+    print("\n[레지스트리] 상주 상한 2 (기본 풀 고정)")
+    loaded = []
+
+    def loader(key):
+        loaded.append(key)
+        return fake_pool(key, 1, 0.0)
+
+    registry = RecognizerRegistry(loader, max_resident=2, pinned="auto")
+    registry.add("auto", fake_pool("auto", 1, 0.0))
+
+    ko = registry.acquire("ko")
+    registry.acquire("en")
+    check(failures, registry.keys() == ["auto", "ko", "en"],
+          f"사용 중인 풀은 상한을 넘어도 유지: {registry.keys()}")
+    check(failures, registry.acquire("ko") is ko and loaded.count("ko") == 1,
+          "사용 중인 풀을 다시 요청하면 같은 풀 (추가 로드 없음)")
+
+    registry.release("ko")
+    check(failures, "ko" in registry.keys(), "다른 세션이 아직 잡고 있으면 유지")
+    registry.release("ko")
+    check(failures, registry.keys() == ["auto", "en"],
+          f"마지막 세션이 반환하면 언로드: {registry.keys()}")
+
+    registry.release("en")
+    registry.get("ja")
+    check(failures, registry.keys() == ["auto", "ja"] and registry.unloads == 2,
+          f"사용 중이 아닌 풀은 LRU 언로드: {registry.keys()}")
+    check(failures, registry.stats()["resident"] == 2, "상주 수가 상한으로 복귀")
+
+
+async def feed_utterance(session):
+    """1초 음성 + 침묵으로 음성 구간 1개를 끝내고 인식 결과 반환"""
+    samples = int(SAMPLE_RATE * CHUNK_SECONDS)
+    speech = (0.1 * np.sin(np.arange(samples) / 5)).astype(np.float32)
+    silence = np.zeros(samples, dtype=np.float32)
+    result = None
+    for chunk in [speech, speech] + [silence] * 3:
+        result = await session.process_audio_chunk(chunk) or result
+    return result
+
+
+async def max_loop_gap(stop: asyncio.Event) -> float:
+    """이벤트 루프가 멈춘 최대 시간 (초)"""
+    gap = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.01)
+        now = time.perf_counter()
+        gap = max(gap, now - last - 0.01)
+        last = now
+    return gap
+
+
+async def run_sessions(server, pool_size: int, delay: float):
+    """풀 크기 pool_size 로 두 세션을 동시에 디코딩, (소요 초, 결과 수, 루프 최대 멈춤 초)"""
+    engine_model.recognizer = fake_pool("auto", pool_size, delay)
+    engine_model.registry = RecognizerRegistry(lambda key: fake_pool(key, 1, delay), pinned="auto")
+    engine_model.registry.add("auto", engine_model.recognizer)
+
+    sessions = [server.session_manager.create_session(device_id=f"dev{i}") for i in range(2)]
+    for session in sessions:
+        session.start()
+
+    stop = asyncio.Event()
+    gap_task = asyncio.create_task(max_loop_gap(stop))
+    start = time.perf_counter()
+    results = await asyncio.gather(*(feed_utterance(session) for session in sessions))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    gap = await gap_task
+
+    for session in sessions:
+        server.session_manager.remove_session(session.session_id)
+    return elapsed, sum(1 for result in results if result), gap
+
+
+async def run_language_load(server, load_seconds: float):
+    """언어별 풀을 처음 쓰는 세션 생성 중 이벤트 루프 최대 멈춤 (초)"""
+    engine_model.registry = RecognizerRegistry(
+        lambda key: fake_pool(key, 1, 0.0, load_seconds=load_seconds), pinned="auto"
+    )
+    engine_model.registry.add("auto", engine_model.recognizer)
+
+    stop = asyncio.Event()
+    gap_task = asyncio.create_task(max_loop_gap(stop))
+    session = await server.run_blocking(server.session_manager.create_session, device_id="dev-ko", language="ko")
+    session.start()
+    stop.set()
+    gap = await gap_task
+    server.session_manager.remove_session(session.session_id)
+    return gap, engine_model.registry.stats()
+
+
+def test_server(failures, delay: float):
+    import asr_api_server as server
+
+    print(f"\n[API 서버] 두 세션 동시 음성 구간 종료 (디코딩 {delay * 1000:.0f}ms)")
+    serial, count1, gap1 = asyncio.run(run_sessions(server, 1, delay))
+    parallel, count2, gap2 = asyncio.run(run_sessions(server, 2, delay))
+    print(f"  풀 크기 1: {serial * 1000:.0f}ms, 풀 크기 2: {parallel * 1000:.0f}ms")
+    check(failures, count1 == 2 and count2 == 2, f"두 세션 모두 인식 결과 ({count1}, {count2})")
+    check(failures, serial >= 2 * delay * 0.9, "풀 크기 1 은 디코딩이 차례로 실행")
+    check(failures, parallel < 1.5 * delay, "풀 크기 2 는 디코딩이 병렬로 실행")
+    check(failures, max(gap1, gap2) < delay / 2,
+          f"디코딩 중 이벤트 루프 멈춤 {max(gap1, gap2) * 1000:.0f}ms")
+
+    gap, stats = asyncio.run(run_language_load(server, delay))
+    check(failures, gap < delay / 2, f"언어별 모델 로드 중 이벤트 루프 멈춤 {gap * 1000:.0f}ms")
+    check(failures, stats["loads"] == 1 and all(p["holders"] == 0 for p in stats["pools"]),
+          "세션 종료 후 언어별 풀 반환")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recognizer 풀 / 레지스트리 테스트")
+    parser.add_argument("--decode-ms", type=float, default=300, help="가짜 디코딩 시간 (ms)")
+    args = parser.parse_args()
+
+    failures = []
+    test_registry(failures)
+    test_server(failures, args.decode_ms / 1000)
+
+    print(f"\n{'✅ 모두 통과' if not failures else f'❌ 실패 {len(failures)}건'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -21,7 +21,9 @@ CREATE TABLE IF NOT EXISTS users (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     last_login_at TIMESTAMP NULL,
     INDEX idx_username (username),
-    INDEX idx_email (email)
+    INDEX idx_email (email),
+    INDEX idx_role_id (role, id),
+    INDEX idx_active_id (is_active, id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- 장비 테이블
@@ -39,7 +41,10 @@ CREATE TABLE IF NOT EXISTS devices (
     location VARCHAR(200),
     description TEXT,
     INDEX idx_device_id (device_id),
-    INDEX idx_is_online (is_online)
+    INDEX idx_is_online (is_online),
+    INDEX idx_registered (registered_at, id),
+    INDEX idx_online_registered (is_online, registered_at, id),
+    INDEX idx_type_registered (device_type, registered_at, id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- 장비 상태 테이블
@@ -55,7 +60,47 @@ CREATE TABLE IF NOT EXISTS device_status (
     mic_status ENUM('active', 'paused', 'stopped') DEFAULT 'stopped',
     recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE,
-    INDEX idx_device_recorded (device_id, recorded_at)
+    INDEX idx_device_recorded (device_id, recorded_at),
+    INDEX idx_recorded_at (recorded_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 장비 최신 상태 테이블 (장비당 1행, 상태 수신 시 upsert)
+CREATE TABLE IF NOT EXISTS device_latest_status (
+    device_id INT PRIMARY KEY,
+    status_id INT NOT NULL,
+    battery_level INT,
+    memory_usage INT,
+    storage_usage INT,
+    temperature FLOAT,
+    cpu_usage INT,
+    camera_status ENUM('active', 'paused', 'stopped') DEFAULT 'stopped',
+    mic_status ENUM('active', 'paused', 'stopped') DEFAULT 'stopped',
+    recorded_at TIMESTAMP NOT NULL,
+    FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 장비 상태 롤업 테이블 (1분 / 1시간 요약)
+CREATE TABLE IF NOT EXISTS device_status_rollups (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    device_id INT NOT NULL,
+    resolution VARCHAR(8) NOT NULL,
+    bucket_start DATETIME NOT NULL,
+    sample_count INT NOT NULL DEFAULT 0,
+    battery_min INT,
+    battery_max INT,
+    battery_avg FLOAT,
+    temperature_min FLOAT,
+    temperature_max FLOAT,
+    temperature_avg FLOAT,
+    cpu_min INT,
+    cpu_max INT,
+    cpu_avg FLOAT,
+    memory_min INT,
+    memory_max INT,
+    memory_avg FLOAT,
+    FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE,
+    UNIQUE KEY uq_rollup_device_bucket (device_id, resolution, bucket_start),
+    INDEX idx_resolution_bucket (resolution, bucket_start)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- 리프레시 토큰 테이블
@@ -66,9 +111,12 @@ CREATE TABLE IF NOT EXISTS refresh_tokens (
     expires_at TIMESTAMP NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     revoked BOOLEAN DEFAULT FALSE,
+    revoked_at TIMESTAMP NULL DEFAULT NULL,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     INDEX idx_user_token (user_id, token_hash),
-    INDEX idx_expires (expires_at)
+    INDEX idx_user_revoked_expires (user_id, revoked, expires_at),
+    INDEX idx_expires (expires_at),
+    INDEX idx_revoked_at (revoked_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- 감사 로그 테이블
@@ -88,6 +136,19 @@ CREATE TABLE IF NOT EXISTS audit_logs (
     INDEX idx_device_action (device_id, action, created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- 응급 이벤트 테이블
+CREATE TABLE IF NOT EXISTS emergency_events (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    device_id INT NOT NULL,
+    session_id VARCHAR(100),
+    text TEXT NOT NULL,
+    keywords TEXT,
+    segment_end DOUBLE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE,
+    INDEX idx_device_created (device_id, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- 초기 데이터 확인
 SELECT 'Database setup completed!' as status;
 
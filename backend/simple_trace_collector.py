@@ -0,0 +1,120 @@
+"""
+간단한 trace 수집기
+OpenTelemetry Collector 를 대체하는 OTLP/HTTP JSON 수신기 (POST /v1/traces)
+
+ASR 서버 (ASR_TRACE_EXPORTER=otlp) 와 백엔드 (TRACE_EXPORTER=otlp) 의 span 을 한 파일에 모읍니다.
+저장 형식은 TRACE_EXPORTER=file 과 같은 JSON Lines 이므로 trace_summary.py 로 바로 분석할 수 있습니다.
+protobuf 인코딩은 지원하지 않습니다 (Content-Type: application/json 만).
+
+실행:
+    python simple_trace_collector.py --port 4318 --output ./logs/traces.jsonl
+"""
+import os
+import json
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _attribute_value(value: dict):
+    """OTLP AnyValue → 파이썬 값"""
+    if "stringValue" in value:
+        return value["stringValue"]
+    if "boolValue" in value:
+        return value["boolValue"]
+    if "intValue" in value:
+        return int(value["intValue"])
+    if "doubleValue" in value:
+        return value["doubleValue"]
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _attributes(items) -> dict:
+    return {item["key"]: _attribute_value(item.get("value", {})) for item in items or []}
+
+
+def otlp_to_records(body: dict):
+    """OTLP ExportTraceServiceRequest (JSON) → span 레코드 목록"""
+    records = []
+    for resource_spans in body.get("resourceSpans", []):
+        resource = _attributes(resource_spans.get("resource", {}).get("attributes"))
+        service = resource.get("service.name", "unknown")
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span in scope_spans.get("spans", []):
+                start_ns = int(span["startTimeUnixNano"])
+                end_ns = int(span["endTimeUnixNano"])
+                records.append({
+                    "trace_id": span["traceId"],
+                    "span_id": span["spanId"],
+                    "parent_id": span.get("parentSpanId") or None,
+                    "name": span["name"],
+                    "service": service,
+                    "start": start_ns / 1e9,
+                    "end": end_ns / 1e9,
+                    "duration_ms": round((end_ns - start_ns) / 1e6, 3),
+                    "attributes": _attributes(span.get("attributes")),
+                })
+    return records
+
+
+def make_handler(output_path: str):
+    write_lock = threading.Lock()
+
+    class TraceHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip("/") != "/v1/traces":
+                self.send_error(404)
+                return
+            if "json" not in self.headers.get("Content-Type", ""):
+                self.send_error(415, "application/json 만 지원합니다")
+                return
+
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                records = otlp_to_records(json.loads(self.rfile.read(length)))
+            except (ValueError, KeyError) as e:
+                self.send_error(400, f"잘못된 OTLP 요청: {e}")
+                return
+
+            with write_lock, open(output_path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return TraceHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OTLP/HTTP JSON trace 수집기")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--output", default="./logs/traces.jsonl", help="span 을 기록할 JSON Lines 파일")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.output))
+
+    print("=" * 60)
+    print(f"trace 수집기 시작됨: http://{args.host}:{args.port}/v1/traces")
+    print(f"저장 파일: {args.output}")
+    print("Ctrl+C로 종료")
+    print("=" * 60)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
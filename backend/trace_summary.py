@@ -0,0 +1,151 @@
+"""
+발화 trace 구간별 지연 요약
+
+ASR 서버와 백엔드가 남긴 span (JSON Lines, TRACE_EXPORTER=file 또는 simple_trace_collector.py 출력) 을
+trace_id 로 묶어, 장비 오디오 도착부터 대시보드 전송까지 구간별 지연의 p50 / p95 / max 를 출력합니다.
+
+구간 (발화 1개 기준):
+- vad.speech        : 첫 음성 청크 도착 → 마지막 음성 청크 도착 (발화 길이, 지연 아님)
+- vad.silence_wait  : 마지막 음성 청크 → 침묵 판정으로 구간 종료 (VAD 침묵 대기)
+- asr.decode        : 디코딩
+- handoff           : 디코딩 종료 → 백엔드 전송 시작 (응급 키워드 매칭, 전송 스레드 시작)
+- network           : 전송 시작 → 백엔드 수신 시작 (요청 전송 + 본문 파싱, 서버 간 시계 차이 포함)
+- backend           : 백엔드 수신 시작 → 브로드캐스트 시작 (장비 조회 / 응급 이벤트 저장)
+- broadcast         : WebSocket 브로드캐스트
+- end_to_end        : 마지막 음성 청크 → 브로드캐스트 종료 (말이 끝난 뒤 화면에 뜨기까지)
+
+ASR 서버와 백엔드가 다른 장비면 network / end_to_end 에 두 서버의 시계 차이가 그대로 들어갑니다.
+NTP (chrony 등) 로 시계를 맞춘 뒤 측정하세요.
+
+실행:
+    python trace_summary.py ./logs/traces.jsonl ./rk3588asr/logs/traces.jsonl
+    python trace_summary.py traces.jsonl --slowest 5
+"""
+import sys
+import json
+import argparse
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+STAGES = [
+    "vad.speech",
+    "vad.silence_wait",
+    "asr.decode",
+    "handoff",
+    "network",
+    "backend",
+    "broadcast",
+    "end_to_end",
+]
+
+
+def load_spans(paths: List[str]) -> Dict[str, List[dict]]:
+    """JSON Lines 파일들 → {trace_id: [span, ...]}"""
+    traces: Dict[str, List[dict]] = defaultdict(list)
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    span = json.loads(line)
+                except ValueError:
+                    print(f"⚠️ {path}:{line_no} JSON 파싱 실패, 건너뜀", file=sys.stderr)
+                    continue
+                traces[span["trace_id"]].append(span)
+    return traces
+
+
+def _first(spans: List[dict], prefix: str) -> Optional[dict]:
+    matched = [span for span in spans if span["name"].startswith(prefix)]
+    return min(matched, key=lambda span: span["start"]) if matched else None
+
+
+def _ms(start: float, end: float) -> float:
+    return (end - start) * 1000
+
+
+def breakdown(spans: List[dict]) -> Dict[str, float]:
+    """
+    trace 1개 → 구간별 지연 (ms)
+
+    해당 span 이 없는 구간은 빠집니다 (예: 인식 결과가 비어 백엔드로 보내지 않은 발화).
+    """
+    speech = _first(spans, "vad.speech")
+    silence = _first(spans, "vad.silence_wait")
+    decode = _first(spans, "asr.decode")
+    send = _first(spans, "asr.send_result")
+    receive = _first(spans, "backend.receive_asr_result")
+    broadcast = _first(spans, "ws.broadcast")
+
+    stages: Dict[str, float] = {}
+    if speech:
+        stages["vad.speech"] = speech["duration_ms"]
+    if silence:
+        stages["vad.silence_wait"] = silence["duration_ms"]
+    if decode:
+        stages["asr.decode"] = decode["duration_ms"]
+    if decode and send:
+        stages["handoff"] = _ms(decode["end"], send["start"])
+    if send and receive:
+        stages["network"] = _ms(send["start"], receive["start"])
+    if receive and broadcast:
+        stages["backend"] = _ms(receive["start"], broadcast["start"])
+    if broadcast:
+        stages["broadcast"] = broadcast["duration_ms"]
+    if silence and broadcast:
+        stages["end_to_end"] = _ms(silence["start"], broadcast["end"])
+    return stages
+
+
+def percentile(samples: List[float], p: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(p * len(samples)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발화 trace 구간별 지연 요약")
+    parser.add_argument("files", nargs="+", help="span JSON Lines 파일 (ASR 서버 / 백엔드 / 수집기)")
+    parser.add_argument("--slowest", type=int, default=0, help="end_to_end 가 가장 긴 trace N개 상세 출력")
+    args = parser.parse_args()
+
+    traces = load_spans(args.files)
+    breakdowns = {trace_id: breakdown(spans) for trace_id, spans in traces.items()}
+
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for stages in breakdowns.values():
+        for name, value in stages.items():
+            samples[name].append(value)
+
+    complete = len(samples["end_to_end"])
+    print(f"\n[발화 trace] 전체 {len(traces)}개, 대시보드 전송까지 이어진 trace {complete}개")
+    print(f"  {'구간':<18} {'건수':>6} {'p50':>10} {'p95':>10} {'max':>10}")
+    for name in STAGES:
+        values = samples.get(name)
+        if not values:
+            continue
+        print(
+            f"  {name:<18} {len(values):>6} {percentile(values, 0.5):>8.1f}ms "
+            f"{percentile(values, 0.95):>8.1f}ms {max(values):>8.1f}ms"
+        )
+
+    if samples.get("network") and min(samples["network"]) < 0:
+        print("\n⚠️ network 구간이 음수인 trace 가 있습니다: ASR 서버와 백엔드의 시계가 어긋나 있습니다 (NTP 확인).")
+
+    if args.slowest and complete:
+        slowest = sorted(
+            (item for item in breakdowns.items() if "end_to_end" in item[1]),
+            key=lambda item: item[1]["end_to_end"],
+            reverse=True,
+        )[:args.slowest]
+        print(f"\n[가장 느린 trace {len(slowest)}개]")
+        for trace_id, stages in slowest:
+            root = _first(traces[trace_id], "asr.utterance") or {}
+            device = root.get("attributes", {}).get("device_id", "-")
+            detail = ", ".join(f"{name} {stages[name]:.0f}ms" for name in STAGES if name in stages)
+            print(f"  {trace_id} (device {device}): {detail}")
+
+
+if __name__ == '__main__':
+    main()